@@ -3,9 +3,12 @@ from typing import Optional, List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, Body, HTTPException, status, Path
-from sqlalchemy.orm import Session
+from fastapi_cache.decorator import cache
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from db.session import get_db
+from core.config import settings
+from db.session import get_async_session
 from models.article import ArticleStatus
 from schemas.article import (
     ArticleCreate,
@@ -15,9 +18,11 @@ from schemas.article import (
     ArticlePublishResponse
 )
 from schemas.common import APIResponse
-from services.article_service import ArticleService
-from services.auth_service import get_current_user
+from services.article_cache import ARTICLE_CACHE_NAMESPACE, article_cache_key_builder
+from services.article_service import AsyncArticleService
+from services.auth_service import get_current_user_async
 from schemas.auth import User as UserSchema
+from utils.redis import get_redis_client
 
 
 router = APIRouter()
@@ -26,12 +31,13 @@ router = APIRouter()
 @router.post("", status_code=status.HTTP_201_CREATED, response_model=APIResponse[ArticleResponse])
 async def create_article(
     article_in: ArticleCreate,
-    db: Session = Depends(get_db),
-    current_user: UserSchema = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_session),
+    redis: Redis = Depends(get_redis_client),
+    current_user: UserSchema = Depends(get_current_user_async)
 ):
     """创建文章"""
-    article_service = ArticleService(db)
-    article = article_service.create_article(
+    article_service = AsyncArticleService(db, redis)
+    article = await article_service.create_article(
         data=article_in,
         author_id=current_user.id
     )
@@ -39,17 +45,24 @@ async def create_article(
 
 
 @router.get("", response_model=APIResponse[List[ArticleListResponse]])
+@cache(expire=settings.ARTICLE_CACHE_EXPIRE_SECONDS, namespace=ARTICLE_CACHE_NAMESPACE,
+       key_builder=article_cache_key_builder)
 async def get_articles(
-    page: int = Query(1, ge=1, description="页码"),
+    page: int = Query(1, ge=1, description="页码，传入cursor时忽略"),
     per_page: int = Query(10, ge=1, le=100, description="每页数量"),
+    cursor: Optional[str] = Query(None, description="分页游标，取上一页返回的nextCursor"),
     status: Optional[str] = Query(None, description="文章状态: draft或published"),
     tags: Optional[List[str]] = Query(None, description="标签筛选"),
     created_after: Optional[datetime] = Query(None, description="创建时间起始"),
     created_before: Optional[datetime] = Query(None, description="创建时间结束"),
-    db: Session = Depends(get_db),
-    current_user: UserSchema = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_session),
+    redis: Redis = Depends(get_redis_client),
+    current_user: UserSchema = Depends(get_current_user_async)
 ):
-    """获取文章列表"""
+    """获取文章列表
+
+    响应按查询参数缓存，文章发生写操作后失效；深分页请使用cursor而不是page。
+    """
     # 验证status参数
     if status and status not in [ArticleStatus.DRAFT.value, ArticleStatus.PUBLISHED.value]:
         raise HTTPException(
@@ -57,54 +70,71 @@ async def get_articles(
             detail=f"无效的状态参数: {status}"
         )
 
-    article_service = ArticleService(db)
-    result = article_service.get_articles(
+    article_service = AsyncArticleService(db, redis)
+    result = await article_service.get_articles(
         page=page,
         per_page=per_page,
         status=status,
         tags=tags,
         created_after=created_after,
-        created_before=created_before
+        created_before=created_before,
+        cursor=cursor
     )
 
+    # 缓存的是序列化结果，ORM对象先转换为响应模型
     return APIResponse(
-        data=result["items"],
+        data=[ArticleListResponse.model_validate(article) for article in result["items"]],
         metadata={
             "page": result["page"],
             "pageSize": result["per_page"],
             "total": result["total"],
-            "totalPages": result["total_pages"]
+            "totalPages": result["total_pages"],
+            "nextCursor": result["next_cursor"]
         }
     )
 
 
+async def count_article_view(
+    id: UUID = Path(..., description="文章ID"),
+    db: AsyncSession = Depends(get_async_session),
+    current_user: UserSchema = Depends(get_current_user_async)
+) -> None:
+    """增加浏览量（仅当不是作者本人查看时）
+
+    作为依赖执行，详情接口命中缓存时也会计数。
+    """
+    await AsyncArticleService(db).increment_view_count(id, viewer_id=current_user.id)
+
+
 @router.get("/{id}", response_model=APIResponse[ArticleResponse])
+@cache(expire=settings.ARTICLE_CACHE_EXPIRE_SECONDS, namespace=ARTICLE_CACHE_NAMESPACE,
+       key_builder=article_cache_key_builder)
 async def get_article(
     id: UUID = Path(..., description="文章ID"),
-    db: Session = Depends(get_db),
-    current_user: UserSchema = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_session),
+    current_user: UserSchema = Depends(get_current_user_async),
+    _: None = Depends(count_article_view)
 ):
-    """获取文章详情"""
-    article_service = ArticleService(db)
-    article = article_service.get_article(id)
-
-    # 增加浏览量（仅当不是作者本人查看时）
-    if str(article.author_id) != str(current_user.id):
-        article_service.increment_view_count(id)
+    """获取文章详情
 
-    return APIResponse(data=article)
+    响应缓存期间浏览量可能滞后，文章发生写操作后缓存失效。
+    """
+    article_service = AsyncArticleService(db)
+    article = await article_service.get_article(id)
+    return APIResponse(data=ArticleResponse.model_validate(article))
 
 
 @router.put("/{id}", response_model=APIResponse[ArticleResponse])
 async def update_article(
     id: UUID = Path(..., description="文章ID"),
     article_in: ArticleUpdate = Body(...),
-    db: Session = Depends(get_db),
-    current_user: UserSchema = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_session),
+    redis: Redis = Depends(get_redis_client),
+    current_user: UserSchema = Depends(get_current_user_async)
 ):
     """更新文章"""
-    article_service = ArticleService(db)
-    article = article_service.update_article(
+    article_service = AsyncArticleService(db, redis)
+    article = await article_service.update_article(
         article_id=id,
         data=article_in,
         current_user_id=current_user.id
@@ -115,12 +145,13 @@ async def update_article(
 @router.post("/{id}/publish", response_model=APIResponse[ArticlePublishResponse])
 async def publish_article(
     id: UUID = Path(..., description="文章ID"),
-    db: Session = Depends(get_db),
-    current_user: UserSchema = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_session),
+    redis: Redis = Depends(get_redis_client),
+    current_user: UserSchema = Depends(get_current_user_async)
 ):
     """发布文章"""
-    article_service = ArticleService(db)
-    article = article_service.publish_article(
+    article_service = AsyncArticleService(db, redis)
+    article = await article_service.publish_article(
         article_id=id,
         current_user_id=current_user.id
     )
@@ -130,12 +161,13 @@ async def publish_article(
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_article(
     id: UUID = Path(..., description="文章ID"),
-    db: Session = Depends(get_db),
-    current_user: UserSchema = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_session),
+    redis: Redis = Depends(get_redis_client),
+    current_user: UserSchema = Depends(get_current_user_async)
 ):
     """删除文章"""
-    article_service = ArticleService(db)
-    article_service.delete_article(
+    article_service = AsyncArticleService(db, redis)
+    await article_service.delete_article(
         article_id=id,
         current_user_id=current_user.id
     )
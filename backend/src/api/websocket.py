@@ -21,7 +21,7 @@ async def websocket_endpoint(
             # 处理心跳
             if data == "ping":
                 websocket_manager.update_heartbeat(client_id)
-                await websocket.send_text("pong")
+                await websocket_manager.send_personal_message("pong", client_id)
                 continue
 
             # 处理 AI 消息
@@ -53,10 +53,18 @@ class Settings(BaseSettings):
     REDIS_DB: int = 0
     REDIS_PASSWORD: str | None = None
 
+    WS_QUEUE_SIZE: int = 100  # 每个WebSocket连接的发送队列长度
+    WS_SEND_TIMEOUT: float = 5.0  # 单条消息发送超时秒数，超时断开
+    WS_REDIS_BROADCAST: bool = False  # 多worker时通过Redis发布/订阅同步广播
+
     DB_POOL_SIZE: int = Field(default=83)
     WEB_CONCURRENCY: int = Field(default=9)
     MAX_OVERFLOW: int = Field(default=64)
-    POOL_SIZE: Optional[int] = None
+    # 未显式配置时由下方validator按worker数推算，需要validate_default才会对默认值生效
+    POOL_SIZE: Optional[int] = Field(default=None, validate_default=True)
+    ASYNC_MAX_OVERFLOW: Optional[int] = Field(default=None, validate_default=True)
+    DB_POOL_TIMEOUT: int = 30  # 等待空闲连接的秒数
+    DB_POOL_RECYCLE: int = 1800  # 连接最长复用秒数，避免被服务端空闲断开
 
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "GenFlow Backend"
@@ -110,6 +118,8 @@ class Settings(BaseSettings):
 
     # 缓存配置
     CACHE_EXPIRE_MINUTES: int = 15
+    ARTICLE_CACHE_EXPIRE_SECONDS: int = 60  # 文章读接口响应缓存秒数
+    ARTICLE_COUNT_CACHE_EXPIRE_SECONDS: int = 600  # 文章列表总数缓存秒数，写操作会提前失效
 
     # 文件上传配置
     MAX_UPLOAD_SIZE: Union[int, str] = Field(default=5 * 1024 * 1024)  # 5MB
@@ -139,6 +149,15 @@ class Settings(BaseSettings):
 
         return max(values.data.get("DB_POOL_SIZE") // values.data.get("WEB_CONCURRENCY"), 5)  # type: ignore
 
+    @field_validator("ASYNC_MAX_OVERFLOW", mode="before")
+    @classmethod
+    def build_max_overflow(cls, v: Optional[str], values: ValidationInfo) -> Any:
+        if isinstance(v, int):
+            return v
+
+        # 将全局溢出连接数平均分给每个worker进程
+        return max(values.data.get("MAX_OVERFLOW") // values.data.get("WEB_CONCURRENCY"), 0)  # type: ignore
+
     @field_validator("POSTGRES_URL", mode="before")
     @classmethod
     def build_db_connection(cls, v: Optional[str], values: ValidationInfo) -> Any:
@@ -1,31 +1,245 @@
-from typing import Dict
+import asyncio
+import json
+import logging
+import uuid
+from collections import deque
+from typing import Any, Deque, Dict, Hashable, Optional, Union
 from fastapi import WebSocket
 from datetime import datetime
 
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+BROADCAST_CHANNEL = "genflow:backend:ws_broadcast"
+
+# 可以合并/丢弃的消息类型，只有最新一条有意义（与 core/control_ai/broadcaster 一致）
+COALESCE_TYPES = {"progress", "task_progress", "task_status", "heartbeat"}
+
+Message = Union[str, Dict[str, Any]]
+
+
+def coalesce_key(message: Message) -> Optional[Hashable]:
+    """可合并消息返回 (类型, 任务ID)，否则返回None；字符串消息不合并"""
+    if isinstance(message, dict) and message.get("type") in COALESCE_TYPES:
+        return message["type"], message.get("task_id")
+    return None
+
+
+class ClientQueue:
+    """单个连接的发送队列
+
+    同一任务的进度消息在队列中合并，只发送最新一条；队列满时先丢弃最旧的进度消息，
+    积压的都是普通消息时才判定客户端落后太多。
+    """
+
+    def __init__(self, client_id: str, max_size: int):
+        self.client_id = client_id
+        self.max_size = max_size
+        # 队列项为 ("msg", 消息) 或 ("key", 合并键)，合并键对应的最新消息保存在 _pending 中
+        self._queue: Deque[tuple] = deque()
+        self._pending: Dict[Hashable, Message] = {}
+        self._ready = asyncio.Event()
+        self.closed = False
+        self.stats = {"sent": 0, "coalesced": 0, "dropped": 0}
+
+    def put(self, message: Message) -> bool:
+        """放入一条消息，客户端已关闭或积压过多时返回False"""
+        if self.closed:
+            return False
+
+        key = coalesce_key(message)
+        if key is not None:
+            if key in self._pending:
+                self._pending[key] = message
+                self.stats["coalesced"] += 1
+                return True
+            self._pending[key] = message
+            self._queue.append(("key", key))
+        else:
+            self._queue.append(("msg", message))
+
+        if len(self._queue) > self.max_size and not self._drop_stale():
+            self.closed = True
+        self._ready.set()
+        return not self.closed
+
+    def _drop_stale(self) -> bool:
+        """丢弃最旧的一条可合并消息"""
+        for i, (kind, value) in enumerate(self._queue):
+            if kind == "key":
+                del self._queue[i]
+                self._pending.pop(value, None)
+                self.stats["dropped"] += 1
+                return True
+        return False
+
+    async def get(self) -> Optional[Message]:
+        """取出下一条消息，队列关闭后返回None"""
+        while not self._queue:
+            if self.closed:
+                return None
+            self._ready.clear()
+            await self._ready.wait()
+        kind, value = self._queue.popleft()
+        return self._pending.pop(value) if kind == "key" else value
+
+    def close(self):
+        self.closed = True
+        self._queue.clear()
+        self._pending.clear()
+        self._ready.set()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+
 class WebSocketManager:
-    def __init__(self):
+    """每个连接独立发送队列的WebSocket管理器
+
+    发送和广播只把消息放入连接的队列，由该连接的写任务发送，不会拖慢其他连接。
+    字典消息以JSON发送，其中进度类消息按 (类型, 任务ID) 合并；
+    积压的普通消息超过队列长度或发送超时的连接会被断开。
+    """
+
+    def __init__(self, queue_size: int = settings.WS_QUEUE_SIZE,
+                 send_timeout: float = settings.WS_SEND_TIMEOUT):
         self.active_connections: Dict[str, WebSocket] = {}
         self.last_heartbeat: Dict[str, datetime] = {}
+        self.queue_size = queue_size
+        self.send_timeout = send_timeout
+        self.instance_id = uuid.uuid4().hex
+        self._queues: Dict[str, ClientQueue] = {}
+        self._writers: Dict[str, asyncio.Task] = {}
+        self._redis = None
+        self._listener: Optional[asyncio.Task] = None
 
     async def connect(self, websocket: WebSocket, client_id: str):
         await websocket.accept()
+        self.disconnect(client_id)
         self.active_connections[client_id] = websocket
         self.last_heartbeat[client_id] = datetime.utcnow()
+        self._queues[client_id] = ClientQueue(client_id, self.queue_size)
+        self._writers[client_id] = asyncio.create_task(self._writer(client_id, websocket))
 
     def disconnect(self, client_id: str):
         if client_id in self.active_connections:
             del self.active_connections[client_id]
         if client_id in self.last_heartbeat:
             del self.last_heartbeat[client_id]
+        queue = self._queues.pop(client_id, None)
+        if queue is not None:
+            queue.close()
+        writer = self._writers.pop(client_id, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
 
-    async def send_personal_message(self, message: str, client_id: str):
-        if client_id in self.active_connections:
-            await self.active_connections[client_id].send_text(message)
+    async def _writer(self, client_id: str, websocket: WebSocket):
+        queue = self._queues[client_id]
+        try:
+            while True:
+                message = await queue.get()
+                if message is None:
+                    break
+                if isinstance(message, str):
+                    send = websocket.send_text(message)
+                else:
+                    send = websocket.send_json(message)
+                await asyncio.wait_for(send, timeout=self.send_timeout)
+                queue.stats["sent"] += 1
+        except asyncio.CancelledError:
+            return
+        except asyncio.TimeoutError:
+            logger.warning(f"WebSocket客户端 {client_id} 发送超时，断开连接")
+        except Exception as e:
+            logger.info(f"WebSocket客户端 {client_id} 发送失败: {e}")
+
+        if self.active_connections.get(client_id) is websocket:
+            self.disconnect(client_id)
+        await self._close(websocket)
+
+    def _enqueue(self, client_id: str, message: Message) -> bool:
+        queue = self._queues.get(client_id)
+        if queue is None:
+            return False
+        if queue.put(message):
+            return True
+        # 队列中都是不能丢弃的消息，客户端已落后太多
+        logger.warning(f"WebSocket客户端 {client_id} 积压消息过多，断开连接")
+        websocket = self.active_connections.get(client_id)
+        self.disconnect(client_id)
+        if websocket is not None:
+            asyncio.create_task(self._close(websocket))
+        return False
 
-    async def broadcast(self, message: str, exclude: str = None):
-        for client_id, connection in self.active_connections.items():
+    @staticmethod
+    async def _close(websocket: WebSocket):
+        try:
+            await websocket.close()
+        except Exception:
+            pass
+
+    async def send_personal_message(self, message: Message, client_id: str):
+        self._enqueue(client_id, message)
+
+    def broadcast_local(self, message: Message, exclude: str = None):
+        for client_id in list(self._queues):
             if client_id != exclude:
-                await connection.send_text(message)
+                self._enqueue(client_id, message)
+
+    async def broadcast(self, message: Message, exclude: str = None):
+        self.broadcast_local(message, exclude)
+        if self._redis is not None:
+            payload = json.dumps({"origin": self.instance_id, "message": message, "exclude": exclude},
+                                 ensure_ascii=False)
+            try:
+                await self._redis.publish(BROADCAST_CHANNEL, payload)
+            except Exception as e:
+                logger.error(f"发布WebSocket广播到Redis失败: {e}")
+
+    async def start(self):
+        """订阅Redis广播频道，多个worker之间同步广播"""
+        if not settings.WS_REDIS_BROADCAST or self._listener is not None:
+            return
+        import redis.asyncio as redis
+
+        self._redis = redis.Redis(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB,
+            password=settings.REDIS_PASSWORD,
+            decode_responses=True,
+        )
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(BROADCAST_CHANNEL)
+        self._listener = asyncio.create_task(self._listen(pubsub))
+
+    async def _listen(self, pubsub):
+        try:
+            async for item in pubsub.listen():
+                if item.get("type") != "message":
+                    continue
+                try:
+                    data = json.loads(item["data"])
+                except (TypeError, ValueError):
+                    continue
+                if data.get("origin") != self.instance_id:
+                    self.broadcast_local(data.get("message"), data.get("exclude"))
+        except asyncio.CancelledError:
+            pass
+        finally:
+            await pubsub.close()
+
+    async def stop(self):
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+        for client_id in list(self.active_connections):
+            self.disconnect(client_id)
 
     def update_heartbeat(self, client_id: str):
         if client_id in self.active_connections:
@@ -34,4 +248,13 @@ class WebSocketManager:
     def is_connected(self, client_id: str) -> bool:
         return client_id in self.active_connections
 
+    def get_stats(self) -> Dict[str, Any]:
+        """连接数、最长队列以及发送/合并/丢弃的消息数"""
+        totals = {"sent": 0, "coalesced": 0, "dropped": 0}
+        for queue in self._queues.values():
+            for key in totals:
+                totals[key] += queue.stats[key]
+        max_queue = max((len(q) for q in self._queues.values()), default=0)
+        return {"clients": len(self._queues), "max_queue": max_queue, **totals}
+
 websocket_manager = WebSocketManager()
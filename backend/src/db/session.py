@@ -1,19 +1,43 @@
 from typing import AsyncGenerator, Generator
 
 from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from backend.src.core.config import settings
 
 
+def get_async_database_url(url: str) -> str:
+    """将同步数据库URL转换为对应的异步驱动URL"""
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    return url
+
+
+def create_pooled_async_engine(url: str) -> AsyncEngine:
+    """创建带连接池的异步引擎
+
+    每个worker进程持有 POOL_SIZE 个常驻连接，突发时最多再借出
+    ASYNC_MAX_OVERFLOW 个，所有worker的连接总数不超过 DB_POOL_SIZE + MAX_OVERFLOW，
+    避免像 NullPool 那样每个请求都新建一次数据库连接。
+    """
+    return create_async_engine(
+        get_async_database_url(url),
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.POOL_SIZE,
+        max_overflow=settings.ASYNC_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+        echo=settings.DEBUG,
+    )
+
+
 # 创建异步引擎
-engine = create_async_engine(
-    settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://"),
-    poolclass=NullPool,
-    echo=settings.DEBUG,
-)
+engine = create_pooled_async_engine(settings.DATABASE_URL)
 
 # 创建同步引擎（用于非异步上下文）
 sync_engine = create_engine(
@@ -18,11 +18,13 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
 from fastapi_cache.backends.redis import RedisBackend
 
 from api.v1 import api_router
 from core.config import settings
 from core.exceptions import register_exception_handlers
+from core.websocket import websocket_manager
 from db.session import init_db
 from middleware import RequestHeadersMiddleware
 from utils.redis import get_redis_client
@@ -60,6 +62,13 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Redis缓存初始化失败: {e}")
             logger.warning("应用将在没有缓存的情况下继续运行")
+            # 带 @cache 的接口要求已初始化，这里以禁用状态初始化，请求直接执行不经过缓存
+            FastAPICache.init(InMemoryBackend(), enable=False)
+
+        try:
+            await websocket_manager.start()
+        except Exception as e:
+            logger.error(f"WebSocket广播频道订阅失败: {e}")
 
         logger.info("启动完成")
         yield
@@ -70,6 +79,7 @@ async def lifespan(app: FastAPI):
     finally:
         # Cleanup
         logger.info("正在关闭应用...")
+        await websocket_manager.stop()
 
 
 app = FastAPI(
@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Optional, List
 from enum import Enum
 
-from sqlalchemy import Column, String, Text, DateTime, Integer, ForeignKey, Table, Boolean, UniqueConstraint
+from sqlalchemy import Column, String, Text, DateTime, Integer, ForeignKey, Table, Boolean, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
 
@@ -35,6 +35,11 @@ class Tag(Base):
 
 class Article(Base):
     __tablename__ = "article"
+    __table_args__ = (
+        # 列表按 (created_at, id) 倒序键集分页，游标比较和排序都走这个索引
+        Index("ix_article_created_at_id", "created_at", "id"),
+        {"extend_existing": True},
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = Column(String(100), nullable=False, index=True)
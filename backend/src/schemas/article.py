@@ -80,7 +80,8 @@ class ArticleListResponse(BaseModel):
     class Config:
         from_attributes = True
 
-    @field_validator("tags", pre=True)
+    @field_validator("tags", mode="before")
+    @classmethod
     def extract_tag_names(cls, v):
         if isinstance(v, list) and v and hasattr(v[0], "name"):
             return [tag.name for tag in v]
@@ -100,7 +101,8 @@ class ArticleResponse(ArticleBase):
     class Config:
         from_attributes = True
 
-    @field_validator("tags", pre=True)
+    @field_validator("tags", mode="before")
+    @classmethod
     def extract_tag_names(cls, v):
         if isinstance(v, list) and v and hasattr(v[0], "name"):
             return [tag.name for tag in v]
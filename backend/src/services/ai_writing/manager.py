@@ -50,6 +50,7 @@ class WritingSessionManager:
     def __init__(self):
         self.sessions: Dict[UUID, WritingSession] = {}
         self.core_interface = WritingInterface()
+        self.writing_adapter = None
 
     async def cleanup(self):
         """清理资源"""
@@ -138,6 +139,9 @@ class WritingSessionManager:
                     suggestions = await self.core_interface.get_suggestions(session_id, content)
                     await self._send_message(session, "ai", suggestions, MessageType.SUGGESTION)
 
+            elif event.type == "stream_article":
+                await self._stream_article(session, event.data)
+
         except Exception as e:
             await session.websocket.send_json({
                 "type": "error",
@@ -145,6 +149,48 @@ class WritingSessionManager:
                 "timestamp": datetime.utcnow().isoformat()
             })
 
+    async def _stream_article(self, session: WritingSession, data: Dict):
+        """流式写作文章，将写作事件逐个推送到会话的 WebSocket
+
+        大纲完成、章节正文片段、事实核查结果一产生就以 writing_event 消息推送，
+        完成后将最终稿作为普通消息保存到会话历史。
+        """
+        from core.agents.writing_crew.writing_adapter import WritingTeamAdapter
+        from core.models.topic.topic import Topic
+
+        if self.writing_adapter is None:
+            self.writing_adapter = WritingTeamAdapter()
+
+        topic = Topic(
+            title=data.get("title") or session.context.title or "未命名",
+            description=session.context.content or "",
+            tags=session.context.tags,
+            platform=data.get("platform", ""),
+            content_type=data.get("content_type", "article"),
+        )
+        options = {"outline": data["outline"]} if data.get("outline") else None
+
+        session.progress.status = "processing"
+        final_draft = None
+        async for writing_event in self.writing_adapter.stream_content(
+            topic,
+            research_data=data.get("research_data") or {},
+            style=data.get("style"),
+            options=options
+        ):
+            if writing_event["type"] == "final_draft":
+                final_draft = writing_event["data"]
+            if session.websocket:
+                await session.websocket.send_json({
+                    "type": "writing_event",
+                    "data": writing_event,
+                    "timestamp": datetime.utcnow().isoformat()
+                })
+
+        session.progress.status = "idle"
+        if final_draft and final_draft.get("content"):
+            await self._send_message(session, "ai", final_draft["content"], MessageType.MARKDOWN)
+
     async def _send_message(self, session: WritingSession, role: str, content: str, msg_type: MessageType):
         """发送消息到会话"""
         message = Message(
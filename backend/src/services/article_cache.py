@@ -0,0 +1,145 @@
+"""文章缓存
+
+文章列表原先每次翻页都对整个筛选结果执行一次 COUNT，数据量大时总数查询比取一页数据还慢。
+这里把两类数据缓存在 Redis 中：
+- 列表总数：按筛选条件组合缓存，键为 ``articles:count:<版本>:<筛选条件摘要>``
+- 读接口响应：fastapi_cache 的 @cache 使用 article_cache_key_builder 生成键，同样带上版本号，
+  键为 ``<前缀>:articles:<版本>:<请求摘要>``
+
+创建、更新、发布、删除文章后调用 invalidate_article_cache 把版本号加一，
+所有旧键立即失效，不需要用 KEYS 扫描删除，旧键到期后由 Redis 自动清理。
+Redis 不可用时只记录警告，查询回退到数据库。
+"""
+
+import hashlib
+import json
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ARTICLE_CACHE_NAMESPACE = "articles"
+ARTICLE_CACHE_VERSION_KEY = f"{ARTICLE_CACHE_NAMESPACE}:version"
+
+
+def filter_digest(**filters: Any) -> str:
+    """筛选条件组合的摘要，条件相同（标签顺序不同也算相同）时摘要相同"""
+    normalized = {}
+    for name, value in filters.items():
+        if value is None or value == []:
+            continue
+        if isinstance(value, (list, tuple, set)):
+            value = sorted(str(item) for item in value)
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        else:
+            value = str(value)
+        normalized[name] = value
+    payload = json.dumps(normalized, sort_keys=True, ensure_ascii=False)
+    return hashlib.md5(payload.encode("utf-8")).hexdigest()  # noqa: S324
+
+
+def count_cache_key(version: str, digest: str) -> str:
+    """列表总数的缓存键"""
+    return f"{ARTICLE_CACHE_NAMESPACE}:count:{version}:{digest}"
+
+
+def _decode_version(version) -> str:
+    if isinstance(version, bytes):
+        version = version.decode()
+    return version or "0"
+
+
+async def get_cache_version(redis) -> str:
+    """当前缓存版本号，从未失效过时为 "0" """
+    return _decode_version(await redis.get(ARTICLE_CACHE_VERSION_KEY))
+
+
+async def get_cached_count(redis, digest: str) -> Tuple[Optional[str], Optional[int]]:
+    """读取缓存的总数
+
+    Returns:
+        Tuple[Optional[str], Optional[int]]: (版本号, 总数)，Redis 不可用时版本号为 None，未命中时总数为 None
+    """
+    try:
+        version = await get_cache_version(redis)
+        cached = await redis.get(count_cache_key(version, digest))
+    except Exception as e:
+        logger.warning(f"读取文章总数缓存失败: {e}")
+        return None, None
+    return version, int(cached) if cached is not None else None
+
+
+async def set_cached_count(redis, version: str, digest: str, total: int, expire: int) -> None:
+    """写入总数缓存"""
+    try:
+        await redis.set(count_cache_key(version, digest), total, ex=expire)
+    except Exception as e:
+        logger.warning(f"写入文章总数缓存失败: {e}")
+
+
+async def invalidate_article_cache(redis) -> None:
+    """文章发生写操作后使全部文章缓存失效"""
+    try:
+        await redis.incr(ARTICLE_CACHE_VERSION_KEY)
+    except Exception as e:
+        logger.warning(f"文章缓存失效失败: {e}")
+
+
+def get_cached_count_sync(redis, digest: str) -> Tuple[Optional[str], Optional[int]]:
+    """get_cached_count 的同步版本，用于同步 Redis 客户端"""
+    try:
+        version = _decode_version(redis.get(ARTICLE_CACHE_VERSION_KEY))
+        cached = redis.get(count_cache_key(version, digest))
+    except Exception as e:
+        logger.warning(f"读取文章总数缓存失败: {e}")
+        return None, None
+    return version, int(cached) if cached is not None else None
+
+
+def set_cached_count_sync(redis, version: str, digest: str, total: int, expire: int) -> None:
+    """set_cached_count 的同步版本"""
+    try:
+        redis.set(count_cache_key(version, digest), total, ex=expire)
+    except Exception as e:
+        logger.warning(f"写入文章总数缓存失败: {e}")
+
+
+def invalidate_article_cache_sync(redis) -> None:
+    """invalidate_article_cache 的同步版本"""
+    try:
+        redis.incr(ARTICLE_CACHE_VERSION_KEY)
+    except Exception as e:
+        logger.warning(f"文章缓存失效失败: {e}")
+
+
+async def article_cache_key_builder(
+    func: Callable[..., Any],
+    namespace: str = "",
+    *,
+    request=None,
+    response=None,
+    args: Tuple[Any, ...] = (),
+    kwargs: Optional[Dict[str, Any]] = None,
+) -> str:
+    """fastapi_cache 的键生成函数
+
+    默认的键生成函数把全部参数（包括数据库会话、当前用户）格式化进键里，每个请求的键都不同，
+    缓存永远不会命中。这里只用请求路径和排序后的查询参数，并带上缓存版本号，写操作后旧键全部失效。
+    """
+    from utils.redis import get_redis_client
+
+    try:
+        version = await get_cache_version(await get_redis_client())
+    except Exception as e:
+        logger.warning(f"读取文章缓存版本失败: {e}")
+        version = "0"
+
+    if request is not None:
+        params = sorted(request.query_params.multi_items())
+        raw = f"{request.url.path}?{params}"
+    else:
+        raw = f"{args}:{sorted((kwargs or {}).items(), key=lambda item: item[0])}"
+    digest = hashlib.md5(f"{func.__module__}:{func.__name__}:{raw}".encode("utf-8")).hexdigest()  # noqa: S324
+    return f"{namespace}:{version}:{digest}"
@@ -1,21 +1,125 @@
+import base64
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Union, Tuple
 from uuid import UUID
 import uuid
 
-from sqlalchemy import desc, asc, and_, or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import desc, asc, and_, or_, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.sql import functions as func
 
 from models.article import Article, Tag, ArticleStatus
 from models.user import User
 from schemas.article import ArticleCreate, ArticleUpdate
-from core.exceptions import ResourceException
+from core.config import settings
+from core.exceptions import RequestException, ResourceException
+from services.article_cache import (
+    filter_digest,
+    get_cached_count,
+    get_cached_count_sync,
+    invalidate_article_cache,
+    invalidate_article_cache_sync,
+    set_cached_count,
+    set_cached_count_sync,
+)
+
+
+def encode_cursor(article: Article) -> str:
+    """把一页最后一篇文章的 (created_at, id) 编码为下一页的游标"""
+    raw = f"{article.created_at.isoformat()}|{article.id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """解析游标，返回 (created_at, id)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        created_at, article_id = raw.split("|")
+        return datetime.fromisoformat(created_at), UUID(article_id)
+    except (ValueError, UnicodeDecodeError):
+        raise RequestException(
+            error_code="REQ_001",
+            message="无效的分页游标",
+            target="cursor",
+            source="article_service.get_articles"
+        )
+
+
+def _with_relations(query):
+    # selectinload 用独立的 IN 查询加载关联，不会像 joinedload 那样按标签数放大行数，LIMIT 也不会截断标签
+    return query.options(selectinload(Article.author), selectinload(Article.tags))
+
+
+def _list_conditions(
+    status: Optional[str] = None,
+    tags: Optional[List[str]] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    author_id: Optional[UUID] = None,
+) -> list:
+    """文章列表的筛选条件"""
+    conditions = [Article.is_deleted == False]
+
+    if status:
+        conditions.append(Article.status == status)
+
+    if tags:
+        # EXISTS 子查询，文章匹配多个标签时不会重复
+        conditions.append(Article.tags.any(Tag.name.in_(tags)))
+
+    if created_after:
+        conditions.append(Article.created_at >= created_after)
+
+    if created_before:
+        conditions.append(Article.created_at <= created_before)
+
+    if author_id:
+        conditions.append(Article.author_id == author_id)
+
+    return conditions
+
+
+def _list_query(conditions: list, page: int, per_page: int, cursor: Optional[str]):
+    """按 (created_at, id) 倒序取一页，多取一条用来判断是否还有下一页
+
+    带游标时用键集分页，直接从索引 (created_at, id) 上的游标位置往后读，
+    耗时与页码无关；没有游标时退回 OFFSET，第一页的 OFFSET 为 0。
+    """
+    query = select(Article).where(*conditions)
+    if cursor:
+        created_at, article_id = decode_cursor(cursor)
+        query = query.where(tuple_(Article.created_at, Article.id) < tuple_(created_at, article_id))
+    else:
+        query = query.offset((page - 1) * per_page)
+    return _with_relations(
+        query.order_by(desc(Article.created_at), desc(Article.id)).limit(per_page + 1)
+    )
+
+
+def _page_result(articles: list, total: int, page: int, per_page: int) -> Dict[str, Any]:
+    """组装分页结果"""
+    has_more = len(articles) > per_page
+    items = articles[:per_page]
+    return {
+        "items": items,
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+        "total_pages": (total + per_page - 1) // per_page,
+        "next_cursor": encode_cursor(items[-1]) if has_more else None,
+    }
 
 
 class ArticleService:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, redis=None):
+        """
+        Args:
+            db: 数据库会话
+            redis: 同步 Redis 客户端，用于缓存列表总数，为 None 时每次都查询总数
+        """
         self.db = db
+        self.redis = redis
 
     def get_articles(
         self,
@@ -26,58 +130,45 @@ class ArticleService:
         created_after: Optional[datetime] = None,
         created_before: Optional[datetime] = None,
         author_id: Optional[UUID] = None,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """获取文章列表"""
-        query = self.db.query(Article).filter(Article.is_deleted == False)
-
-        # 应用筛选条件
-        if status:
-            query = query.filter(Article.status == status)
-
-        if tags:
-            query = query.join(Article.tags).filter(Tag.name.in_(tags))
-
-        if created_after:
-            query = query.filter(Article.created_at >= created_after)
-
-        if created_before:
-            query = query.filter(Article.created_at <= created_before)
-
-        if author_id:
-            query = query.filter(Article.author_id == author_id)
-
-        # 获取总数
-        total = query.count()
-
-        # 排序和分页
-        query = query.order_by(desc(Article.created_at))
-        query = query.offset((page - 1) * per_page).limit(per_page)
-
-        # 加载关联数据
-        query = query.options(
-            joinedload(Article.author),
-            joinedload(Article.tags)
-        )
-
-        articles = query.all()
-
-        return {
-            "items": articles,
-            "total": total,
-            "page": page,
-            "per_page": per_page,
-            "total_pages": (total + per_page - 1) // per_page
-        }
+        """获取文章列表
+
+        传入上一页返回的 next_cursor 时按游标取下一页，忽略 page。
+        """
+        filters = dict(status=status, tags=tags, created_after=created_after,
+                       created_before=created_before, author_id=author_id)
+        conditions = _list_conditions(**filters)
+
+        total = self._count(conditions, filter_digest(**filters))
+        articles = self.db.execute(_list_query(conditions, page, per_page, cursor)).scalars().all()
+        return _page_result(articles, total, page, per_page)
+
+    def _count(self, conditions: list, digest: str) -> int:
+        """获取筛选结果总数，优先读取 Redis 缓存"""
+        version = None
+        if self.redis is not None:
+            version, cached = get_cached_count_sync(self.redis, digest)
+            if cached is not None:
+                return cached
+
+        total = self.db.scalar(select(func.count()).select_from(Article).where(*conditions)) or 0
+
+        if version is not None:
+            set_cached_count_sync(self.redis, version, digest, total,
+                                  settings.ARTICLE_COUNT_CACHE_EXPIRE_SECONDS)
+        return total
+
+    def _invalidate_cache(self) -> None:
+        """写操作后使文章缓存失效"""
+        if self.redis is not None:
+            invalidate_article_cache_sync(self.redis)
 
     def get_article(self, article_id: UUID) -> Article:
         """获取文章详情"""
-        article = self.db.query(Article).filter(
-            Article.id == article_id,
-            Article.is_deleted == False
-        ).options(
-            joinedload(Article.author),
-            joinedload(Article.tags)
-        ).first()
+        article = self.db.execute(_with_relations(
+            select(Article).where(Article.id == article_id, Article.is_deleted == False)
+        )).scalars().first()
 
         if not article:
             raise ResourceException(
@@ -128,6 +219,7 @@ class ArticleService:
 
         self.db.add(article)
         self.db.commit()
+        self._invalidate_cache()
         self.db.refresh(article)
         return article
 
@@ -174,6 +266,7 @@ class ArticleService:
                 article.tags = self._get_or_create_tags(data.tags)
 
         self.db.commit()
+        self._invalidate_cache()
         self.db.refresh(article)
         return article
 
@@ -208,6 +301,7 @@ class ArticleService:
         article.published_at = datetime.utcnow()
 
         self.db.commit()
+        self._invalidate_cache()
         self.db.refresh(article)
         return article
 
@@ -232,6 +326,7 @@ class ArticleService:
         article.is_deleted = True
 
         self.db.commit()
+        self._invalidate_cache()
 
     def _get_or_create_tags(self, tag_names: List[str]) -> List[Tag]:
         """获取或创建标签"""
@@ -248,3 +343,250 @@ class ArticleService:
         """检查用户是否不是管理员"""
         user = self.db.query(User).filter(User.id == user_id).first()
         return not user or user.role != "admin"
+
+
+class AsyncArticleService:
+    """ArticleService 的 AsyncSession 版本
+
+    在 async 端点中使用，查询通过异步驱动执行，不阻塞事件循环。
+    异步会话不支持懒加载，返回的文章都预先加载了作者和标签。
+    """
+
+    def __init__(self, db: AsyncSession, redis=None):
+        """
+        Args:
+            db: 异步数据库会话
+            redis: redis.asyncio 客户端，用于缓存列表总数，为 None 时每次都查询总数
+        """
+        self.db = db
+        self.redis = redis
+
+    async def get_articles(
+        self,
+        page: int = 1,
+        per_page: int = 10,
+        status: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        author_id: Optional[UUID] = None,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """获取文章列表
+
+        传入上一页返回的 next_cursor 时按游标取下一页，忽略 page。
+        """
+        filters = dict(status=status, tags=tags, created_after=created_after,
+                       created_before=created_before, author_id=author_id)
+        conditions = _list_conditions(**filters)
+
+        total = await self._count(conditions, filter_digest(**filters))
+        articles = (await self.db.execute(_list_query(conditions, page, per_page, cursor))).scalars().all()
+        return _page_result(articles, total, page, per_page)
+
+    async def _count(self, conditions: list, digest: str) -> int:
+        """获取筛选结果总数，优先读取 Redis 缓存"""
+        version = None
+        if self.redis is not None:
+            version, cached = await get_cached_count(self.redis, digest)
+            if cached is not None:
+                return cached
+
+        total = await self.db.scalar(
+            select(func.count()).select_from(Article).where(*conditions)
+        ) or 0
+
+        if version is not None:
+            await set_cached_count(self.redis, version, digest, total,
+                                   settings.ARTICLE_COUNT_CACHE_EXPIRE_SECONDS)
+        return total
+
+    async def _invalidate_cache(self) -> None:
+        """写操作后使文章缓存失效"""
+        if self.redis is not None:
+            await invalidate_article_cache(self.redis)
+
+    async def get_article(self, article_id: UUID) -> Article:
+        """获取文章详情"""
+        query = _with_relations(
+            select(Article).where(Article.id == article_id, Article.is_deleted == False)
+        )
+        article = (await self.db.execute(query)).scalars().first()
+
+        if not article:
+            raise ResourceException(
+                error_code="RES_001",
+                message="文章不存在",
+                target="article_id",
+                source="article_service.get_article"
+            )
+
+        return article
+
+    async def increment_view_count(self, article_id: UUID, viewer_id: Optional[UUID] = None) -> None:
+        """增加文章浏览量
+
+        单条 UPDATE 原子地加一，不需要先加载文章，详情接口命中缓存时也能计数。
+
+        Args:
+            article_id: 文章ID
+            viewer_id: 查看者ID，作者本人查看时不计数
+        """
+        query = update(Article).where(Article.id == article_id, Article.is_deleted == False)
+        if viewer_id is not None:
+            query = query.where(Article.author_id != viewer_id)
+        # 不同步会话中已加载的对象，避免在条件求值时触发属性的懒加载
+        await self.db.execute(
+            query.values(view_count=Article.view_count + 1).execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+
+    async def create_article(
+        self,
+        data: ArticleCreate,
+        author_id: UUID
+    ) -> Article:
+        """创建文章"""
+        # 确保作者存在
+        author = await self.db.get(User, author_id)
+        if not author:
+            raise ResourceException(
+                error_code="RES_001",
+                message="作者不存在",
+                target="author_id",
+                source="article_service.create_article"
+            )
+
+        # 创建文章
+        article = Article(
+            id=uuid.uuid4(),
+            title=data.title,
+            content=data.content,
+            summary=data.summary,
+            cover_image=data.cover_image,
+            author_id=author_id,
+            status=ArticleStatus.DRAFT.value
+        )
+        article.tags = await self._get_or_create_tags(data.tags) if data.tags else []
+
+        self.db.add(article)
+        await self.db.commit()
+        await self._invalidate_cache()
+        return await self.get_article(article.id)
+
+    async def update_article(
+        self,
+        article_id: UUID,
+        data: ArticleUpdate,
+        current_user_id: UUID
+    ) -> Article:
+        """更新文章"""
+        article = await self.get_article(article_id)
+
+        # 权限检查
+        if article.author_id != current_user_id and await self._is_not_admin(current_user_id):
+            raise ResourceException(
+                error_code="RES_003",
+                message="无权限修改此文章",
+                target="article_id",
+                source="article_service.update_article"
+            )
+
+        if data.title:
+            article.title = data.title
+        if data.summary:
+            article.summary = data.summary
+        if data.cover_image:
+            article.cover_image = data.cover_image
+
+        # 已发布文章不能修改内容
+        if article.status == ArticleStatus.PUBLISHED.value:
+            if data.tags:
+                article.tags = await self._get_or_create_tags(data.tags)
+        else:
+            # 草稿状态可以修改所有内容
+            if data.content:
+                article.content = data.content
+            if data.tags is not None:
+                article.tags = await self._get_or_create_tags(data.tags)
+
+        await self.db.commit()
+        await self._invalidate_cache()
+        return await self.get_article(article_id)
+
+    async def publish_article(
+        self,
+        article_id: UUID,
+        current_user_id: UUID
+    ) -> Article:
+        """发布文章"""
+        article = await self.get_article(article_id)
+
+        # 权限检查
+        if article.author_id != current_user_id and await self._is_not_admin(current_user_id):
+            raise ResourceException(
+                error_code="RES_003",
+                message="无权限发布此文章",
+                target="article_id",
+                source="article_service.publish_article"
+            )
+
+        # 已发布的文章不能重复发布
+        if article.status == ArticleStatus.PUBLISHED.value:
+            raise ResourceException(
+                error_code="RES_002",
+                message="文章已发布",
+                target="article_id",
+                source="article_service.publish_article"
+            )
+
+        # 发布文章
+        article.status = ArticleStatus.PUBLISHED.value
+        article.published_at = datetime.utcnow()
+
+        await self.db.commit()
+        await self._invalidate_cache()
+        return await self.get_article(article_id)
+
+    async def delete_article(
+        self,
+        article_id: UUID,
+        current_user_id: UUID
+    ) -> None:
+        """删除文章（软删除）"""
+        article = await self.get_article(article_id)
+
+        # 权限检查
+        if article.author_id != current_user_id and await self._is_not_admin(current_user_id):
+            raise ResourceException(
+                error_code="RES_003",
+                message="无权限删除此文章",
+                target="article_id",
+                source="article_service.delete_article"
+            )
+
+        # 软删除
+        article.is_deleted = True
+
+        await self.db.commit()
+        await self._invalidate_cache()
+
+    async def _get_or_create_tags(self, tag_names: List[str]) -> List[Tag]:
+        """获取或创建标签，一次查询取回已存在的标签"""
+        result = await self.db.execute(select(Tag).where(Tag.name.in_(tag_names)))
+        existing = {tag.name: tag for tag in result.scalars().all()}
+
+        tags = []
+        for name in tag_names:
+            tag = existing.get(name)
+            if not tag:
+                tag = Tag(name=name)
+                self.db.add(tag)
+                existing[name] = tag
+            tags.append(tag)
+        return tags
+
+    async def _is_not_admin(self, user_id: UUID) -> bool:
+        """检查用户是否不是管理员"""
+        user = await self.db.get(User, user_id)
+        return not user or user.role != "admin"
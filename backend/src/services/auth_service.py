@@ -5,14 +5,15 @@ import uuid
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from core.config import settings
 from core.security import TokenPayload, create_access_token, create_refresh_token
-from db.session import get_db
+from db.session import get_db, get_async_session
 from models.user import User
 from schemas.auth import Token, TokenPair, User as UserSchema
-from services.user_service import UserService
+from services.user_service import UserService, AsyncUserService
 
 
 class AuthService:
@@ -108,6 +109,33 @@ class AuthService:
             return None
 
 
+class AsyncAuthService:
+    """AuthService 的 AsyncSession 版本，令牌校验时的用户查询不阻塞事件循环"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.user_service = AsyncUserService(db)
+
+    async def verify_token(self, token: str) -> Optional[User]:
+        """校验访问令牌，返回对应的有效用户"""
+        try:
+            payload = jwt.decode(
+                token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+            )
+            token_data = TokenPayload(**payload)
+        except (JWTError, ValueError):
+            return None
+
+        # 检查令牌是否过期
+        if token_data.exp and datetime.fromtimestamp(token_data.exp) < datetime.now():
+            return None
+
+        user = await self.user_service.get_by_id(token_data.sub)
+        if not user or not self.user_service.is_active(user):
+            return None
+        return user
+
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
 
@@ -123,3 +151,17 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     return db.query(User).filter(User.id == uuid.UUID(result["user"]["id"])).first()
+
+
+async def get_current_user_async(
+    db: AsyncSession = Depends(get_async_session), token: str = Depends(oauth2_scheme)
+) -> User:
+    auth_service = AsyncAuthService(db)
+    user = await auth_service.verify_token(token)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="无效的认证凭据",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
@@ -1,7 +1,10 @@
 from typing import Optional, Union
 import uuid
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
+from starlette.concurrency import run_in_threadpool
 
 from core.security import get_password_hash, verify_password
 from models.user import User
@@ -72,3 +75,37 @@ class UserService:
 
     def is_admin(self, user: User) -> bool:
         return user.role == "admin"
+
+
+class AsyncUserService:
+    """UserService 的 AsyncSession 版本，供 async 端点使用"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        result = await self.db.execute(select(User).where(User.email == email))
+        return result.scalars().first()
+
+    async def get_by_id(self, user_id: Union[uuid.UUID, str]) -> Optional[User]:
+        if isinstance(user_id, str):
+            try:
+                user_id = uuid.UUID(user_id)
+            except ValueError:
+                return None
+        return await self.db.get(User, user_id)
+
+    async def authenticate(self, email: str, password: str) -> Optional[User]:
+        user = await self.get_by_email(email=email)
+        if not user:
+            return None
+        # bcrypt校验是CPU密集操作，放到线程池避免阻塞事件循环
+        if not await run_in_threadpool(verify_password, password, user.hashed_password):
+            return None
+        return user
+
+    def is_active(self, user: User) -> bool:
+        return user.is_active == True
+
+    def is_admin(self, user: User) -> bool:
+        return user.role == "admin"
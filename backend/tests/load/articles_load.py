@@ -0,0 +1,128 @@
+"""GET /articles 吞吐量测试
+
+两种模式:
+- 指定 --base-url 时压测已启动的服务（本地 Postgres），需提供 --token
+- 否则在进程内用 SQLite(aiosqlite) 代替 Postgres，写入测试数据后通过 ASGI 直接调用应用
+
+用法:
+    python backend/tests/load/articles_load.py --requests 2000 --concurrency 50
+    python backend/tests/load/articles_load.py --base-url http://localhost:8080 --token <token>
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import List, Optional
+
+import httpx
+
+PROJECT_ROOT = Path(__file__).parents[3]
+BACKEND_SRC = PROJECT_ROOT / "backend" / "src"
+
+
+async def _prepare_in_process_app(articles: int):
+    """使用SQLite替身数据库构建应用并写入测试数据"""
+    db_file = os.path.join(tempfile.mkdtemp(prefix="genflow-load-"), "load.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_file}"
+    sys.path.insert(0, str(PROJECT_ROOT))
+    sys.path.insert(0, str(BACKEND_SRC))
+
+    from main import app
+    from db.session import async_session_maker, init_db
+    from models.article import Article, ArticleStatus
+    from models.user import User
+    from services.auth_service import get_current_user_async
+
+    await init_db()
+
+    author = User(id=uuid.uuid4(), email="load@example.com", name="load",
+                  hashed_password="x", role="user", is_active=True)
+    async with async_session_maker() as session:
+        session.add(author)
+        for i in range(articles):
+            session.add(Article(
+                id=uuid.uuid4(), title=f"压测文章 {i}", content="内容" * 50,
+                summary="摘要", author_id=author.id,
+                status=ArticleStatus.PUBLISHED.value if i % 2 else ArticleStatus.DRAFT.value,
+            ))
+        await session.commit()
+
+    # 压测只关注文章查询，跳过JWT校验
+    app.dependency_overrides[get_current_user_async] = lambda: author
+    return app
+
+
+async def run_load(client: httpx.AsyncClient, path: str, total: int, concurrency: int) -> dict:
+    """并发发送请求并统计结果"""
+    latencies: List[float] = []
+    errors = 0
+    queue: asyncio.Queue = asyncio.Queue()
+    for _ in range(total):
+        queue.put_nowait(None)
+
+    async def worker():
+        nonlocal errors
+        while True:
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            start = time.perf_counter()
+            try:
+                response = await client.get(path, params={"per_page": 20})
+                if response.status_code != 200:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": total,
+        "errors": errors,
+        "elapsed": elapsed,
+        "rps": total / elapsed if elapsed else 0.0,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+async def main(args) -> None:
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+    if args.base_url:
+        client = httpx.AsyncClient(base_url=args.base_url, headers=headers, timeout=30,
+                                   limits=httpx.Limits(max_connections=args.concurrency))
+    else:
+        app = await _prepare_in_process_app(args.articles)
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app),
+                                   base_url="http://testserver", headers=headers, timeout=30)
+
+    async with client:
+        # 预热连接池
+        await run_load(client, args.path, min(args.concurrency, args.requests), args.concurrency)
+        result = await run_load(client, args.path, args.requests, args.concurrency)
+
+    print(f"目标: {args.base_url or 'in-process (SQLite/aiosqlite)'} {args.path}")
+    print(f"请求数: {result['requests']}  并发: {args.concurrency}  错误: {result['errors']}")
+    print(f"吞吐量: {result['rps']:.1f} req/s  p50: {result['p50_ms']:.1f} ms  p95: {result['p95_ms']:.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="GET /articles 吞吐量测试")
+    parser.add_argument("--base-url", help="已启动服务的地址，不指定时在进程内使用SQLite替身")
+    parser.add_argument("--token", help="访问令牌（压测外部服务时使用）")
+    parser.add_argument("--path", default="/api/v1/articles")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--articles", type=int, default=1000, help="进程内模式写入的文章数")
+    asyncio.run(main(parser.parse_args()))
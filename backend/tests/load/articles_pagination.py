@@ -0,0 +1,171 @@
+"""文章列表分页基准测试
+
+在 SQLite 中写入大量文章（默认 100 万篇，每篇 0-3 个标签），比较不同页码下 ArticleService.get_articles
+新旧实现的耗时：
+- COUNT：筛选结果的总数查询，原实现每次翻页都执行，新实现按筛选条件缓存在 Redis 中
+- OFFSET + joinedload：原实现，OFFSET 越大需要跳过的行越多，joinedload 标签使每篇文章按标签数重复
+- OFFSET + selectinload：只把 joinedload 换成 selectinload，单独看 OFFSET 的开销
+- 键集 + selectinload：新实现，从 (created_at, id) 索引上的游标位置直接往后读，标签用一条 IN 查询加载
+
+游标通过不计时的查询定位到对应页，并校验两种方式取到的文章相同。
+指定 --db 时复用已有的数据库文件，避免每次重新写入。
+
+用法:
+    python backend/tests/load/articles_pagination.py --articles 1000000 --pages 1 100 10000 40000
+    python backend/tests/load/articles_pagination.py --db /tmp/articles.db --repeat 5
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, desc, insert, select
+from sqlalchemy.orm import Session, joinedload
+
+PROJECT_ROOT = Path(__file__).parents[3]
+BACKEND_SRC = PROJECT_ROOT / "backend" / "src"
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(BACKEND_SRC))
+
+# 模型中的关系按 backend.src.models.* 路径引用类，服务层按 models.* 导入；让两个路径指向同一组模块，
+# 否则同一张表会定义两次映射，关系配置失败
+import backend.src.models  # noqa: E402
+
+for _name in ["", ".base", ".user", ".article"]:
+    sys.modules[f"models{_name}"] = sys.modules[f"backend.src.models{_name}"]
+
+from models.article import Article, ArticleStatus, Tag, article_tag  # noqa: E402
+from models.user import User  # noqa: E402
+from services.article_service import ArticleService, _list_conditions, _list_query, encode_cursor  # noqa: E402
+
+BATCH_SIZE = 50_000
+TAG_NAMES = [f"标签{i}" for i in range(50)]
+
+
+def populate(engine, articles: int) -> None:
+    """批量写入作者、标签和文章"""
+    Article.metadata.create_all(engine, tables=[User.__table__, Tag.__table__, Article.__table__, article_tag])
+    author_id = uuid.uuid4()
+    start = datetime(2020, 1, 1)
+    rng = random.Random(42)
+
+    with engine.begin() as conn:
+        conn.execute(insert(User.__table__), [{
+            "id": author_id, "email": "bench@example.com", "name": "bench",
+            "hashed_password": "x", "role": "user", "is_active": True,
+        }])
+        conn.execute(insert(Tag.__table__), [{"name": name} for name in TAG_NAMES])
+
+        for offset in range(0, articles, BATCH_SIZE):
+            rows, links = [], []
+            for i in range(offset, min(offset + BATCH_SIZE, articles)):
+                article_id = uuid.uuid4()
+                # 每两篇文章的创建时间相同，用来验证 id 作为第二排序键
+                created_at = start + timedelta(seconds=i // 2)
+                rows.append({
+                    "id": article_id, "title": f"文章 {i}", "content": "内容", "summary": "摘要",
+                    "author_id": author_id, "created_at": created_at, "updated_at": created_at,
+                    "status": ArticleStatus.PUBLISHED.value if i % 2 else ArticleStatus.DRAFT.value,
+                    "view_count": 0, "is_deleted": i % 100 == 0,
+                })
+                links.extend({"article_id": article_id, "tag_name": name}
+                             for name in rng.sample(TAG_NAMES, rng.randint(0, 3)))
+            conn.execute(insert(Article.__table__), rows)
+            if links:
+                conn.execute(insert(article_tag), links)
+            print(f"  已写入 {min(offset + BATCH_SIZE, articles)} / {articles}", end="\r", flush=True)
+        # 收集统计信息，否则 SQLite 会选择 is_deleted 上的索引再排序（Postgres 由 autovacuum 自动收集）
+        conn.exec_driver_sql("ANALYZE")
+    print()
+
+
+def legacy_page(db: Session, page: int, per_page: int) -> list:
+    """原实现的分页查询：OFFSET + joinedload"""
+    query = db.query(Article).filter(Article.is_deleted == False)  # noqa: E712
+    query = query.order_by(desc(Article.created_at)).offset((page - 1) * per_page).limit(per_page)
+    return query.options(joinedload(Article.author), joinedload(Article.tags)).all()
+
+
+def legacy_count(db: Session) -> int:
+    """原实现的总数查询"""
+    return db.query(Article).filter(Article.is_deleted == False).count()  # noqa: E712
+
+
+def cursor_for(db: Session, page: int, per_page: int):
+    """定位到第 page 页的游标（不计时）"""
+    if page == 1:
+        return None
+    previous = db.execute(
+        select(Article).where(*_list_conditions())
+        .order_by(desc(Article.created_at), desc(Article.id))
+        .offset((page - 1) * per_page - 1).limit(1)
+    ).scalars().first()
+    return encode_cursor(previous)
+
+
+def timed(func, repeat: int):
+    """执行 repeat 次，返回最后一次的结果和耗时中位数（毫秒）"""
+    samples = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return result, statistics.median(samples)
+
+
+def main(args) -> None:
+    db_file = args.db or os.path.join(tempfile.mkdtemp(prefix="genflow-pagination-"), "articles.db")
+    engine = create_engine(f"sqlite:///{db_file}")
+    if not os.path.exists(db_file) or os.path.getsize(db_file) == 0:
+        print(f"写入 {args.articles} 篇文章到 {db_file}")
+        started = time.perf_counter()
+        populate(engine, args.articles)
+        print(f"写入耗时 {time.perf_counter() - started:.1f} s")
+
+    with Session(engine) as db:
+        service = ArticleService(db)
+        conditions = _list_conditions()
+        total, count_ms = timed(lambda: legacy_count(db), args.repeat)
+        print(f"文章数: {total}（未删除）  每页: {args.per_page}  COUNT: {count_ms:.1f} ms")
+        print(f"{'页码':>8}{'OFFSET+joinedload':>20}{'OFFSET+selectinload':>22}{'键集+selectinload':>20}"
+              f"{'旧合计(含COUNT)':>18}{'新(总数命中缓存)':>18}  结果一致")
+
+        for page in args.pages:
+            if (page - 1) * args.per_page >= total:
+                continue
+            cursor = cursor_for(db, page, args.per_page)
+            legacy, legacy_ms = timed(lambda: legacy_page(db, page, args.per_page), args.repeat)
+            db.expunge_all()
+            _, offset_ms = timed(
+                lambda: db.execute(_list_query(conditions, page, args.per_page, None)).scalars().all(), args.repeat
+            )
+            db.expunge_all()
+            # 总数命中缓存时 get_articles 只执行分页查询，这里单独计时分页查询
+            _, keyset_ms = timed(
+                lambda: db.execute(_list_query(conditions, 1, args.per_page, cursor)).scalars().all(), args.repeat
+            )
+            db.expunge_all()
+            keyset = service.get_articles(per_page=args.per_page, cursor=cursor)["items"]
+            db.expunge_all()
+            # 原实现只按 created_at 排序，创建时间相同的文章顺序不确定，按创建时间比较
+            same = sorted(a.created_at for a in legacy) == sorted(a.created_at for a in keyset)
+            print(f"{page:>8}{legacy_ms:>20.1f}{offset_ms:>22.1f}{keyset_ms:>20.1f}{legacy_ms + count_ms:>18.1f}"
+                  f"{keyset_ms:>18.1f}  {'是' if same else '否'}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="文章列表分页基准测试")
+    parser.add_argument("--articles", type=int, default=1_000_000, help="写入的文章数")
+    parser.add_argument("--db", help="SQLite 数据库文件，已存在时直接复用")
+    parser.add_argument("--per-page", type=int, default=20)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 100, 1000, 10000, 40000])
+    parser.add_argument("--repeat", type=int, default=3, help="每项重复次数，取中位数")
+    main(parser.parse_args())
@@ -0,0 +1,33 @@
+"""GET /articles 的 locust 压测脚本
+
+用法（服务需已启动，令牌通过 /auth/login 获取）:
+    GENFLOW_LOAD_TOKEN=<access token> locust -f backend/tests/load/locustfile.py \
+        --host http://localhost:8080 --users 200 --spawn-rate 50 --headless -t 60s
+"""
+
+import os
+
+from locust import HttpUser, between, task
+
+
+API_PREFIX = os.environ.get("GENFLOW_API_PREFIX", "/api/v1")
+TOKEN = os.environ.get("GENFLOW_LOAD_TOKEN", "")
+
+
+class ArticleReader(HttpUser):
+    wait_time = between(0, 0.1)
+
+    def on_start(self):
+        self.client.headers["Authorization"] = f"Bearer {TOKEN}"
+
+    @task(4)
+    def list_articles(self):
+        self.client.get(f"{API_PREFIX}/articles", params={"per_page": 20}, name="GET /articles")
+
+    @task(1)
+    def list_published(self):
+        self.client.get(
+            f"{API_PREFIX}/articles",
+            params={"per_page": 20, "status": "published"},
+            name="GET /articles?status=published",
+        )
@@ -0,0 +1,129 @@
+import sys
+import uuid
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import fakeredis
+import fakeredis.aioredis
+import pytest
+from starlette.requests import Request
+
+PROJECT_ROOT = Path(__file__).parents[2]
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "backend" / "src"))
+
+# 模型中的关系按 backend.src.models.* 路径引用类，服务层按 models.* 导入，两个路径指向同一组模块
+import backend.src.models  # noqa: E402
+
+for _name in ["", ".base", ".user", ".article"]:
+    sys.modules[f"models{_name}"] = sys.modules[f"backend.src.models{_name}"]
+
+import utils.redis  # noqa: E402
+from core.exceptions import RequestException  # noqa: E402
+from services.article_cache import (  # noqa: E402
+    article_cache_key_builder,
+    filter_digest,
+    get_cached_count_sync,
+    invalidate_article_cache_sync,
+    set_cached_count_sync,
+)
+from services.article_service import decode_cursor, encode_cursor  # noqa: E402
+
+
+def make_request(query_string: str) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/api/v1/articles",
+        "query_string": query_string.encode(),
+        "headers": [],
+    })
+
+
+def list_articles():
+    pass
+
+
+def test_cursor_round_trip():
+    article = SimpleNamespace(created_at=datetime(2024, 5, 1, 12, 30, 15, 123456), id=uuid.uuid4())
+    cursor = encode_cursor(article)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (article.created_at, article.id)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "", encode_cursor(
+    SimpleNamespace(created_at=datetime(2024, 5, 1), id="不是UUID")
+)])
+def test_decode_invalid_cursor(cursor):
+    with pytest.raises(RequestException):
+        decode_cursor(cursor)
+
+
+def test_filter_digest_ignores_tag_order_and_empty_filters():
+    digest = filter_digest(status="published", tags=["python", "ai"], author_id=None)
+
+    assert digest == filter_digest(tags=["ai", "python"], status="published", created_after=None)
+    assert digest == filter_digest(status="published", tags=("ai", "python"), author_id=None)
+    assert digest != filter_digest(status="draft", tags=["python", "ai"])
+    assert filter_digest(tags=[]) == filter_digest()
+
+
+async def test_key_builder_ignores_session_and_user(monkeypatch):
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+    async def get_redis_client():
+        return redis
+
+    monkeypatch.setattr(utils.redis, "get_redis_client", get_redis_client)
+
+    first = await article_cache_key_builder(
+        list_articles, "genflow:articles",
+        request=make_request("page=1&tags=ai&tags=python"),
+        kwargs={"db": object(), "current_user": SimpleNamespace(id=uuid.uuid4())},
+    )
+    second = await article_cache_key_builder(
+        list_articles, "genflow:articles",
+        request=make_request("tags=python&page=1&tags=ai"),
+        kwargs={"db": object(), "current_user": SimpleNamespace(id=uuid.uuid4())},
+    )
+    other_page = await article_cache_key_builder(
+        list_articles, "genflow:articles", request=make_request("page=2&tags=ai&tags=python"),
+    )
+
+    assert first == second
+    assert first.startswith("genflow:articles:0:")
+    assert other_page != first
+
+    await redis.incr("articles:version")
+    after_write = await article_cache_key_builder(
+        list_articles, "genflow:articles", request=make_request("page=1&tags=ai&tags=python"),
+    )
+    assert after_write.startswith("genflow:articles:1:")
+
+
+def test_sync_count_cache_invalidated_by_version():
+    redis = fakeredis.FakeRedis()
+    digest = filter_digest(status="published")
+
+    version, cached = get_cached_count_sync(redis, digest)
+    assert (version, cached) == ("0", None)
+
+    set_cached_count_sync(redis, version, digest, 42, expire=60)
+    assert get_cached_count_sync(redis, digest) == ("0", 42)
+
+    invalidate_article_cache_sync(redis)
+    assert get_cached_count_sync(redis, digest) == ("1", None)
+
+
+def test_sync_helpers_tolerate_redis_errors():
+    class BrokenRedis:
+        def __getattr__(self, name):
+            def fail(*args, **kwargs):
+                raise ConnectionError("redis down")
+            return fail
+
+    assert get_cached_count_sync(BrokenRedis(), "digest") == (None, None)
+    set_cached_count_sync(BrokenRedis(), "0", "digest", 1, expire=60)
+    invalidate_article_cache_sync(BrokenRedis())
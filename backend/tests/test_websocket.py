@@ -0,0 +1,101 @@
+import asyncio
+
+from core.websocket import WebSocketManager
+
+
+class FakeWebSocket:
+    """记录发送内容的WebSocket，blocked 为 True 时发送会一直等待"""
+
+    def __init__(self, blocked: bool = False):
+        self.sent = []
+        self.closed = False
+        self.unblocked = asyncio.Event()
+        if not blocked:
+            self.unblocked.set()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message):
+        await self.unblocked.wait()
+        self.sent.append(message)
+
+    async def send_json(self, message):
+        await self.unblocked.wait()
+        self.sent.append(message)
+
+    async def close(self):
+        self.closed = True
+
+
+async def settle():
+    """让写任务把队列中的消息发完"""
+    await asyncio.sleep(0.05)
+
+
+def progress(task_id, value):
+    return {"type": "progress", "task_id": task_id, "progress": value}
+
+
+async def test_slow_consumer_progress_coalesced():
+    """慢客户端积压的进度消息只保留每个任务的最新一条，连接不会被断开"""
+    manager = WebSocketManager(queue_size=5, send_timeout=5)
+    slow = FakeWebSocket(blocked=True)
+    await manager.connect(slow, "slow")
+
+    for value in range(200):
+        await manager.broadcast(progress("t1", value))
+        await manager.broadcast(progress("t2", value))
+    await manager.broadcast("done")
+
+    assert manager.is_connected("slow")
+    assert manager.get_stats()["max_queue"] <= 5
+
+    slow.unblocked.set()
+    await settle()
+
+    assert slow.sent[-1] == "done"
+    latest = {m["task_id"]: m["progress"] for m in slow.sent if isinstance(m, dict)}
+    assert latest == {"t1": 199, "t2": 199}
+    assert len(slow.sent) <= 5
+    await manager.stop()
+
+
+async def test_stale_progress_dropped_before_disconnect():
+    """队列满时先丢弃最旧的进度消息，普通消息保持顺序"""
+    manager = WebSocketManager(queue_size=3, send_timeout=5)
+    slow = FakeWebSocket(blocked=True)
+    await manager.connect(slow, "slow")
+    await asyncio.sleep(0)
+
+    await manager.send_personal_message(progress("t1", 1), "slow")
+    for text in ["a", "b", "c"]:
+        await manager.send_personal_message(text, "slow")
+
+    assert manager.is_connected("slow")
+    assert manager.get_stats()["dropped"] == 1
+
+    slow.unblocked.set()
+    await settle()
+    assert slow.sent == ["a", "b", "c"]
+    await manager.stop()
+
+
+async def test_slow_consumer_does_not_block_others():
+    """积压普通消息的慢客户端被断开，其他客户端照常收到全部消息"""
+    manager = WebSocketManager(queue_size=5, send_timeout=5)
+    slow = FakeWebSocket(blocked=True)
+    fast = FakeWebSocket()
+    await manager.connect(slow, "slow")
+    await manager.connect(fast, "fast")
+
+    for i in range(20):
+        await manager.broadcast(f"message {i}")
+        await settle()
+    await settle()
+
+    assert not manager.is_connected("slow")
+    assert slow.closed
+    assert manager.is_connected("fast")
+    assert fast.sent == [f"message {i}" for i in range(20)]
+    await manager.stop()
@@ -3,17 +3,7 @@
 提供研究团队相关的组件导出，便于其他模块导入使用。
 """
 
-from core.agents.research_crew.research_tools import ResearchTools
-from core.agents.research_crew.research_agents import ResearchAgents
-from core.agents.research_crew.research_crew import ResearchCrew, ResearchWorkflowResult
-from core.models.research.research import BasicResearch, TopicResearch
-from core.agents.research_crew.research_adapter import ResearchTeamAdapter
-from core.agents.research_crew.research_protocol import (
-    ResearchRequest,
-    ResearchResponse,
-    FactVerificationRequest,
-    FactVerificationResponse
-)
+from core.lazy_imports import lazy_exports
 
 __all__ = [
     'ResearchTools',
@@ -28,3 +18,17 @@ __all__ = [
     'FactVerificationRequest',
     'FactVerificationResponse'
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "ResearchTools": ".research_tools",
+    "ResearchAgents": ".research_agents",
+    "ResearchCrew": ".research_crew",
+    "ResearchWorkflowResult": ".research_crew",
+    "BasicResearch": "core.models.research.research",
+    "TopicResearch": "core.models.research.research",
+    "ResearchTeamAdapter": ".research_adapter",
+    "ResearchRequest": ".research_protocol",
+    "ResearchResponse": ".research_protocol",
+    "FactVerificationRequest": ".research_protocol",
+    "FactVerificationResponse": ".research_protocol",
+})
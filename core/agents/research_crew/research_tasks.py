@@ -13,8 +13,10 @@ from core.agents.research_crew.research_util import (
     RESEARCH_DEPTH_LIGHT,
     RESEARCH_DEPTH_MEDIUM,
     RESEARCH_DEPTH_DEEP,
-    map_research_depth
+    map_research_depth,
+    fit_research_materials
 )
+from core.tools.nlp_tools.token_budget import record_prompt
 
 # 配置日志
 logger = logging.getLogger("research_tasks")
@@ -121,6 +123,7 @@ class ResearchTasks:
         if "background_researcher" not in self.agents:
             raise ValueError("未找到背景研究智能体")
 
+        record_prompt("research", "background_research", description, expected_outputs[depth_level])
         return Task(
             description=description,
             expected_output=expected_outputs[depth_level],
@@ -156,8 +159,9 @@ class ResearchTasks:
             "high": "5-7位"
         }
 
-        # 获取背景研究内容
+        # 获取背景研究内容，超出token预算时保留靠前的片段
         background_content = getattr(background_research, "raw_output", str(background_research))
+        background_content = fit_research_materials({"background": background_content})["background"]
 
         # 构建任务描述
         description = f"""
@@ -199,6 +203,7 @@ class ResearchTasks:
         if "expert_finder" not in self.agents:
             raise ValueError("未找到专家发现智能体")
 
+        record_prompt("research", "expert_finder", description, expected_outputs[depth_level])
         return Task(
             description=description,
             expected_output=expected_outputs[depth_level],
@@ -234,8 +239,9 @@ class ResearchTasks:
             "high": "进行全面深入的数据收集和分析，包括详细的统计分析和多维度比较"
         }
 
-        # 获取背景研究内容
+        # 获取背景研究内容，超出token预算时保留靠前的片段
         background_content = getattr(background_research, "raw_output", str(background_research))
+        background_content = fit_research_materials({"background": background_content})["background"]
 
         # 构建任务描述
         description = f"""
@@ -278,6 +284,7 @@ class ResearchTasks:
         if "data_analyst" not in self.agents:
             raise ValueError("未找到数据分析智能体")
 
+        record_prompt("research", "data_analysis", description, expected_outputs[depth_level])
         return Task(
             description=description,
             expected_output=expected_outputs[depth_level],
@@ -314,10 +321,18 @@ class ResearchTasks:
         content_type_info = self.current_research_config.get("content_type_info", "一般")
         content_type_display = content_type_info if isinstance(content_type_info, str) else "一般"
 
-        # 获取各个研究结果的内容
+        # 获取各个研究结果的内容，合计超出token预算时按片段优先级压缩
         background_content = getattr(background_research, "raw_output", str(background_research))
         expert_content = getattr(expert_insights, "raw_output", str(expert_insights)) if expert_insights else None
         data_content = getattr(data_analysis, "raw_output", str(data_analysis)) if data_analysis else None
+        fitted = fit_research_materials({
+            "background": background_content,
+            "expert": expert_content,
+            "data": data_content
+        })
+        background_content = fitted["background"]
+        expert_content = fitted["expert"] or None
+        data_content = fitted["data"] or None
 
         # 整合所有研究结果
         description_parts = [
@@ -382,6 +397,7 @@ class ResearchTasks:
         if "research_writer" not in self.agents:
             raise ValueError("未找到研究报告撰写智能体")
 
+        record_prompt("research", "research_report", description, expected_outputs[depth_level])
         return Task(
             description=description,
             expected_output=expected_outputs[depth_level],
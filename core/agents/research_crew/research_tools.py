@@ -4,17 +4,24 @@
 所有工具都按照CrewAI最佳实践组织，便于智能体调用和使用。
 """
 import logging
+import os
 from typing import List, Dict, Optional, Any
 from crewai.tools import tool
 
 from core.tools.content_collectors import ContentCollector
 from core.tools.search_tools import SearchAggregator
+from core.tools.search_tools.searcher import run_sync
 from core.tools.nlp_tools import NLPAggregator
+from core.tools.nlp_tools.token_budget import record_prompt
 from core.config import Config
+from core.agents.research_crew.research_util import fit_research_materials
 
 # 配置日志
 logger = logging.getLogger("research_tools")
 
+# 内容收集结果中每篇正文保留的字符数
+COLLECT_CONTENT_CHARS = int(os.environ.get("RESEARCH_COLLECT_CONTENT_CHARS", 2000))
+
 class ResearchTools:
     """研究团队工具集
 
@@ -42,18 +49,40 @@ class ResearchTools:
     def collect_content(self, query: str, source_type: str = "web", limit: int = 5) -> str:
         """收集与特定查询相关的内容
 
-        这个工具可以从各种来源收集信息，包括网页、新闻文章、学术文献等。
+        先搜索相关网页，再批量抓取并提取正文。
 
         Args:
             query: 搜索查询词
-            source_type: 内容来源类型，可选值包括 "web"、"news"、"academic"、"social"
+            source_type: 内容来源类型，可选值包括 "web"、"news"、"academic"、"social"，
+                目前只记录在日志中，搜索聚合器不区分来源
             limit: 返回结果数量限制
 
         Returns:
             str: 收集到的内容汇总
         """
         logger.info(f"执行内容收集: 查询={query}, 来源={source_type}, 数量={limit}")
-        return self.content_collector.execute(query=query, source_type=source_type, limit=limit)
+        # 搜索和抓取在同一个事件循环中完成
+        return run_sync(self._collect_content(query, limit))
+
+    async def _collect_content(self, query: str, limit: int) -> str:
+        """搜索后批量抓取搜索结果的正文，抓取失败的页面使用搜索摘要"""
+        result = await self.search_tools.execute(query, limit=limit)
+        if not result.success:
+            return self.search_tools.format_result(result)
+
+        hits = result.data.get("results", [])[:limit]
+        if not hits:
+            return "未找到相关内容"
+
+        items = await self.content_collector.get_contents([hit["url"] for hit in hits])
+        sections = []
+        for i, (hit, item) in enumerate(zip(hits, items), 1):
+            if item is not None and item.content:
+                title, content = item.title or hit["title"], item.content[:COLLECT_CONTENT_CHARS]
+            else:
+                title, content = hit["title"], hit.get("snippet") or ""
+            sections.append(f"{i}. {title} ({hit['url']})\n{content}")
+        return "\n\n".join(sections)
 
     @tool("专家观点搜索")
     def search_expert_opinions(self, topic: str, expert_count: int = 3) -> str:
@@ -69,11 +98,12 @@ class ResearchTools:
             str: 专家观点汇总
         """
         logger.info(f"搜索专家观点: 话题={topic}, 专家数量={expert_count}")
-        return self.search_tools.execute(
+        result = self.search_tools.execute_sync(
             query=f"{topic} expert opinions",
             filter="credible_sources",
             limit=expert_count
         )
+        return self.search_tools.format_result(result)
 
     @tool("数据分析工具")
     def analyze_data(self, content: str, analysis_type: str = "key_insights") -> str:
@@ -106,6 +136,14 @@ class ResearchTools:
             str: 生成的研究报告
         """
         logger.info("生成研究报告: 整合背景、专家观点和数据分析")
+        materials = fit_research_materials({
+            "background": background,
+            "expert_insights": expert_insights,
+            "data_analysis": data_analysis
+        })
+        background = materials["background"]
+        expert_insights = materials["expert_insights"]
+        data_analysis = materials["data_analysis"]
         report_prompt = f"""
         基于以下研究材料生成一份结构化研究报告:
 
@@ -126,6 +164,7 @@ class ResearchTools:
         5. 结论与建议
         6. 参考资料
         """
+        record_prompt("research", "generate_research_report", report_prompt)
         return self.nlp_tools.execute(text=report_prompt, action="generation")
 
     @tool("关键发现提取工具")
@@ -162,15 +201,14 @@ class ResearchTools:
             str: 验证结果
         """
         logger.info(f"执行事实验证: 验证 {len(fact_list)} 个事实陈述")
-        # 组合使用搜索和内容收集工具来验证事实
+        # 所有事实的验证查询一次性并发执行，而不是逐条等待
+        search_results = self.search_tools.search_many_sync(
+            [f"verify {fact}" for fact in fact_list],
+            limit=3
+        )
         results = []
-        for fact in fact_list:
-            search_result = self.search_tools.execute(
-                query=f"verify {fact}",
-                filter="reliable_sources",
-                limit=3
-            )
-            results.append(f"事实: {fact}\n验证结果: {search_result}\n")
+        for fact, search_result in zip(fact_list, search_results):
+            results.append(f"事实: {fact}\n验证结果: {self.search_tools.format_result(search_result)}\n")
 
         return "\n".join(results)
 
@@ -199,7 +237,8 @@ class ResearchTools:
         elif resource_type == "websites":
             query = f"{topic} reliable websites resources"
 
-        return self.search_tools.execute(query=query, limit=limit)
+        result = self.search_tools.execute_sync(query=query, limit=limit)
+        return self.search_tools.format_result(result)
 
     @tool("观点对比分析")
     def compare_perspectives(self, topic: str, perspective_a: str, perspective_b: str) -> str:
@@ -3,9 +3,11 @@
 提供研究团队使用的工具类和辅助函数，将工具逻辑与业务逻辑分离。
 """
 import logging
+import os
 from typing import Dict, List, Any, Optional, Union
 import re
 from core.models.research.research import BasicResearch
+from core.tools.nlp_tools.token_budget import get_tokenizer, pack_to_budget
 from core.agents.research_crew.research_result import ResearchWorkflowResult
 from core.models.content_manager import ContentManager
 
@@ -14,6 +16,9 @@ RESEARCH_DEPTH_LIGHT = "light"
 RESEARCH_DEPTH_MEDIUM = "medium"
 RESEARCH_DEPTH_DEEP = "deep"
 
+# 研究材料（背景、专家观点、数据分析）在提示词中的token预算
+RESEARCH_PROMPT_TOKEN_BUDGET = int(os.environ.get("RESEARCH_PROMPT_TOKEN_BUDGET", "12000"))
+
 # 默认研究配置
 DEFAULT_RESEARCH_CONFIG = {
     "content_type": "article",
@@ -111,6 +116,58 @@ def get_research_config(content_type=None):
     return default_config
 
 
+def fit_research_materials(
+    materials: Dict[str, Optional[str]],
+    token_budget: int = RESEARCH_PROMPT_TOKEN_BUDGET,
+    weights: Optional[Dict[str, float]] = None
+) -> Dict[str, str]:
+    """将研究材料压缩到token预算内
+
+    材料按空行切分为片段，片段优先级为 材料权重 / (1 + 片段序号)，
+    各材料靠前的片段（通常是概述和要点）优先保留，保留的片段保持原顺序。
+    超过预算四分之一的单个片段会先被截断。未超出预算时原样返回。
+
+    Args:
+        materials: 材料名称到内容的映射
+        token_budget: token预算
+        weights: 材料权重，默认均为1
+
+    Returns:
+        Dict[str, str]: 压缩后的材料
+    """
+    tokenizer = get_tokenizer()
+    materials = {name: text or "" for name, text in materials.items()}
+    total = tokenizer.count_many(materials.values())
+    if total <= token_budget:
+        return materials
+
+    weights = weights or {}
+    max_snippet = max(1, token_budget // 4)
+    snippets = []
+    for name, text in materials.items():
+        paragraphs = [p.strip() for p in re.split(r"\n\s*\n", text) if p.strip()]
+        for position, paragraph in enumerate(paragraphs):
+            if tokenizer.count(paragraph) > max_snippet:
+                paragraph = tokenizer.truncate(paragraph, max_snippet)
+            snippets.append((name, position, paragraph))
+
+    pack = pack_to_budget(
+        snippets,
+        token_budget,
+        text=lambda snippet: snippet[2],
+        priority=lambda snippet: weights.get(snippet[0], 1.0) / (1 + snippet[1]),
+        tokenizer=tokenizer,
+        item_overhead=1,
+    )
+    logger.info(f"研究材料 {total} tokens 超过预算 {token_budget}，保留 {len(pack.items)}/{len(snippets)} 个片段，"
+                f"共 {pack.tokens} tokens")
+
+    fitted = {name: [] for name in materials}
+    for name, _, paragraph in pack.items:
+        fitted[name].append(paragraph)
+    return {name: "\n\n".join(parts) for name, parts in fitted.items()}
+
+
 def extract_experts_from_insights(expert_insights_text: str) -> List:
     """从专家见解文本中提取专家信息
 
@@ -2,6 +2,7 @@ from core.agents.research_crew.research_protocol import FactVerificationRequest,
 from core.agents.research_crew.research_result import ResearchWorkflowResult
 from core.models.feedback import ResearchFeedback
 from core.models.research.research import BasicResearch
+from core.tools.nlp_tools.token_budget import record_prompt
 
 import logging
 
@@ -51,6 +52,7 @@ async def verify_facts(
                     expected_output="验证结果，包含陈述评估、验证状态(真/假/不确定)、置信度和来源",
                     agent=self.agents.get("fact_checker", self.agents["background_researcher"])
                 )
+                record_prompt("research", "verify_fact", verify_task.description, verify_task.expected_output)
 
                 # 执行验证任务
                 verify_crew = Crew(
@@ -4,17 +4,24 @@
 提供基于CrewAI的文章审核功能，包括原创性检测、AI内容识别、敏感内容审核和合规性评估。
 """
 
-from .review_crew import ReviewCrew, ReviewResult
-from .review_agents import ReviewAgents
-from .review_tools import ReviewTools
-from .get_human_feedback import get_human_feedback
-from .review_adapter import ReviewTeamAdapter
+from core.lazy_imports import lazy_exports
 
 __all__ = [
     'ReviewCrew',
     'ReviewResult',
     'ReviewAgents',
     'ReviewTools',
+    'ReviewEngine',
     'get_human_feedback',
     'ReviewTeamAdapter',
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "ReviewCrew": ".review_crew",
+    "ReviewResult": ".review_crew",
+    "ReviewAgents": ".review_agents",
+    "ReviewTools": ".review_tools",
+    "ReviewEngine": ".review_engine",
+    "get_human_feedback": ".get_human_feedback",
+    "ReviewTeamAdapter": ".review_adapter",
+})
@@ -5,6 +5,7 @@
 """
 import os
 import json
+import asyncio
 import logging
 import traceback
 from typing import List, Dict, Optional, Any
@@ -16,7 +17,9 @@ from crewai.agent import Agent
 
 from core.models.article.article import Article
 from core.models.platform.platform import Platform
+from core.tools.nlp_tools.token_budget import record_prompt
 from .review_agents import ReviewAgents
+from .review_engine import ReviewEngine, rules_from_platform
 
 # 配置日志
 logger = logging.getLogger(__name__)
@@ -34,7 +37,8 @@ class ReviewResult:
         ai_detection_report: Optional[Dict] = None,
         content_review_report: Optional[Dict] = None,
         quality_assessment: Optional[Dict] = None,
-        final_review: Optional[Dict] = None
+        final_review: Optional[Dict] = None,
+        metrics: Optional[Dict] = None
     ):
         """初始化审核结果对象
 
@@ -45,6 +49,7 @@ class ReviewResult:
             content_review_report: 内容审核报告结果
             quality_assessment: 质量评估结果
             final_review: 终审结果
+            metrics: 审核耗时和LLM调用统计
         """
         self.article = article
         self.plagiarism_report = plagiarism_report or {}
@@ -52,6 +57,7 @@ class ReviewResult:
         self.content_review_report = content_review_report or {}
         self.quality_assessment = quality_assessment or {}
         self.final_review = final_review or {}
+        self.metrics = metrics or {}
         self.created_at = datetime.now()
         self.human_feedback: Optional[Dict] = None
 
@@ -69,6 +75,7 @@ class ReviewResult:
             "content_review_report": self.content_review_report,
             "quality_assessment": self.quality_assessment,
             "final_review": self.final_review,
+            "metrics": self.metrics,
             "created_at": self.created_at.isoformat(),
             "human_feedback": self.human_feedback
         }
@@ -104,14 +111,17 @@ class ReviewCrew:
     采用CrewAI框架实现智能体协作，支持异步执行和人工反馈收集。
     """
 
-    def __init__(self, verbose: bool = True):
+    def __init__(self, verbose: bool = True, use_review_engine: bool = True):
         """初始化审核团队
 
         Args:
             verbose: 是否启用详细日志输出
+            use_review_engine: 是否先并发执行本地检查、再用一次LLM终审；
+                为False时使用五个智能体顺序执行的完整工作流
         """
         logger.info("初始化审核团队")
         self.verbose = verbose
+        self.use_review_engine = use_review_engine
 
         # 智能体将在执行时初始化
         self.agents = None
@@ -123,11 +133,80 @@ class ReviewCrew:
 
         logger.info("审核团队初始化完成")
 
-    async def review_article(self, article: Article, platform: Platform) -> ReviewResult:
+    async def review_article(self, article: Article, platform: Platform,
+                             compare_texts: Optional[List[str]] = None) -> ReviewResult:
         """实现文章审核流程
 
-        组织智能体团队，执行从原创性检测到最终审核的完整文章审核流程。
-        每个智能体负责特定的审核任务，最终结果由终审智能体整合。
+        默认先由审核引擎并发执行原创性、敏感词、合规和AI特征等本地检查，
+        再把结构化结果交给终审智能体做一次LLM调用；本地检查已判定拒绝时不调用LLM。
+
+        Args:
+            article: 文章信息对象，包含标题和内容
+            platform: 目标发布平台，决定了内容规范和要求
+            compare_texts: 查重对比文本
+
+        Returns:
+            ReviewResult: 完整的审核过程结果
+        """
+        if self.use_review_engine:
+            return await self._review_with_engine(article, platform, compare_texts)
+        return await self._review_with_crew(article, platform)
+
+    async def _review_with_engine(self, article: Article, platform: Platform,
+                                  compare_texts: Optional[List[str]] = None) -> ReviewResult:
+        """本地检查 + 单次LLM终审
+
+        Args:
+            article: 文章对象
+            platform: 目标平台
+            compare_texts: 查重对比文本
+
+        Returns:
+            ReviewResult: 审核结果
+        """
+        logger.info(f"开始文章审核(审核引擎): {article.title}, 目标平台: {platform.name}")
+
+        async def final_reviewer(prompt: str) -> Dict:
+            if self.agents is None:
+                self.agents = ReviewAgents(platform)
+            self.final_reviewer = self.agents.create_final_reviewer(self.verbose)
+            task = Task(
+                description=prompt,
+                expected_output="包含最终审核决定的JSON格式报告",
+                agent=self.final_reviewer
+            )
+            record_prompt("review", "final_review", task.description, task.expected_output)
+            crew = Crew(agents=[self.final_reviewer], tasks=[task], process=Process.sequential, verbose=self.verbose)
+            result = await asyncio.to_thread(crew.kickoff)
+            return self._parse_json_result(str(result))
+
+        try:
+            engine = ReviewEngine(rules_from_platform(platform), final_reviewer=final_reviewer)
+            review = await engine.review(
+                self._get_article_text(article),
+                title=article.title,
+                tags=getattr(article, "tags", None),
+                compare_texts=compare_texts
+            )
+        except Exception as e:
+            logger.error(f"审核过程发生错误: {str(e)}")
+            logger.debug(traceback.format_exc())
+            return ReviewResult(article=article)
+
+        checks = review["checks"]
+        final_review = review["final_review"]
+        return ReviewResult(
+            article=article,
+            plagiarism_report=checks["plagiarism"],
+            ai_detection_report=checks["ai_detection"],
+            content_review_report={**checks["sensitive"], **checks["compliance"]},
+            quality_assessment={"quality_score": final_review["quality_score"]} if "quality_score" in final_review else {},
+            final_review=final_review,
+            metrics=review["metrics"]
+        )
+
+    async def _review_with_crew(self, article: Article, platform: Platform) -> ReviewResult:
+        """五个智能体顺序执行的完整审核工作流
 
         Args:
             article: 文章信息对象，包含标题和内容
@@ -313,13 +392,17 @@ class ReviewCrew:
             ]
         )
 
-        return [
-            plagiarism_task,
-            ai_detection_task,
-            content_review_task,
-            quality_assessment_task,
-            final_review_task
-        ]
+        tasks = {
+            "plagiarism": plagiarism_task,
+            "ai_detection": ai_detection_task,
+            "content_review": content_review_task,
+            "quality_assessment": quality_assessment_task,
+            "final_review": final_review_task
+        }
+        for name, task in tasks.items():
+            record_prompt("review", name, task.description, task.expected_output)
+
+        return list(tasks.values())
 
     def _organize_review_results(self, article: Article, result: Dict) -> ReviewResult:
         """整理审核结果
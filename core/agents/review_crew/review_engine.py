@@ -0,0 +1,459 @@
+"""审核引擎模块
+
+在LLM审核之前并发执行不需要LLM的确定性检查（原创性、敏感词、长度/标签合规、
+AI文本特征），再把结构化检查结果交给一次终审LLM调用。本地检查已经可以判定
+"拒绝"时直接返回，不再调用LLM。
+
+检查函数都是模块级纯函数，可以放进线程池或进程池执行。
+"""
+import asyncio
+import functools
+import json
+import logging
+import os
+import re
+import time
+from collections import Counter
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from core.models.article.text_metrics import count_words
+
+# 配置日志
+logger = logging.getLogger(__name__)
+
+# 本地检查使用的工作线程数
+REVIEW_CHECK_WORKERS = int(os.environ.get("REVIEW_CHECK_WORKERS", 4))
+
+# 原有审核流程中调用LLM的任务数（查重、AI检测、内容审核、质量评估、终审）
+CREW_LLM_TASKS = 5
+
+# 判定阈值，与 ReviewTools.generate_review_report 保持一致
+REJECT_PLAGIARISM_RATE = 0.3
+REVISION_PLAGIARISM_RATE = 0.15
+REVISION_AI_SCORE = 0.8
+
+# 原创性检测的字符shingle长度
+SHINGLE_SIZE = 8
+
+SENSITIVE_WORDS_FILE = Path(__file__).resolve().parents[2] / "tools" / "review_tools" / "data" / "sensitive_words.txt"
+
+_CJK = re.compile(r"[一-鿿]")
+_NON_CJK_WORD = re.compile(r"[A-Za-z0-9_]+")
+_SENTENCE_END = re.compile(r"(?<=[。！？!?.])\s*")
+_AI_PATTERNS = [
+    re.compile(r"让我们|接下来|首先|其次|最后|总的来说|综上所述"),
+    re.compile(r"根据(?:上述|以上)(?:分析|内容|结果)"),
+    re.compile(r"值得注意的是|需要指出的是|不难发现"),
+    re.compile(r"通过(?:上述|以上)(?:分析|讨论|研究)"),
+    re.compile(r"(?:本文|我们)(?:将|已经)(?:分析|讨论|研究)"),
+]
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """获取本地检查共享的线程池
+
+    Returns:
+        ThreadPoolExecutor: 线程池
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=REVIEW_CHECK_WORKERS, thread_name_prefix="review-check")
+    return _executor
+
+
+@functools.lru_cache(maxsize=1)
+def load_sensitive_words() -> frozenset:
+    """加载默认敏感词表
+
+    Returns:
+        frozenset: 敏感词集合
+    """
+    try:
+        with open(SENSITIVE_WORDS_FILE, "r", encoding="utf-8") as f:
+            return frozenset(line.strip() for line in f if line.strip())
+    except FileNotFoundError:
+        logger.warning(f"敏感词表不存在: {SENSITIVE_WORDS_FILE}")
+        return frozenset()
+
+
+def rules_from_platform(platform: Any) -> Dict[str, Any]:
+    """从平台对象提取审核规则
+
+    兼容带 ``content_rules`` 的平台和 ``Platform`` 模型的长度/禁用词字段。
+
+    Args:
+        platform: 平台对象，可以为None
+
+    Returns:
+        Dict[str, Any]: 包含 min_words、max_words、allowed_tags、sensitive_words 的规则
+    """
+    if platform is None:
+        return {}
+    rules = getattr(platform, "content_rules", None)
+    if isinstance(rules, dict):
+        return dict(rules)
+    return {
+        "min_words": getattr(platform, "min_length", 0),
+        "max_words": getattr(platform, "max_length", 100000),
+        "sensitive_words": list(getattr(platform, "forbidden_words", []) or []),
+    }
+
+
+def check_plagiarism(text: str, compare_texts: Optional[List[str]] = None,
+                     shingle_size: int = SHINGLE_SIZE) -> Dict[str, Any]:
+    """原创性检测：统计文章的字符shingle在对比文本中出现的比例
+
+    Args:
+        text: 文章内容
+        compare_texts: 对比文本
+        shingle_size: shingle长度
+
+    Returns:
+        Dict[str, Any]: 查重率、重复段落数和最相似的对比文本序号
+    """
+    normalized = re.sub(r"\s+", "", text)
+    shingles = {normalized[i:i + shingle_size] for i in range(max(len(normalized) - shingle_size + 1, 0))}
+
+    # 文章内部重复的段落
+    paragraphs = [p.strip() for p in text.split("\n") if len(p.strip()) >= 20]
+    duplicate_paragraphs = sum(count - 1 for count in Counter(paragraphs).values() if count > 1)
+
+    plagiarism_rate = 0.0
+    most_similar = None
+    if shingles and compare_texts:
+        for i, compare_text in enumerate(compare_texts):
+            other = re.sub(r"\s+", "", compare_text)
+            other_shingles = {other[j:j + shingle_size] for j in range(max(len(other) - shingle_size + 1, 0))}
+            rate = len(shingles & other_shingles) / len(shingles)
+            if rate > plagiarism_rate:
+                plagiarism_rate, most_similar = rate, i
+
+    return {
+        "plagiarism_rate": round(plagiarism_rate, 4),
+        "duplicate_paragraphs": duplicate_paragraphs,
+        "most_similar_source": most_similar,
+        "is_original": plagiarism_rate < REVISION_PLAGIARISM_RATE,
+    }
+
+
+def check_sensitive_words(text: str, words: Iterable[str]) -> Dict[str, Any]:
+    """敏感词检测
+
+    Args:
+        text: 文章内容
+        words: 敏感词
+
+    Returns:
+        Dict[str, Any]: 命中的敏感词及位置
+    """
+    found = []
+    for word in words:
+        if not word:
+            continue
+        start = text.find(word)
+        while start != -1:
+            found.append((word, start))
+            start = text.find(word, start + len(word))
+    found.sort(key=lambda x: x[1])
+    return {"sensitive_words": found, "sensitive_count": len(found)}
+
+
+def check_compliance(text: str, rules: Dict[str, Any], tags: Optional[List[str]] = None) -> Dict[str, Any]:
+    """长度和标签合规检查
+
+    Args:
+        text: 文章内容
+        rules: 平台规则
+        tags: 文章标签
+
+    Returns:
+        Dict[str, Any]: 长度合规和标签合规结果
+    """
+    min_words = rules.get("min_words", 0)
+    max_words = rules.get("max_words", 100000)
+    word_count = count_words(text)
+    allowed_tags = rules.get("allowed_tags", [])
+    article_tags = list(tags or [])
+    invalid_tags = [tag for tag in article_tags if allowed_tags and tag not in allowed_tags]
+
+    return {
+        "length_compliance": {
+            "word_count": word_count,
+            "min_required": min_words,
+            "max_allowed": max_words,
+            "is_compliant": min_words <= word_count <= max_words,
+        },
+        "tags_compliance": {
+            "article_tags": article_tags,
+            "allowed_tags": allowed_tags,
+            "invalid_tags": invalid_tags,
+            "is_compliant": not invalid_tags,
+        },
+    }
+
+
+def detect_ai_features(text: str) -> Dict[str, Any]:
+    """基于统计特征的AI文本检测（句长方差、词汇重复度、句首多样性、常见套话）
+
+    Args:
+        text: 文章内容
+
+    Returns:
+        Dict[str, Any]: AI得分和各项特征
+    """
+    sentences = [s for s in _SENTENCE_END.split(text) if s.strip()]
+    if not sentences:
+        return {"ai_score": 0.0, "is_likely_ai": False, "features": {}}
+
+    lengths = [len(s) for s in sentences]
+    avg_len = sum(lengths) / len(lengths)
+    variance = sum((n - avg_len) ** 2 for n in lengths) / len(lengths)
+
+    tokens = _CJK.findall(text) + [w.lower() for w in _NON_CJK_WORD.findall(text)]
+    unique_ratio = len(set(tokens)) / len(tokens) if tokens else 1.0
+    start_ratio = len({s.strip()[:2] for s in sentences}) / len(sentences)
+    pattern_count = sum(1 for pattern in _AI_PATTERNS if pattern.search(text))
+
+    score = 0.0
+    if variance < 100:
+        score += 0.2
+    if unique_ratio < 0.4:
+        score += 0.2
+    if start_ratio < 0.5:
+        score += 0.2
+    if pattern_count >= 2:
+        score += 0.2
+
+    return {
+        "ai_score": round(min(1.0, score), 2),
+        "is_likely_ai": score > 0.5,
+        "features": {
+            "sentence_length_variance": round(variance, 2),
+            "unique_token_ratio": round(unique_ratio, 4),
+            "sentence_start_ratio": round(start_ratio, 4),
+            "ai_pattern_count": pattern_count,
+        },
+    }
+
+
+def decide_locally(checks: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """根据本地检查结果给出初步判定，规则与 ReviewTools.generate_review_report 一致
+
+    Args:
+        checks: 本地检查结果
+
+    Returns:
+        Dict[str, Any]: 初步审核报告
+    """
+    plagiarism_rate = checks["plagiarism"]["plagiarism_rate"]
+    sensitive_count = checks["sensitive"]["sensitive_count"]
+    ai_score = checks["ai_detection"]["ai_score"]
+    compliance = checks["compliance"]
+
+    suggestions = []
+    if plagiarism_rate > REVISION_PLAGIARISM_RATE:
+        suggestions.append({
+            "aspect": "原创性",
+            "issue": f"查重率达到{plagiarism_rate * 100:.1f}%，超过建议水平",
+            "suggestion": "增加原创内容，正确引用外部资料，避免直接复制",
+        })
+    if sensitive_count > 0:
+        words = sorted({word for word, _ in checks["sensitive"]["sensitive_words"]})
+        suggestions.append({
+            "aspect": "敏感内容",
+            "issue": f"发现{sensitive_count}处敏感词: {'、'.join(words)}",
+            "suggestion": "修改或删除敏感内容，确保符合平台规范和法律要求",
+        })
+    if not compliance["length_compliance"]["is_compliant"]:
+        length = compliance["length_compliance"]
+        suggestions.append({
+            "aspect": "篇幅",
+            "issue": f"字数{length['word_count']}不在{length['min_required']}-{length['max_allowed']}范围内",
+            "suggestion": "调整篇幅以符合平台要求",
+        })
+    if not compliance["tags_compliance"]["is_compliant"]:
+        suggestions.append({
+            "aspect": "标签",
+            "issue": f"平台不支持的标签: {'、'.join(compliance['tags_compliance']['invalid_tags'])}",
+            "suggestion": "使用平台允许的标签",
+        })
+
+    if plagiarism_rate > REJECT_PLAGIARISM_RATE or sensitive_count > 0:
+        approval_status = "rejected"
+    elif (plagiarism_rate > REVISION_PLAGIARISM_RATE or ai_score > REVISION_AI_SCORE
+          or not compliance["length_compliance"]["is_compliant"]
+          or not compliance["tags_compliance"]["is_compliant"]):
+        approval_status = "needs_revision"
+    else:
+        approval_status = "approved"
+
+    if plagiarism_rate > REJECT_PLAGIARISM_RATE or sensitive_count > 5:
+        risk_level = "high"
+    elif plagiarism_rate > REVISION_PLAGIARISM_RATE or ai_score > REVISION_AI_SCORE or sensitive_count > 0:
+        risk_level = "medium"
+    else:
+        risk_level = "low"
+
+    return {
+        "approval_status": approval_status,
+        "risk_level": risk_level,
+        "plagiarism_rate": plagiarism_rate,
+        "ai_score": ai_score,
+        "sensitive_content_count": sensitive_count,
+        "improvement_suggestions": suggestions,
+        "revision_required": approval_status != "approved",
+    }
+
+
+def build_final_review_prompt(title: str, checks: Dict[str, Dict[str, Any]],
+                              preliminary: Dict[str, Any], excerpt: str) -> str:
+    """构造终审提示词
+
+    Args:
+        title: 文章标题
+        checks: 本地检查结果
+        preliminary: 本地初步判定
+        excerpt: 文章节选
+
+    Returns:
+        str: 提示词
+    """
+    return f"""对文章"{title}"进行最终审核决策。
+
+以下是确定性检查的结构化结果（原创性、敏感词、长度/标签合规、AI文本特征），请直接采信，不要重复检测：
+{json.dumps(checks, ensure_ascii=False, indent=2)}
+
+本地初步判定：
+{json.dumps(preliminary, ensure_ascii=False, indent=2)}
+
+文章节选：
+"{excerpt}"
+
+任务要求:
+1. 结合检查结果评估内容质量、价值导向和表述是否适当
+2. 做出最终的审核决定（approved、needs_revision 或 rejected）
+3. 提供具体的修改建议（如需要）
+
+输出格式:
+以JSON格式提供最终审核决定，包含 approval_status、risk_level、quality_score、improvement_suggestions。"""
+
+
+class ReviewEngine:
+    """审核引擎
+
+    并发执行本地确定性检查，再用一次LLM调用做终审。
+    """
+
+    def __init__(self,
+                 rules: Optional[Dict[str, Any]] = None,
+                 final_reviewer: Optional[Callable[[str], Awaitable[Dict[str, Any]]]] = None,
+                 executor: Optional[Executor] = None,
+                 skip_llm_on_reject: bool = True,
+                 sensitive_words: Optional[Iterable[str]] = None):
+        """初始化审核引擎
+
+        Args:
+            rules: 平台审核规则，见 rules_from_platform
+            final_reviewer: 终审函数，参数为提示词，返回解析后的审核结果；为None时只做本地检查
+            executor: 执行本地检查的线程池或进程池，默认使用共享线程池
+            skip_llm_on_reject: 本地检查判定拒绝时是否跳过LLM
+            sensitive_words: 敏感词，默认使用内置词表加平台敏感词
+        """
+        self.rules = rules or {}
+        self.final_reviewer = final_reviewer
+        self.executor = executor
+        self.skip_llm_on_reject = skip_llm_on_reject
+        base_words = load_sensitive_words() if sensitive_words is None else frozenset(sensitive_words)
+        self.sensitive_words = sorted(base_words | set(self.rules.get("sensitive_words", [])))
+
+    async def run_local_checks(self, text: str, tags: Optional[List[str]] = None,
+                               compare_texts: Optional[List[str]] = None) -> Dict[str, Any]:
+        """并发执行所有本地检查
+
+        Args:
+            text: 文章内容
+            tags: 文章标签
+            compare_texts: 查重对比文本
+
+        Returns:
+            Dict[str, Any]: {"checks": 各项检查结果, "timings": 各项耗时}
+        """
+        loop = asyncio.get_running_loop()
+        executor = self.executor or get_executor()
+        jobs = {
+            "plagiarism": functools.partial(check_plagiarism, text, compare_texts),
+            "sensitive": functools.partial(check_sensitive_words, text, self.sensitive_words),
+            "compliance": functools.partial(check_compliance, text, self.rules, tags),
+            "ai_detection": functools.partial(detect_ai_features, text),
+        }
+
+        async def run(name: str, job: Callable[[], Dict[str, Any]]):
+            start = time.perf_counter()
+            result = await loop.run_in_executor(executor, job)
+            return name, result, time.perf_counter() - start
+
+        results = await asyncio.gather(*(run(name, job) for name, job in jobs.items()))
+        return {
+            "checks": {name: result for name, result, _ in results},
+            "timings": {name: round(elapsed, 4) for name, _, elapsed in results},
+        }
+
+    async def review(self, text: str, title: str = "", tags: Optional[List[str]] = None,
+                     compare_texts: Optional[List[str]] = None) -> Dict[str, Any]:
+        """审核文章
+
+        Args:
+            text: 文章内容
+            title: 文章标题
+            tags: 文章标签
+            compare_texts: 查重对比文本
+
+        Returns:
+            Dict[str, Any]: 本地检查结果、终审结果和耗时/LLM调用统计
+        """
+        start = time.perf_counter()
+        local = await self.run_local_checks(text, tags, compare_texts)
+        local_time = time.perf_counter() - start
+        checks = local["checks"]
+        preliminary = decide_locally(checks)
+
+        final_review = dict(preliminary)
+        decided_by = "local_checks"
+        llm_calls = 0
+        llm_time = 0.0
+
+        if self.final_reviewer is None:
+            logger.info("未配置终审LLM，使用本地检查结果")
+        elif preliminary["approval_status"] == "rejected" and self.skip_llm_on_reject:
+            logger.info(f"本地检查判定拒绝，跳过LLM终审: {title}")
+        else:
+            llm_start = time.perf_counter()
+            llm_calls = 1
+            try:
+                prompt = build_final_review_prompt(title, checks, preliminary, text[:500])
+                llm_review = await self.final_reviewer(prompt) or {}
+                final_review.update({k: v for k, v in llm_review.items() if v is not None})
+                decided_by = "llm"
+            except Exception as e:
+                logger.error(f"LLM终审失败，使用本地检查结果: {str(e)}")
+            llm_time = time.perf_counter() - llm_start
+
+        final_review["decided_by"] = decided_by
+        final_review["revision_required"] = final_review.get("approval_status") != "approved"
+
+        metrics = {
+            "local_time": round(local_time, 4),
+            "check_times": local["timings"],
+            "llm_time": round(llm_time, 4),
+            "total_time": round(time.perf_counter() - start, 4),
+            "llm_calls": llm_calls,
+            "llm_calls_saved": CREW_LLM_TASKS - llm_calls,
+        }
+        logger.info(f"审核完成: {final_review.get('approval_status')}，由{decided_by}判定，"
+                    f"耗时 {metrics['total_time']:.3f}s，节省LLM调用 {metrics['llm_calls_saved']} 次")
+
+        return {"checks": checks, "preliminary": preliminary, "final_review": final_review, "metrics": metrics}
@@ -14,6 +14,7 @@ from core.tools.review_tools.reviewer import (
     SensitiveWordChecker
 )
 from core.models.platform.platform import Platform
+from core.models.article.text_metrics import count_words
 
 # 配置日志
 logger = logging.getLogger(__name__)
@@ -173,7 +174,7 @@ class ReviewTools:
         # 2. 内容长度检查
         min_words = rules.get("min_words", 0)
         max_words = rules.get("max_words", 10000)
-        word_count = len(text.split())
+        word_count = count_words(text)
         length_compliance = {
             "word_count": word_count,
             "min_required": min_words,
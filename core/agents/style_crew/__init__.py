@@ -4,7 +4,12 @@
 对内容进行改写和适配。支持直接从文本改写风格，不依赖于话题和大纲。
 """
 
-from .style_crew import StyleCrew, StyleWorkflowResult
-from .style_adapter import StyleTeamAdapter
+from core.lazy_imports import lazy_exports
 
 __all__ = ['StyleCrew', 'StyleWorkflowResult', 'StyleTeamAdapter']
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "StyleCrew": ".style_crew",
+    "StyleWorkflowResult": ".style_crew",
+    "StyleTeamAdapter": ".style_adapter",
+})
@@ -3,8 +3,13 @@
 该模块实现了风格化团队的核心逻辑，负责将内容按照不同风格规范进行改写和适配。
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import Dict, List, Optional, Any, Union
+import os
+import re
+import time
+from typing import Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass, field
 from datetime import datetime
 import uuid
@@ -13,10 +18,169 @@ import json
 from crewai import Crew, Agent, Task, Process
 from core.models.article.basic_article import BasicArticle
 from core.tools.style_tools.adapter import StyleAdapter
+from core.tools.nlp_tools.token_budget import record_prompt
 from .style_agents import PlatformAnalystAgent, StyleExpertAgent, ContentAdapterAgent, QualityCheckerAgent
 
 logger = logging.getLogger(__name__)
 
+# 平台分析结果缓存时间（秒）
+PLATFORM_ANALYSIS_TTL = float(os.environ.get("STYLE_PLATFORM_ANALYSIS_TTL", 3600))
+
+# 超过该字数的文章按章节分块并行改写
+ADAPT_CHUNK_CHARS = int(os.environ.get("STYLE_ADAPT_CHUNK_CHARS", 3000))
+
+# 并行改写的分块数上限
+ADAPT_CONCURRENCY = int(os.environ.get("STYLE_ADAPT_CONCURRENCY", 4))
+
+
+class PlatformAnalysisCache:
+    """平台分析结果缓存
+
+    按 (平台ID, 规则版本) 缓存，过期后重新分析；同一平台同时只分析一次，
+    并发请求等待同一个分析结果。
+    """
+
+    def __init__(self, ttl: float = PLATFORM_ANALYSIS_TTL):
+        """初始化缓存
+
+        Args:
+            ttl: 缓存时间（秒）
+        """
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, str], Tuple[float, Dict]] = {}
+        self._pending: Dict[Tuple[str, str], asyncio.Future] = {}
+        # clear() 时加一，清空前开始的分析完成后不再写入缓存
+        self._generation = 0
+        self.stats = {"hits": 0, "misses": 0}
+
+    @staticmethod
+    def make_key(platform_info: Dict[str, Any]) -> Tuple[str, str]:
+        """计算缓存键
+
+        规则版本优先使用 platform_info["rules_version"]，否则取平台描述、受众和规则的摘要，
+        平台规则变化后自动失效。
+
+        Args:
+            platform_info: 平台信息
+
+        Returns:
+            Tuple[str, str]: (平台ID, 规则版本)
+        """
+        platform_id = str(platform_info.get("platform_id") or platform_info.get("platform_name") or "")
+        version = platform_info.get("rules_version")
+        if version is None:
+            payload = json.dumps({
+                "name": platform_info.get("platform_name"),
+                "description": platform_info.get("platform_description"),
+                "audience": platform_info.get("target_audience"),
+                "rules": platform_info.get("style_rules", {}),
+            }, sort_keys=True, ensure_ascii=False, default=str)
+            version = hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+        return platform_id, str(version)
+
+    def get(self, platform_info: Dict[str, Any]) -> Optional[Dict]:
+        """获取未过期的分析结果
+
+        Args:
+            platform_info: 平台信息
+
+        Returns:
+            Optional[Dict]: 分析结果，未命中返回None
+        """
+        key = self.make_key(platform_info)
+        entry = self._entries.get(key)
+        if entry and time.monotonic() - entry[0] < self.ttl:
+            self.stats["hits"] += 1
+            return entry[1]
+        self._entries.pop(key, None)
+        return None
+
+    async def get_or_create(self, platform_info: Dict[str, Any], factory) -> Dict:
+        """获取分析结果，未命中时调用factory分析并缓存
+
+        Args:
+            platform_info: 平台信息
+            factory: 无参协程函数，返回分析结果
+
+        Returns:
+            Dict: 分析结果
+        """
+        cached = self.get(platform_info)
+        if cached is not None:
+            return cached
+
+        key = self.make_key(platform_info)
+        pending = self._pending.get(key)
+        if pending is not None:
+            self.stats["hits"] += 1
+            return await asyncio.shield(pending)
+
+        self.stats["misses"] += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        generation = self._generation
+        try:
+            analysis = await factory()
+            if generation == self._generation:
+                self._entries[key] = (time.monotonic(), analysis)
+            future.set_result(analysis)
+            return analysis
+        except BaseException as e:
+            future.set_exception(e)
+            # 没有其他等待者时避免"exception was never retrieved"警告
+            future.exception()
+            raise
+        finally:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+
+    def clear(self) -> None:
+        """清空缓存，进行中的分析结果不再共享给之后的请求，也不写入缓存"""
+        self._generation += 1
+        self._entries.clear()
+        self._pending.clear()
+
+
+# 所有StyleCrew实例共享的平台分析缓存
+platform_analysis_cache = PlatformAnalysisCache()
+
+
+def split_into_chunks(content: str, max_chars: int = ADAPT_CHUNK_CHARS) -> List[str]:
+    """按章节把长文分块，章节过长时再按段落切分
+
+    Args:
+        content: 文章内容
+        max_chars: 每块最大字数
+
+    Returns:
+        List[str]: 分块列表，拼接后与原文一致（除分隔空行外）
+    """
+    sections = [s for s in re.split(r"\n(?=#{1,6}\s)", content) if s.strip()]
+    chunks: List[str] = []
+    for section in sections:
+        if len(section) <= max_chars:
+            chunks.append(section)
+            continue
+        current = ""
+        for paragraph in re.split(r"\n\s*\n", section):
+            if current and len(current) + len(paragraph) + 2 > max_chars:
+                chunks.append(current)
+                current = paragraph
+            else:
+                current = f"{current}\n\n{paragraph}" if current else paragraph
+        if current:
+            chunks.append(current)
+
+    # 合并过短的相邻分块，减少LLM调用
+    merged: List[str] = []
+    for chunk in chunks:
+        if merged and len(merged[-1]) + len(chunk) + 1 <= max_chars:
+            merged[-1] = f"{merged[-1]}\n{chunk}"
+        else:
+            merged.append(chunk)
+    return merged
+
+
 @dataclass
 class StyleWorkflowResult:
     """风格化工作流结果"""
@@ -26,6 +190,7 @@ class StyleWorkflowResult:
     quality_check: Optional[Dict] = None
     final_article: Optional[BasicArticle] = None
     execution_time: float = 0.0
+    stage_timings: Dict[str, float] = field(default_factory=dict)
     timestamp: datetime = field(default_factory=datetime.now)
 
     def to_dict(self) -> Dict:
@@ -36,6 +201,7 @@ class StyleWorkflowResult:
             "adapted_content": self.adapted_content,
             "quality_check": self.quality_check,
             "execution_time": self.execution_time,
+            "stage_timings": self.stage_timings,
             "timestamp": self.timestamp.isoformat()
         }
 
@@ -58,6 +224,7 @@ class StyleWorkflowResult:
             adapted_content=data.get("adapted_content"),
             quality_check=data.get("quality_check"),
             execution_time=data.get("execution_time", 0.0),
+            stage_timings=data.get("stage_timings", {}),
         )
 
         if "timestamp" in data:
@@ -95,14 +262,16 @@ class StyleCrew:
     专注于风格转换的核心实现，不处理任何解析工作。
     """
 
-    def __init__(self, verbose: bool = True):
+    def __init__(self, verbose: bool = True, overlap_stages: bool = True):
         """初始化风格化团队
 
         Args:
             verbose: 是否启用详细日志输出
+            overlap_stages: 平台分析未命中缓存时，是否基于平台原始信息与平台分析同时生成风格建议
         """
         logger.info("初始化风格化团队")
         self.verbose = verbose
+        self.overlap_stages = overlap_stages
         self._init_complete = False
 
         # 创建智能体
@@ -201,46 +370,9 @@ class StyleCrew:
         """
         self._ensure_initialized()
 
-        # 创建平台分析任务
-        agent = self.platform_analyst.get_agent()
-        task = Task(
-            description=f"""分析平台 {platform_info.get('platform_name', '未知平台')} 的风格特点。
-
-            平台描述：{platform_info.get('platform_description', '无描述')}
-            目标受众：{platform_info.get('target_audience', '未指定')}
-            平台规则：{json.dumps(platform_info.get('style_rules', {}))}
-
-            请提供详细的平台风格分析，包括：
-            1. 语言风格特点
-            2. 内容结构偏好
-            3. 媒体使用建议
-            4. 受众特征与偏好
-            5. 适合的表达方式
-            """,
-            expected_output="""详细的平台风格分析报告，JSON格式：
-            {
-                "language_style": "语言风格描述",
-                "content_structure": "内容结构描述",
-                "media_usage": "媒体使用建议",
-                "audience_preferences": "受众偏好描述",
-                "expression_style": "表达方式建议"
-            }
-            """,
-            agent=agent
-        )
-
-        # 执行任务
-        platform_crew = Crew(
-            agents=[agent],
-            tasks=[task],
-            verbose=self.verbose,
-            process=Process.sequential
-        )
-
-        result = await platform_crew.run_async(inputs=platform_info)
-
-        # 解析结果为字典
-        return self._parse_json_result(result)
+        if options and options.get("refresh"):
+            return await self._run_platform_analysis(platform_info)
+        return await self._analyze_platform_internal(platform_info)
 
     async def _run_style_workflow(
         self,
@@ -266,33 +398,58 @@ class StyleCrew:
         # 创建工作流结果对象
         result = StyleWorkflowResult()
 
+        async def timed(stage: str, coro):
+            """执行一个阶段并记录耗时"""
+            stage_start = time.perf_counter()
+            try:
+                return await coro
+            finally:
+                result.stage_timings[stage] = round(time.perf_counter() - stage_start, 3)
+
         try:
-            # 步骤1: 平台分析
-            platform_analysis = await self._analyze_platform_internal(platform_info)
+            # 步骤1、2: 平台分析与风格推荐
+            platform_analysis = platform_analysis_cache.get(platform_info)
+            if platform_analysis is not None:
+                result.stage_timings["platform_analysis"] = 0.0
+                style_recommendations = await timed("style_recommendations", self._generate_style_recommendations(
+                    platform_analysis,
+                    article,
+                    style_config
+                ))
+            elif self.overlap_stages:
+                # 分析结果未缓存时，风格建议直接基于平台原始信息生成，与平台分析同时进行
+                platform_analysis, style_recommendations = await asyncio.gather(
+                    timed("platform_analysis", self._analyze_platform_internal(platform_info)),
+                    timed("style_recommendations", self._generate_style_recommendations(
+                        self._platform_brief(platform_info),
+                        article,
+                        style_config
+                    ))
+                )
+            else:
+                platform_analysis = await timed("platform_analysis", self._analyze_platform_internal(platform_info))
+                style_recommendations = await timed("style_recommendations", self._generate_style_recommendations(
+                    platform_analysis,
+                    article,
+                    style_config
+                ))
             result.platform_analysis = platform_analysis
-
-            # 步骤2: 风格推荐
-            style_recommendations = await self._generate_style_recommendations(
-                platform_analysis,
-                article,
-                style_config
-            )
             result.style_recommendations = style_recommendations
 
             # 步骤3: 内容适配
-            adapted_content = await self._adapt_content(
+            adapted_content = await timed("content_adaptation", self._adapt_content(
                 article,
                 style_recommendations,
                 style_config
-            )
+            ))
             result.adapted_content = adapted_content
 
             # 步骤4: 质量检查
-            quality_check = await self._check_quality(
+            quality_check = await timed("quality_check", self._check_quality(
                 adapted_content,
                 platform_info,
                 style_config
-            )
+            ))
             result.quality_check = quality_check
 
             # 创建最终文章
@@ -306,7 +463,7 @@ class StyleCrew:
             end_time = datetime.now()
             result.execution_time = (end_time - start_time).total_seconds()
 
-            logger.info(f"风格适配完成，耗时: {result.execution_time:.2f}秒")
+            logger.info(f"风格适配完成，耗时: {result.execution_time:.2f}秒，各阶段: {result.stage_timings}")
             return result
 
         except Exception as e:
@@ -317,7 +474,37 @@ class StyleCrew:
             raise
 
     async def _analyze_platform_internal(self, platform_info: Dict[str, Any]) -> Dict:
-        """内部使用的平台分析方法
+        """内部使用的平台分析方法，结果按 (平台ID, 规则版本) 缓存
+
+        Args:
+            platform_info: 平台信息
+
+        Returns:
+            Dict: 平台分析结果
+        """
+        return await platform_analysis_cache.get_or_create(
+            platform_info,
+            lambda: self._run_platform_analysis(platform_info)
+        )
+
+    def _platform_brief(self, platform_info: Dict[str, Any]) -> Dict:
+        """平台分析完成前用于生成风格建议的平台原始信息
+
+        Args:
+            platform_info: 平台信息
+
+        Returns:
+            Dict: 平台名称、描述、受众和风格规则
+        """
+        return {
+            "platform_name": platform_info.get("platform_name", "未知平台"),
+            "platform_description": platform_info.get("platform_description", "无描述"),
+            "target_audience": platform_info.get("target_audience", "未指定"),
+            "style_rules": platform_info.get("style_rules", {})
+        }
+
+    async def _run_platform_analysis(self, platform_info: Dict[str, Any]) -> Dict:
+        """调用平台分析智能体
 
         Args:
             platform_info: 平台信息
@@ -353,6 +540,8 @@ class StyleCrew:
             agent=agent
         )
 
+        record_prompt("style", "platform_analysis", task.description, task.expected_output)
+
         # 执行任务
         platform_crew = Crew(
             agents=[agent],
@@ -433,6 +622,8 @@ class StyleCrew:
             agent=agent
         )
 
+        record_prompt("style", "style_advice", task.description, task.expected_output)
+
         # 执行任务
         style_crew = Crew(
             agents=[agent],
@@ -463,11 +654,58 @@ class StyleCrew:
     ) -> str:
         """适配内容风格
 
+        长文按章节分块并行改写，长度和段落要求按分块字数比例分配。
+
         Args:
             article: 原始文章
             style_recommendations: 风格建议
             style_config: 风格配置
 
+        Returns:
+            str: 适配后的内容
+        """
+        chunks = split_into_chunks(article.content, ADAPT_CHUNK_CHARS) if len(article.content) > ADAPT_CHUNK_CHARS else []
+        if len(chunks) <= 1:
+            return await self._adapt_section(article, style_recommendations, style_config)
+
+        logger.info(f"文章《{article.title}》共{len(article.content)}字，分{len(chunks)}块并行改写")
+        semaphore = asyncio.Semaphore(ADAPT_CONCURRENCY)
+        total = len(article.content)
+
+        async def adapt(index: int, chunk: str) -> str:
+            ratio = len(chunk) / total
+            chunk_config = {
+                **style_config,
+                "min_length": int(style_config.get("min_length", 800) * ratio),
+                "max_length": max(1, int(style_config.get("max_length", 8000) * ratio)),
+                "paragraph_count_min": max(1, int(style_config.get("paragraph_count_min", 5) * ratio)),
+                "paragraph_count_max": max(1, round(style_config.get("paragraph_count_max", 30) * ratio)),
+            }
+            part = BasicArticle(title=article.title, content=chunk)
+            part_note = (f"本次只改写全文的第{index + 1}/{len(chunks)}部分，保留原有标题层级，"
+                         "不要添加全文的引言或总结。")
+            async with semaphore:
+                adapted = await self._adapt_section(part, style_recommendations, chunk_config, part_note)
+            return str(adapted).strip()
+
+        parts = await asyncio.gather(*(adapt(i, chunk) for i, chunk in enumerate(chunks)))
+        return "\n\n".join(parts)
+
+    async def _adapt_section(
+        self,
+        article: BasicArticle,
+        style_recommendations: Dict,
+        style_config: Dict[str, Any],
+        part_note: str = ""
+    ) -> str:
+        """调用内容适配智能体改写一篇文章或其中一部分
+
+        Args:
+            article: 原始文章（或分块）
+            style_recommendations: 风格建议
+            style_config: 风格配置
+            part_note: 分块改写时的附加说明
+
         Returns:
             str: 适配后的内容
         """
@@ -475,7 +713,7 @@ class StyleCrew:
         agent = self.content_adapter.get_agent()
         task = Task(
             description=f"""
-            根据风格建议，改写文章《{article.title}》的内容，使其符合目标风格要求。
+            根据风格建议，改写文章《{article.title}》的内容，使其符合目标风格要求。{part_note}
 
             原始内容：{article.content}
 
@@ -521,6 +759,8 @@ class StyleCrew:
             agent=agent
         )
 
+        record_prompt("style", "content_adaptation", task.description, task.expected_output)
+
         # 执行任务
         adapter_crew = Crew(
             agents=[agent],
@@ -629,6 +869,8 @@ class StyleCrew:
             agent=agent
         )
 
+        record_prompt("style", "quality_check", task.description, task.expected_output)
+
         # 执行任务
         checker_crew = Crew(
             agents=[agent],
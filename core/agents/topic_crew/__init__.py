@@ -4,10 +4,7 @@
 提供基于CrewAI的话题发现和评估功能，包括热点话题挖掘、话题价值分析等。
 """
 
-from .topic_crew import TopicCrew
-from .topic_agents import TopicAgents
-from .topic_tools import TopicTools
-from .topic_adapter import TopicTeamAdapter
+from core.lazy_imports import lazy_exports
 
 __all__ = [
     'TopicCrew',
@@ -15,3 +12,10 @@ __all__ = [
     'TopicTools',
     'TopicTeamAdapter',
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "TopicCrew": ".topic_crew",
+    "TopicAgents": ".topic_agents",
+    "TopicTools": ".topic_tools",
+    "TopicTeamAdapter": ".topic_adapter",
+})
@@ -37,7 +37,8 @@ class TopicAgents:
             "topic_advisor": [
                 self.tools.get_trending_topics,
                 self.tools.get_topic_details,
-                self.tools.recommend_topics
+                self.tools.recommend_topics,
+                self.tools.get_related_topics
             ]
         }
 
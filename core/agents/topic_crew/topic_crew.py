@@ -12,6 +12,7 @@ import traceback
 from crewai import Task, Crew, Process
 from core.models.topic.topic import Topic
 from core.config import Config
+from core.tools.nlp_tools.token_budget import record_prompt
 from .topic_agents import TopicAgents
 
 # 配置日志
@@ -338,7 +339,7 @@ class TopicCrew:
             Task: 话题建议任务
         """
         logger.info(f"创建话题建议任务: 分类={category or '全部'}, 数量={count}")
-        return Task(
+        task = Task(
             description=f"""
             ## 热门话题建议任务
 
@@ -359,6 +360,8 @@ class TopicCrew:
             expected_output=f"包含{count}个推荐话题的JSON数据",
             agent=self.topic_advisor
         )
+        record_prompt("topic", "topic_suggestion", task.description, task.expected_output)
+        return task
 
     def _create_topic_evaluation_task(self, topics: List[Topic]) -> Task:
         """创建话题评估任务
@@ -384,7 +387,7 @@ class TopicCrew:
         topics_json = json.dumps(topics_data, ensure_ascii=False)
 
         logger.info(f"创建话题评估任务: {len(topics)} 个话题")
-        return Task(
+        task = Task(
             description=f"""
             ## 话题评估任务
 
@@ -414,6 +417,8 @@ class TopicCrew:
             expected_output="话题评估结果JSON",
             agent=self.topic_advisor
         )
+        record_prompt("topic", "topic_evaluation", task.description, task.expected_output)
+        return task
 
     def _create_topic_details_task(self, topic_id: str) -> Task:
         """创建话题详情任务
@@ -425,7 +430,7 @@ class TopicCrew:
             Task: 话题详情任务
         """
         logger.info(f"创建话题详情任务: {topic_id}")
-        return Task(
+        task = Task(
             description=f"""
             ## 话题详情获取任务
 
@@ -440,6 +445,8 @@ class TopicCrew:
             expected_output="话题详情的JSON数据",
             agent=self.topic_advisor
         )
+        record_prompt("topic", "topic_details", task.description, task.expected_output)
+        return task
 
     async def _execute_crew(self, crew: Crew) -> Any:
         """执行团队工作流
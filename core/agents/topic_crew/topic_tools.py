@@ -22,6 +22,12 @@ class TopicDetailsInput(BaseModel):
     topic_id: str = Field(..., description="话题ID或话题完整名称")
 
 
+class RelatedTopicsInput(BaseModel):
+    """相关话题查询工具的输入架构"""
+    topic: str = Field(..., description="话题标题或其中的关键部分")
+    limit: int = Field(10, description="返回的相关话题数量上限，默认为10")
+
+
 class RecommendTopicsInput(BaseModel):
     """话题推荐工具的输入架构"""
     target_audience: Optional[str] = Field(None, description="目标受众群体，如'年轻人'、'职场人士'、'学生'等")
@@ -109,6 +115,46 @@ class RecommendTopicsTool(BaseTool):
                                           content_type=content_type, limit=limit)
 
 
+class GetRelatedTopicsTool(BaseTool):
+    """相关话题查询工具"""
+    name: str = "相关话题查询工具"
+    description: str = "基于话题知识图谱查找与指定话题涉及相同人物、组织、事件的其他热点话题。"
+    args_schema: Type[BaseModel] = RelatedTopicsInput
+
+    # 允许额外属性
+    model_config = {"extra": "allow"}
+
+    def __init__(self, db_path: Optional[str] = None):
+        super().__init__()
+        self.db_path = db_path
+        self.store = None
+
+    def _run(self, topic: str, limit: int = 10) -> str:
+        """查找与指定话题共享实体的其他话题。
+
+        Args:
+            topic: 话题标题或其中的关键部分
+            limit: 返回的相关话题数量上限
+
+        Returns:
+            str: 相关话题列表及共同涉及的实体
+        """
+        if self.store is None:
+            from core.tools.kg_tools.kg_store import KnowledgeGraphStore, TOPIC_KG_DB_PATH
+            self.store = KnowledgeGraphStore(self.db_path or TOPIC_KG_DB_PATH)
+
+        topic_id = self.store.find_topic(topic)
+        if not topic_id:
+            return f"知识图谱中没有找到话题: {topic}"
+        related = self.store.related_topics(topic_id, limit)
+        if not related:
+            return f"没有找到与「{topic}」相关的话题"
+        return "\n".join(
+            f"{i}. {item['title']}（{item['platform'] or '未知平台'}，共同实体：{item['shared_entities']}）"
+            for i, item in enumerate(related, 1)
+        )
+
+
 class TopicTools:
     """选题团队工具集
 
@@ -132,3 +178,4 @@ class TopicTools:
         self.get_trending_topics = GetTrendingTopicsTool(self.trending_tools)
         self.get_topic_details = GetTopicDetailsTool(self.trending_tools)
         self.recommend_topics = RecommendTopicsTool(self.trending_tools)
+        self.get_related_topics = GetRelatedTopicsTool()
@@ -4,11 +4,7 @@
 提供基于CrewAI的文章写作功能，包括大纲设计、内容创作、优化和编辑。
 """
 
-from .writing_crew import WritingCrew, WritingResult
-from .writing_agents import WritingAgents
-from .writing_tools import WritingTools
-from .get_human_feedback import get_human_feedback
-from .writing_adapter import WritingTeamAdapter
+from core.lazy_imports import lazy_exports
 
 __all__ = [
     'WritingCrew',
@@ -17,4 +13,15 @@ __all__ = [
     'WritingTools',
     'get_human_feedback',
     'WritingTeamAdapter',
+    'WritingEvent',
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "WritingCrew": ".writing_crew",
+    "WritingResult": ".writing_crew",
+    "WritingAgents": ".writing_agents",
+    "WritingTools": ".writing_tools",
+    "get_human_feedback": ".get_human_feedback",
+    "WritingTeamAdapter": ".writing_adapter",
+    "WritingEvent": ".writing_stream",
+})
@@ -3,7 +3,7 @@
 为写作团队提供统一的接口适配层，处理参数转换和错误处理。
 """
 
-from typing import Dict, Any, Optional, Union
+from typing import AsyncIterator, Dict, Any, Optional, Tuple, Union
 import uuid
 from loguru import logger
 
@@ -12,6 +12,7 @@ from core.models.content_manager import ContentManager
 from core.models.topic.topic import Topic
 from core.models.article.article import Article
 from core.agents.writing_crew import WritingCrew
+from core.agents.writing_crew.writing_stream import WritingEvent, EVENT_DONE, EVENT_ERROR
 
 class WritingTeamAdapter(BaseTeamAdapter):
     """写作团队适配器
@@ -67,82 +68,7 @@ class WritingTeamAdapter(BaseTeamAdapter):
         await self.initialize()
 
         try:
-            # 1. 获取话题对应的内容类型
-            content_type_id = None
-            content_type = None
-
-            if hasattr(topic, 'content_type') and topic.content_type:
-                content_type_id = topic.content_type
-                content_type = ContentManager.get_content_type(content_type_id)
-            elif hasattr(topic, 'categories') and topic.categories:
-                # 尝试从第一个分类推断内容类型
-                primary_category = topic.categories[0] if topic.categories else None
-                if primary_category:
-                    content_type = ContentManager.get_content_type_by_category(primary_category)
-                    if content_type:
-                        content_type_id = content_type.id
-
-            logger.info(f"解析得到内容类型: {content_type_id or '未指定'}")
-
-            # 2. 获取平台信息
-            platform_id = None
-            if hasattr(topic, 'platform') and topic.platform:
-                platform_id = topic.platform
-                logger.info(f"从话题获取平台ID: {platform_id}")
-
-            # 3. 处理文章风格
-            style_id = None
-            if style:
-                # 如果指定了风格，直接使用
-                article_style = ContentManager.get_article_style(style)
-                if article_style:
-                    style_id = article_style.id
-                    logger.info(f"使用指定风格: {style_id}")
-            elif platform_id:
-                # 尝试根据平台获取文章风格
-                article_style = ContentManager.get_platform_style(platform_id)
-                if article_style:
-                    style_id = article_style.id
-                    logger.info(f"使用平台风格: {style_id}")
-
-            # 如果有内容类型但没有风格，获取推荐风格
-            if content_type_id and not style_id:
-                article_style = ContentManager.get_recommended_style_for_content_type(content_type_id)
-                if article_style:
-                    style_id = article_style.id
-                    logger.info(f"为内容类型 {content_type_id} 推荐风格: {style_id}")
-
-            # 检查内容类型和风格是否兼容
-            if content_type_id and style_id:
-                is_compatible = ContentManager.is_compatible(content_type_id, style_id)
-                if not is_compatible:
-                    logger.warning(f"内容类型 {content_type_id} 与风格 {style_id} 不兼容，尝试寻找替代方案")
-                    # 尝试获取兼容风格
-                    article_style = ContentManager.get_recommended_style_for_content_type(content_type_id)
-                    if article_style:
-                        style_id = article_style.id
-                        logger.info(f"使用兼容风格: {style_id}")
-
-            # 4. 整合选项
-            merged_options = options or {}
-            if content_type:
-                merged_options["content_type"] = content_type.id
-                merged_options["content_type_info"] = content_type.get_type_summary()
-            if article_style:
-                merged_options["style"] = article_style.id
-                merged_options["style_info"] = article_style.get_style_summary()
-            if platform_id:
-                platform = ContentManager.get_platform(platform_id)
-                if platform:
-                    merged_options["platform"] = platform.id
-                    merged_options["platform_info"] = platform.to_dict()
-
-            # 5. 创建临时文章对象
-            article = Article(
-                id=topic.id if hasattr(topic, 'id') else str(uuid.uuid4()),
-                title=topic.title if hasattr(topic, 'title') else "未命名",
-                topic=topic
-            )
+            article, writing_kwargs = self._prepare_writing(topic, style, options)
 
             # 记录状态
             if hasattr(topic, 'id'):
@@ -152,10 +78,7 @@ class WritingTeamAdapter(BaseTeamAdapter):
             result = await self.crew.write_article(
                 article=article,
                 research_data=research_data,
-                platform=platform_id,
-                content_type=content_type_id,
-                style=style_id,
-                **merged_options
+                **writing_kwargs
             )
 
             # 7. 更新状态
@@ -169,6 +92,157 @@ class WritingTeamAdapter(BaseTeamAdapter):
                 self._writing_status[topic.id] = "failed"
             raise RuntimeError(f"写作内容失败: {str(e)}")
 
+    async def stream_content(
+        self,
+        topic: Topic,
+        research_data: Dict[str, Any],
+        style: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """流式写作内容
+
+        参数解析与write_content相同，写作过程中逐个产出事件字典（大纲完成、
+        章节正文片段、事实核查结果等），最后一个事件为done或error。
+
+        Args:
+            topic: 话题对象
+            research_data: 研究资料
+            style: 写作风格(可选)
+            options: 其他选项，可包含outline（已有大纲）
+
+        Yields:
+            Dict[str, Any]: 写作事件，结构见WritingEvent.to_dict
+        """
+        await self.initialize()
+
+        topic_id = getattr(topic, 'id', None)
+        try:
+            article, writing_kwargs = self._prepare_writing(topic, style, options)
+        except Exception as e:
+            if topic_id:
+                self._writing_status[topic_id] = "failed"
+            yield WritingEvent(EVENT_ERROR, {"message": f"写作内容失败: {str(e)}"}).to_dict()
+            return
+
+        if topic_id:
+            self._writing_status[topic_id] = "processing"
+
+        status = "failed"
+        try:
+            async for event in self.crew.stream_article(
+                article=article,
+                research_data=research_data,
+                **writing_kwargs
+            ):
+                if event.type == EVENT_DONE:
+                    status = "completed"
+                yield event.to_dict()
+        finally:
+            if topic_id:
+                self._writing_status[topic_id] = status
+
+    def _prepare_writing(
+        self,
+        topic: Topic,
+        style: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Article, Dict[str, Any]]:
+        """解析话题的内容类型、平台和风格，构造WritingCrew的调用参数
+
+        Args:
+            topic: 话题对象
+            style: 写作风格(可选)
+            options: 其他选项
+
+        Returns:
+            Tuple[Article, Dict[str, Any]]: 临时文章对象和写作参数
+        """
+        article_style = None
+
+        # 1. 获取话题对应的内容类型
+        content_type_id = None
+        content_type = None
+
+        if hasattr(topic, 'content_type') and topic.content_type:
+            content_type_id = topic.content_type
+            content_type = ContentManager.get_content_type(content_type_id)
+        elif hasattr(topic, 'categories') and topic.categories:
+            # 尝试从第一个分类推断内容类型
+            primary_category = topic.categories[0] if topic.categories else None
+            if primary_category:
+                content_type = ContentManager.get_content_type_by_category(primary_category)
+                if content_type:
+                    content_type_id = content_type.id
+
+        logger.info(f"解析得到内容类型: {content_type_id or '未指定'}")
+
+        # 2. 获取平台信息
+        platform_id = None
+        if hasattr(topic, 'platform') and topic.platform:
+            platform_id = topic.platform
+            logger.info(f"从话题获取平台ID: {platform_id}")
+
+        # 3. 处理文章风格
+        style_id = None
+        if style:
+            # 如果指定了风格，直接使用
+            article_style = ContentManager.get_article_style(style)
+            if article_style:
+                style_id = article_style.id
+                logger.info(f"使用指定风格: {style_id}")
+        elif platform_id:
+            # 尝试根据平台获取文章风格
+            article_style = ContentManager.get_platform_style(platform_id)
+            if article_style:
+                style_id = article_style.id
+                logger.info(f"使用平台风格: {style_id}")
+
+        # 如果有内容类型但没有风格，获取推荐风格
+        if content_type_id and not style_id:
+            article_style = ContentManager.get_recommended_style_for_content_type(content_type_id)
+            if article_style:
+                style_id = article_style.id
+                logger.info(f"为内容类型 {content_type_id} 推荐风格: {style_id}")
+
+        # 检查内容类型和风格是否兼容
+        if content_type_id and style_id:
+            is_compatible = ContentManager.is_compatible(content_type_id, style_id)
+            if not is_compatible:
+                logger.warning(f"内容类型 {content_type_id} 与风格 {style_id} 不兼容，尝试寻找替代方案")
+                # 尝试获取兼容风格
+                article_style = ContentManager.get_recommended_style_for_content_type(content_type_id)
+                if article_style:
+                    style_id = article_style.id
+                    logger.info(f"使用兼容风格: {style_id}")
+
+        # 4. 整合选项
+        merged_options = options or {}
+        if content_type:
+            merged_options["content_type"] = content_type.id
+            merged_options["content_type_info"] = content_type.get_type_summary()
+        if article_style:
+            merged_options["style"] = article_style.id
+            merged_options["style_info"] = article_style.get_style_summary()
+        if platform_id:
+            platform = ContentManager.get_platform(platform_id)
+            if platform:
+                merged_options["platform"] = platform.id
+                merged_options["platform_info"] = platform.to_dict()
+
+        # 5. 创建临时文章对象
+        article = Article(
+            id=topic.id if hasattr(topic, 'id') else str(uuid.uuid4()),
+            title=topic.title if hasattr(topic, 'title') else "未命名",
+            topic=topic
+        )
+
+        return article, {
+            "platform": platform_id,
+            "content_type": content_type_id,
+            "style": style_id,
+            **merged_options
+        }
+
     async def create_outline(
         self,
         topic_or_text: Union[str, Topic, Dict, Any],
@@ -8,7 +8,7 @@ import json
 import logging
 import asyncio
 import uuid
-from typing import List, Dict, Optional, Any, Union
+from typing import AsyncIterator, List, Dict, Optional, Any, Union
 from datetime import datetime
 from pathlib import Path
 from json_repair import repair_json  # 添加json修复库
@@ -17,13 +17,31 @@ from crewai import Task, Crew, Process
 from crewai.agent import Agent
 
 from core.models.article.article import Article, Section
-from core.models.platform.platform import Platform
+from core.models.platform.platform import Platform, get_default_platform
 from core.models.topic.topic import Topic
 from core.models.content_manager import ContentManager
 from core.models.outline.basic_outline import BasicOutline, OutlineSection
 from core.models.outline.article_outline import ArticleOutline
 from .writing_agents import WritingAgents
+from .writing_stream import (
+    WritingEvent,
+    EVENT_STARTED,
+    EVENT_OUTLINE_READY,
+    EVENT_SECTION_STARTED,
+    EVENT_TOKEN,
+    EVENT_SECTION_COMPLETED,
+    EVENT_FACT_CHECK,
+    EVENT_FINAL_DRAFT,
+    EVENT_ERROR,
+    EVENT_DONE,
+    STREAM_MODEL,
+    STREAM_MIN_CHUNK_CHARS,
+    normalize_outline_sections,
+    build_section_messages,
+    assemble_markdown,
+)
 from core.models.util import ArticleParser
+from core.tools.nlp_tools.token_budget import record_prompt
 
 # 配置日志
 logger = logging.getLogger(__name__)
@@ -156,30 +174,7 @@ class WritingCrew:
         Returns:
             WritingResult: 完整的写作过程结果
         """
-        platform_obj = None
-        platform_id = None
-
-        # 处理平台参数
-        if isinstance(platform, str):
-            platform_id = platform
-            platform_obj = ContentManager.get_platform(platform)
-            if not platform_obj:
-                platform_obj = Platform(
-                    id=platform,
-                    name=platform,
-                    description="平台描述"
-                )
-        elif isinstance(platform, Platform):
-            platform_obj = platform
-            platform_id = platform.id
-
-        # 如果没有提供平台，创建默认平台
-        if not platform_obj:
-            platform_obj = Platform(
-                id="default",
-                name="通用平台",
-                description="适用于各种内容的通用平台"
-            )
+        platform_obj = self._resolve_platform(platform)
 
         logger.info(f"开始文章写作流程: {article.title}, 目标平台: {platform_obj.name}, 内容类型: {content_type or '未指定'}")
 
@@ -249,6 +244,7 @@ class WritingCrew:
                 }
                 """
             )
+            record_prompt("writing", "content", content_task.description, content_task.expected_output)
             tasks.append(content_task)
 
             # 3. 事实核查任务
@@ -286,6 +282,162 @@ class WritingCrew:
             logger.error(f"写作过程发生错误: {str(e)}")
             raise
 
+    async def stream_article(
+        self,
+        article: Article,
+        research_data: Optional[Dict[str, Any]] = None,
+        platform: Optional[Union[str, Platform]] = None,
+        content_type: Optional[str] = None,
+        style: Optional[str] = None,
+        outline: Optional[Dict[str, Any]] = None,
+        llm: Any = None,
+        **kwargs
+    ) -> AsyncIterator[WritingEvent]:
+        """流式执行文章写作流程
+
+        与write_article的阶段相同，但每个阶段完成后立即产出事件：大纲由大纲智能体
+        生成后推送；章节正文通过流式LLM调用逐章节生成，生成的片段以token事件推送；
+        事实核查和编辑仍由对应智能体完成，结果完成后推送。
+
+        Args:
+            article: 文章信息对象
+            research_data: 研究资料（可选）
+            platform: 目标发布平台或平台ID
+            content_type: 内容类型
+            style: 写作风格
+            outline: 已有大纲（可选），提供时跳过大纲生成
+            llm: 提供stream_chat方法的LLM客户端，默认使用共享LLM客户端
+            **kwargs: 其他参数
+
+        Yields:
+            WritingEvent: 写作事件，最后一个事件为done（含完整WritingResult）或error
+        """
+        result = WritingResult(article=article)
+        yield WritingEvent(EVENT_STARTED, {"article_id": article.id, "title": article.title})
+
+        try:
+            # 平台、配置解析失败也以error事件结束
+            platform_obj = self._resolve_platform(platform)
+            self.current_content_config = self.get_writing_config(content_type)
+
+            if not hasattr(article, "metadata") or not article.metadata:
+                article.metadata = {}
+            article.metadata["content_type"] = content_type
+            if research_data:
+                article.metadata["research_data"] = research_data
+
+            if llm is None:
+                from core.control_ai.llm_client import get_llm_client
+                llm = get_llm_client()
+
+            if not self.agents:
+                self._initialize_agents()
+
+            logger.info(f"开始流式写作: {article.title}, 目标平台: {platform_obj.name}")
+
+            # 1. 大纲
+            if outline is None:
+                outline_task = self._create_outline_task(article, platform_obj)
+                outline = self._parse_json_result(
+                    await self._run_single_task(self.outline_creator, outline_task)
+                )
+            result.outline = outline
+            sections = normalize_outline_sections(outline)
+            if not sections:
+                raise ValueError("大纲中没有可写作的章节")
+            yield WritingEvent(EVENT_OUTLINE_READY, {"outline": outline, "sections": sections})
+
+            # 2. 按章节流式生成正文
+            completed = []
+            for index, section in enumerate(sections):
+                yield WritingEvent(EVENT_SECTION_STARTED, {"title": section["title"]}, index)
+
+                messages = build_section_messages(
+                    article.title, section, sections, self.current_content_config, platform_obj.name
+                )
+                parts = []
+                buffer = ""
+                async for delta in llm.stream_chat(messages, model=STREAM_MODEL):
+                    parts.append(delta)
+                    buffer += delta
+                    if len(buffer) >= STREAM_MIN_CHUNK_CHARS:
+                        yield WritingEvent(EVENT_TOKEN, {"text": buffer}, index)
+                        buffer = ""
+                if buffer:
+                    yield WritingEvent(EVENT_TOKEN, {"text": buffer}, index)
+
+                section_result = {"title": section["title"], "content": "".join(parts)}
+                completed.append(section_result)
+                yield WritingEvent(EVENT_SECTION_COMPLETED, section_result, index)
+
+            result.content = {"sections": completed}
+            draft = assemble_markdown(completed)
+
+            # 3. 事实核查
+            fact_check_task = self._create_fact_check_task(article, platform_obj, content=draft)
+            fact_check = self._parse_json_result(
+                await self._run_single_task(self.fact_checker, fact_check_task)
+            )
+            yield WritingEvent(EVENT_FACT_CHECK, fact_check)
+
+            # 4. 编辑
+            edit_task = self._create_edit_task(
+                article, platform_obj, content=draft,
+                fact_check=json.dumps(fact_check, ensure_ascii=False)
+            )
+            final_draft = self._parse_json_result(
+                await self._run_single_task(self.editor, edit_task)
+            )
+            final_draft.setdefault("metadata", {})["fact_check"] = fact_check
+            result.final_draft = final_draft
+            yield WritingEvent(EVENT_FINAL_DRAFT, final_draft)
+
+        except Exception as e:
+            logger.error(f"流式写作过程发生错误: {str(e)}")
+            yield WritingEvent(EVENT_ERROR, {"message": str(e)})
+            return
+
+        logger.info(f"流式写作完成: {article.title}")
+        yield WritingEvent(EVENT_DONE, result.to_dict())
+
+    async def _run_single_task(self, agent: Agent, task: Task) -> Any:
+        """在线程中执行单个任务，不阻塞事件循环
+
+        Args:
+            agent: 执行任务的智能体
+            task: 任务
+
+        Returns:
+            Any: 任务输出
+        """
+        crew = Crew(agents=[agent], tasks=[task], verbose=self.verbose, process=Process.sequential)
+        output = await asyncio.to_thread(crew.kickoff)
+        return output if isinstance(output, (dict, str)) else str(output)
+
+    def _resolve_platform(self, platform: Optional[Union[str, Platform]]) -> Platform:
+        """将平台ID或平台对象解析为平台对象
+
+        Args:
+            platform: 平台ID或平台对象
+
+        Returns:
+            Platform: 平台对象，未提供时返回通用平台
+        """
+        if isinstance(platform, Platform):
+            return platform
+
+        if isinstance(platform, str):
+            platform_obj = ContentManager.get_platform(platform)
+            if platform_obj:
+                return platform_obj
+            return Platform(
+                name=platform,
+                url="",
+                description="平台描述"
+            )
+
+        return get_default_platform()
+
     def _initialize_agents(self):
         """初始化写作智能体团队"""
         if self.agents:
@@ -342,6 +494,7 @@ class WritingCrew:
             }
             """
         )
+        record_prompt("writing", "outline", outline_task.description, outline_task.expected_output)
         return outline_task
 
     def _create_content_task(self, article: Article, platform: Platform, outline_data: List[Dict]) -> Task:
@@ -394,23 +547,27 @@ class WritingCrew:
             }
             """
         )
+        record_prompt("writing", "content", content_task.description, content_task.expected_output)
         return content_task
 
-    def _create_fact_check_task(self, article: Article, platform: Platform) -> Task:
+    def _create_fact_check_task(self, article: Article, platform: Platform,
+                                content: Optional[str] = None) -> Task:
         """创建事实核查任务
 
         Args:
             article: 文章信息
             platform: 发布平台信息
+            content: 已完成的文章内容，不提供时引用内容任务的输出
 
         Returns:
             Task: 事实核查任务
         """
+        content_ref = content if content is not None else "{content_task.output}"
         fact_check_task = Task(
             description=f"""
             对文章《{article.title}》进行事实核查和准确性验证。
 
-            文章内容：{{content_task.output}}
+            文章内容：{content_ref}
 
             请仔细审核文章中的事实性内容，特别注意：
             1. 数据和统计信息的准确性
@@ -436,24 +593,31 @@ class WritingCrew:
             }
             """
         )
+        record_prompt("writing", "fact_check", fact_check_task.description, fact_check_task.expected_output)
         return fact_check_task
 
-    def _create_edit_task(self, article: Article, platform: Platform) -> Task:
+    def _create_edit_task(self, article: Article, platform: Platform,
+                          content: Optional[str] = None,
+                          fact_check: Optional[str] = None) -> Task:
         """创建编辑任务
 
         Args:
             article: 文章信息
             platform: 发布平台信息
+            content: 已完成的文章内容，不提供时引用内容任务的输出
+            fact_check: 事实核查结果，不提供时引用事实核查任务的输出
 
         Returns:
             Task: 编辑任务
         """
+        content_ref = content if content is not None else "{content_task.output}"
+        fact_check_ref = fact_check if fact_check is not None else "{fact_check_task.output}"
         edit_task = Task(
             description=f"""
             对文章《{article.title}》进行最终编辑和完善。
 
-            原始内容：{{content_task.output}}
-            事实核查：{{fact_check_task.output}}
+            原始内容：{content_ref}
+            事实核查：{fact_check_ref}
 
             内容类型：{article.metadata.get('content_type', '未指定')}
             目标平台：{platform.name}
@@ -482,6 +646,7 @@ class WritingCrew:
             }
             """
         )
+        record_prompt("writing", "edit", edit_task.description, edit_task.expected_output)
         return edit_task
 
     def _process_results(self, crew_results: Any, article: Article) -> WritingResult:
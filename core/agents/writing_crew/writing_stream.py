@@ -0,0 +1,129 @@
+"""写作流式事件模块
+
+定义写作过程中推送给客户端的事件。``WritingCrew.stream_article`` 以异步迭代器的
+形式逐个产出这些事件：大纲完成后立即推送大纲，各章节正文按LLM生成的片段逐段推送，
+事实核查和编辑结果在完成后推送，客户端无需等待整篇文章写完才看到内容。
+
+事件顺序::
+
+    started → outline_ready → (section_started → token... → section_completed)...
+            → fact_check → final_draft → done
+
+任何阶段出错时推送 error 事件并结束。
+"""
+
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+# 事件类型
+EVENT_STARTED = "started"
+EVENT_OUTLINE_READY = "outline_ready"
+EVENT_SECTION_STARTED = "section_started"
+EVENT_TOKEN = "token"
+EVENT_SECTION_COMPLETED = "section_completed"
+EVENT_FACT_CHECK = "fact_check"
+EVENT_FINAL_DRAFT = "final_draft"
+EVENT_ERROR = "error"
+EVENT_DONE = "done"
+
+# 章节正文生成使用的模型，默认与控制AI相同
+STREAM_MODEL = os.environ.get("WRITING_STREAM_MODEL") or None
+
+# 相邻token事件合并的最小字符数，减少WebSocket帧数量
+STREAM_MIN_CHUNK_CHARS = int(os.environ.get("WRITING_STREAM_MIN_CHUNK_CHARS", 1))
+
+
+@dataclass
+class WritingEvent:
+    """写作流式事件"""
+
+    type: str
+    data: Dict[str, Any] = field(default_factory=dict)
+    section_index: Optional[int] = None
+    timestamp: float = field(default_factory=time.time)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为可JSON序列化的字典
+
+        Returns:
+            Dict[str, Any]: 事件字典
+        """
+        result = {"type": self.type, "data": self.data, "timestamp": self.timestamp}
+        if self.section_index is not None:
+            result["section_index"] = self.section_index
+        return result
+
+
+def normalize_outline_sections(outline: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """从大纲结果中取出章节列表
+
+    兼容 ``{"outline": [...]}`` 和 ``{"sections": [...]}`` 两种结构，
+    每个章节统一为 ``{"title": ..., "points": [...]}``。
+
+    Args:
+        outline: 大纲结果
+
+    Returns:
+        List[Dict[str, Any]]: 章节列表
+    """
+    sections = outline.get("outline") or outline.get("sections") or []
+    normalized = []
+    for section in sections:
+        if isinstance(section, str):
+            normalized.append({"title": section, "points": []})
+        elif isinstance(section, dict):
+            points = section.get("points") or section.get("key_points") or []
+            normalized.append({
+                "title": section.get("title", ""),
+                "points": [str(p) for p in points],
+            })
+    return normalized
+
+
+def build_section_messages(title: str,
+                           section: Dict[str, Any],
+                           sections: List[Dict[str, Any]],
+                           config: Dict[str, Any],
+                           platform_name: str) -> List[Dict[str, str]]:
+    """构造单个章节正文的生成消息
+
+    Args:
+        title: 文章标题
+        section: 当前章节
+        sections: 全部章节，用于让模型了解上下文、避免重复
+        config: 写作配置（word_count、style、depth、tone）
+        platform_name: 目标平台名称
+
+    Returns:
+        List[Dict[str, str]]: 聊天消息列表
+    """
+    section_words = max(int(config.get("word_count", 1500)) // max(len(sections), 1), 100)
+    outline_text = "\n".join(f"- {s['title']}" for s in sections)
+    points = "\n".join(f"- {p}" for p in section["points"]) or "（无）"
+
+    system = (
+        f"你是一名专业的内容创作者，为{platform_name}撰写文章。"
+        f"写作风格：{config.get('style', 'formal')}，语气：{config.get('tone', 'professional')}，"
+        f"内容深度：{config.get('depth', 'medium')}。"
+    )
+    user = (
+        f"文章《{title}》的大纲如下：\n{outline_text}\n\n"
+        f"请只撰写其中「{section['title']}」这一部分的正文，约{section_words}字。\n"
+        f"本部分要点：\n{points}\n\n"
+        "直接输出正文，使用Markdown格式，不要输出章节标题，不要重复其他部分的内容。"
+    )
+    return [{"role": "system", "content": system}, {"role": "user", "content": user}]
+
+
+def assemble_markdown(sections: List[Dict[str, Any]]) -> str:
+    """将章节拼接为Markdown正文
+
+    Args:
+        sections: 已完成的章节，包含title和content
+
+    Returns:
+        str: Markdown文本，用##分隔章节
+    """
+    return "\n\n".join(f"## {s['title']}\n{s['content'].strip()}" for s in sections)
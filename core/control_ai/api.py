@@ -17,7 +17,10 @@ from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Depe
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 
+from core.control_ai.broadcaster import WebSocketBroadcaster
+from core.control_ai.clients import close_http_session, get_endpoint_metrics
 from core.control_ai.control_ai import ControlAI
+from core.control_ai.llm_client import close_llm_client, get_llm_client
 
 # 配置日志
 logger = logging.getLogger(__name__)
@@ -42,12 +45,22 @@ app.add_middleware(
 class ConnectionManager:
     """WebSocket连接管理器
 
-    管理活动的WebSocket连接。
+    管理活动的WebSocket连接。每个连接有独立的发送队列和写任务，
+    发送和广播只将消息放入队列，慢客户端不会阻塞其他客户端。
     """
 
-    def __init__(self):
-        """初始化连接管理器"""
-        self.active_connections: Dict[str, WebSocket] = {}
+    def __init__(self, broadcaster: Optional[WebSocketBroadcaster] = None):
+        """初始化连接管理器
+
+        Args:
+            broadcaster: 广播器，默认按环境变量创建
+        """
+        self.broadcaster = broadcaster or WebSocketBroadcaster()
+
+    @property
+    def active_connections(self) -> Dict[str, Any]:
+        """活动连接"""
+        return self.broadcaster.clients
 
     async def connect(self, websocket: WebSocket, client_id: str) -> None:
         """处理新的WebSocket连接
@@ -57,7 +70,7 @@ class ConnectionManager:
             client_id: 客户端标识符
         """
         await websocket.accept()
-        self.active_connections[client_id] = websocket
+        self.broadcaster.register(client_id, websocket.send_json, websocket.close)
         logger.info(f"WebSocket客户端连接: {client_id}")
 
     def disconnect(self, client_id: str) -> None:
@@ -66,8 +79,8 @@ class ConnectionManager:
         Args:
             client_id: 客户端标识符
         """
-        if client_id in self.active_connections:
-            del self.active_connections[client_id]
+        if client_id in self.broadcaster.clients:
+            self.broadcaster.unregister(client_id)
             logger.info(f"WebSocket客户端断开连接: {client_id}")
 
     async def send_message(self, client_id: str, message: Dict[str, Any]) -> bool:
@@ -78,18 +91,9 @@ class ConnectionManager:
             message: 要发送的消息
 
         Returns:
-            bool: 是否成功发送
+            bool: 是否成功放入发送队列
         """
-        if client_id not in self.active_connections:
-            return False
-
-        websocket = self.active_connections[client_id]
-        try:
-            await websocket.send_json(message)
-            return True
-        except Exception as e:
-            logger.error(f"发送WebSocket消息失败: {str(e)}")
-            return False
+        return self.broadcaster.send(client_id, message)
 
     async def broadcast(self, message: Dict[str, Any]) -> None:
         """向所有连接的客户端广播消息
@@ -97,12 +101,7 @@ class ConnectionManager:
         Args:
             message: 要广播的消息
         """
-        for client_id, websocket in list(self.active_connections.items()):
-            try:
-                await websocket.send_json(message)
-            except Exception as e:
-                logger.error(f"向客户端 {client_id} 广播消息失败: {str(e)}")
-                self.disconnect(client_id)
+        await self.broadcaster.broadcast(message)
 
 
 # 创建连接管理器
@@ -130,6 +129,18 @@ class ApiResponse(BaseModel):
 # 控制AI实例
 control_ai = ControlAI()
 
+@app.on_event("startup")
+async def startup_event():
+    """服务启动时连接广播频道"""
+    await manager.broadcaster.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """服务退出时关闭WebSocket连接、团队API和LLM连接池"""
+    await manager.broadcaster.stop()
+    await close_http_session()
+    await close_llm_client()
+
 # 健康检查端点
 @app.get("/health", response_model=ApiResponse)
 async def health_check():
@@ -139,7 +150,11 @@ async def health_check():
         "message": "控制AI服务正常运行",
         "data": {
             "version": "1.0.0",
-            "uptime": "正常"
+            "uptime": "正常",
+            "llm": get_llm_client().get_stats(),
+            "websocket": manager.broadcaster.get_stats(),
+            "teams": get_endpoint_metrics(),
+            "plan_cache": control_ai.task_planner.plan_cache.get_stats() if control_ai.task_planner.plan_cache else None
         }
     }
 
@@ -212,7 +227,7 @@ async def get_session_info(session_id: str):
         ApiResponse: API响应
     """
     try:
-        session = control_ai.get_session(session_id)
+        session = await control_ai.aget_session(session_id, create=False)
 
         if not session:
             return {
@@ -255,7 +270,7 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
                 # 处理自然语言请求
                 query = data.get("query")
                 if not query:
-                    await websocket.send_json({
+                    await manager.send_message(client_id, {
                         "type": "error",
                         "message": "缺少必要字段: query"
                     })
@@ -269,14 +284,14 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
                     )
 
                     # 发送响应
-                    await websocket.send_json({
+                    await manager.send_message(client_id, {
                         "type": "nl-response",
                         "data": result,
                         "request_id": data.get("request_id")
                     })
                 except Exception as e:
                     logger.error(f"处理WebSocket自然语言请求失败: {str(e)}")
-                    await websocket.send_json({
+                    await manager.send_message(client_id, {
                         "type": "error",
                         "message": str(e),
                         "request_id": data.get("request_id")
@@ -288,7 +303,7 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
                 action = data.get("action")
 
                 if not all([session_id, task_id, action]):
-                    await websocket.send_json({
+                    await manager.send_message(client_id, {
                         "type": "error",
                         "message": "缺少必要字段: session_id, task_id, action",
                         "request_id": data.get("request_id")
@@ -304,14 +319,14 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
                     )
 
                     # 发送响应
-                    await websocket.send_json({
+                    await manager.send_message(client_id, {
                         "type": "task-result",
                         "data": result,
                         "request_id": data.get("request_id")
                     })
                 except Exception as e:
                     logger.error(f"处理WebSocket任务执行请求失败: {str(e)}")
-                    await websocket.send_json({
+                    await manager.send_message(client_id, {
                         "type": "error",
                         "message": str(e),
                         "request_id": data.get("request_id")
@@ -320,7 +335,7 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
             elif request_type == "get-session":
                 # 获取会话信息
                 if not session_id:
-                    await websocket.send_json({
+                    await manager.send_message(client_id, {
                         "type": "error",
                         "message": "缺少必要字段: session_id",
                         "request_id": data.get("request_id")
@@ -329,17 +344,24 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
 
                 try:
                     # 获取会话
-                    session = control_ai.get_session(session_id)
+                    session = await control_ai.aget_session(session_id, create=False)
+                    if not session:
+                        await manager.send_message(client_id, {
+                            "type": "error",
+                            "message": f"找不到会话: {session_id}",
+                            "request_id": data.get("request_id")
+                        })
+                        continue
 
                     # 发送响应
-                    await websocket.send_json({
+                    await manager.send_message(client_id, {
                         "type": "session-info",
                         "data": session.to_dict(),
                         "request_id": data.get("request_id")
                     })
                 except Exception as e:
                     logger.error(f"处理WebSocket获取会话请求失败: {str(e)}")
-                    await websocket.send_json({
+                    await manager.send_message(client_id, {
                         "type": "error",
                         "message": str(e),
                         "request_id": data.get("request_id")
@@ -347,7 +369,7 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
 
             else:
                 # 未知请求类型
-                await websocket.send_json({
+                await manager.send_message(client_id, {
                     "type": "error",
                     "message": f"未知请求类型: {request_type}",
                     "request_id": data.get("request_id")
@@ -0,0 +1,402 @@
+"""WebSocket广播器 - 每个连接独立发送队列的扇出广播
+
+广播时只把消息放入各连接的发送队列，由每个连接自己的写任务发送，
+一个慢客户端不会拖慢其他客户端：
+
+- 同一任务的进度消息在队列中合并，只发送最新一条
+- 队列满时优先丢弃最旧的进度消息
+- 队列中积压的普通消息超过上限，或单次发送超时的客户端会被断开
+- 配置Redis后，广播通过Redis发布/订阅同步到所有API进程
+
+发送函数与WebSocket解耦，注册时传入 ``websocket.send_json`` 即可。
+"""
+
+import asyncio
+import json
+import logging
+import os
+import uuid
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, Optional
+
+# 配置日志
+logger = logging.getLogger(__name__)
+
+# 每个连接的发送队列长度
+MAX_QUEUE_SIZE = int(os.environ.get("CONTROL_AI_WS_QUEUE_SIZE", 100))
+
+# 单条消息的发送超时（秒），超时视为客户端已失去响应
+SEND_TIMEOUT = float(os.environ.get("CONTROL_AI_WS_SEND_TIMEOUT", 5))
+
+# 跨进程广播使用的Redis连接URL，未设置时只在本进程内广播
+REDIS_URL = os.environ.get("CONTROL_AI_WS_REDIS_URL")
+
+# Redis广播频道
+REDIS_CHANNEL = "genflow:control_ai:broadcast"
+
+# Redis订阅中断后重新订阅的退避时间（秒），每次失败翻倍直到上限
+RESUBSCRIBE_MIN_DELAY = float(os.environ.get("CONTROL_AI_WS_RESUBSCRIBE_MIN_DELAY", 0.5))
+RESUBSCRIBE_MAX_DELAY = float(os.environ.get("CONTROL_AI_WS_RESUBSCRIBE_MAX_DELAY", 30))
+
+# 可以合并/丢弃的消息类型，只有最新一条有意义
+COALESCE_TYPES = {"progress", "task_progress", "task_status", "heartbeat"}
+
+SendFunc = Callable[[Any], Awaitable[Any]]
+CloseFunc = Callable[[], Awaitable[Any]]
+
+
+def coalesce_key(message: Any) -> Optional[Hashable]:
+    """计算消息的合并键
+
+    Args:
+        message: 消息
+
+    Returns:
+        Optional[Hashable]: 可合并消息返回 (类型, 任务ID)，否则返回None
+    """
+    if isinstance(message, dict) and message.get("type") in COALESCE_TYPES:
+        return message["type"], message.get("task_id")
+    return None
+
+
+class ClientChannel:
+    """单个客户端的发送通道"""
+
+    def __init__(self, client_id: str, send: SendFunc,
+                 close: Optional[CloseFunc] = None,
+                 max_queue_size: int = MAX_QUEUE_SIZE,
+                 send_timeout: float = SEND_TIMEOUT):
+        """初始化发送通道
+
+        Args:
+            client_id: 客户端标识符
+            send: 发送函数
+            close: 断开连接函数
+            max_queue_size: 队列长度上限
+            send_timeout: 单条消息的发送超时（秒）
+        """
+        self.client_id = client_id
+        self.send = send
+        self.close = close
+        self.max_queue_size = max_queue_size
+        self.send_timeout = send_timeout
+
+        # 队列项为 ("msg", 消息) 或 ("key", 合并键)，合并键对应的最新消息保存在 _pending 中
+        self._queue: Deque[tuple] = deque()
+        self._pending: Dict[Hashable, Any] = {}
+        self._ready = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._on_closed: Optional[Callable[["ClientChannel"], None]] = None
+        self.closed = False
+        self.lagging = False
+        self.stats = {"sent": 0, "coalesced": 0, "dropped": 0}
+
+    def start(self, on_closed: Callable[["ClientChannel"], None]) -> None:
+        """启动写任务
+
+        Args:
+            on_closed: 写任务结束时的回调
+        """
+        self._on_closed = on_closed
+        self._task = asyncio.create_task(self._writer())
+
+    def put(self, message: Any) -> bool:
+        """放入一条消息，不等待发送
+
+        Args:
+            message: 消息
+
+        Returns:
+            bool: 是否放入成功，客户端已关闭或积压过多时返回False
+        """
+        if self.closed:
+            return False
+
+        key = coalesce_key(message)
+        if key is not None:
+            if key in self._pending:
+                self._pending[key] = message
+                self.stats["coalesced"] += 1
+                return True
+            self._pending[key] = message
+            self._queue.append(("key", key))
+        else:
+            self._queue.append(("msg", message))
+
+        if len(self._queue) > self.max_queue_size and not self._drop_stale():
+            # 队列中都是不能丢弃的消息，客户端已落后太多
+            self.lagging = True
+            self.closed = True
+            logger.warning(f"WebSocket客户端 {self.client_id} 积压消息过多，断开连接")
+
+        self._ready.set()
+        return not self.closed
+
+    def _drop_stale(self) -> bool:
+        """丢弃最旧的一条可合并消息
+
+        Returns:
+            bool: 是否丢弃成功
+        """
+        for i, (kind, value) in enumerate(self._queue):
+            if kind == "key":
+                del self._queue[i]
+                self._pending.pop(value, None)
+                self.stats["dropped"] += 1
+                return True
+        return False
+
+    async def _writer(self) -> None:
+        """写任务：按顺序发送队列中的消息"""
+        try:
+            while not self.closed:
+                if not self._queue:
+                    self._ready.clear()
+                    await self._ready.wait()
+                    continue
+
+                kind, value = self._queue.popleft()
+                message = self._pending.pop(value) if kind == "key" else value
+                await asyncio.wait_for(self.send(message), timeout=self.send_timeout)
+                self.stats["sent"] += 1
+        except asyncio.TimeoutError:
+            self.lagging = True
+            logger.warning(f"向WebSocket客户端 {self.client_id} 发送超时，断开连接")
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.info(f"WebSocket客户端 {self.client_id} 发送失败: {str(e)}")
+        finally:
+            self.closed = True
+            self._queue.clear()
+            self._pending.clear()
+            if self._on_closed is not None:
+                self._on_closed(self)
+            if self.close is not None:
+                try:
+                    await self.close()
+                except Exception:
+                    pass
+
+    async def stop(self) -> None:
+        """停止写任务"""
+        self.closed = True
+        self._ready.set()
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    @property
+    def queue_size(self) -> int:
+        """当前队列长度"""
+        return len(self._queue)
+
+
+class WebSocketBroadcaster:
+    """WebSocket扇出广播器"""
+
+    def __init__(self,
+                 max_queue_size: int = MAX_QUEUE_SIZE,
+                 send_timeout: float = SEND_TIMEOUT,
+                 redis_url: Optional[str] = REDIS_URL,
+                 channel: str = REDIS_CHANNEL):
+        """初始化广播器
+
+        Args:
+            max_queue_size: 每个连接的发送队列长度
+            send_timeout: 单条消息的发送超时（秒）
+            redis_url: Redis连接URL，设置后广播同步到所有进程
+            channel: Redis广播频道
+        """
+        self.max_queue_size = max_queue_size
+        self.send_timeout = send_timeout
+        self.redis_url = redis_url
+        self.channel = channel
+        self.instance_id = uuid.uuid4().hex
+        self.clients: Dict[str, ClientChannel] = {}
+        self.stats = {"broadcasts": 0, "disconnected_slow": 0, "remote_broadcasts": 0, "resubscribes": 0}
+
+        self._redis = None
+        self._listener: Optional[asyncio.Task] = None
+
+    def register(self, client_id: str, send: SendFunc, close: Optional[CloseFunc] = None) -> ClientChannel:
+        """注册客户端并启动其写任务
+
+        Args:
+            client_id: 客户端标识符
+            send: 发送函数，如 websocket.send_json
+            close: 断开连接函数，如 websocket.close
+
+        Returns:
+            ClientChannel: 发送通道
+        """
+        old = self.clients.pop(client_id, None)
+        if old is not None:
+            old.closed = True
+            old._ready.set()
+
+        channel = ClientChannel(client_id, send, close, self.max_queue_size, self.send_timeout)
+        self.clients[client_id] = channel
+        channel.start(self._on_channel_closed)
+        return channel
+
+    def unregister(self, client_id: str) -> None:
+        """注销客户端
+
+        Args:
+            client_id: 客户端标识符
+        """
+        channel = self.clients.pop(client_id, None)
+        if channel is not None:
+            channel.closed = True
+            channel._ready.set()
+
+    def _on_channel_closed(self, channel: ClientChannel) -> None:
+        if channel.lagging:
+            self.stats["disconnected_slow"] += 1
+        if self.clients.get(channel.client_id) is channel:
+            del self.clients[channel.client_id]
+
+    def send(self, client_id: str, message: Any) -> bool:
+        """向指定客户端发送消息（放入队列）
+
+        Args:
+            client_id: 客户端标识符
+            message: 消息
+
+        Returns:
+            bool: 是否放入成功
+        """
+        channel = self.clients.get(client_id)
+        return channel.put(message) if channel else False
+
+    def broadcast_local(self, message: Any, exclude: Optional[str] = None) -> int:
+        """向本进程的所有客户端广播
+
+        Args:
+            message: 消息
+            exclude: 排除的客户端标识符
+
+        Returns:
+            int: 成功放入队列的客户端数
+        """
+        delivered = 0
+        for client_id, channel in list(self.clients.items()):
+            if client_id != exclude and channel.put(message):
+                delivered += 1
+        return delivered
+
+    async def broadcast(self, message: Any, exclude: Optional[str] = None) -> int:
+        """向所有客户端广播，配置Redis时同步到其他进程
+
+        Args:
+            message: 消息，需可JSON序列化
+            exclude: 排除的客户端标识符
+
+        Returns:
+            int: 本进程中成功放入队列的客户端数
+        """
+        self.stats["broadcasts"] += 1
+        delivered = self.broadcast_local(message, exclude)
+
+        if self._redis is not None:
+            payload = json.dumps({"origin": self.instance_id, "message": message, "exclude": exclude},
+                                 ensure_ascii=False)
+            try:
+                await self._redis.publish(self.channel, payload)
+            except Exception as e:
+                logger.error(f"发布广播消息到Redis失败: {str(e)}")
+
+        return delivered
+
+    async def start(self) -> None:
+        """连接Redis并订阅广播频道（未配置Redis时不做任何事）"""
+        if not self.redis_url or self._listener is not None:
+            return
+
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise ImportError("跨进程广播需要安装 redis: pip install redis") from e
+
+        self._redis = redis.from_url(self.redis_url)
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(self.channel)
+        self._listener = asyncio.create_task(self._listen(pubsub))
+        logger.info(f"WebSocket广播已通过Redis频道同步: {self.channel}")
+
+    async def _listen(self, pubsub) -> None:
+        """接收其他进程的广播并分发给本进程客户端
+
+        Redis连接中断等错误不会结束监听：记录日志后按指数退避重新订阅，直到被stop取消。
+        """
+        delay = RESUBSCRIBE_MIN_DELAY
+        try:
+            while True:
+                try:
+                    if pubsub is None:
+                        pubsub = self._redis.pubsub()
+                        await pubsub.subscribe(self.channel)
+                        self.stats["resubscribes"] += 1
+                        logger.info(f"已重新订阅Redis广播频道: {self.channel}")
+                    async for item in pubsub.listen():
+                        delay = RESUBSCRIBE_MIN_DELAY
+                        if item.get("type") != "message":
+                            continue
+                        try:
+                            data = json.loads(item["data"])
+                        except (TypeError, ValueError):
+                            continue
+                        if data.get("origin") == self.instance_id:
+                            continue
+                        self.stats["remote_broadcasts"] += 1
+                        self.broadcast_local(data.get("message"), data.get("exclude"))
+                    logger.warning(f"Redis广播订阅已结束，{delay:.1f}秒后重新订阅")
+                except Exception as e:
+                    logger.error(f"接收Redis广播失败，{delay:.1f}秒后重新订阅: {str(e)}")
+
+                await self._close_pubsub(pubsub)
+                pubsub = None
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RESUBSCRIBE_MAX_DELAY)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            await self._close_pubsub(pubsub)
+
+    @staticmethod
+    async def _close_pubsub(pubsub) -> None:
+        """关闭订阅，连接已断开时忽略错误"""
+        if pubsub is None:
+            return
+        try:
+            await pubsub.close()
+        except Exception as e:
+            logger.debug(f"关闭Redis订阅失败: {str(e)}")
+
+    async def stop(self) -> None:
+        """停止所有写任务并断开Redis"""
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+        channels = list(self.clients.values())
+        self.clients.clear()
+        await asyncio.gather(*(c.stop() for c in channels), return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取统计信息
+
+        Returns:
+            Dict[str, Any]: 连接数、发送/合并/丢弃数、因落后断开的连接数
+        """
+        totals = {"sent": 0, "coalesced": 0, "dropped": 0}
+        max_queue = 0
+        for channel in self.clients.values():
+            for key in totals:
+                totals[key] += channel.stats[key]
+            max_queue = max(max_queue, channel.queue_size)
+        return {"clients": len(self.clients), "max_queue": max_queue, **totals, **self.stats}
@@ -3,44 +3,228 @@
 
 该模块提供与各专业团队(选题、研究、写作、风格、审核)API交互的客户端类，
 用于执行任务计划中的各种行动步骤。
+
+所有客户端共享进程内同一个HTTP会话（连接池、keep-alive）；幂等的GET请求在
+超过对冲延迟仍未返回时会再发一次、取先返回的结果，网络错误和5xx会重试；
+团队API与控制AI在同一进程时，可通过 ``register_local_handler`` 注册处理函数，
+直接调用而不经过HTTP。每个接口的调用次数、错误数和延迟分位见 ``get_endpoint_metrics``。
+
+可通过环境变量调整:
+- TEAMS_API_BASE_URL: 团队API地址
+- TEAMS_HTTP_TIMEOUT: 单次请求超时秒数，默认30
+- TEAMS_HTTP_MAX_CONNECTIONS: 连接池最大连接数，默认100
+- TEAMS_HTTP_MAX_PER_HOST: 每个主机的最大连接数，默认32
+- TEAMS_HTTP_KEEPALIVE: 空闲连接保持秒数，默认30
+- TEAMS_HEDGE_DELAY: GET请求的对冲延迟秒数，0表示不对冲，默认1
+- TEAMS_GET_RETRIES: GET请求失败重试次数，默认2
 """
 
 import json
 import logging
 import os
 import asyncio
+import inspect
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple, Union
+
 import aiohttp
-from typing import Dict, List, Any, Optional, Union
 
 # 配置日志
 logger = logging.getLogger(__name__)
 
+HTTP_TIMEOUT = float(os.environ.get("TEAMS_HTTP_TIMEOUT", 30))
+HTTP_CONNECT_TIMEOUT = float(os.environ.get("TEAMS_HTTP_CONNECT_TIMEOUT", 5))
+HTTP_MAX_CONNECTIONS = int(os.environ.get("TEAMS_HTTP_MAX_CONNECTIONS", 100))
+HTTP_MAX_PER_HOST = int(os.environ.get("TEAMS_HTTP_MAX_PER_HOST", 32))
+HTTP_KEEPALIVE = float(os.environ.get("TEAMS_HTTP_KEEPALIVE", 30))
+HEDGE_DELAY = float(os.environ.get("TEAMS_HEDGE_DELAY", 1))
+GET_RETRIES = int(os.environ.get("TEAMS_GET_RETRIES", 2))
+
+# 每个接口保留的最近延迟样本数，用于计算分位数
+METRICS_WINDOW = 512
+
+LocalHandler = Callable[[Dict[str, Any]], Union[Dict[str, Any], Awaitable[Dict[str, Any]]]]
+
+
+class TeamAPIError(Exception):
+    """团队API请求失败"""
+
+    def __init__(self, message: str, status: Optional[int] = None, retriable: bool = False):
+        """初始化异常
+
+        Args:
+            message: 错误信息
+            status: HTTP状态码，网络错误时为None
+            retriable: 是否可以重试（网络错误、超时和5xx）
+        """
+        super().__init__(message)
+        self.status = status
+        self.retriable = retriable
+
+
+class EndpointMetrics:
+    """按接口统计调用次数、错误数和延迟"""
+
+    def __init__(self, window: int = METRICS_WINDOW):
+        """初始化统计
+
+        Args:
+            window: 每个接口保留的最近延迟样本数
+        """
+        self.window = window
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._latencies: Dict[str, Deque[float]] = {}
+
+    def record(self, endpoint: str, elapsed: float, ok: bool, **counters: int) -> None:
+        """记录一次调用
+
+        Args:
+            endpoint: 接口，如 "GET /api/topics/trending"
+            elapsed: 耗时（秒）
+            ok: 是否成功
+            **counters: 额外计数，如 hedged=1、retries=1、local=1
+        """
+        stats = self._stats.setdefault(endpoint, {"requests": 0, "errors": 0, "total_time": 0.0, "max_time": 0.0})
+        stats["requests"] += 1
+        stats["total_time"] += elapsed
+        stats["max_time"] = max(stats["max_time"], elapsed)
+        if not ok:
+            stats["errors"] += 1
+        for name, value in counters.items():
+            if value:
+                stats[name] = stats.get(name, 0) + value
+        self._latencies.setdefault(endpoint, deque(maxlen=self.window)).append(elapsed)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """获取各接口的统计
+
+        Returns:
+            Dict[str, Dict[str, Any]]: 接口 -> 请求数、错误数、平均/p50/p95/最大耗时等
+        """
+        result = {}
+        for endpoint, stats in self._stats.items():
+            samples = sorted(self._latencies[endpoint])
+            result[endpoint] = {
+                **stats,
+                "avg_time": stats["total_time"] / stats["requests"],
+                "p50": samples[int(0.50 * (len(samples) - 1))],
+                "p95": samples[int(0.95 * (len(samples) - 1))],
+            }
+        return result
+
+    def clear(self) -> None:
+        """清空统计"""
+        self._stats.clear()
+        self._latencies.clear()
+
+
+# 全局接口统计
+endpoint_metrics = EndpointMetrics()
+
+# 进程内处理函数: (方法, 接口路径) -> 处理函数
+_local_handlers: Dict[Tuple[str, str], LocalHandler] = {}
+
+# 进程内共享的HTTP会话
+_http_session: Optional[aiohttp.ClientSession] = None
+_http_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _normalize_endpoint(endpoint: str) -> str:
+    return "/" + endpoint.lstrip("/")
+
+
+def register_local_handler(endpoint: str, handler: LocalHandler, method: str = "POST") -> None:
+    """注册进程内处理函数，请求该接口时直接调用而不发HTTP请求
+
+    Args:
+        endpoint: 接口路径，如 "/api/topics/trending"
+        handler: 处理函数，参数为请求数据（GET为查询参数），可以是协程函数
+        method: HTTP方法
+    """
+    _local_handlers[(method.upper(), _normalize_endpoint(endpoint))] = handler
+
+
+def unregister_local_handler(endpoint: str, method: str = "POST") -> None:
+    """注销进程内处理函数
+
+    Args:
+        endpoint: 接口路径
+        method: HTTP方法
+    """
+    _local_handlers.pop((method.upper(), _normalize_endpoint(endpoint)), None)
+
+
+async def get_http_session() -> aiohttp.ClientSession:
+    """获取进程内共享的HTTP会话
+
+    Returns:
+        aiohttp.ClientSession: HTTP会话
+    """
+    global _http_session, _http_session_loop
+    loop = asyncio.get_running_loop()
+    if _http_session is None or _http_session.closed or _http_session_loop is not loop:
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_MAX_CONNECTIONS,
+            limit_per_host=HTTP_MAX_PER_HOST,
+            keepalive_timeout=HTTP_KEEPALIVE,
+            ttl_dns_cache=300,
+        )
+        _http_session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+        )
+        _http_session_loop = loop
+    return _http_session
+
+
+async def close_http_session() -> None:
+    """关闭共享的HTTP会话，服务退出时调用"""
+    global _http_session, _http_session_loop
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
+    _http_session_loop = None
+
+
+def get_endpoint_metrics() -> Dict[str, Dict[str, Any]]:
+    """获取各接口的调用统计
+
+    Returns:
+        Dict[str, Dict[str, Any]]: 接口 -> 统计信息
+    """
+    return endpoint_metrics.get_stats()
+
+
 class TeamClient:
     """专业团队客户端基类
 
     提供与专业团队API交互的基础功能。
     """
 
-    def __init__(self, base_url: Optional[str] = None):
+    def __init__(self,
+                 base_url: Optional[str] = None,
+                 hedge_delay: float = HEDGE_DELAY,
+                 get_retries: int = GET_RETRIES):
         """初始化专业团队客户端
 
         Args:
             base_url: API基础URL，如果不提供则从环境变量获取
+            hedge_delay: GET请求的对冲延迟秒数，0表示不对冲
+            get_retries: GET请求失败重试次数
         """
         self.base_url = base_url or os.environ.get("TEAMS_API_BASE_URL", "http://localhost:8000")
-        self.session = None
-
-    async def _ensure_session(self):
-        """确保存在有效的HTTP会话"""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
+        self.hedge_delay = hedge_delay
+        self.get_retries = get_retries
 
     async def _request(self,
                    method: str,
                    endpoint: str,
                    data: Optional[Dict[str, Any]] = None,
                    params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """发送HTTP请求
+        """发送请求
+
+        已注册进程内处理函数的接口直接调用处理函数；GET请求会对冲并重试。
 
         Args:
             method: HTTP方法，如'GET'、'POST'等
@@ -52,23 +236,97 @@ class TeamClient:
             Dict[str, Any]: API响应
 
         Raises:
-            Exception: 当请求失败时
+            TeamAPIError: 当请求失败时
         """
-        await self._ensure_session()
-
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        method = method.upper()
+        path = _normalize_endpoint(endpoint)
+        name = f"{method} {path}"
+        counters = {"hedged": 0, "retries": 0, "local": 0}
+        start = time.perf_counter()
+        ok = False
 
         try:
-            # 设置超时
-            timeout = aiohttp.ClientTimeout(total=30)
+            handler = _local_handlers.get((method, path))
+            if handler is not None:
+                counters["local"] = 1
+                result = handler(data if data is not None else dict(params or {}))
+                if inspect.isawaitable(result):
+                    result = await result
+            elif method == "GET":
+                result = await self._request_idempotent(method, path, data, params, counters)
+            else:
+                result = await self._send(method, path, data, params)
+            ok = True
+            return result
+        finally:
+            endpoint_metrics.record(name, time.perf_counter() - start, ok, **counters)
+
+    async def _request_idempotent(self,
+                                  method: str,
+                                  path: str,
+                                  data: Optional[Dict[str, Any]],
+                                  params: Optional[Dict[str, Any]],
+                                  counters: Dict[str, int]) -> Dict[str, Any]:
+        """发送幂等请求：超过对冲延迟未返回时再发一次，可重试的错误按退避重试"""
+        for attempt in range(self.get_retries + 1):
+            try:
+                return await self._hedged(method, path, data, params, counters)
+            except TeamAPIError as e:
+                if not e.retriable or attempt == self.get_retries:
+                    raise
+                counters["retries"] += 1
+                logger.warning(f"请求 {method} {path} 失败，第 {attempt + 1} 次重试: {str(e)}")
+                await asyncio.sleep(0.2 * 2 ** attempt)
+
+    async def _hedged(self,
+                      method: str,
+                      path: str,
+                      data: Optional[Dict[str, Any]],
+                      params: Optional[Dict[str, Any]],
+                      counters: Dict[str, int]) -> Dict[str, Any]:
+        """对冲请求：取两次请求中先成功返回的结果"""
+        first = asyncio.create_task(self._send(method, path, data, params))
+        if self.hedge_delay <= 0:
+            return await first
+
+        done, _ = await asyncio.wait({first}, timeout=self.hedge_delay)
+        if done:
+            return first.result()
+
+        counters["hedged"] += 1
+        pending = {first, asyncio.create_task(self._send(method, path, data, params))}
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _send(self,
+                    method: str,
+                    path: str,
+                    data: Optional[Dict[str, Any]] = None,
+                    params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """发送一次HTTP请求
 
-            # 发送请求
-            async with self.session.request(
+        Raises:
+            TeamAPIError: 当请求失败时
+        """
+        session = await get_http_session()
+        url = f"{self.base_url}{path}"
+
+        try:
+            async with session.request(
                 method=method,
                 url=url,
                 json=data,
-                params=params,
-                timeout=timeout
+                params=params
             ) as response:
                 # 解析响应
                 result = await response.json()
@@ -76,26 +334,21 @@ class TeamClient:
                 # 检查响应状态
                 if response.status >= 400:
                     logger.error(f"API请求失败: {response.status} - {result}")
-                    error_message = result.get("detail", str(result))
-                    raise Exception(f"API错误: {error_message}")
+                    error_message = result.get("detail", str(result)) if isinstance(result, dict) else str(result)
+                    raise TeamAPIError(f"API错误: {error_message}", status=response.status,
+                                       retriable=response.status >= 500)
 
                 return result
 
-        except aiohttp.ClientError as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"HTTP请求异常: {str(e)}")
-            raise Exception(f"网络错误: {str(e)}")
+            raise TeamAPIError(f"网络错误: {str(e)}", retriable=True)
         except json.JSONDecodeError as e:
             logger.error(f"JSON解析异常: {str(e)}")
-            raise Exception(f"响应解析错误: {str(e)}")
-        except Exception as e:
-            logger.error(f"请求异常: {str(e)}")
-            raise
+            raise TeamAPIError(f"响应解析错误: {str(e)}")
 
     async def close(self):
-        """关闭HTTP会话"""
-        if self.session and not self.session.closed:
-            await self.session.close()
-            self.session = None
+        """客户端共享进程内的HTTP会话，关闭会话请调用 close_http_session"""
 
 
 class TopicClient(TeamClient):
@@ -354,8 +607,15 @@ class TeamClientFactory:
 
         return client
 
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """获取各接口的调用统计
+
+        Returns:
+            Dict[str, Dict[str, Any]]: 接口 -> 统计信息
+        """
+        return get_endpoint_metrics()
+
     async def close_all(self):
-        """关闭所有客户端"""
-        for client in self._clients.values():
-            await client.close()
+        """关闭所有客户端及共享的HTTP会话"""
         self._clients = {}
+        await close_http_session()
@@ -17,16 +17,30 @@ from core.control_ai.intent_recognizer import IntentRecognizer
 from core.control_ai.task_planner import TaskPlanner
 from core.control_ai.response_generator import ResponseGenerator
 from core.control_ai.clients import TeamClientFactory
+from core.control_ai.session_store import SessionStore, create_session_store
 from core.controllers.content_controller import ContentController
 
 # 配置日志
 logger = logging.getLogger(__name__)
 
+# 会话中保留的完整交互轮数，更早的轮次压缩进摘要
+HISTORY_WINDOW = 10
+
+# 会话摘要的最大字符数，超出时丢弃最早的内容
+SUMMARY_MAX_CHARS = 2000
+
+# 每条交互写入摘要时保留的字符数
+SUMMARY_SNIPPET_CHARS = 60
+
+# 会话中保留的任务结果数
+MAX_TASK_RESULTS = 20
+
 # 会话状态
 class SessionState:
     """用户会话状态
 
-    存储与用户交互的上下文信息。
+    存储与用户交互的上下文信息。只保留最近 HISTORY_WINDOW 轮完整交互，
+    更早的交互压缩为滚动摘要，会话占用的内存不随对话轮数增长。
     """
 
     def __init__(self, session_id: str):
@@ -39,6 +53,8 @@ class SessionState:
         self.created_at = datetime.now()
         self.updated_at = datetime.now()
         self.history = []
+        self.summary = ""
+        self.turn_count = 0
         self.current_task = None
         self.task_results = {}
         self.task_status = "idle"  # idle, processing, completed, failed
@@ -60,8 +76,29 @@ class SessionState:
             "assistant": response,
             "timestamp": datetime.now().isoformat()
         })
+        self.turn_count += 1
+        self._compact_history()
         self.update()
 
+    def _compact_history(self):
+        """将超出窗口的交互压缩进摘要"""
+        if len(self.history) <= HISTORY_WINDOW:
+            return
+
+        overflow = self.history[:-HISTORY_WINDOW]
+        self.history = self.history[-HISTORY_WINDOW:]
+
+        lines = [self.summary] if self.summary else []
+        for item in overflow:
+            lines.append(f"用户: {item['user'][:SUMMARY_SNIPPET_CHARS]}")
+            lines.append(f"助手: {item['assistant'][:SUMMARY_SNIPPET_CHARS]}")
+        summary = "\n".join(lines)
+
+        if len(summary) > SUMMARY_MAX_CHARS:
+            summary = summary[-SUMMARY_MAX_CHARS:]
+            summary = summary[summary.find("\n") + 1:]
+        self.summary = summary
+
     def set_task(self, task: Dict[str, Any]):
         """设置当前任务
 
@@ -79,7 +116,10 @@ class SessionState:
             task_id: 任务ID
             result: 任务结果
         """
+        self.task_results.pop(task_id, None)
         self.task_results[task_id] = result
+        while len(self.task_results) > MAX_TASK_RESULTS:
+            self.task_results.pop(next(iter(self.task_results)))
         self.update()
 
     def set_task_status(self, status: str):
@@ -110,7 +150,7 @@ class SessionState:
             "session_id": self.session_id,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
-            "history_length": len(self.history),
+            "history_length": self.turn_count,
             "last_interaction": self.history[-1] if self.history else None,
             "task_status": self.task_status,
             "has_content": self.content is not None
@@ -119,21 +159,67 @@ class SessionState:
     def get_context(self) -> Dict[str, Any]:
         """获取会话上下文
 
+        包含窗口内的全部完整交互和更早交互的摘要，两者衔接，不会遗漏中间的轮次。
+
         Returns:
             Dict[str, Any]: 会话上下文
         """
         context = {
-            "history": self.history[-5:] if len(self.history) > 5 else self.history,
+            "history": self.history[-HISTORY_WINDOW:],
             "current_task": self.current_task,
             "task_status": self.task_status
         }
 
+        if self.summary:
+            context["summary"] = self.summary
+
         if self.content:
             context["current_topic"] = self.content.get("topic")
             context["available_content"] = True
 
         return context
 
+    def to_state(self) -> Dict[str, Any]:
+        """导出完整状态，用于持久化存储
+
+        Returns:
+            Dict[str, Any]: 可JSON序列化的会话状态
+        """
+        return {
+            "session_id": self.session_id,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+            "history": self.history,
+            "summary": self.summary,
+            "turn_count": self.turn_count,
+            "current_task": self.current_task,
+            "task_results": self.task_results,
+            "task_status": self.task_status,
+            "content": self.content
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "SessionState":
+        """从持久化状态还原会话
+
+        Args:
+            state: to_state导出的会话状态
+
+        Returns:
+            SessionState: 会话状态
+        """
+        session = cls(state["session_id"])
+        session.created_at = datetime.fromisoformat(state["created_at"])
+        session.updated_at = datetime.fromisoformat(state["updated_at"])
+        session.history = state.get("history", [])
+        session.summary = state.get("summary", "")
+        session.turn_count = state.get("turn_count", len(session.history))
+        session.current_task = state.get("current_task")
+        session.task_results = state.get("task_results", {})
+        session.task_status = state.get("task_status", "idle")
+        session.content = state.get("content")
+        return session
+
 
 class ControlAI:
     """控制AI
@@ -141,11 +227,12 @@ class ControlAI:
     GenFlow内容生产系统的智能控制中心，负责理解用户意图、规划和协调任务执行。
     """
 
-    def __init__(self, config_dir: Optional[str] = None):
+    def __init__(self, config_dir: Optional[str] = None, session_store: Optional[SessionStore] = None):
         """初始化控制AI
 
         Args:
             config_dir: 配置目录路径，如果不提供则使用默认路径
+            session_store: 会话存储，默认根据环境变量CONTROL_AI_SESSION_BACKEND创建
         """
         # 设置配置目录
         self.config_dir = config_dir or os.path.join(os.path.dirname(__file__), "config")
@@ -170,7 +257,7 @@ class ControlAI:
         self.content_controller = ContentController()
 
         # 用户会话存储
-        self.sessions = {}
+        self.sessions = session_store or create_session_store(SessionState)
 
         logger.info("控制AI初始化完成")
 
@@ -187,19 +274,19 @@ class ControlAI:
             Dict[str, Any]: 处理结果
         """
         # 获取或创建会话
-        session = self.get_session(session_id)
+        session = await self.aget_session(session_id)
 
         try:
             logger.info(f"处理用户请求: {user_input[:50]}...，会话ID: {session.session_id}")
 
             # 1. 识别用户意图
             context = session.get_context()
-            intent_result = self.intent_recognizer.recognize(user_input, context)
+            intent_result = await self.intent_recognizer.recognize(user_input, context)
 
             logger.info(f"识别出意图: {intent_result.get('intent_type')}")
 
             # 2. 规划任务
-            task_plan = self.task_planner.plan(intent_result, context)
+            task_plan = await self.task_planner.plan(intent_result, context)
 
             logger.info(f"规划任务: {task_plan.get('task_type')}，步骤数: {len(task_plan.get('steps', []))}")
 
@@ -225,10 +312,11 @@ class ControlAI:
                 }
 
             # 4. 生成回复
-            response = self.response_generator.generate(task_result, task_plan, user_input, context)
+            response = await self.response_generator.generate(task_result, task_plan, user_input, context)
 
             # 5. 更新会话
             session.add_interaction(user_input, response.get("text", ""))
+            await self.sessions.asave(session)
 
             # 构建响应
             result = {
@@ -251,6 +339,7 @@ class ControlAI:
             # 添加错误交互记录
             error_response = f"抱歉，处理您的请求时出现了问题: {str(e)}"
             session.add_interaction(user_input, error_response)
+            await self.sessions.asave(session)
 
             # 返回错误响应
             return {
@@ -260,29 +349,50 @@ class ControlAI:
                 "suggestions": ["请尝试重新表述您的请求", "如需帮助，请输入'帮助'"]
             }
 
-    def get_session(self, session_id: Optional[str] = None) -> SessionState:
+    def get_session(self, session_id: Optional[str] = None, create: bool = True) -> Optional[SessionState]:
         """获取会话状态
 
         Args:
             session_id: 会话ID，如果不提供则创建新会话
+            create: 会话不存在（或已过期）时是否以该ID创建新会话
 
         Returns:
-            SessionState: 会话状态
+            Optional[SessionState]: 会话状态，create为False且会话不存在时返回None
         """
         if not session_id:
             # 创建新会话
-            new_id = str(uuid.uuid4())
-            session = SessionState(new_id)
-            self.sessions[new_id] = session
+            session = SessionState(str(uuid.uuid4()))
+            self.sessions.save(session)
             return session
 
         # 获取现有会话
-        if session_id in self.sessions:
-            return self.sessions[session_id]
+        session = self.sessions.get(session_id)
+        if session is not None or not create:
+            return session
 
         # 创建指定ID的新会话
         session = SessionState(session_id)
-        self.sessions[session_id] = session
+        self.sessions.save(session)
+        return session
+
+    async def aget_session(self, session_id: Optional[str] = None,
+                           create: bool = True) -> Optional[SessionState]:
+        """异步获取会话状态，Redis存储的读写不阻塞事件循环
+
+        Args:
+            session_id: 会话ID，如果不提供则创建新会话
+            create: 会话不存在（或已过期）时是否以该ID创建新会话
+
+        Returns:
+            Optional[SessionState]: 会话状态，create为False且会话不存在时返回None
+        """
+        if session_id:
+            session = await self.sessions.aget(session_id)
+            if session is not None or not create:
+                return session
+
+        session = SessionState(session_id or str(uuid.uuid4()))
+        await self.sessions.asave(session)
         return session
 
     async def execute_task_step(self,
@@ -300,7 +410,7 @@ class ControlAI:
             Dict[str, Any]: 执行结果
         """
         # 获取会话
-        session = self.get_session(session_id)
+        session = await self.aget_session(session_id)
 
         # 验证任务ID
         if not session.current_task or session.current_task.get("task_id") != task_id:
@@ -324,6 +434,7 @@ class ControlAI:
         elif action == "cancel":
             # 取消任务
             session.set_task_status("cancelled")
+            await self.sessions.asave(session)
 
             return {
                 "status": "success",
@@ -413,16 +524,14 @@ class ControlAI:
                     session_id = step.get("parameters", {}).get("session_id")
 
             # 如果没有会话ID，返回错误
-            if not session_id or session_id not in self.sessions:
+            session = await self.sessions.aget(session_id) if session_id else None
+            if session is None:
                 return {
                     "status": "error",
                     "message": "无法找到指定会话",
                     "session_id": session_id
                 }
 
-            # 获取会话状态
-            session = self.sessions[session_id]
-
             return {
                 "status": "success",
                 "session_status": session.to_dict(),
@@ -464,7 +573,8 @@ class ControlAI:
                     session_id = step.get("parameters", {}).get("session_id")
 
             # 如果没有会话ID，返回错误
-            if not session_id or session_id not in self.sessions:
+            session = await self.sessions.aget(session_id) if session_id else None
+            if session is None:
                 return {
                     "status": "error",
                     "message": "无法找到指定会话",
@@ -472,8 +582,8 @@ class ControlAI:
                 }
 
             # 更新会话状态
-            session = self.sessions[session_id]
             session.set_task_status("cancelled")
+            await self.sessions.asave(session)
 
             return {
                 "status": "success",
@@ -547,6 +657,7 @@ class ControlAI:
                 session.set_task_status("failed")
 
             session.set_task_result(task_id, result)
+            await self.sessions.asave(session)
 
             logger.info(f"任务执行完成: {task_type}")
 
@@ -566,6 +677,7 @@ class ControlAI:
                 "task_type": task_type
             }
             session.set_task_result(task_id, error_result)
+            await self.sessions.asave(session)
 
             return error_result
 
@@ -0,0 +1,406 @@
+"""本地意图分类器 - 在调用LLM前识别常见意图
+
+分两级:
+1. 规则分类器：按 TaskPlanner.TASK_TYPES 中的任务类型编译关键词/正则规则，
+   只命中一个意图（或某个意图权重明显更高）时直接返回
+2. TF-IDF最近邻分类器（可选）：用示例语句和历史LLM识别日志训练，
+   与最相近样本的相似度足够高且邻居意见一致时返回
+
+两级都没有把握时返回None，由 IntentRecognizer 交给LLM处理。
+"""
+
+import json
+import logging
+import math
+import os
+import re
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
+
+from core.control_ai.task_planner import TaskPlanner
+
+# 配置日志
+logger = logging.getLogger(__name__)
+
+# 本地结果的最低置信度，低于该值交给LLM
+DEFAULT_CONFIDENCE_THRESHOLD = 0.85
+
+# 内置示例语句
+DEFAULT_EXAMPLES_PATH = os.path.join(os.path.dirname(__file__), "config", "intent_examples.jsonl")
+
+# 每种任务类型的规则: (正则, 权重)
+# 权重较高的规则代表更具体的意图，例如"全流程"比"写一篇"更能说明是完整内容生产
+INTENT_RULES: Dict[str, List[Tuple[str, int]]] = {
+    "trending_query": [
+        (r"热点|热门|热搜|热榜|爆款|趋势|最近.{0,4}(火|流行)", 1),
+    ],
+    "research_request": [
+        (r"研究|调研|调查|深入了解|资料|背景分析", 1),
+    ],
+    "writing_request": [
+        (r"写(一|1)?(篇|个|段|份)|撰写|创作|起草|写作|帮我写", 1),
+    ],
+    "style_request": [
+        (r"风格|语气|润色|改写|口吻|调整.{0,4}(文风|表达)", 1),
+    ],
+    "review_request": [
+        (r"审核|审查|校对|检查.{0,6}(文章|内容|稿)|挑.{0,2}毛病", 1),
+    ],
+    "content_production": [
+        (r"全流程|完整(的)?(内容)?(生产|流程)|一键(生成|生产)|从选题到", 2),
+    ],
+    "information_query": [
+        (r"^(什么是|.{1,20}是什么)|介绍一下|有哪些功能|支持哪些", 1),
+    ],
+    "status_query": [
+        (r"进度|进展|状态|完成了(吗|没)|到哪(一步|了)", 1),
+    ],
+    "help_request": [
+        (r"^(帮助|help|\?|？)$|怎么用|如何使用|使用说明|能做什么", 1),
+    ],
+    "cancel_request": [
+        (r"^(取消|停止|停下|算了|不要了)|取消(任务|这个|当前)|停止(任务|生成)", 2),
+    ],
+}
+
+# 分类关键词，用于提取category实体
+CATEGORY_KEYWORDS = {
+    "科技": ["科技", "技术", "AI", "人工智能", "互联网", "数码"],
+    "财经": ["财经", "金融", "经济", "股市", "投资"],
+    "娱乐": ["娱乐", "明星", "综艺", "电影", "影视"],
+    "体育": ["体育", "足球", "篮球", "赛事"],
+    "教育": ["教育", "学习", "考试", "高考"],
+    "健康": ["健康", "医疗", "养生"],
+    "汽车": ["汽车", "新能源车", "电动车"],
+}
+
+_TOPIC_PATTERNS = [
+    re.compile(r"关于[「“\"']?(?P<topic>.+?)[」”\"']?的"),
+    re.compile(r"(研究|调研)(一下)?[「“\"']?(?P<topic>[^，。,.!！?？]{2,}?)[」”\"']?(的(现状|发展|资料))?$"),
+    re.compile(r"写(一|1)?(篇|个|段|份)[「“\"']?(?P<topic>[^，。,.!！?？]{2,}?)[」”\"']?(的)?(文章|内容|文案|报告)?$"),
+]
+_STYLE_PATTERN = re.compile(r"(用|以|改成|换成)(?P<style>[^，。,\s]{1,8}?)(的)?(风格|语气|口吻)")
+
+
+def extract_entities(text: str) -> Dict[str, str]:
+    """从输入中提取常见实体
+
+    Args:
+        text: 用户输入
+
+    Returns:
+        Dict[str, str]: 提取到的topic、category、style
+    """
+    entities = {}
+
+    for pattern in _TOPIC_PATTERNS:
+        match = pattern.search(text)
+        if match and match.group("topic").strip():
+            entities["topic"] = match.group("topic").strip()
+            break
+
+    for category, keywords in CATEGORY_KEYWORDS.items():
+        if any(k.lower() in text.lower() for k in keywords):
+            entities["category"] = category
+            break
+
+    match = _STYLE_PATTERN.search(text)
+    if match:
+        entities["style"] = match.group("style")
+
+    return entities
+
+
+class RuleIntentClassifier:
+    """基于关键词/正则规则的意图分类器"""
+
+    def __init__(self, rules: Optional[Dict[str, List[Tuple[str, int]]]] = None):
+        """初始化规则分类器
+
+        Args:
+            rules: 意图规则，默认使用INTENT_RULES；只编译TaskPlanner.TASK_TYPES中存在的任务类型
+        """
+        rules = rules or INTENT_RULES
+        self.rules: Dict[str, List[Tuple[Pattern, int]]] = {}
+        for intent_type in TaskPlanner.TASK_TYPES:
+            if intent_type in rules:
+                self.rules[intent_type] = [(re.compile(p, re.IGNORECASE), w) for p, w in rules[intent_type]]
+
+    def classify(self, text: str) -> Optional[Dict]:
+        """对输入分类
+
+        Args:
+            text: 用户输入
+
+        Returns:
+            Optional[Dict]: 识别结果，无规则命中时返回None
+        """
+        text = text.strip()
+        scores = Counter()
+        for intent_type, patterns in self.rules.items():
+            for pattern, weight in patterns:
+                if pattern.search(text):
+                    scores[intent_type] += weight
+
+        if not scores:
+            return None
+
+        ranked = scores.most_common(2)
+        top_intent, top_score = ranked[0]
+        second_score = ranked[1][1] if len(ranked) > 1 else 0
+
+        if second_score == 0:
+            confidence = 0.95
+        elif top_score >= 2 * second_score:
+            confidence = 0.88
+        else:
+            # 多个意图势均力敌，交给LLM判断
+            confidence = 0.5
+
+        return {
+            "intent_type": top_intent,
+            "confidence": confidence,
+            "entities": extract_entities(text),
+            "explanation": f"规则匹配: {', '.join(scores)}",
+            "source": "rules",
+        }
+
+
+class TfidfIntentClassifier:
+    """基于字符n-gram TF-IDF的最近邻意图分类器
+
+    中文不需要分词，直接使用单字和双字作为特征；样本通过倒排索引检索。
+    """
+
+    def __init__(self, ngram_range: Tuple[int, int] = (1, 2), k: int = 3,
+                 min_similarity: float = 0.5):
+        """初始化分类器
+
+        Args:
+            ngram_range: 字符n-gram范围
+            k: 参与投票的最近邻数量
+            min_similarity: 最近邻的最低相似度，低于该值视为没有把握；
+                达到该值时以近邻投票的一致程度作为置信度
+        """
+        self.ngram_range = ngram_range
+        self.k = k
+        self.min_similarity = min_similarity
+        self.idf: Dict[str, float] = {}
+        self.labels: List[str] = []
+        self.vectors: List[Dict[str, float]] = []
+        self.index: Dict[str, List[int]] = defaultdict(list)
+
+    @property
+    def is_fitted(self) -> bool:
+        """是否已训练"""
+        return bool(self.vectors)
+
+    def _ngrams(self, text: str) -> Counter:
+        text = re.sub(r"\s+", "", text.lower())
+        grams = Counter()
+        low, high = self.ngram_range
+        for n in range(low, high + 1):
+            for i in range(len(text) - n + 1):
+                grams[text[i:i + n]] += 1
+        return grams
+
+    def _vectorize(self, text: str) -> Dict[str, float]:
+        vector = {g: (1 + math.log(c)) * self.idf[g]
+                  for g, c in self._ngrams(text).items() if g in self.idf}
+        norm = math.sqrt(sum(v * v for v in vector.values()))
+        return {g: v / norm for g, v in vector.items()} if norm else {}
+
+    def fit(self, examples: Iterable[Tuple[str, str]]) -> "TfidfIntentClassifier":
+        """训练分类器
+
+        Args:
+            examples: (文本, 意图类型) 样本
+
+        Returns:
+            TfidfIntentClassifier: 自身
+        """
+        examples = [(t, label) for t, label in examples if t and label]
+        doc_freq = Counter()
+        for text, _ in examples:
+            doc_freq.update(set(self._ngrams(text)))
+
+        total = len(examples)
+        self.idf = {g: math.log((1 + total) / (1 + df)) + 1 for g, df in doc_freq.items()}
+        self.labels = []
+        self.vectors = []
+        self.index = defaultdict(list)
+
+        for text, label in examples:
+            vector = self._vectorize(text)
+            if not vector:
+                continue
+            for g in vector:
+                self.index[g].append(len(self.vectors))
+            self.labels.append(label)
+            self.vectors.append(vector)
+
+        logger.info(f"TF-IDF意图分类器训练完成: {len(self.vectors)} 个样本，{len(self.idf)} 个特征")
+        return self
+
+    def classify(self, text: str) -> Optional[Dict]:
+        """对输入分类
+
+        Args:
+            text: 用户输入
+
+        Returns:
+            Optional[Dict]: 识别结果，未训练或没有足够相似的样本时返回None
+        """
+        if not self.is_fitted:
+            return None
+
+        query = self._vectorize(text)
+        similarities: Dict[int, float] = defaultdict(float)
+        for g, weight in query.items():
+            for i in self.index.get(g, ()):
+                similarities[i] += weight * self.vectors[i][g]
+
+        if not similarities:
+            return None
+
+        neighbors = sorted(similarities.items(), key=lambda x: x[1], reverse=True)[:self.k]
+        best_similarity = neighbors[0][1]
+        if best_similarity < self.min_similarity:
+            return None
+
+        votes = Counter()
+        for i, similarity in neighbors:
+            votes[self.labels[i]] += similarity
+        intent_type, score = votes.most_common(1)[0]
+        agreement = score / sum(votes.values())
+
+        return {
+            "intent_type": intent_type,
+            "confidence": round(agreement, 3),
+            "entities": extract_entities(text),
+            "explanation": f"最近邻相似度 {best_similarity:.2f}",
+            "source": "tfidf",
+        }
+
+
+def load_examples(path: str) -> List[Tuple[str, str]]:
+    """读取意图样本
+
+    文件为JSONL格式，每行包含text和intent_type字段。
+
+    Args:
+        path: 文件路径
+
+    Returns:
+        List[Tuple[str, str]]: (文本, 意图类型) 列表
+    """
+    examples = []
+    if not os.path.exists(path):
+        return examples
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get("text") and record.get("intent_type"):
+                examples.append((record["text"], record["intent_type"]))
+    return examples
+
+
+def log_intent(path: str, text: str, result: Dict) -> None:
+    """记录LLM识别结果，作为TF-IDF分类器的训练样本
+
+    Args:
+        path: 日志文件路径
+        text: 用户输入
+        result: 识别结果
+    """
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({
+                "text": text,
+                "intent_type": result.get("intent_type"),
+                "confidence": result.get("confidence"),
+            }, ensure_ascii=False) + "\n")
+    except OSError as e:
+        logger.warning(f"记录意图日志失败: {str(e)}")
+
+
+class LocalIntentClassifier:
+    """分级本地意图分类器
+
+    先用规则分类，没有把握时再用TF-IDF最近邻分类，都没有把握时返回None。
+    """
+
+    def __init__(self,
+                 rule_classifier: Optional[RuleIntentClassifier] = None,
+                 tfidf_classifier: Optional[TfidfIntentClassifier] = None,
+                 confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD):
+        """初始化分类器
+
+        Args:
+            rule_classifier: 规则分类器
+            tfidf_classifier: TF-IDF分类器，为None时只使用规则
+            confidence_threshold: 直接返回结果的最低置信度
+        """
+        self.rule_classifier = rule_classifier or RuleIntentClassifier()
+        self.tfidf_classifier = tfidf_classifier
+        self.confidence_threshold = confidence_threshold
+        self.stats = Counter()
+
+    @classmethod
+    def from_examples(cls, paths: Iterable[str],
+                      confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD) -> "LocalIntentClassifier":
+        """使用样本文件训练TF-IDF层并创建分类器
+
+        Args:
+            paths: 样本文件路径（内置示例、意图日志等），不存在的文件会被跳过
+            confidence_threshold: 直接返回结果的最低置信度
+
+        Returns:
+            LocalIntentClassifier: 分类器
+        """
+        examples = []
+        for path in paths:
+            examples.extend(load_examples(path))
+
+        tfidf = TfidfIntentClassifier().fit(examples) if examples else None
+        return cls(tfidf_classifier=tfidf, confidence_threshold=confidence_threshold)
+
+    def classify(self, text: str) -> Optional[Dict]:
+        """对输入分类
+
+        Args:
+            text: 用户输入
+
+        Returns:
+            Optional[Dict]: 有把握时返回识别结果，否则返回None
+        """
+        self.stats["total"] += 1
+
+        for classifier in (self.rule_classifier, self.tfidf_classifier):
+            if classifier is None:
+                continue
+            result = classifier.classify(text)
+            if result and result["confidence"] >= self.confidence_threshold:
+                self.stats[result["source"]] += 1
+                return result
+
+        self.stats["escalated"] += 1
+        return None
+
+    def get_stats(self) -> Dict[str, int]:
+        """获取各层命中次数
+
+        Returns:
+            Dict[str, int]: total、rules、tfidf、escalated 计数
+        """
+        return {key: self.stats.get(key, 0) for key in ("total", "rules", "tfidf", "escalated")}
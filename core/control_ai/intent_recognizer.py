@@ -10,11 +10,21 @@ import logging
 import os
 from typing import Dict, List, Any, Optional
 
-from openai import OpenAI
+from core.control_ai.intent_classifier import DEFAULT_EXAMPLES_PATH, LocalIntentClassifier, log_intent
+from core.control_ai.llm_client import LLMClient, get_llm_client
 
 # 配置日志
 logger = logging.getLogger(__name__)
 
+# 是否启用本地意图分类（规则 + TF-IDF），命中时不调用LLM
+LOCAL_INTENT_ENABLED = os.environ.get("CONTROL_AI_LOCAL_INTENT", "true").lower() in ("1", "true", "yes")
+
+# LLM识别结果日志，用作TF-IDF分类器的训练样本；为空时不记录
+INTENT_LOG_PATH = os.environ.get("CONTROL_AI_INTENT_LOG", "")
+
+# 写入意图日志的最低置信度
+INTENT_LOG_MIN_CONFIDENCE = 0.8
+
 class IntentRecognizer:
     """意图识别器
 
@@ -37,18 +47,35 @@ class IntentRecognizer:
         "unknown"             # 未知意图
     ]
 
-    def __init__(self, system_prompt: Optional[str] = None):
+    def __init__(self,
+                 system_prompt: Optional[str] = None,
+                 llm_client: Optional[LLMClient] = None,
+                 local_classifier: Optional[LocalIntentClassifier] = None,
+                 use_local_classifier: bool = LOCAL_INTENT_ENABLED,
+                 intent_log_path: Optional[str] = None):
         """初始化意图识别器
 
         Args:
             system_prompt: 可选的系统提示，用于引导LLM更好地识别意图
+            llm_client: 可选的LLM客户端，默认使用全局共享客户端
+            local_classifier: 可选的本地意图分类器，默认用内置示例和意图日志训练
+            use_local_classifier: 是否先用本地分类器识别
+            intent_log_path: LLM识别结果日志路径，默认读取环境变量CONTROL_AI_INTENT_LOG
         """
-        self.client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+        self.client = llm_client or get_llm_client()
+        self.intent_log_path = intent_log_path if intent_log_path is not None else INTENT_LOG_PATH
+
+        # 本地意图分类器
+        self.local_classifier = None
+        if use_local_classifier:
+            self.local_classifier = local_classifier or LocalIntentClassifier.from_examples(
+                [DEFAULT_EXAMPLES_PATH, self.intent_log_path] if self.intent_log_path else [DEFAULT_EXAMPLES_PATH]
+            )
 
         # 设置系统提示
         self.system_prompt = system_prompt or self._get_default_system_prompt()
 
-    def recognize(self, user_input: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    async def recognize(self, user_input: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """识别用户输入的意图和实体
 
         Args:
@@ -59,10 +86,20 @@ class IntentRecognizer:
             Dict[str, Any]: 包含意图类型、置信度和提取实体的结果
         """
         try:
+            # 先尝试本地分类，有把握时不调用LLM
+            if self.local_classifier:
+                local_result = self.local_classifier.classify(user_input)
+                if local_result:
+                    logger.info(f"本地识别意图: {local_result['intent_type']} "
+                                f"(来源: {local_result['source']}, 置信度: {local_result['confidence']})")
+                    return local_result
+
             # 构建上下文提示
             context_prompt = ""
             if context:
                 context_prompt = "上下文信息:\n"
+                if context.get("summary"):
+                    context_prompt += f"更早的对话摘要:\n{context['summary']}\n"
                 if "history" in context:
                     # 添加最近的历史交互记录
                     history = context["history"][-5:] if len(context["history"]) > 5 else context["history"]
@@ -88,15 +125,13 @@ class IntentRecognizer:
             ]
 
             # 调用OpenAI API
-            response = self.client.chat.completions.create(
-                model="gpt-4-turbo",  # 或其他适合的模型
+            content = await self.client.chat(
                 messages=messages,
                 response_format={"type": "json_object"},
                 temperature=0.1,
             )
 
             # 解析响应
-            content = response.choices[0].message.content
             result = json.loads(content)
 
             # 验证结果格式
@@ -106,6 +141,11 @@ class IntentRecognizer:
             logger.info(f"识别意图: {result.get('intent_type')} (置信度: {result.get('confidence')})")
             logger.debug(f"识别实体: {result.get('entities')}")
 
+            # 记录高置信度结果，供本地分类器再训练
+            if (self.intent_log_path and result["intent_type"] != "unknown"
+                    and result["confidence"] >= INTENT_LOG_MIN_CONFIDENCE):
+                log_intent(self.intent_log_path, user_input, result)
+
             return result
 
         except Exception as e:
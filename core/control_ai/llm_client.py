@@ -0,0 +1,228 @@
+"""LLM客户端 - 控制AI各组件共享的异步OpenAI客户端
+
+意图识别、任务规划和响应生成都通过本模块访问OpenAI，共享同一个连接池，
+避免每个组件各自建立连接；所有调用都是异步的，不会阻塞事件循环上的其他会话
+和WebSocket连接。
+
+可通过环境变量调整:
+- OPENAI_BASE_URL: API地址（可指向本地模拟服务做压测）
+- CONTROL_AI_LLM_TIMEOUT: 单次请求超时秒数，默认60
+- CONTROL_AI_LLM_CONNECT_TIMEOUT: 建立连接超时秒数，默认5
+- CONTROL_AI_LLM_MAX_RETRIES: 失败重试次数，默认2
+- CONTROL_AI_LLM_MAX_CONNECTIONS: 连接池最大连接数，默认100
+- CONTROL_AI_LLM_MAX_CONCURRENCY: 同时进行的LLM请求上限，默认32
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+from openai import AsyncOpenAI
+
+# 配置日志
+logger = logging.getLogger(__name__)
+
+# 默认模型
+DEFAULT_MODEL = os.environ.get("OPENAI_MODEL", "gpt-4-turbo")
+
+LLM_TIMEOUT = float(os.environ.get("CONTROL_AI_LLM_TIMEOUT", 60))
+LLM_CONNECT_TIMEOUT = float(os.environ.get("CONTROL_AI_LLM_CONNECT_TIMEOUT", 5))
+LLM_MAX_RETRIES = int(os.environ.get("CONTROL_AI_LLM_MAX_RETRIES", 2))
+LLM_MAX_CONNECTIONS = int(os.environ.get("CONTROL_AI_LLM_MAX_CONNECTIONS", 100))
+LLM_MAX_CONCURRENCY = int(os.environ.get("CONTROL_AI_LLM_MAX_CONCURRENCY", 32))
+
+
+class LLMClient:
+    """异步LLM客户端
+
+    封装AsyncOpenAI，提供共享连接池、超时和并发上限。
+    """
+
+    def __init__(self,
+                 api_key: Optional[str] = None,
+                 base_url: Optional[str] = None,
+                 timeout: float = LLM_TIMEOUT,
+                 max_retries: int = LLM_MAX_RETRIES,
+                 max_connections: int = LLM_MAX_CONNECTIONS,
+                 max_concurrency: int = LLM_MAX_CONCURRENCY):
+        """初始化LLM客户端
+
+        Args:
+            api_key: OpenAI API密钥，默认读取环境变量OPENAI_API_KEY
+            base_url: API地址，默认读取环境变量OPENAI_BASE_URL
+            timeout: 单次请求超时秒数
+            max_retries: 失败重试次数
+            max_connections: 连接池最大连接数
+            max_concurrency: 同时进行的请求上限
+        """
+        self.max_concurrency = max_concurrency
+        self._options = {
+            "api_key": api_key or os.environ.get("OPENAI_API_KEY"),
+            "base_url": base_url or os.environ.get("OPENAI_BASE_URL"),
+            "timeout": timeout,
+            "max_retries": max_retries,
+            "max_connections": max_connections,
+        }
+        self._http_client, self.client = self._create_client()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # 连接池和信号量所属的事件循环，首次请求时绑定
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closed = False
+
+        # 统计信息
+        self.stats = {"requests": 0, "errors": 0, "in_flight": 0, "total_time": 0.0}
+
+    def _create_client(self):
+        """创建连接池和AsyncOpenAI客户端"""
+        options = self._options
+        http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(options["timeout"], connect=LLM_CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=options["max_connections"],
+                max_keepalive_connections=options["max_connections"],
+            ),
+        )
+        client = AsyncOpenAI(
+            api_key=options["api_key"],
+            base_url=options["base_url"],
+            max_retries=options["max_retries"],
+            http_client=http_client,
+        )
+        return http_client, client
+
+    def _bind_loop(self) -> None:
+        """把连接池和信号量绑定到当前事件循环
+
+        httpx连接和asyncio信号量只能在创建它们的事件循环中使用；客户端被另一个
+        事件循环（如asyncio.run新建的循环）使用时或关闭后再次使用时重新创建。
+        旧循环通常已经关闭，无法在其中关闭旧连接池，只丢弃引用。
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and not self._closed:
+            return
+        if self._loop is not None or self._closed:
+            logger.debug("事件循环已变化，重新创建LLM连接池")
+            self._http_client, self.client = self._create_client()
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._loop = loop
+        self._closed = False
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """当前事件循环的并发信号量"""
+        self._bind_loop()
+        return self._semaphore
+
+    async def chat(self,
+                   messages: List[Dict[str, Any]],
+                   model: Optional[str] = None,
+                   **kwargs) -> str:
+        """调用聊天补全接口
+
+        Args:
+            messages: 消息列表
+            model: 模型名称，默认使用DEFAULT_MODEL
+            **kwargs: 其他传给chat.completions.create的参数
+
+        Returns:
+            str: 回复内容
+        """
+        async with self.semaphore:
+            self.stats["in_flight"] += 1
+            start = time.perf_counter()
+            try:
+                response = await self.client.chat.completions.create(
+                    model=model or DEFAULT_MODEL,
+                    messages=messages,
+                    **kwargs
+                )
+                return response.choices[0].message.content
+            except Exception:
+                self.stats["errors"] += 1
+                raise
+            finally:
+                self.stats["in_flight"] -= 1
+                self.stats["requests"] += 1
+                self.stats["total_time"] += time.perf_counter() - start
+
+    async def stream_chat(self,
+                          messages: List[Dict[str, Any]],
+                          model: Optional[str] = None,
+                          **kwargs) -> AsyncIterator[str]:
+        """流式调用聊天补全接口，逐段返回生成的文本
+
+        Args:
+            messages: 消息列表
+            model: 模型名称，默认使用DEFAULT_MODEL
+            **kwargs: 其他传给chat.completions.create的参数
+
+        Yields:
+            str: 新生成的文本片段
+        """
+        async with self.semaphore:
+            self.stats["in_flight"] += 1
+            start = time.perf_counter()
+            try:
+                stream = await self.client.chat.completions.create(
+                    model=model or DEFAULT_MODEL,
+                    messages=messages,
+                    stream=True,
+                    **kwargs
+                )
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        yield delta
+            except Exception:
+                self.stats["errors"] += 1
+                raise
+            finally:
+                self.stats["in_flight"] -= 1
+                self.stats["requests"] += 1
+                self.stats["total_time"] += time.perf_counter() - start
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取统计信息
+
+        Returns:
+            Dict[str, Any]: 请求数、错误数、进行中请求数和平均耗时
+        """
+        stats = dict(self.stats)
+        stats["avg_time"] = stats["total_time"] / stats["requests"] if stats["requests"] else 0.0
+        stats["max_concurrency"] = self.max_concurrency
+        return stats
+
+    async def close(self) -> None:
+        """关闭连接池，连接池属于其他事件循环时只丢弃引用"""
+        if self._loop is None or self._loop is asyncio.get_running_loop():
+            await self.client.close()
+        self._closed = True
+
+
+# 全局共享客户端
+_llm_client: Optional[LLMClient] = None
+
+
+def get_llm_client() -> LLMClient:
+    """获取全局共享的LLM客户端
+
+    Returns:
+        LLMClient: LLM客户端
+    """
+    global _llm_client
+    if _llm_client is None:
+        _llm_client = LLMClient()
+    return _llm_client
+
+
+async def close_llm_client() -> None:
+    """关闭全局LLM客户端，服务退出时调用"""
+    global _llm_client
+    if _llm_client is not None:
+        await _llm_client.close()
+        _llm_client = None
@@ -0,0 +1,210 @@
+"""计划模板缓存 - 复用LLM生成的任务计划
+
+"写一篇关于X、风格为Y的文章"这类请求的计划只在实体取值上不同。LLM规划完成后，
+将计划中出现的实体值替换为占位符（如 ``{{topic}}``）保存为模板，之后遇到意图类型
+和实体字段相同的请求时，直接代入新实体得到计划，无需再次调用LLM。
+
+模板按 (意图类型, 实体字段集合, 是否有可用内容) 索引，LRU淘汰。
+"""
+
+import copy
+import logging
+import os
+import re
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# 配置日志
+logger = logging.getLogger(__name__)
+
+# 缓存的模板数量上限
+PLAN_CACHE_SIZE = int(os.environ.get("CONTROL_AI_PLAN_CACHE_SIZE", 256))
+
+# 参与模板化的实体值最小长度，过短的值（如"中"）容易误替换
+MIN_ENTITY_VALUE_LENGTH = 2
+
+_PLACEHOLDER = re.compile(r"\{\{(\w+)\}\}")
+
+PlanKey = Tuple[str, Tuple[str, ...], bool]
+
+
+def _placeholder(name: str) -> str:
+    return "{{" + name + "}}"
+
+
+class PlanTemplateCache:
+    """任务计划模板缓存"""
+
+    def __init__(self, max_size: int = PLAN_CACHE_SIZE):
+        """初始化缓存
+
+        Args:
+            max_size: 模板数量上限
+        """
+        self.max_size = max_size
+        self._templates: "OrderedDict[PlanKey, Dict[str, Any]]" = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "stored": 0, "skipped": 0, "evicted": 0, "invalid": 0}
+
+    @staticmethod
+    def make_key(intent_type: str, entities: Dict[str, Any],
+                 context: Optional[Dict[str, Any]] = None) -> PlanKey:
+        """计算缓存键
+
+        Args:
+            intent_type: 意图类型
+            entities: 实体
+            context: 上下文
+
+        Returns:
+            PlanKey: (意图类型, 非空实体字段, 是否有可用内容)
+        """
+        fields = tuple(sorted(k for k, v in entities.items() if v not in (None, "", [], {})))
+        has_content = bool(context and context.get("available_content"))
+        return intent_type, fields, has_content
+
+    def get(self, intent_type: str, entities: Dict[str, Any],
+            context: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """查找模板并代入实体
+
+        Args:
+            intent_type: 意图类型
+            entities: 实体
+            context: 上下文
+
+        Returns:
+            Optional[Dict[str, Any]]: 代入实体后的计划，未命中时返回None
+        """
+        key = self.make_key(intent_type, entities, context)
+        template = self._templates.get(key)
+        if template is None:
+            self.stats["misses"] += 1
+            return None
+
+        self._templates.move_to_end(key)
+        self.stats["hits"] += 1
+        return self._fill(template, entities)
+
+    def put(self, intent_type: str, entities: Dict[str, Any], plan: Dict[str, Any],
+            context: Optional[Dict[str, Any]] = None) -> bool:
+        """将计划保存为模板
+
+        只有所有实体值都能在计划中找到并替换为占位符时才缓存，
+        避免模板中残留上一个请求的实体值。
+
+        Args:
+            intent_type: 意图类型
+            entities: 生成该计划时的实体
+            plan: 已通过校验的计划
+            context: 上下文
+
+        Returns:
+            bool: 是否已缓存
+        """
+        values = {}
+        for name, value in entities.items():
+            if value in (None, "", [], {}):
+                continue
+            if not isinstance(value, (str, int, float, list)):
+                self.stats["skipped"] += 1
+                return False
+            values[name] = value
+
+        found = set()
+        template = self._extract(copy.deepcopy(plan), values, found)
+        template.pop("task_id", None)
+        if found != set(values):
+            self.stats["skipped"] += 1
+            return False
+
+        key = self.make_key(intent_type, entities, context)
+        self._templates[key] = template
+        self._templates.move_to_end(key)
+        self.stats["stored"] += 1
+        while len(self._templates) > self.max_size:
+            self._templates.popitem(last=False)
+            self.stats["evicted"] += 1
+        return True
+
+    def invalidate(self, intent_type: str, entities: Dict[str, Any],
+                   context: Optional[Dict[str, Any]] = None) -> None:
+        """删除模板（代入后的计划未通过校验时调用）
+
+        Args:
+            intent_type: 意图类型
+            entities: 实体
+            context: 上下文
+        """
+        self._templates.pop(self.make_key(intent_type, entities, context), None)
+        self.stats["invalid"] += 1
+
+    def _extract(self, node: Any, values: Dict[str, Any], found: set) -> Any:
+        """将计划中的实体值替换为占位符"""
+        if isinstance(node, dict):
+            return {k: self._extract(v, values, found) for k, v in node.items()}
+
+        if isinstance(node, list):
+            for name, value in values.items():
+                if isinstance(value, list) and node == value:
+                    found.add(name)
+                    return _placeholder(name)
+            return [self._extract(item, values, found) for item in node]
+
+        if isinstance(node, (int, float)) and not isinstance(node, bool):
+            for name, value in values.items():
+                if not isinstance(value, bool) and isinstance(value, (int, float)) and node == value:
+                    found.add(name)
+                    return _placeholder(name)
+            return node
+
+        if isinstance(node, str):
+            # 先替换较长的值，避免短值破坏长值
+            for name, value in sorted(values.items(), key=lambda x: -len(str(x[1]))):
+                if isinstance(value, list):
+                    continue
+                text = str(value)
+                if len(text) < MIN_ENTITY_VALUE_LENGTH and node != text:
+                    continue
+                if node == text:
+                    found.add(name)
+                    return _placeholder(name)
+                if text in node:
+                    found.add(name)
+                    node = node.replace(text, _placeholder(name))
+            return node
+
+        return node
+
+    def _fill(self, node: Any, entities: Dict[str, Any]) -> Any:
+        """将占位符替换为实体值"""
+        if isinstance(node, dict):
+            return {k: self._fill(v, entities) for k, v in node.items()}
+
+        if isinstance(node, list):
+            return [self._fill(item, entities) for item in node]
+
+        if isinstance(node, str):
+            match = _PLACEHOLDER.fullmatch(node)
+            if match:
+                # 整个值是占位符时保留实体原类型（列表、数字）
+                return copy.deepcopy(entities.get(match.group(1)))
+            return _PLACEHOLDER.sub(lambda m: str(entities.get(m.group(1), "")), node)
+
+        return node
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取统计信息
+
+        Returns:
+            Dict[str, Any]: 模板数、命中次数、命中率等
+        """
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            "templates": len(self._templates),
+            "max_size": self.max_size,
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+            **self.stats,
+        }
+
+    def clear(self) -> None:
+        """清空缓存"""
+        self._templates.clear()
@@ -7,10 +7,9 @@
 
 import json
 import logging
-import os
 from typing import Dict, List, Any, Optional
 
-from openai import OpenAI
+from core.control_ai.llm_client import LLMClient, get_llm_client
 
 # 配置日志
 logger = logging.getLogger(__name__)
@@ -21,18 +20,19 @@ class ResponseGenerator:
     将任务执行结果转化为自然语言回复。
     """
 
-    def __init__(self, system_prompt: Optional[str] = None):
+    def __init__(self, system_prompt: Optional[str] = None, llm_client: Optional[LLMClient] = None):
         """初始化响应生成器
 
         Args:
             system_prompt: 可选的系统提示，用于引导LLM生成更好的回复
+            llm_client: 可选的LLM客户端，默认使用全局共享客户端
         """
-        self.client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+        self.client = llm_client or get_llm_client()
 
         # 设置系统提示
         self.system_prompt = system_prompt or self._get_default_system_prompt()
 
-    def generate(self,
+    async def generate(self,
             task_result: Dict[str, Any],
             task_plan: Dict[str, Any],
             user_input: str,
@@ -63,7 +63,7 @@ class ResponseGenerator:
                 return self._generate_simple_response(task_type, task_result)
 
             # 对于复杂结果使用LLM生成回复
-            return self._generate_complex_response(task_result, task_plan, user_input, context)
+            return await self._generate_complex_response(task_result, task_plan, user_input, context)
 
         except Exception as e:
             logger.error(f"生成回复失败: {str(e)}")
@@ -136,7 +136,7 @@ class ResponseGenerator:
         # 默认回复
         return {"text": "已完成处理。"}
 
-    def _generate_complex_response(self,
+    async def _generate_complex_response(self,
                               task_result: Dict[str, Any],
                               task_plan: Dict[str, Any],
                               user_input: str,
@@ -183,15 +183,11 @@ class ResponseGenerator:
         ]
 
         # 调用OpenAI API
-        response = self.client.chat.completions.create(
-            model="gpt-4-turbo",  # 或其他适合的模型
+        text_response = await self.client.chat(
             messages=messages,
             temperature=0.7,
         )
 
-        # 解析响应
-        text_response = response.choices[0].message.content
-
         # 尝试提取建议行动
         suggestions = self._extract_suggestions(text_response, task_type, task_result)
 
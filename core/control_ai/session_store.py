@@ -0,0 +1,302 @@
+"""会话存储 - 控制AI会话的有界存储
+
+提供两种实现:
+- MemorySessionStore: 进程内LRU存储，超过容量淘汰最久未访问的会话，空闲超时的会话自动过期
+- RedisSessionStore: 以Redis为共享存储、MemorySessionStore为本地缓存的两级存储，
+  会话在服务重启和多实例负载均衡时仍然可用
+
+会话对象需要实现 ``to_state()`` / ``from_state()`` 才能保存到Redis。
+异步代码应使用 ``aget()`` / ``asave()`` / ``adelete()``，Redis读写在线程池中执行，
+不会阻塞事件循环。
+可通过环境变量配置:
+- CONTROL_AI_SESSION_BACKEND: memory（默认）或 redis
+- CONTROL_AI_REDIS_URL: Redis连接URL
+- CONTROL_AI_MAX_SESSIONS: 内存中最多保留的会话数，默认10000
+- CONTROL_AI_SESSION_TTL: 会话空闲过期秒数，默认86400
+- CONTROL_AI_SESSION_CACHE_TTL: Redis模式下本地缓存的过期秒数，默认30
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# 配置日志
+logger = logging.getLogger(__name__)
+
+SESSION_BACKEND = os.environ.get("CONTROL_AI_SESSION_BACKEND", "memory")
+REDIS_URL = os.environ.get("CONTROL_AI_REDIS_URL", "redis://localhost:6379/0")
+MAX_SESSIONS = int(os.environ.get("CONTROL_AI_MAX_SESSIONS", 10000))
+SESSION_TTL = int(os.environ.get("CONTROL_AI_SESSION_TTL", 24 * 60 * 60))
+SESSION_CACHE_TTL = int(os.environ.get("CONTROL_AI_SESSION_CACHE_TTL", 30))
+
+# Redis键前缀
+REDIS_KEY_PREFIX = "genflow:control_ai:session:"
+
+
+class SessionStore:
+    """会话存储基类"""
+
+    def get(self, session_id: str) -> Optional[Any]:
+        """获取会话
+
+        Args:
+            session_id: 会话ID
+
+        Returns:
+            Optional[Any]: 会话，不存在或已过期时返回None
+        """
+        raise NotImplementedError
+
+    def save(self, session: Any) -> None:
+        """保存会话
+
+        Args:
+            session: 会话对象，需要有session_id属性
+        """
+        raise NotImplementedError
+
+    def delete(self, session_id: str) -> None:
+        """删除会话
+
+        Args:
+            session_id: 会话ID
+        """
+        raise NotImplementedError
+
+    async def aget(self, session_id: str) -> Optional[Any]:
+        """异步获取会话，默认直接调用get"""
+        return self.get(session_id)
+
+    async def asave(self, session: Any) -> None:
+        """异步保存会话，默认直接调用save"""
+        self.save(session)
+
+    async def adelete(self, session_id: str) -> None:
+        """异步删除会话，默认直接调用delete"""
+        self.delete(session_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取统计信息
+
+        Returns:
+            Dict[str, Any]: 统计信息
+        """
+        return {}
+
+    def __contains__(self, session_id: str) -> bool:
+        return self.get(session_id) is not None
+
+
+class MemorySessionStore(SessionStore):
+    """进程内LRU会话存储
+
+    按最近访问顺序保存会话，超过容量时淘汰最久未访问的会话；
+    空闲时间超过TTL的会话在访问或写入时清理。
+    """
+
+    def __init__(self, max_sessions: int = MAX_SESSIONS, ttl: float = SESSION_TTL):
+        """初始化内存存储
+
+        Args:
+            max_sessions: 最多保留的会话数
+            ttl: 会话空闲过期秒数
+        """
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        # session_id -> (会话, 最后访问时间)
+        self._sessions: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "evicted": 0, "expired": 0}
+
+    def get(self, session_id: str) -> Optional[Any]:
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+
+        session, last_access = entry
+        now = time.monotonic()
+        if now - last_access > self.ttl:
+            del self._sessions[session_id]
+            self.stats["expired"] += 1
+            self.stats["misses"] += 1
+            return None
+
+        self._sessions[session_id] = (session, now)
+        self._sessions.move_to_end(session_id)
+        self.stats["hits"] += 1
+        return session
+
+    def save(self, session: Any) -> None:
+        now = time.monotonic()
+        self._sessions[session.session_id] = (session, now)
+        self._sessions.move_to_end(session.session_id)
+        self._sweep(now)
+
+    def delete(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+
+    def _sweep(self, now: float) -> None:
+        """清理过期会话并淘汰超出容量的会话
+
+        会话按访问时间排序，只需从最旧的一端检查。
+        """
+        while self._sessions:
+            session_id, (_, last_access) = next(iter(self._sessions.items()))
+            if now - last_access <= self.ttl:
+                break
+            self._sessions.popitem(last=False)
+            self.stats["expired"] += 1
+
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+            self.stats["evicted"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "memory",
+            "sessions": len(self._sessions),
+            "max_sessions": self.max_sessions,
+            **self.stats,
+        }
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+class RedisSessionStore(SessionStore):
+    """Redis两级会话存储
+
+    Redis保存全部会话并负责过期，本地LRU缓存减少读取次数。
+    本地缓存的TTL较短，多实例部署时其他实例的修改最多延迟该时间可见。
+    """
+
+    def __init__(self,
+                 session_cls: Any,
+                 redis_url: str = REDIS_URL,
+                 ttl: int = SESSION_TTL,
+                 cache_size: int = MAX_SESSIONS,
+                 cache_ttl: float = SESSION_CACHE_TTL,
+                 redis_client: Any = None):
+        """初始化Redis存储
+
+        Args:
+            session_cls: 会话类，用于从Redis数据还原会话
+            redis_url: Redis连接URL
+            ttl: 会话空闲过期秒数
+            cache_size: 本地缓存容量
+            cache_ttl: 本地缓存过期秒数
+            redis_client: 可选的Redis客户端，默认根据redis_url创建
+        """
+        if redis_client is None:
+            try:
+                import redis
+            except ImportError as e:
+                raise ImportError("Redis会话存储需要安装 redis: pip install redis") from e
+            redis_client = redis.from_url(redis_url, socket_timeout=1, socket_connect_timeout=1)
+
+        self.session_cls = session_cls
+        self.redis = redis_client
+        self.ttl = ttl
+        self.cache = MemorySessionStore(max_sessions=cache_size, ttl=cache_ttl)
+        self.stats = {"redis_hits": 0, "redis_misses": 0, "redis_errors": 0}
+
+    def _key(self, session_id: str) -> str:
+        return f"{REDIS_KEY_PREFIX}{session_id}"
+
+    def get(self, session_id: str) -> Optional[Any]:
+        session = self.cache.get(session_id)
+        if session is not None:
+            return session
+        return self._cache(self._load(session_id))
+
+    def save(self, session: Any) -> None:
+        self.cache.save(session)
+        self._store(session.session_id, self._dump(session))
+
+    def delete(self, session_id: str) -> None:
+        self.cache.delete(session_id)
+        self._remove(session_id)
+
+    async def aget(self, session_id: str) -> Optional[Any]:
+        session = self.cache.get(session_id)
+        if session is not None:
+            return session
+        # 本地缓存不是线程安全的，只在事件循环线程中写入
+        return self._cache(await asyncio.to_thread(self._load, session_id))
+
+    async def asave(self, session: Any) -> None:
+        # 在事件循环线程中序列化，线程池只负责网络写入，不会读到被并发修改的会话
+        self.cache.save(session)
+        await asyncio.to_thread(self._store, session.session_id, self._dump(session))
+
+    async def adelete(self, session_id: str) -> None:
+        self.cache.delete(session_id)
+        await asyncio.to_thread(self._remove, session_id)
+
+    @staticmethod
+    def _dump(session: Any) -> str:
+        return json.dumps(session.to_state(), ensure_ascii=False)
+
+    def _cache(self, session: Optional[Any]) -> Optional[Any]:
+        if session is not None:
+            self.cache.save(session)
+        return session
+
+    def _load(self, session_id: str) -> Optional[Any]:
+        """从Redis读取会话"""
+        try:
+            data = self.redis.get(self._key(session_id))
+        except Exception as e:
+            self.stats["redis_errors"] += 1
+            logger.error(f"从Redis读取会话失败: {str(e)}")
+            return None
+
+        if data is None:
+            self.stats["redis_misses"] += 1
+            return None
+
+        self.stats["redis_hits"] += 1
+        return self.session_cls.from_state(json.loads(data))
+
+    def _store(self, session_id: str, data: str) -> None:
+        """写入Redis"""
+        try:
+            self.redis.setex(self._key(session_id), self.ttl, data)
+        except Exception as e:
+            self.stats["redis_errors"] += 1
+            logger.error(f"保存会话到Redis失败: {str(e)}")
+
+    def _remove(self, session_id: str) -> None:
+        """从Redis删除"""
+        try:
+            self.redis.delete(self._key(session_id))
+        except Exception as e:
+            self.stats["redis_errors"] += 1
+            logger.error(f"从Redis删除会话失败: {str(e)}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "redis",
+            "cache": self.cache.get_stats(),
+            **self.stats,
+        }
+
+
+def create_session_store(session_cls: Any, backend: str = SESSION_BACKEND) -> SessionStore:
+    """根据配置创建会话存储
+
+    Args:
+        session_cls: 会话类
+        backend: memory 或 redis
+
+    Returns:
+        SessionStore: 会话存储
+    """
+    if backend == "redis":
+        logger.info(f"使用Redis会话存储: {REDIS_URL}")
+        return RedisSessionStore(session_cls)
+    return MemorySessionStore()
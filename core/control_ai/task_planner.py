@@ -7,10 +7,10 @@
 
 import json
 import logging
-import os
 from typing import Dict, List, Any, Optional, Tuple
 
-from openai import OpenAI
+from core.control_ai.llm_client import LLMClient, get_llm_client
+from core.control_ai.plan_cache import PlanTemplateCache
 
 # 配置日志
 logger = logging.getLogger(__name__)
@@ -50,18 +50,26 @@ class TaskPlanner:
         "cancel_request": ["cancel_task"]
     }
 
-    def __init__(self, system_prompt: Optional[str] = None):
+    def __init__(self,
+                 system_prompt: Optional[str] = None,
+                 llm_client: Optional[LLMClient] = None,
+                 plan_cache: Optional[PlanTemplateCache] = None,
+                 use_plan_cache: bool = True):
         """初始化任务规划器
 
         Args:
             system_prompt: 可选的系统提示，用于引导LLM更好地规划任务
+            llm_client: 可选的LLM客户端，默认使用全局共享客户端
+            plan_cache: 可选的计划模板缓存
+            use_plan_cache: 是否复用已缓存的计划模板
         """
-        self.client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+        self.client = llm_client or get_llm_client()
+        self.plan_cache = (plan_cache or PlanTemplateCache()) if use_plan_cache else None
 
         # 设置系统提示
         self.system_prompt = system_prompt or self._get_default_system_prompt()
 
-    def plan(self, intent_result: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    async def plan(self, intent_result: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """根据意图规划任务
 
         Args:
@@ -86,7 +94,7 @@ class TaskPlanner:
                 return self._create_simple_plan(intent_type, entities)
 
             # 对于复杂任务，使用LLM来规划
-            return self._plan_complex_task(intent_type, entities, context)
+            return await self._plan_complex_task(intent_type, entities, context)
 
         except Exception as e:
             logger.error(f"任务规划失败: {str(e)}")
@@ -165,10 +173,10 @@ class TaskPlanner:
             "requires_confirmation": False
         }
 
-    def _plan_complex_task(self,
-                       intent_type: str,
-                       entities: Dict[str, Any],
-                       context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    async def _plan_complex_task(self,
+                             intent_type: str,
+                             entities: Dict[str, Any],
+                             context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """使用LLM规划复杂任务
 
         Args:
@@ -179,6 +187,19 @@ class TaskPlanner:
         Returns:
             Dict[str, Any]: 任务规划结果
         """
+        # 优先使用缓存的计划模板
+        if self.plan_cache:
+            cached_plan = self.plan_cache.get(intent_type, entities, context)
+            if cached_plan is not None:
+                try:
+                    self._validate_plan(cached_plan)
+                    logger.info(f"使用缓存的计划模板: {cached_plan.get('task_type')} "
+                                f"(步骤数: {len(cached_plan.get('steps', []))})")
+                    return cached_plan
+                except ValueError as e:
+                    logger.warning(f"缓存的计划模板无效，重新规划: {str(e)}")
+                    self.plan_cache.invalidate(intent_type, entities, context)
+
         # 构建上下文提示
         context_prompt = ""
         if context:
@@ -206,20 +227,22 @@ class TaskPlanner:
         ]
 
         # 调用OpenAI API
-        response = self.client.chat.completions.create(
-            model="gpt-4-turbo",  # 或其他适合的模型
+        content = await self.client.chat(
             messages=messages,
             response_format={"type": "json_object"},
             temperature=0.1,
         )
 
         # 解析响应
-        content = response.choices[0].message.content
         result = json.loads(content)
 
         # 验证结果格式
         self._validate_plan(result)
 
+        # 保存为模板，供实体字段相同的请求复用
+        if self.plan_cache:
+            self.plan_cache.put(intent_type, entities, result, context)
+
         # 记录规划结果
         logger.info(f"任务规划完成: {result.get('task_type')} (步骤数: {len(result.get('steps', []))})")
 
@@ -75,8 +75,8 @@ def mock_control_ai():
             "task_status": "completed"
         }
 
-        # 设置get_session方法
-        mock.get_session = MagicMock(return_value=session_mock)
+        # 设置aget_session方法
+        mock.aget_session = AsyncMock(return_value=session_mock)
 
         # 设置execute_task_step方法
         mock.execute_task_step = AsyncMock(return_value={
@@ -202,14 +202,14 @@ async def test_get_session_info(mock_control_ai):
     assert "session_id" in response.json()["data"]
 
     # 验证控制AI方法调用
-    mock_control_ai.get_session.assert_called_once_with(TEST_SESSION_ID)
+    mock_control_ai.aget_session.assert_awaited_once_with(TEST_SESSION_ID, create=False)
 
 
 @pytest.mark.asyncio
 async def test_get_session_info_not_found(mock_control_ai):
     """测试获取不存在的会话信息"""
-    # 设置get_session返回None
-    mock_control_ai.get_session.return_value = None
+    # 设置aget_session返回None
+    mock_control_ai.aget_session.return_value = None
 
     # 发送请求
     response = client.get(f"/api/session/non-existent-session")
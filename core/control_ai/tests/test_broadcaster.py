@@ -0,0 +1,198 @@
+"""
+WebSocket广播器单元测试 - 测试扇出、慢客户端隔离、进度合并与积压断开
+"""
+
+import asyncio
+import json
+import time
+import unittest
+from unittest.mock import patch
+
+from core.control_ai.broadcaster import WebSocketBroadcaster
+
+
+class SimulatedClient:
+    """模拟WebSocket客户端"""
+
+    def __init__(self, delay: float = 0.0, block: bool = False):
+        self.delay = delay
+        self.block = block
+        self.received = []
+        self.closed = False
+
+    async def send(self, message):
+        if self.block:
+            await asyncio.Event().wait()
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.received.append(message)
+
+    async def close(self):
+        self.closed = True
+
+
+async def wait_until(predicate, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise TimeoutError("等待条件超时")
+        await asyncio.sleep(0.01)
+
+
+class FakePubSub:
+    """依次产出给定消息，消息为异常时抛出该异常"""
+
+    def __init__(self, items):
+        self.items = items
+        self.closed = False
+        self.channels = []
+
+    async def subscribe(self, channel):
+        self.channels.append(channel)
+
+    async def listen(self):
+        for item in self.items:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+        await asyncio.Event().wait()
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeRedis:
+    """每次pubsub()返回预设的下一个订阅"""
+
+    def __init__(self, pubsubs):
+        self.pubsubs = list(pubsubs)
+
+    def pubsub(self):
+        return self.pubsubs.pop(0)
+
+
+def remote_message(seq):
+    payload = {"origin": "other", "message": {"type": "message", "seq": seq}, "exclude": None}
+    return {"type": "message", "data": json.dumps(payload)}
+
+
+class TestWebSocketBroadcaster(unittest.TestCase):
+    """WebSocket广播器测试"""
+
+    def test_fan_out_to_5k_clients_with_slow_ones(self):
+        """5000个客户端中有慢客户端和卡死客户端，其他客户端仍及时收到全部消息"""
+
+        async def run():
+            broadcaster = WebSocketBroadcaster(max_queue_size=20, send_timeout=0.5)
+            fast = [SimulatedClient() for _ in range(4950)]
+            slow = [SimulatedClient(delay=0.05) for _ in range(40)]
+            stuck = [SimulatedClient(block=True) for _ in range(10)]
+            for i, client in enumerate(fast + slow + stuck):
+                broadcaster.register(f"client-{i}", client.send, client.close)
+
+            start = time.perf_counter()
+            for n in range(10):
+                await broadcaster.broadcast({"type": "message", "seq": n})
+                await broadcaster.broadcast({"type": "progress", "task_id": "t1", "progress": n * 10})
+            enqueue_time = time.perf_counter() - start
+
+            # 进度消息可能被合并，普通消息和最新进度一定送达
+            await wait_until(lambda: all(
+                c.received and c.received[-1] == {"type": "progress", "task_id": "t1", "progress": 90}
+                for c in fast
+            ))
+            fast_time = time.perf_counter() - start
+            await wait_until(lambda: all(c.closed for c in stuck))
+            await wait_until(lambda: all(
+                {"type": "message", "seq": 9} in c.received for c in slow
+            ))
+
+            stats = broadcaster.get_stats()
+            await broadcaster.stop()
+            return enqueue_time, fast_time, fast, slow, stuck, stats
+
+        enqueue_time, fast_time, fast, slow, stuck, stats = asyncio.run(run())
+
+        # 广播只入队，不等待任何客户端
+        self.assertLess(enqueue_time, 1.0)
+        self.assertLess(fast_time, 3.0)
+        # 卡死的客户端发送超时后被断开
+        self.assertTrue(all(c.closed for c in stuck))
+        self.assertEqual(stats["disconnected_slow"], 10)
+        self.assertEqual(stats["clients"], 4990)
+        # 普通消息不会丢失且保持顺序
+        for client in fast[:100] + slow:
+            seqs = [m["seq"] for m in client.received if m["type"] == "message"]
+            self.assertEqual(seqs, list(range(10)))
+
+    def test_progress_frames_coalesce(self):
+        """未发送的同一任务进度消息只保留最新一条"""
+
+        async def run():
+            broadcaster = WebSocketBroadcaster()
+            client = SimulatedClient(delay=0.05)
+            broadcaster.register("c", client.send, client.close)
+
+            broadcaster.send("c", {"type": "message", "text": "开始"})
+            for progress in range(0, 101, 10):
+                broadcaster.send("c", {"type": "progress", "task_id": "t1", "progress": progress})
+
+            await wait_until(lambda: len(client.received) == 2)
+            await broadcaster.stop()
+            return client.received
+
+        received = asyncio.run(run())
+        self.assertEqual(received[1]["progress"], 100)
+
+    def test_lagging_client_disconnected(self):
+        """积压的普通消息超过上限时断开客户端"""
+
+        async def run():
+            broadcaster = WebSocketBroadcaster(max_queue_size=5, send_timeout=10)
+            client = SimulatedClient(block=True)
+            broadcaster.register("c", client.send, client.close)
+
+            results = [broadcaster.send("c", {"type": "message", "seq": i}) for i in range(10)]
+            await wait_until(lambda: client.closed)
+            stats = broadcaster.get_stats()
+            await broadcaster.stop()
+            return results, stats
+
+        results, stats = asyncio.run(run())
+        self.assertFalse(all(results))
+        self.assertEqual(stats["clients"], 0)
+        self.assertEqual(stats["disconnected_slow"], 1)
+
+    def test_listener_resubscribes_after_redis_error(self):
+        """订阅连接出错后记录日志并重新订阅，之后的远程广播照常分发"""
+
+        async def run():
+            broadcaster = WebSocketBroadcaster()
+            client = SimulatedClient()
+            broadcaster.register("c1", client.send, client.close)
+
+            first = FakePubSub([remote_message(1), ConnectionError("连接断开")])
+            second = FakePubSub([remote_message(2)])
+            broadcaster._redis = FakeRedis([second])
+
+            with patch("core.control_ai.broadcaster.RESUBSCRIBE_MIN_DELAY", 0.01):
+                listener = asyncio.create_task(broadcaster._listen(first))
+                await wait_until(lambda: len(client.received) == 2)
+                listener.cancel()
+                await asyncio.gather(listener, return_exceptions=True)
+
+            broadcaster._redis = None
+            await broadcaster.stop()
+            return client.received, first, second, broadcaster.get_stats()
+
+        received, first, second, stats = asyncio.run(run())
+        self.assertEqual([m["seq"] for m in received], [1, 2])
+        self.assertTrue(first.closed)
+        self.assertTrue(second.closed)
+        self.assertEqual(second.channels, ["genflow:control_ai:broadcast"])
+        self.assertEqual(stats["resubscribes"], 1)
+        self.assertEqual(stats["remote_broadcasts"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
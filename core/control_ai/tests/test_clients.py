@@ -0,0 +1,97 @@
+"""
+专业团队客户端单元测试 - 测试进程内调用、GET对冲与重试、接口统计
+"""
+
+import asyncio
+import unittest
+
+from core.control_ai import clients
+from core.control_ai.clients import TeamAPIError, TopicClient, WritingClient
+
+
+class TestTeamClient(unittest.TestCase):
+    """专业团队客户端测试"""
+
+    def setUp(self):
+        clients.endpoint_metrics.clear()
+
+    def tearDown(self):
+        clients.unregister_local_handler("/api/topics/trending", method="GET")
+        clients.unregister_local_handler("/api/writing/create")
+
+    def test_local_handler_skips_http(self):
+        """注册了进程内处理函数的接口不发HTTP请求"""
+        calls = []
+
+        async def create(data):
+            calls.append(data)
+            return {"content": f"关于{data['topic']}的文章"}
+
+        clients.register_local_handler("/api/writing/create", create)
+        client = WritingClient("http://unreachable.invalid")
+
+        async def fail_send(*args, **kwargs):
+            raise AssertionError("不应发送HTTP请求")
+
+        client._send = fail_send
+        result = asyncio.run(client.create_content("人工智能"))
+
+        self.assertEqual(result["content"], "关于人工智能的文章")
+        self.assertEqual(calls, [{"topic": "人工智能"}])
+        stats = clients.get_endpoint_metrics()["POST /api/writing/create"]
+        self.assertEqual(stats["requests"], 1)
+        self.assertEqual(stats["local"], 1)
+
+    def test_get_is_hedged(self):
+        """GET请求超过对冲延迟未返回时再发一次，取先返回的结果"""
+        client = TopicClient(hedge_delay=0.05)
+        delays = [1.0, 0.01]
+
+        async def send(method, path, data=None, params=None):
+            await asyncio.sleep(delays.pop(0))
+            return {"trending_topics": ["话题"]}
+
+        client._send = send
+
+        async def run():
+            start = asyncio.get_running_loop().time()
+            result = await client.get_trending_topics()
+            return result, asyncio.get_running_loop().time() - start
+
+        result, elapsed = asyncio.run(run())
+
+        self.assertEqual(result["trending_topics"], ["话题"])
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(clients.get_endpoint_metrics()["GET /api/topics/trending"]["hedged"], 1)
+
+    def test_get_retries_only_retriable_errors(self):
+        """GET请求遇到5xx重试，遇到4xx直接失败；POST不重试"""
+        client = TopicClient(hedge_delay=0, get_retries=2)
+        errors = [TeamAPIError("API错误: 503", status=503, retriable=True)]
+
+        async def send(method, path, data=None, params=None):
+            if errors:
+                raise errors.pop(0)
+            return {"trending_topics": []}
+
+        client._send = send
+        asyncio.run(client.get_trending_topics())
+        self.assertEqual(clients.get_endpoint_metrics()["GET /api/topics/trending"]["retries"], 1)
+
+        attempts = []
+
+        async def reject(method, path, data=None, params=None):
+            attempts.append(method)
+            raise TeamAPIError("API错误: 请求无效", status=400)
+
+        client._send = reject
+        with self.assertRaises(TeamAPIError):
+            asyncio.run(client.get_trending_topics())
+        with self.assertRaises(TeamAPIError):
+            asyncio.run(client.evaluate_topic("话题"))
+        self.assertEqual(attempts, ["GET", "POST"])
+        self.assertEqual(clients.get_endpoint_metrics()["POST /api/topics/evaluate"]["errors"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
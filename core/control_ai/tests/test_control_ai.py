@@ -76,9 +76,9 @@ class TestControlAI(unittest.TestCase):
             with open("core/control_ai/config/system_prompt.txt", "w", encoding="utf-8") as f:
                 f.write("你是GenFlow内容生产系统的控制AI，负责连接用户与专业团队。")
 
-    @patch("core.control_ai.intent_recognizer.OpenAI")
-    @patch("core.control_ai.task_planner.OpenAI")
-    @patch("core.control_ai.response_generator.OpenAI")
+    @patch("core.control_ai.intent_recognizer.get_llm_client")
+    @patch("core.control_ai.task_planner.get_llm_client")
+    @patch("core.control_ai.response_generator.get_llm_client")
     async def test_process_request(self, mock_response_openai, mock_task_openai, mock_intent_openai):
         """测试处理用户请求"""
         # 导入控制AI类
@@ -131,7 +131,7 @@ class TestControlAI(unittest.TestCase):
             # 验证方法调用
             mock_execute_task.assert_called_once()
 
-    @patch("core.control_ai.intent_recognizer.OpenAI")
+    @patch("core.control_ai.intent_recognizer.get_llm_client")
     def test_recognize_intent(self, mock_openai):
         """测试意图识别器集成"""
         from core.control_ai.control_ai import ControlAI
@@ -147,7 +147,7 @@ class TestControlAI(unittest.TestCase):
         # 模拟意图识别方法
         with patch.object(IntentRecognizer, "recognize", return_value=MOCK_INTENT_RESULT) as mock_recognize:
             # 调用意图识别
-            result = control_ai.intent_recognizer.recognize("写一篇关于AI发展的文章", {})
+            result = asyncio.run(control_ai.intent_recognizer.recognize("写一篇关于AI发展的文章", {}))
 
             # 验证结果
             self.assertEqual(result["intent_type"], MOCK_INTENT_RESULT["intent_type"])
@@ -157,7 +157,7 @@ class TestControlAI(unittest.TestCase):
             # 验证方法调用
             mock_recognize.assert_called_once()
 
-    @patch("core.control_ai.task_planner.OpenAI")
+    @patch("core.control_ai.task_planner.get_llm_client")
     def test_plan_task(self, mock_openai):
         """测试任务规划器集成"""
         from core.control_ai.control_ai import ControlAI
@@ -173,7 +173,7 @@ class TestControlAI(unittest.TestCase):
         # 模拟任务规划方法
         with patch.object(TaskPlanner, "plan", return_value=MOCK_TASK_PLAN) as mock_plan:
             # 调用任务规划
-            result = control_ai.task_planner.plan(MOCK_INTENT_RESULT, {})
+            result = asyncio.run(control_ai.task_planner.plan(MOCK_INTENT_RESULT, {}))
 
             # 验证结果
             self.assertEqual(result["task_type"], MOCK_TASK_PLAN["task_type"])
@@ -183,7 +183,7 @@ class TestControlAI(unittest.TestCase):
             # 验证方法调用
             mock_plan.assert_called_once()
 
-    @patch("core.control_ai.response_generator.OpenAI")
+    @patch("core.control_ai.response_generator.get_llm_client")
     def test_generate_response(self, mock_openai):
         """测试响应生成器集成"""
         from core.control_ai.control_ai import ControlAI
@@ -200,7 +200,7 @@ class TestControlAI(unittest.TestCase):
         with patch.object(ResponseGenerator, "generate", return_value=MOCK_RESPONSE) as mock_generate:
             # 调用响应生成
             task_result = {"status": "success", "result": {"message": "任务执行成功"}}
-            result = control_ai.response_generator.generate(task_result, MOCK_TASK_PLAN, "写一篇关于AI发展的文章", {})
+            result = asyncio.run(control_ai.response_generator.generate(task_result, MOCK_TASK_PLAN, "写一篇关于AI发展的文章", {}))
 
             # 验证结果
             self.assertEqual(result["text"], MOCK_RESPONSE["text"])
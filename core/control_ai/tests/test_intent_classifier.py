@@ -0,0 +1,89 @@
+"""
+本地意图分类器单元测试 - 测试规则层、TF-IDF层与LLM降级
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from core.control_ai.intent_classifier import (
+    DEFAULT_EXAMPLES_PATH,
+    LocalIntentClassifier,
+    RuleIntentClassifier,
+    TfidfIntentClassifier,
+    load_examples,
+    log_intent,
+)
+from core.control_ai.intent_recognizer import IntentRecognizer
+
+
+class TestIntentClassifier(unittest.TestCase):
+    """本地意图分类器测试"""
+
+    def test_rules_short_circuit(self):
+        """常见输入由规则层直接识别"""
+        classifier = RuleIntentClassifier()
+
+        result = classifier.classify("看看今天科技热点")
+        self.assertEqual(result["intent_type"], "trending_query")
+        self.assertEqual(result["entities"]["category"], "科技")
+
+        result = classifier.classify("写一篇关于AI发展的文章")
+        self.assertEqual(result["intent_type"], "writing_request")
+        self.assertEqual(result["entities"]["topic"], "AI发展")
+
+        self.assertEqual(classifier.classify("帮助")["intent_type"], "help_request")
+        self.assertIsNone(classifier.classify("嗯"))
+
+    def test_weighted_rule_wins(self):
+        """更具体的规则权重更高"""
+        result = RuleIntentClassifier().classify("一键生成一篇科技热点文章")
+        self.assertEqual(result["intent_type"], "content_production")
+        self.assertGreaterEqual(result["confidence"], 0.85)
+
+    def test_tfidf_nearest_neighbor(self):
+        """规则未覆盖的说法由TF-IDF层按相似样本识别"""
+        tfidf = TfidfIntentClassifier().fit(load_examples(DEFAULT_EXAMPLES_PATH))
+        result = tfidf.classify("别写了，不要继续")
+        self.assertEqual(result["intent_type"], "cancel_request")
+
+    def test_ambiguous_input_escalates(self):
+        """没有把握的输入返回None"""
+        classifier = LocalIntentClassifier()
+        self.assertIsNone(classifier.classify("这个怎么样"))
+        self.assertEqual(classifier.get_stats()["escalated"], 1)
+
+    def test_recognizer_escalates_and_logs(self):
+        """本地未命中时调用LLM，并记录高置信度结果"""
+        llm = MagicMock()
+        llm.chat = AsyncMock(return_value=json.dumps({
+            "intent_type": "feedback",
+            "confidence": 0.9,
+            "entities": {}
+        }))
+        log_path = os.path.join(tempfile.mkdtemp(), "intent_log.jsonl")
+        recognizer = IntentRecognizer(llm_client=llm, intent_log_path=log_path)
+
+        result = asyncio.run(recognizer.recognize("这个怎么样"))
+        self.assertEqual(result["intent_type"], "feedback")
+        llm.chat.assert_awaited_once()
+        self.assertEqual(load_examples(log_path), [("这个怎么样", "feedback")])
+
+        result = asyncio.run(recognizer.recognize("帮助"))
+        self.assertEqual(result["source"], "rules")
+        llm.chat.assert_awaited_once()
+
+    def test_log_intent_round_trip(self):
+        """意图日志可作为训练样本读取"""
+        log_path = os.path.join(tempfile.mkdtemp(), "intent_log.jsonl")
+        log_intent(log_path, "来点新鲜的选题", {"intent_type": "trending_query", "confidence": 0.9})
+
+        classifier = LocalIntentClassifier.from_examples([log_path])
+        self.assertTrue(classifier.tfidf_classifier.is_fitted)
+
+
+if __name__ == "__main__":
+    unittest.main()
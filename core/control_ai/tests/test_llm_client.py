@@ -0,0 +1,102 @@
+"""
+LLM客户端单元测试 - 测试并发上限与组件的异步调用
+"""
+
+import asyncio
+import json
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from core.control_ai.llm_client import LLMClient
+from core.control_ai.intent_recognizer import IntentRecognizer
+
+
+class TestLLMClient(unittest.TestCase):
+    """LLM客户端测试"""
+
+    def test_concurrency_cap(self):
+        """同时进行的请求数不超过并发上限"""
+        llm = LLMClient(api_key="test", max_concurrency=3)
+        state = {"in_flight": 0, "peak": 0}
+
+        async def fake_create(**kwargs):
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            await asyncio.sleep(0.01)
+            state["in_flight"] -= 1
+            response = MagicMock()
+            response.choices[0].message.content = "ok"
+            return response
+
+        llm.client.chat.completions.create = fake_create
+
+        async def run():
+            results = await asyncio.gather(*(llm.chat([{"role": "user", "content": "hi"}]) for _ in range(10)))
+            await llm.close()
+            return results
+
+        results = asyncio.run(run())
+
+        self.assertEqual(results, ["ok"] * 10)
+        self.assertEqual(state["peak"], 3)
+        self.assertEqual(llm.get_stats()["requests"], 10)
+
+    def test_rebinds_on_new_event_loop(self):
+        """在新的事件循环中使用时重新创建连接池和信号量"""
+        llm = LLMClient(api_key="test", max_concurrency=2)
+        clients = []
+
+        def create_client():
+            response = MagicMock()
+            response.choices[0].message.content = "ok"
+            client = MagicMock()
+            client.chat.completions.create = AsyncMock(return_value=response)
+            client.close = AsyncMock()
+            clients.append(client)
+            return MagicMock(), client
+
+        llm._create_client = create_client
+        llm._http_client, llm.client = create_client()
+
+        async def run():
+            return await llm.chat([{"role": "user", "content": "hi"}]), llm.semaphore
+
+        first, first_semaphore = asyncio.run(run())
+        second, second_semaphore = asyncio.run(run())
+
+        self.assertEqual((first, second), ("ok", "ok"))
+        self.assertEqual(len(clients), 2)
+        self.assertIsNot(first_semaphore, second_semaphore)
+        clients[0].chat.completions.create.assert_awaited_once()
+        clients[1].chat.completions.create.assert_awaited_once()
+
+        # 关闭当前循环的连接池后再次使用会重新创建
+        async def close_and_reuse():
+            await llm.chat([{"role": "user", "content": "hi"}])
+            await llm.close()
+            return await llm.chat([{"role": "user", "content": "hi"}])
+
+        self.assertEqual(asyncio.run(close_and_reuse()), "ok")
+        clients[1].close.assert_not_awaited()
+        clients[2].close.assert_awaited_once()
+        self.assertEqual(len(clients), 4)
+
+    def test_recognizer_uses_async_client(self):
+        """意图识别器通过异步客户端获取并校验结果"""
+        llm = MagicMock()
+        llm.chat = AsyncMock(return_value=json.dumps({
+            "intent_type": "writing_request",
+            "confidence": 0.9,
+            "entities": {"topic": "AI"}
+        }))
+
+        recognizer = IntentRecognizer(llm_client=llm, use_local_classifier=False)
+        result = asyncio.run(recognizer.recognize("写一篇关于AI的文章"))
+
+        self.assertEqual(result["intent_type"], "writing_request")
+        self.assertEqual(result["entities"], {"topic": "AI"})
+        llm.chat.assert_awaited_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
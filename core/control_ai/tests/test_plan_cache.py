@@ -0,0 +1,96 @@
+"""
+计划模板缓存单元测试 - 测试模板提取、实体代入与规划器降级
+"""
+
+import asyncio
+import json
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from core.control_ai.plan_cache import PlanTemplateCache
+from core.control_ai.task_planner import TaskPlanner
+
+PLAN = {
+    "task_type": "writing_request",
+    "steps": [
+        {"action": "create_content", "parameters": {
+            "topic": "AI发展",
+            "style": "深度分析",
+            "title": "AI发展的未来",
+            "focus": ["伦理", "产业"]
+        }}
+    ],
+    "requires_confirmation": False
+}
+
+ENTITIES = {"topic": "AI发展", "style": "深度分析", "focus": ["伦理", "产业"]}
+
+
+class TestPlanTemplateCache(unittest.TestCase):
+    """计划模板缓存测试"""
+
+    def test_substitute_entities(self):
+        """命中模板时代入新实体"""
+        cache = PlanTemplateCache()
+        self.assertTrue(cache.put("writing_request", ENTITIES, PLAN))
+
+        plan = cache.get("writing_request", {"topic": "新能源车", "style": "幽默", "focus": ["价格"]})
+        parameters = plan["steps"][0]["parameters"]
+
+        self.assertEqual(parameters["topic"], "新能源车")
+        self.assertEqual(parameters["title"], "新能源车的未来")
+        self.assertEqual(parameters["focus"], ["价格"])
+        self.assertEqual(cache.get_stats()["hits"], 1)
+
+    def test_entity_shape_is_part_of_key(self):
+        """实体字段不同时不命中"""
+        cache = PlanTemplateCache()
+        cache.put("writing_request", ENTITIES, PLAN)
+        self.assertIsNone(cache.get("writing_request", {"topic": "新能源车"}))
+
+    def test_skip_plan_without_entity_values(self):
+        """计划中找不到实体值时不缓存，避免残留旧实体"""
+        cache = PlanTemplateCache()
+        self.assertFalse(cache.put("writing_request", {"topic": "区块链"}, PLAN))
+        self.assertEqual(cache.get_stats()["templates"], 0)
+
+    def test_lru_bound(self):
+        """超过容量时淘汰最久未使用的模板"""
+        cache = PlanTemplateCache(max_size=1)
+        cache.put("writing_request", ENTITIES, PLAN)
+        cache.put("research_request", {"topic": "AI发展"}, PLAN)
+
+        self.assertIsNone(cache.get("writing_request", ENTITIES))
+        self.assertEqual(cache.get_stats()["evicted"], 1)
+
+    def test_planner_reuses_template(self):
+        """规划器命中模板时不调用LLM"""
+        llm = MagicMock()
+        llm.chat = AsyncMock(return_value=json.dumps(PLAN, ensure_ascii=False))
+        planner = TaskPlanner(llm_client=llm)
+
+        asyncio.run(planner.plan({"intent_type": "writing_request", "entities": ENTITIES}))
+        plan = asyncio.run(planner.plan({
+            "intent_type": "writing_request",
+            "entities": {"topic": "新能源车", "style": "幽默", "focus": ["价格"]}
+        }))
+
+        llm.chat.assert_awaited_once()
+        self.assertEqual(plan["steps"][0]["parameters"]["topic"], "新能源车")
+
+    def test_planner_falls_back_on_invalid_template(self):
+        """模板代入后校验失败时重新调用LLM"""
+        llm = MagicMock()
+        llm.chat = AsyncMock(return_value=json.dumps(PLAN, ensure_ascii=False))
+        cache = PlanTemplateCache()
+        cache.put("writing_request", {"topic": "AI发展"}, {"task_type": "writing_request", "note": "AI发展"})
+        planner = TaskPlanner(llm_client=llm, plan_cache=cache)
+
+        asyncio.run(planner.plan({"intent_type": "writing_request", "entities": {"topic": "AI发展"}}))
+
+        llm.chat.assert_awaited_once()
+        self.assertEqual(cache.get_stats()["invalid"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+"""
+会话存储单元测试 - 测试LRU淘汰、空闲过期、历史压缩与Redis存储
+"""
+
+import asyncio
+import threading
+import unittest
+from unittest.mock import patch
+
+from core.control_ai.control_ai import HISTORY_WINDOW, SessionState
+from core.control_ai.session_store import MemorySessionStore, RedisSessionStore
+
+
+class FakeRedis:
+    """只实现会话存储用到的命令"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+class ThreadRecordingRedis(FakeRedis):
+    """记录每条命令在哪个线程中执行"""
+
+    def __init__(self):
+        super().__init__()
+        self.threads = []
+
+    def get(self, key):
+        self.threads.append(threading.get_ident())
+        return super().get(key)
+
+    def setex(self, key, ttl, value):
+        self.threads.append(threading.get_ident())
+        super().setex(key, ttl, value)
+
+    def delete(self, key):
+        self.threads.append(threading.get_ident())
+        super().delete(key)
+
+
+class TestSessionStore(unittest.TestCase):
+    """会话存储测试"""
+
+    def test_lru_eviction(self):
+        """超过容量时淘汰最久未访问的会话"""
+        store = MemorySessionStore(max_sessions=2, ttl=60)
+        for session_id in ("a", "b"):
+            store.save(SessionState(session_id))
+
+        store.get("a")
+        store.save(SessionState("c"))
+
+        self.assertIsNotNone(store.get("a"))
+        self.assertIsNone(store.get("b"))
+        self.assertEqual(len(store), 2)
+        self.assertEqual(store.get_stats()["evicted"], 1)
+
+    def test_idle_expiry(self):
+        """空闲超过TTL的会话过期"""
+        store = MemorySessionStore(max_sessions=10, ttl=60)
+        with patch("core.control_ai.session_store.time.monotonic", return_value=1000.0):
+            store.save(SessionState("a"))
+        with patch("core.control_ai.session_store.time.monotonic", return_value=1030.0):
+            self.assertIsNotNone(store.get("a"))
+        with patch("core.control_ai.session_store.time.monotonic", return_value=1100.0):
+            self.assertIsNone(store.get("a"))
+        self.assertEqual(store.get_stats()["expired"], 1)
+
+    def test_history_compaction(self):
+        """超出窗口的交互压缩进摘要"""
+        session = SessionState("a")
+        for i in range(HISTORY_WINDOW + 5):
+            session.add_interaction(f"问题{i}", f"回答{i}")
+
+        self.assertEqual(len(session.history), HISTORY_WINDOW)
+        self.assertEqual(session.turn_count, HISTORY_WINDOW + 5)
+        self.assertIn("问题0", session.summary)
+        self.assertNotIn(f"问题{HISTORY_WINDOW + 4}", session.summary)
+        self.assertEqual(session.get_context()["summary"], session.summary)
+        self.assertEqual(session.to_dict()["history_length"], HISTORY_WINDOW + 5)
+
+    def test_context_covers_every_turn(self):
+        """上下文中的完整交互与摘要衔接，每一轮都出现在其中之一"""
+        for turns in range(8, 13):
+            session = SessionState("a")
+            for i in range(turns):
+                session.add_interaction(f"问题{i}", f"回答{i}")
+
+            context = session.get_context()
+            recent = [item["user"] for item in context["history"]]
+            summary = context.get("summary", "")
+            for i in range(turns):
+                self.assertTrue(f"问题{i}" in recent or f"用户: 问题{i}\n" in summary + "\n",
+                                f"{turns} 轮对话中第 {i} 轮丢失")
+            self.assertEqual(recent[-1], f"问题{turns - 1}")
+
+    def test_redis_round_trip(self):
+        """Redis存储在本地缓存失效后从Redis还原会话"""
+        redis_client = FakeRedis()
+        store = RedisSessionStore(SessionState, redis_client=redis_client)
+
+        session = SessionState("a")
+        session.add_interaction("你好", "你好！")
+        session.set_task({"task_id": "t1", "task_type": "writing_request"})
+        store.save(session)
+
+        # 模拟另一个实例（本地缓存为空）
+        other = RedisSessionStore(SessionState, redis_client=redis_client)
+        restored = other.get("a")
+
+        self.assertIsNot(restored, session)
+        self.assertEqual(restored.history, session.history)
+        self.assertEqual(restored.current_task["task_id"], "t1")
+        self.assertEqual(restored.created_at, session.created_at)
+
+        other.delete("a")
+        self.assertIsNone(other.get("a"))
+        self.assertEqual(redis_client.data, {})
+
+    def test_redis_async_methods_off_event_loop(self):
+        """异步接口在线程池中访问Redis，不阻塞事件循环线程"""
+        redis_client = ThreadRecordingRedis()
+        store = RedisSessionStore(SessionState, redis_client=redis_client)
+        other = RedisSessionStore(SessionState, redis_client=redis_client)
+
+        async def run():
+            session = SessionState("a")
+            session.add_interaction("你好", "你好！")
+            await store.asave(session)
+            restored = await other.aget("a")
+            await other.adelete("a")
+            return threading.get_ident(), session, restored
+
+        loop_thread, session, restored = asyncio.run(run())
+
+        self.assertIsNot(restored, session)
+        self.assertEqual(restored.history, session.history)
+        self.assertEqual(len(redis_client.threads), 3)
+        self.assertNotIn(loop_thread, redis_client.threads)
+        self.assertEqual(redis_client.data, {})
+        self.assertIsNone(other.cache.get("a"))
+
+
+if __name__ == "__main__":
+    unittest.main()
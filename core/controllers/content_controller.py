@@ -13,13 +13,8 @@ from core.models.article.article import Article
 from core.models.platform.platform import Platform, get_default_platform
 from core.models.progress import ProductionProgress, ProductionStage, StageStatus
 
-from core.controllers.team_adapter import (
-    TopicTeamAdapter,
-    ResearchTeamAdapter,
-    WritingTeamAdapter,
-    StyleTeamAdapter,
-    ReviewTeamAdapter
-)
+# 团队适配器在创建控制器时才导入，导入本模块不会加载crewai
+from core.controllers import team_adapter
 
 logger = logging.getLogger(__name__)
 
@@ -64,11 +59,11 @@ class ContentController:
     def __init__(self):
         """初始化内容生产控制器"""
         # 使用团队适配器替代直接的团队实例
-        self.topic_team = TopicTeamAdapter()
-        self.research_team = ResearchTeamAdapter()
-        self.writing_team = WritingTeamAdapter()
-        self.style_team = StyleTeamAdapter()
-        self.review_team = ReviewTeamAdapter()
+        self.topic_team = team_adapter.TopicTeamAdapter()
+        self.research_team = team_adapter.ResearchTeamAdapter()
+        self.writing_team = team_adapter.WritingTeamAdapter()
+        self.style_team = team_adapter.StyleTeamAdapter()
+        self.review_team = team_adapter.ReviewTeamAdapter()
 
         self.production_results = []
         self.current_progress = None
@@ -1,7 +1,7 @@
 """团队适配器模块
 
 为各个专业团队提供统一的接口适配层，处理参数转换和错误处理。
-本模块导入各个具体的团队适配器实现，提供统一的访问入口。
+本模块导出各个具体的团队适配器实现，提供统一的访问入口，具体实现在首次访问时才导入。
 
 团队适配器的职责：
 1. 提供统一的API接口给控制器
@@ -13,16 +13,11 @@
 
 from typing import Dict, Any, Optional, List, Union
 
+from core.lazy_imports import lazy_exports
+
 # 导入基础适配器
 from core.controllers.base_adapter import BaseTeamAdapter
 
-# 导入各个团队的适配器
-from core.agents.topic_crew.topic_adapter import TopicTeamAdapter
-from core.agents.research_crew.research_adapter import ResearchTeamAdapter
-from core.agents.writing_crew.writing_adapter import WritingTeamAdapter
-from core.agents.style_crew.style_adapter import StyleTeamAdapter
-from core.agents.review_crew.review_adapter import ReviewTeamAdapter
-
 # 为了向后兼容，导出所有的适配器类
 __all__ = [
     'BaseTeamAdapter',
@@ -33,5 +28,14 @@ __all__ = [
     'ReviewTeamAdapter'
 ]
 
+# 各个团队的适配器在首次访问时才导入，避免加载本模块时导入crewai等依赖
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'TopicTeamAdapter': 'core.agents.topic_crew.topic_adapter',
+    'ResearchTeamAdapter': 'core.agents.research_crew.research_adapter',
+    'WritingTeamAdapter': 'core.agents.writing_crew.writing_adapter',
+    'StyleTeamAdapter': 'core.agents.style_crew.style_adapter',
+    'ReviewTeamAdapter': 'core.agents.review_crew.review_adapter',
+})
+
 # 在这里可以添加更多的团队适配器统一管理逻辑
 # 例如：不同团队之间的协调，全局错误处理等
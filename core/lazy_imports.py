@@ -0,0 +1,49 @@
+"""延迟导入
+
+工具包和团队包的 ``__init__`` 原先在导入时加载全部子模块，crewai、jieba、nltk、newspaper、
+trafilatura、yake、summa 等依赖随之加载，即使只用到其中一个轻量函数也要付出全部导入时间。
+
+lazy_exports 按 PEP 562 为包生成模块级 ``__getattr__`` 和 ``__dir__``：包被导入时不加载子模块，
+首次访问导出名称时才导入对应子模块，之后把结果缓存到包的属性中。``__all__`` 保持不变，
+``from package import Name`` 和 ``from package import *`` 的用法与原来一致。
+
+使用方法（在包的 __init__.py 中）:
+    from core.lazy_imports import lazy_exports
+
+    __all__ = ["NLPAggregator", "count_words"]
+
+    __getattr__, __dir__ = lazy_exports(__name__, {
+        "NLPAggregator": ".processor",
+        "count_words": ".text_utils",
+    })
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """为包生成延迟导入的 __getattr__ 和 __dir__
+
+    Args:
+        package: 包名，通常传入 __name__
+        exports: 导出名称到所在模块的映射，模块名可以是相对于包的相对路径（如 ".processor"）
+
+    Returns:
+        Tuple: (__getattr__, __dir__)
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        # 缓存到包的属性中，之后的访问不再经过 __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
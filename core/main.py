@@ -3,8 +3,6 @@ import asyncio
 import argparse
 import random
 from typing import List, Optional, Tuple
-from core.controllers.content_controller import ContentController
-from core.models.platform.platform import get_default_platform
 from core.models.progress import ProductionStage
 
 # 预定义类别和风格列表
@@ -247,6 +245,10 @@ async def main():
                 print(f"- {stage_names[stage]}")
 
     # 创建控制器并执行内容生产
+    # 控制器和各团队在解析参数之后才导入，--help 和参数错误时不加载crewai等依赖
+    from core.controllers.content_controller import ContentController
+    from core.models.platform.platform import get_default_platform
+
     controller = None
     try:
         # 创建内容控制器
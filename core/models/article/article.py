@@ -5,7 +5,9 @@
 """
 from datetime import datetime
 from typing import List, Dict, Optional, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+from .text_metrics import DocumentMetrics
 
 class Section(BaseModel):
     """文章章节"""
@@ -71,6 +73,9 @@ class Article(BaseModel):
     # 其他元数据
     metadata: Dict[str, Any] = Field(default_factory=dict, description="其他元数据")
 
+    # 按章节缓存的字数统计，不参与序列化
+    _metrics: DocumentMetrics = PrivateAttr(default_factory=DocumentMetrics)
+
     def update_status(self, new_status: str) -> None:
         """更新文章状态并记录时间
 
@@ -92,26 +97,37 @@ class Article(BaseModel):
     def calculate_metrics(self) -> Dict[str, Any]:
         """计算文章指标
 
+        字数为中日韩字符数加拉丁词数。按章节缓存统计结果，只有内容变化的章节会被重新统计。
+
         Returns:
             Dict[str, Any]: 文章指标统计
         """
-        # 计算总字数
-        total_words = len(self.title) + len(self.summary)
-        for section in self.sections:
-            total_words += len(section.title) + len(section.content)
+        parts = [("title", self.title), ("summary", self.summary)]
+        if self.sections:
+            for index, section in enumerate(self.sections):
+                key = section.id or f"section_{index}"
+                parts.append((f"{key}:title", section.title))
+                parts.append((f"{key}:content", section.content))
+        else:
+            parts.append(("content", self.content))
+        metrics = self._metrics.sync(parts)
 
-        # 估算阅读时间 (假设平均阅读速度400字/分钟)
-        read_time = max(1, round(total_words / 400))
+        image_count = max(len(self.images), metrics.images) + (1 if self.cover_image else 0)
+        read_time = metrics.read_time(extra_images=image_count - metrics.images)
 
         # 更新指标
-        self.word_count = total_words
+        self.word_count = metrics.word_count
         self.read_time = read_time
 
         return {
-            "word_count": total_words,
+            "word_count": metrics.word_count,
             "read_time": read_time,
             "section_count": len(self.sections),
-            "image_count": len(self.images) + (1 if self.cover_image else 0)
+            "image_count": image_count,
+            "cjk_chars": metrics.cjk_chars,
+            "latin_words": metrics.latin_words,
+            "sentence_count": metrics.sentences,
+            "paragraph_count": metrics.paragraphs
         }
 
     @classmethod
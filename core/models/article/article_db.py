@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, Table, Integer, Float
+from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, Table, Integer, Float, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.mutable import MutableDict, MutableList
 from typing import Dict, Any, Optional
@@ -12,7 +12,14 @@ from core.models.db.session import Base, get_db
 class Article(Base):
     """文章数据库模型"""
     __tablename__ = "article"
-    __table_args__ = {'extend_existing': True}  # 允许重新定义已存在的表
+    __table_args__ = (
+        # 最新文章及键集分页
+        Index("ix_article_created_at", "created_at", "id"),
+        Index("ix_article_updated_at", "updated_at", "id"),
+        # 按状态取最新文章
+        Index("ix_article_status_created_at", "status", "created_at", "id"),
+        {'extend_existing': True},  # 允许重新定义已存在的表
+    )
 
     id = Column(String(50), primary_key=True, index=True)
     topic_id = Column(String(50), nullable=False, index=True)
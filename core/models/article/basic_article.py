@@ -8,6 +8,7 @@ from typing import List, Dict, Optional, Union, Any
 from pydantic import BaseModel, Field
 
 from .article import Section
+from .text_metrics import TextMetrics, measure_text
 
 class BasicArticle(BaseModel):
     """基础文章模型 - 简化版文章，无需话题和大纲依赖"""
@@ -42,14 +43,14 @@ class BasicArticle(BaseModel):
         Returns:
             Dict[str, Any]: 文章指标统计
         """
-        # 计算总字数
+        # 计算总字数（中日韩字符数 + 拉丁词数）
         if self.sections:
-            total_words = len(self.title) + sum(len(section.title) + len(section.content) for section in self.sections)
+            texts = [self.title] + [text for section in self.sections for text in (section.title, section.content)]
         else:
-            total_words = len(self.title) + len(self.summary) + len(self.content)
-
-        # 估算阅读时间 (假设平均阅读速度400字/分钟)
-        read_time = max(1, round(total_words / 400))
+            texts = [self.title, self.summary, self.content]
+        metrics = sum((measure_text(text) for text in texts), TextMetrics())
+        total_words = metrics.word_count
+        read_time = metrics.read_time()
 
         # 更新指标
         self.word_count = total_words
@@ -0,0 +1,219 @@
+"""文本指标
+
+文章、审核和热点模块共用的字数统计。一个预编译的正则对文本只扫描一次，同时得到：
+
+- 中日韩字符数（每个字算一个字）
+- 拉丁词数（字母数字串，don't、e-mail 算一个词）
+- 句子数、段落数（空行分隔）、图片数（Markdown图片和<img>标签）
+
+HTML标签和链接地址不计入字数。字数 = 中日韩字符数 + 拉丁词数。
+
+DocumentMetrics 按段缓存结果，只重新统计内容发生变化的段落，用于文章某一章节修改后的增量更新。
+"""
+
+import re
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+# 阅读速度：中文字/分钟、英文词/分钟，每张图片的浏览时间（秒）
+READ_SPEED_CJK = 400
+READ_SPEED_LATIN = 200
+IMAGE_READ_SECONDS = 12
+
+_CJK_CLASS = (
+    "\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff"         # 扩展A、基本区、兼容汉字
+    "\u3040-\u30ff\u31f0-\u31ff"                      # 平假名、片假名
+    "\uac00-\ud7af"                                    # 韩文音节
+    "\U00020000-\U0002ebef\U0002f800-\U0002fa1f"      # 扩展B-F、兼容补充
+    "\U00030000-\U0003134f"                            # 扩展G
+)
+
+_TOKEN = re.compile(
+    r"(?P<img>!\[[^\]\n]*\]\([^)\n]*\)|<img\b[^>]*>)"
+    r"|(?P<url>\]\([^)\s]*\)|https?://[^\s<>()]+)"
+    r"|(?P<tag></?[A-Za-z][^>]*>)"
+    r"|(?P<para>\n[ \t\r\f\v]*\n\s*)"
+    rf"|(?P<cjk>[{_CJK_CLASS}]+)"
+    r"|(?P<word>[A-Za-z0-9_]+(?:['’\-][A-Za-z0-9_]+)*)"
+    r"|(?P<sent>[。！？!?]+|…+|\.+(?=\s|$))"
+)
+
+
+@dataclass
+class TextMetrics:
+    """文本指标"""
+    cjk_chars: int = 0
+    latin_words: int = 0
+    sentences: int = 0
+    paragraphs: int = 0
+    images: int = 0
+
+    @property
+    def word_count(self) -> int:
+        """字数：中日韩字符数 + 拉丁词数"""
+        return self.cjk_chars + self.latin_words
+
+    def read_time(self, extra_images: int = 0) -> int:
+        """估算阅读时间（分钟，至少1分钟）
+
+        Args:
+            extra_images: 正文之外的图片数（如封面图）
+
+        Returns:
+            int: 阅读时间
+        """
+        minutes = (self.cjk_chars / READ_SPEED_CJK + self.latin_words / READ_SPEED_LATIN
+                   + (self.images + extra_images) * IMAGE_READ_SECONDS / 60)
+        return max(1, round(minutes))
+
+    def to_dict(self) -> Dict[str, int]:
+        """转换为字典，包含word_count"""
+        data = asdict(self)
+        data["word_count"] = self.word_count
+        return data
+
+    def __add__(self, other: "TextMetrics") -> "TextMetrics":
+        return TextMetrics(
+            self.cjk_chars + other.cjk_chars,
+            self.latin_words + other.latin_words,
+            self.sentences + other.sentences,
+            self.paragraphs + other.paragraphs,
+            self.images + other.images,
+        )
+
+    def __sub__(self, other: "TextMetrics") -> "TextMetrics":
+        return TextMetrics(
+            self.cjk_chars - other.cjk_chars,
+            self.latin_words - other.latin_words,
+            self.sentences - other.sentences,
+            self.paragraphs - other.paragraphs,
+            self.images - other.images,
+        )
+
+
+def measure_text(text: Optional[str]) -> TextMetrics:
+    """单次扫描统计文本指标
+
+    Args:
+        text: 文本（纯文本、Markdown或HTML）
+
+    Returns:
+        TextMetrics: 文本指标
+    """
+    if not text:
+        return TextMetrics()
+
+    cjk = words = sentences = paragraphs = images = 0
+    open_sentence = False
+    paragraph_start = True
+    for match in _TOKEN.finditer(text):
+        kind = match.lastgroup
+        if kind == "cjk":
+            cjk += match.end() - match.start()
+        elif kind == "word":
+            words += 1
+        elif kind == "sent":
+            if open_sentence:
+                sentences += 1
+                open_sentence = False
+            continue
+        elif kind == "para":
+            # 段落结束也结束没有句末标点的句子（如标题）
+            if open_sentence:
+                sentences += 1
+                open_sentence = False
+            paragraph_start = True
+            continue
+        elif kind == "img":
+            images += 1
+            continue
+        else:
+            continue
+
+        open_sentence = True
+        if paragraph_start:
+            paragraphs += 1
+            paragraph_start = False
+
+    if open_sentence:
+        sentences += 1
+    return TextMetrics(cjk, words, sentences, paragraphs, images)
+
+
+def count_words(text: Optional[str]) -> int:
+    """统计字数：中日韩字符按字计，其他语言按词计
+
+    Args:
+        text: 文本
+
+    Returns:
+        int: 字数
+    """
+    return measure_text(text).word_count
+
+
+class DocumentMetrics:
+    """按段缓存的文档指标
+
+    每段以键标识（如章节ID），内容未变化的段落直接复用上次的结果，
+    总计通过减去旧值、加上新值增量维护。
+    """
+
+    def __init__(self):
+        """初始化"""
+        self._parts: Dict[str, Tuple[int, int, TextMetrics]] = {}
+        self.total = TextMetrics()
+
+    def update(self, key: str, text: Optional[str]) -> TextMetrics:
+        """更新一段内容的指标
+
+        Args:
+            key: 段落键
+            text: 段落内容
+
+        Returns:
+            TextMetrics: 更新后的文档总计
+        """
+        text = text or ""
+        fingerprint = (len(text), hash(text))
+        cached = self._parts.get(key)
+        if cached is not None and cached[:2] == fingerprint:
+            return self.total
+
+        metrics = measure_text(text)
+        if cached is not None:
+            self.total = self.total - cached[2]
+        self.total = self.total + metrics
+        self._parts[key] = (*fingerprint, metrics)
+        return self.total
+
+    def remove(self, key: str) -> TextMetrics:
+        """删除一段内容
+
+        Args:
+            key: 段落键
+
+        Returns:
+            TextMetrics: 更新后的文档总计
+        """
+        cached = self._parts.pop(key, None)
+        if cached is not None:
+            self.total = self.total - cached[2]
+        return self.total
+
+    def sync(self, parts: Iterable[Tuple[str, Optional[str]]]) -> TextMetrics:
+        """同步全部段落：更新传入的段落，删除不再存在的段落
+
+        Args:
+            parts: (段落键, 段落内容) 序列
+
+        Returns:
+            TextMetrics: 文档总计
+        """
+        seen = set()
+        for key, text in parts:
+            seen.add(key)
+            self.update(key, text)
+        for key in [key for key in self._parts if key not in seen]:
+            self.remove(key)
+        return self.total
@@ -12,6 +12,7 @@ from .style.style_manager import StyleManager
 from .article.article_manager import ArticleManager
 from .topic.topic_manager import TopicManager
 from .research.research_manager import ResearchManager
+from .infra.config_registry import ConfigRegistry
 
 
 class ContentManager:
@@ -336,6 +337,46 @@ class ContentManager:
         cls._initialize_config()
         return StyleManager.save_style(style)
 
+    @classmethod
+    def get_platform(cls, platform_id: str) -> Optional[Any]:
+        """按ID或名称获取平台，不区分大小写
+
+        Args:
+            platform_id: 平台ID或名称
+
+        Returns:
+            Optional[Any]: 平台对象或None
+        """
+        cls._initialize_config()
+        return ConfigRegistry.get_platform(platform_id)
+
+    @classmethod
+    def get_content_type(cls, content_type_id: str) -> Optional[Any]:
+        """获取内容类型，不区分大小写
+
+        Args:
+            content_type_id: 内容类型名称
+
+        Returns:
+            Optional[Any]: 内容类型对象或None
+        """
+        cls._initialize_config()
+        return ConfigRegistry.get_content_type(content_type_id)
+
+    @classmethod
+    def is_compatible(cls, content_type_id: str, style_name: str) -> bool:
+        """检查内容类型与风格是否兼容
+
+        Args:
+            content_type_id: 内容类型名称
+            style_name: 风格名称
+
+        Returns:
+            bool: 是否兼容
+        """
+        cls._initialize_config()
+        return ConfigRegistry.is_compatible(style_name, content_type_id)
+
     #----------------------------------#
     # 操作和过程相关方法               #
     #----------------------------------#
@@ -18,6 +18,7 @@ from core.models.content_type.constants import (
 )
 from core.models.content_type.content_type import ContentTypeModel
 from ..infra.base_manager import BaseManager
+from ..infra.config_registry import ConfigRegistry
 
 
 class ContentTypeManager(BaseManager):
@@ -43,6 +44,7 @@ class ContentTypeManager(BaseManager):
 
         cls._load_content_types()
         cls._initialized = True
+        ConfigRegistry.invalidate("内容类型加载")
         logger.info("内容类型管理器初始化完成")
 
     @classmethod
@@ -131,6 +133,7 @@ class ContentTypeManager(BaseManager):
 
         # 保存到缓存
         cls._content_types[CONTENT_TYPE_BLOG] = default_content_type
+        ConfigRegistry.invalidate("创建默认内容类型")
         return default_content_type
 
     @classmethod
@@ -147,6 +150,7 @@ class ContentTypeManager(BaseManager):
 
         # 保存到缓存
         cls._content_types[content_type.name] = content_type
+        ConfigRegistry.invalidate(f"保存内容类型 {content_type.name}")
         logger.info(f"内容类型保存成功: {content_type.name}")
         return True
 
@@ -9,7 +9,7 @@ from typing import Dict, List, Any, Set, Type, Callable, Optional, Tuple, Union
 from loguru import logger
 
 # 显式导入数据库模型避免循环引用
-from core.models.db.session import get_db, init_db
+from core.models.db.session import session_scope, init_db
 from core.models.db.initialize import initialize_all
 try:
     from core.models.db import ContentType, ArticleStyle, Platform
@@ -61,48 +61,51 @@ def migrate_config(
 
         logger.info(f"开始迁移 {len(items)} 个{model_cls.__name__}配置")
 
-        with get_db() as db:
-            # 如果是同步模式，先获取所有数据库中的ID并处理删除
-            if sync_mode:
-                db_ids = {getattr(item, id_field) for item in db.query(model_cls).all()}
-                file_ids = set(items.keys())
+        # 延迟导入避免循环引用
+        from core.models.db.repository import BaseRepository
+
+        with session_scope() as db:
+            repo = BaseRepository(model_cls, db)
 
-                # 删除在数据库中存在但不在文件中的记录
-                ids_to_delete = db_ids - file_ids
+            # 如果是同步模式，删除在数据库中存在但不在文件中的记录
+            if sync_mode:
+                db_ids = {
+                    row[0] for row in db.query(getattr(model_cls, id_field)).all()
+                }
+                ids_to_delete = db_ids - set(items.keys())
                 if ids_to_delete:
-                    for item_id in ids_to_delete:
-                        db.query(model_cls).filter(getattr(model_cls, id_field) == item_id).delete()
-                        logger.info(f"删除不在文件中的{model_cls.__name__}: {item_id}")
+                    repo.delete_many(ids_to_delete)
+                    logger.info(f"删除不在文件中的{model_cls.__name__}: {', '.join(sorted(ids_to_delete))}")
+
+            # 一次查询取回所有已存在的记录，避免逐条查询
+            existing_map = {
+                getattr(obj, id_field): obj for obj in repo.get_many(items.keys())
+            }
 
             # 更新或创建记录
             for item_id, item in items.items():
                 # 转换为数据库对象字典
                 item_dict = _create_item_dict(item, model_cls)
 
-                # 检查是否已存在
-                existing = db.query(model_cls).filter(getattr(model_cls, id_field) == item_id).first()
-
+                existing = existing_map.get(item_id)
                 if existing:
                     # 更新现有记录
                     for key, value in item_dict.items():
                         if key != id_field and hasattr(existing, key):
                             setattr(existing, key, value)
                     item_obj = existing
-                    logger.info(f"更新{model_cls.__name__}: {getattr(existing, id_field)}")
+                    logger.debug(f"更新{model_cls.__name__}: {item_id}")
                 else:
                     # 创建新记录
                     item_obj = model_cls(**item_dict)
                     db.add(item_obj)
-                    logger.info(f"创建{model_cls.__name__}: {item_dict.get(id_field)}")
+                    logger.debug(f"创建{model_cls.__name__}: {item_dict.get(id_field)}")
 
                 # 处理特殊逻辑
                 if special_handlers:
                     for handler_name, handler_func in special_handlers.items():
                         handler_func(db, item_obj, item)
 
-            # 提交更改
-            db.commit()
-
         logger.info(f"{model_cls.__name__}配置迁移完成")
         return True
 
@@ -3,14 +3,18 @@
 为各种模型提供数据访问层，隔离数据库操作与业务逻辑。
 """
 
-from typing import List, Optional, Dict, Any, Type, TypeVar, Generic
+from typing import List, Optional, Dict, Any, Type, TypeVar, Generic, Iterable, Iterator, Sequence, Callable
+from dataclasses import dataclass, field
+import base64
+from sqlalchemy import insert, inspect, tuple_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 import json
 from datetime import datetime
 import logging
 
-from core.models.db.session import get_db, get_or_create
-from core.models.db import  ContentType, ArticleStyle, Platform, Article, Topic
+from core.models.db.session import SessionLocal, get_or_create, run_write, use_write_queue
+from core.models.db import ContentTypeName as ContentType, ArticleStyle, Platform, Article, Topic
 
 # 创建logger
 logger = logging.getLogger(__name__)
@@ -19,18 +23,146 @@ logger = logging.getLogger(__name__)
 T = TypeVar('T')
 ModelType = TypeVar('ModelType')
 
+# 批量操作每批行数，SQLite单条语句的绑定参数数量有上限
+BULK_CHUNK_SIZE = 500
+
+# 批量upsert冲突时默认不覆盖的列
+UPSERT_PRESERVED_COLUMNS = ("created_at",)
+
+# 键集分页默认每页条数
+DEFAULT_PAGE_SIZE = 50
+
+# 流式读取默认每批行数
+DEFAULT_STREAM_BATCH_SIZE = 1000
+
+@dataclass
+class Page(Generic[ModelType]):
+    """键集分页结果"""
+    items: List[ModelType] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+    @property
+    def has_more(self) -> bool:
+        """是否还有下一页"""
+        return self.next_cursor is not None
+
+def encode_cursor(value: Any, id: Any) -> str:
+    """将排序值和主键编码为不透明游标
+
+    Args:
+        value: 排序列的值
+        id: 主键值
+
+    Returns:
+        str: URL安全的游标字符串
+    """
+    if isinstance(value, datetime):
+        payload = {"v": value.isoformat(), "t": "dt", "id": id}
+    else:
+        payload = {"v": value, "id": id}
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> tuple[Any, Any]:
+    """解析游标
+
+    Args:
+        cursor: encode_cursor 生成的游标
+
+    Returns:
+        tuple: (排序值, 主键值)
+
+    Raises:
+        ValueError: 游标格式无效
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        value = payload["v"]
+        if payload.get("t") == "dt":
+            value = datetime.fromisoformat(value)
+        return value, payload["id"]
+    except Exception as e:
+        raise ValueError(f"无效的分页游标: {cursor}") from e
+
 class BaseRepository(Generic[ModelType]):
-    """基础数据仓库，提供通用CRUD操作"""
+    """基础数据仓库，提供通用CRUD操作
+
+    会话生命周期:
+    - 传入会话时，仓库参与调用方的工作单元，写操作只flush，由调用方统一提交
+      (通常配合 ``session_scope()`` 使用)
+    - 未传入会话时，仓库按需创建自有会话，每次写操作后立即提交；
+      生产模式下自有会话的写操作投递到串行写队列，在写线程的会话中执行并提交
+
+    会话不是线程安全的，仓库实例不应跨线程共享；自有会话的仓库在一次调用或一个
+    工作单元内使用，结束时关闭，可用 ``with TopicRepository() as repo:`` 自动关闭。
+    """
 
     def __init__(self, model: Type[ModelType], db: Optional[Session] = None):
         """初始化
 
         Args:
             model: 模型类
-            db: 数据库会话，如果为None则自动创建
+            db: 数据库会话，如果为None则按需创建自有会话
         """
         self.model = model
-        self.db = db or get_db()
+        self._db = db
+        self._owns_session = db is None
+        self._pk = inspect(model).primary_key[0]
+
+    @property
+    def db(self) -> Session:
+        """当前仓库使用的会话"""
+        if self._db is None:
+            self._db = SessionLocal()
+        return self._db
+
+    def _commit(self) -> None:
+        """提交或flush写操作
+
+        自有会话立即提交；工作单元会话只flush，提交由调用方负责。
+        """
+        if self._owns_session:
+            self.db.commit()
+        else:
+            self.db.flush()
+
+    def _write(self, fn: Callable[[Session], T], refresh: bool = False) -> T:
+        """执行写操作
+
+        Args:
+            fn: 接收会话的写函数
+            refresh: 是否在提交后刷新返回的对象（仅自有会话）
+
+        Returns:
+            写函数返回值
+        """
+        if self._owns_session and use_write_queue():
+            def queued(db: Session) -> T:
+                result = fn(db)
+                if refresh and result is not None:
+                    db.flush()
+                    db.refresh(result)
+                return result
+            return run_write(queued)
+
+        result = fn(self.db)
+        self._commit()
+        if refresh and result is not None and self._owns_session:
+            self.db.refresh(result)
+        return result
+
+    def close(self) -> None:
+        """关闭自有会话，工作单元会话由调用方关闭"""
+        if self._owns_session and self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def __enter__(self) -> "BaseRepository[ModelType]":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def get(self, id: str) -> Optional[ModelType]:
         """根据ID获取记录
@@ -41,7 +173,23 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             Optional[ModelType]: 记录对象
         """
-        return self.db.query(self.model).filter(self.model.id == id).first()
+        return self.db.query(self.model).filter(self._pk == id).first()
+
+    def get_many(self, ids: Iterable[str]) -> List[ModelType]:
+        """根据ID批量获取记录，按批次执行IN查询
+
+        Args:
+            ids: 记录ID列表
+
+        Returns:
+            List[ModelType]: 记录列表，不存在的ID被忽略，顺序不保证
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        result: List[ModelType] = []
+        for i in range(0, len(unique_ids), BULK_CHUNK_SIZE):
+            chunk = unique_ids[i:i + BULK_CHUNK_SIZE]
+            result.extend(self.db.query(self.model).filter(self._pk.in_(chunk)).all())
+        return result
 
     def get_all(self) -> List[ModelType]:
         """获取所有记录
@@ -68,11 +216,12 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             ModelType: 创建的记录
         """
-        db_obj = self.model(**obj_in)
-        self.db.add(db_obj)
-        self.db.commit()
-        self.db.refresh(db_obj)
-        return db_obj
+        def write(db: Session) -> ModelType:
+            db_obj = self.model(**obj_in)
+            db.add(db_obj)
+            return db_obj
+
+        return self._write(write, refresh=True)
 
     def update(self, id: str, obj_in: Dict[str, Any]) -> Optional[ModelType]:
         """更新记录
@@ -84,17 +233,16 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             Optional[ModelType]: 更新后的记录
         """
-        db_obj = self.db.query(self.model).filter(self.model.id == id).first()
-        if db_obj is None:
-            return None
+        def write(db: Session) -> Optional[ModelType]:
+            db_obj = db.query(self.model).filter(self._pk == id).first()
+            if db_obj is None:
+                return None
+            for key, value in obj_in.items():
+                if hasattr(db_obj, key):
+                    setattr(db_obj, key, value)
+            return db_obj
 
-        for key, value in obj_in.items():
-            if hasattr(db_obj, key):
-                setattr(db_obj, key, value)
-
-        self.db.commit()
-        self.db.refresh(db_obj)
-        return db_obj
+        return self._write(write, refresh=True)
 
     def delete(self, id: str) -> bool:
         """删除记录
@@ -105,13 +253,36 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             bool: 是否成功删除
         """
-        db_obj = self.db.query(self.model).filter(self.model.id == id).first()
-        if db_obj is None:
-            return False
+        def write(db: Session) -> bool:
+            db_obj = db.query(self.model).filter(self._pk == id).first()
+            if db_obj is None:
+                return False
+            db.delete(db_obj)
+            return True
 
-        self.db.delete(db_obj)
-        self.db.commit()
-        return True
+        return self._write(write)
+
+    def delete_many(self, ids: Iterable[str]) -> int:
+        """根据ID批量删除记录
+
+        Args:
+            ids: 记录ID列表
+
+        Returns:
+            int: 删除的记录数
+        """
+        unique_ids = list(dict.fromkeys(ids))
+
+        def write(db: Session) -> int:
+            deleted = 0
+            for i in range(0, len(unique_ids), BULK_CHUNK_SIZE):
+                chunk = unique_ids[i:i + BULK_CHUNK_SIZE]
+                deleted += db.query(self.model).filter(self._pk.in_(chunk)).delete(
+                    synchronize_session=False
+                )
+            return deleted
+
+        return self._write(write)
 
     def get_or_create(self, **kwargs) -> tuple[ModelType, bool]:
         """获取或创建记录
@@ -124,11 +295,183 @@ class BaseRepository(Generic[ModelType]):
         """
         return get_or_create(self.db, self.model, **kwargs)
 
+    def paginate(self, order_by: Optional[str] = None, cursor: Optional[str] = None,
+                 limit: int = DEFAULT_PAGE_SIZE, descending: bool = True,
+                 filters: Sequence[Any] = ()) -> Page[ModelType]:
+        """键集(游标)分页
+
+        以 (排序列, 主键) 为键，用行值比较定位下一页起点，配合同列顺序的
+        复合索引，每页的代价与页码无关，不像OFFSET那样越翻越慢。
+
+        Args:
+            order_by: 排序列名，默认按主键
+            cursor: 上一页返回的 next_cursor，为None时从第一页开始
+            limit: 每页条数
+            descending: 是否降序
+            filters: 额外过滤条件
+
+        Returns:
+            Page[ModelType]: 当前页记录和下一页游标
+        """
+        order_column = getattr(self.model, order_by) if order_by else self._pk
+        query = self.db.query(self.model).filter(*filters)
+
+        if cursor:
+            value, last_id = decode_cursor(cursor)
+            key = tuple_(order_column, self._pk)
+            query = query.filter(key < (value, last_id) if descending else key > (value, last_id))
+
+        if descending:
+            query = query.order_by(order_column.desc(), self._pk.desc())
+        else:
+            query = query.order_by(order_column.asc(), self._pk.asc())
+
+        # 多取一条用于判断是否还有下一页
+        items = query.limit(limit + 1).all()
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            last = items[-1]
+            next_cursor = encode_cursor(
+                getattr(last, order_column.key), getattr(last, self._pk.key)
+            )
+        return Page(items=items, next_cursor=next_cursor)
+
+    def iter_all(self, batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+                 filters: Sequence[Any] = ()) -> Iterator[ModelType]:
+        """流式遍历记录，用于导出等全表扫描场景
+
+        使用 yield_per 分批从游标取行，内存占用与批大小相关而与表大小无关。
+
+        Args:
+            batch_size: 每批行数
+            filters: 过滤条件
+
+        Returns:
+            Iterator[ModelType]: 记录迭代器
+        """
+        query = self.db.query(self.model).filter(*filters).order_by(self._pk)
+        yield from query.yield_per(batch_size)
+
+    def to_row(self, obj_in: Dict[str, Any]) -> Dict[str, Any]:
+        """将输入数据转换为数据表行，丢弃表中不存在的字段
+
+        子类可覆盖以处理需要序列化的字段。
+
+        Args:
+            obj_in: 输入数据
+
+        Returns:
+            Dict[str, Any]: 列名到值的映射
+        """
+        columns = self.model.__table__.columns
+        return {key: value for key, value in obj_in.items() if key in columns}
+
+    def _group_rows(self, objs_in: Iterable[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """按列集合分组并切分批次
+
+        executemany要求同一批次的参数列一致，缺失的列交给列默认值处理。
+
+        Args:
+            objs_in: 输入数据
+
+        Returns:
+            List[List[Dict[str, Any]]]: 批次列表
+        """
+        groups: Dict[frozenset, List[Dict[str, Any]]] = {}
+        for obj_in in objs_in:
+            row = self.to_row(obj_in)
+            groups.setdefault(frozenset(row), []).append(row)
+
+        batches = []
+        for rows in groups.values():
+            for i in range(0, len(rows), BULK_CHUNK_SIZE):
+                batches.append(rows[i:i + BULK_CHUNK_SIZE])
+        return batches
+
+    def bulk_create(self, objs_in: Iterable[Dict[str, Any]]) -> int:
+        """批量插入记录，单次事务内按批次executemany
+
+        不构造ORM对象也不逐行refresh，主键冲突会抛出异常。
+
+        Args:
+            objs_in: 输入数据列表
+
+        Returns:
+            int: 插入的记录数
+        """
+        batches = self._group_rows(objs_in)
+
+        def write(db: Session) -> int:
+            for batch in batches:
+                db.execute(insert(self.model), batch)
+            return sum(len(batch) for batch in batches)
+
+        return self._write(write)
+
+    def bulk_upsert(self, objs_in: Iterable[Dict[str, Any]],
+                    update_columns: Optional[Sequence[str]] = None) -> int:
+        """批量插入或更新记录，使用SQLite的 INSERT … ON CONFLICT DO UPDATE
+
+        冲突更新时，未在更新列中的 onupdate 列（如 updated_at）按列定义的 onupdate 刷新，
+        与ORM的update行为一致。
+
+        Args:
+            objs_in: 输入数据列表，必须包含主键
+            update_columns: 冲突时更新的列，默认更新除主键和created_at外的所有传入列
+
+        Returns:
+            int: 写入的记录数
+        """
+        pk_name = self._pk.name
+        batches = []
+        for batch in self._group_rows(objs_in):
+            if update_columns is None:
+                columns = [c for c in batch[0] if c != pk_name and c not in UPSERT_PRESERVED_COLUMNS]
+            else:
+                columns = [c for c in update_columns if c != pk_name]
+            batches.append((columns, batch))
+
+        def write(db: Session) -> int:
+            for columns, batch in batches:
+                stmt = sqlite_insert(self.model.__table__)
+                if columns:
+                    set_ = {c: stmt.excluded[c] for c in columns}
+                    set_.update(self._onupdate_values(exclude=set_))
+                    stmt = stmt.on_conflict_do_update(index_elements=[pk_name], set_=set_)
+                else:
+                    stmt = stmt.on_conflict_do_nothing(index_elements=[pk_name])
+                db.execute(stmt, batch)
+            return sum(len(batch) for _, batch in batches)
+
+        return self._write(write)
+
+    def _onupdate_values(self, exclude: Iterable[str] = ()) -> Dict[str, Any]:
+        """按列定义的onupdate计算更新时需要刷新的列值
+
+        Args:
+            exclude: 已显式更新的列
+
+        Returns:
+            Dict[str, Any]: 列名到新值（或SQL表达式）的映射
+        """
+        values = {}
+        for column in self.model.__table__.columns:
+            onupdate = column.onupdate
+            if onupdate is None or column.name in exclude:
+                continue
+            if onupdate.is_callable:
+                # SQLAlchemy把无参函数包装为接收执行上下文的函数
+                values[column.name] = onupdate.arg(None)
+            elif onupdate.is_clause_element or onupdate.is_scalar:
+                values[column.name] = onupdate.arg
+        return values
+
 class ContentTypeRepository(BaseRepository[ContentType]):
     """内容类型数据仓库"""
 
-    def __init__(self):
-        super().__init__(ContentType)
+    def __init__(self, db: Optional[Session] = None):
+        super().__init__(ContentType, db)
 
     def get_compatible_with_style(self, style_id: str) -> List[ContentType]:
         """获取与指定风格兼容的内容类型
@@ -154,19 +497,19 @@ class ContentTypeRepository(BaseRepository[ContentType]):
         Returns:
             bool: 是否成功
         """
-        content_type = self.db.query(ContentType).filter(ContentType.id == content_type_id).first()
-        style = self.db.query(ArticleStyle).filter(ArticleStyle.id == style_id).first()
+        def write(db: Session) -> bool:
+            content_type = db.query(ContentType).filter(ContentType.id == content_type_id).first()
+            style = db.query(ArticleStyle).filter(ArticleStyle.id == style_id).first()
 
-        if not content_type or not style:
-            return False
+            if not content_type or not style:
+                return False
 
-        # 检查是否已经存在关联
-        if style in content_type.compatible_styles:
+            # 检查是否已经存在关联
+            if style not in content_type.compatible_styles:
+                content_type.compatible_styles.append(style)
             return True
 
-        content_type.compatible_styles.append(style)
-        self.db.commit()
-        return True
+        return self._write(write)
 
     def remove_compatible_style(self, content_type_id: str, style_id: str) -> bool:
         """移除兼容风格
@@ -178,25 +521,25 @@ class ContentTypeRepository(BaseRepository[ContentType]):
         Returns:
             bool: 是否成功
         """
-        content_type = self.db.query(ContentType).filter(ContentType.id == content_type_id).first()
-        style = self.db.query(ArticleStyle).filter(ArticleStyle.id == style_id).first()
+        def write(db: Session) -> bool:
+            content_type = db.query(ContentType).filter(ContentType.id == content_type_id).first()
+            style = db.query(ArticleStyle).filter(ArticleStyle.id == style_id).first()
 
-        if not content_type or not style:
-            return False
+            if not content_type or not style:
+                return False
 
-        # 检查是否存在关联
-        if style not in content_type.compatible_styles:
+            # 检查是否存在关联
+            if style in content_type.compatible_styles:
+                content_type.compatible_styles.remove(style)
             return True
 
-        content_type.compatible_styles.remove(style)
-        self.db.commit()
-        return True
+        return self._write(write)
 
 class ArticleStyleRepository(BaseRepository[ArticleStyle]):
     """文章风格数据仓库"""
 
-    def __init__(self):
-        super().__init__(ArticleStyle)
+    def __init__(self, db: Optional[Session] = None):
+        super().__init__(ArticleStyle, db)
 
     def get_compatible_with_content_type(self, content_type_id: str) -> List[ArticleStyle]:
         """获取与指定内容类型兼容的风格
@@ -215,8 +558,8 @@ class ArticleStyleRepository(BaseRepository[ArticleStyle]):
 class PlatformRepository(BaseRepository[Platform]):
     """平台数据仓库"""
 
-    def __init__(self):
-        super().__init__(Platform)
+    def __init__(self, db: Optional[Session] = None):
+        super().__init__(Platform, db)
 
     def get_by_type(self, platform_type: str) -> List[Platform]:
         """根据平台类型获取平台
@@ -247,10 +590,35 @@ class ArticleRepository(BaseRepository[Article]):
         """初始化仓库
 
         Args:
-            db: 数据库会话，如果为None则自动创建
+            db: 数据库会话，如果为None则按需创建自有会话
         """
         super().__init__(Article, db)
 
+    # 以JSON文本存储的字段
+    JSON_FIELDS = ("sections", "tags", "keywords", "images", "categories", "metadata")
+
+    def to_row(self, obj_in: Dict[str, Any]) -> Dict[str, Any]:
+        """将文章数据转换为数据表行，序列化JSON字段并解析时间
+
+        Args:
+            obj_in: 文章数据
+
+        Returns:
+            Dict[str, Any]: 列名到值的映射
+        """
+        row = super().to_row(obj_in)
+        for field in self.JSON_FIELDS:
+            value = row.get(field)
+            if value is not None and not isinstance(value, str):
+                row[field] = json.dumps(value, ensure_ascii=False)
+        for field in ("created_at", "updated_at"):
+            value = row.get(field)
+            if isinstance(value, str):
+                row[field] = datetime.fromisoformat(value)
+            elif field in row and value is None:
+                del row[field]
+        return row
+
     def get_by_topic_id(self, topic_id: str) -> List[Article]:
         """获取指定话题的所有文章
 
@@ -262,20 +630,25 @@ class ArticleRepository(BaseRepository[Article]):
         """
         return self.db.query(self.model).filter(self.model.topic_id == topic_id).all()
 
-    def query_by_time_range(self, start_time: int, end_time: int) -> List[Article]:
+    def query_by_time_range(self, start_time: datetime, end_time: datetime,
+                            limit: Optional[int] = None) -> List[Article]:
         """通过时间范围查询文章
 
         Args:
-            start_time: 开始时间戳
-            end_time: 结束时间戳
+            start_time: 开始时间
+            end_time: 结束时间
+            limit: 返回数量限制，为None时不限制（大范围请使用 paginate_by_time_range）
 
         Returns:
-            List[Article]: 文章列表
+            List[Article]: 文章列表，按创建时间降序
         """
-        return self.db.query(self.model).filter(
+        query = self.db.query(self.model).filter(
             self.model.created_at >= start_time,
             self.model.created_at <= end_time
-        ).all()
+        ).order_by(self.model.created_at.desc(), self.model.id.desc())
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
 
     def get_latest(self, limit: int = 10) -> List[Article]:
         """获取最新文章列表
@@ -286,7 +659,41 @@ class ArticleRepository(BaseRepository[Article]):
         Returns:
             List[Article]: 文章列表
         """
-        return self.db.query(self.model).order_by(self.model.created_at.desc()).limit(limit).all()
+        return self.db.query(self.model).order_by(
+            self.model.created_at.desc(), self.model.id.desc()
+        ).limit(limit).all()
+
+    def paginate_latest(self, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE,
+                        status: Optional[str] = None) -> Page[Article]:
+        """按创建时间降序分页获取文章
+
+        Args:
+            cursor: 上一页返回的游标
+            limit: 每页条数
+            status: 可选的状态过滤
+
+        Returns:
+            Page[Article]: 分页结果
+        """
+        filters = [self.model.status == status] if status else []
+        return self.paginate("created_at", cursor=cursor, limit=limit, filters=filters)
+
+    def paginate_by_time_range(self, start_time: datetime, end_time: datetime,
+                               cursor: Optional[str] = None,
+                               limit: int = DEFAULT_PAGE_SIZE) -> Page[Article]:
+        """按时间范围分页获取文章
+
+        Args:
+            start_time: 开始时间
+            end_time: 结束时间
+            cursor: 上一页返回的游标
+            limit: 每页条数
+
+        Returns:
+            Page[Article]: 分页结果
+        """
+        filters = [self.model.created_at >= start_time, self.model.created_at <= end_time]
+        return self.paginate("created_at", cursor=cursor, limit=limit, filters=filters)
 
 class TopicRepository(BaseRepository[Topic]):
     """话题数据仓库，提供基础的CRUD操作"""
@@ -295,38 +702,64 @@ class TopicRepository(BaseRepository[Topic]):
         """初始化仓库
 
         Args:
-            db: 数据库会话，如果为None则自动创建
+            db: 数据库会话，如果为None则按需创建自有会话
         """
         super().__init__(Topic, db)
 
-    def get_by_platform(self, platform: str) -> List[Topic]:
-        """获取指定平台的所有话题
+    def to_row(self, obj_in: Dict[str, Any]) -> Dict[str, Any]:
+        """将话题数据转换为数据表行，关键词列表以逗号拼接
 
         Args:
-            platform: 平台标识
+            obj_in: 话题数据
 
         Returns:
-            List[Topic]: 话题列表
+            Dict[str, Any]: 列名到值的映射
         """
-        return self.db.query(self.model).filter(self.model.platform == platform).all()
+        row = super().to_row(obj_in)
+        keywords = row.get("keywords")
+        if isinstance(keywords, (list, tuple)):
+            row["keywords"] = ",".join(keywords)
+        return row
+
+    def get_by_platform(self, platform: str, limit: Optional[int] = None) -> List[Topic]:
+        """获取指定平台的话题
+
+        Args:
+            platform: 平台标识
+            limit: 返回数量限制，为None时不限制（大量数据请使用 paginate_by_platform）
 
-    def query_by_time_range(self, start_time: int, end_time: int) -> List[Topic]:
+        Returns:
+            List[Topic]: 话题列表，按创建时间降序
+        """
+        query = self.db.query(self.model).filter(self.model.platform == platform).order_by(
+            self.model.created_at.desc(), self.model.id.desc()
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
+    def query_by_time_range(self, start_time: int, end_time: int,
+                            limit: Optional[int] = None) -> List[Topic]:
         """通过时间范围查询话题
 
         Args:
             start_time: 开始时间戳
             end_time: 结束时间戳
+            limit: 返回数量限制，为None时不限制（大范围请使用 paginate_by_time_range）
 
         Returns:
-            List[Topic]: 话题列表
+            List[Topic]: 话题列表，按创建时间降序
         """
-        return self.db.query(self.model).filter(
-            self.model.source_time >= start_time,
-            self.model.source_time <= end_time
-        ).all()
+        query = self.db.query(self.model).filter(
+            self.model.created_at >= start_time,
+            self.model.created_at <= end_time
+        ).order_by(self.model.created_at.desc(), self.model.id.desc())
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
 
     def get_latest(self, limit: int = 10) -> List[Topic]:
-        """获取最新话题列表，按照source_time降序排序
+        """获取最新话题列表，按照created_at降序排序
 
         Args:
             limit: 返回数量限制
@@ -334,11 +767,38 @@ class TopicRepository(BaseRepository[Topic]):
         Returns:
             List[Topic]: 话题列表
         """
-        return self.db.query(self.model).order_by(self.model.source_time.desc()).limit(limit).all()
+        return self.db.query(self.model).order_by(
+            self.model.created_at.desc(), self.model.id.desc()
+        ).limit(limit).all()
+
+    def paginate_by_platform(self, platform: str, cursor: Optional[str] = None,
+                             limit: int = DEFAULT_PAGE_SIZE) -> Page[Topic]:
+        """按平台分页获取话题，使用 (platform, created_at, id) 复合索引
+
+        Args:
+            platform: 平台标识
+            cursor: 上一页返回的游标
+            limit: 每页条数
+
+        Returns:
+            Page[Topic]: 分页结果
+        """
+        return self.paginate("created_at", cursor=cursor, limit=limit,
+                             filters=[self.model.platform == platform])
+
+    def paginate_by_time_range(self, start_time: int, end_time: int,
+                               cursor: Optional[str] = None,
+                               limit: int = DEFAULT_PAGE_SIZE) -> Page[Topic]:
+        """按时间范围分页获取话题
+
+        Args:
+            start_time: 开始时间戳
+            end_time: 结束时间戳
+            cursor: 上一页返回的游标
+            limit: 每页条数
 
-# 创建仓库实例
-content_type_repo = ContentTypeRepository()
-article_style_repo = ArticleStyleRepository()
-platform_repo = PlatformRepository()
-article_repo = ArticleRepository()
-topic_repo = TopicRepository()
+        Returns:
+            Page[Topic]: 分页结果
+        """
+        filters = [self.model.created_at >= start_time, self.model.created_at <= end_time]
+        return self.paginate("created_at", cursor=cursor, limit=limit, filters=filters)
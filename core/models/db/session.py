@@ -3,17 +3,21 @@
 提供SQLite数据库连接和会话管理功能，支持本地存储。
 """
 
-from typing import Generator, Optional, Dict, Any
+from typing import Generator, Optional, Dict, Any, Callable, TypeVar
 import os
+import threading
 from contextlib import contextmanager
 from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session, declarative_base
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import StaticPool, SingletonThreadPool
 import json
 from loguru import logger
 
 from core.config import Config
 
+T = TypeVar("T")
+
 # 创建基类
 Base = declarative_base()
 
@@ -26,27 +30,165 @@ if not os.path.exists(DB_DIR):
     os.makedirs(DB_DIR)
 
 # 数据库文件路径
-DB_FILE = os.path.join(DB_DIR, "genflow.db")
+DB_FILE = os.environ.get("GENFLOW_DB_PATH") or os.path.join(DB_DIR, "genflow.db")
+
+# 存储模式:
+#   default    - 单连接(StaticPool)，适合本地开发和单线程脚本
+#   production - WAL日志 + 每线程读连接 + 单写者队列，适合控制器/适配器并发写入
+DB_MODE_DEFAULT = "default"
+DB_MODE_PRODUCTION = "production"
+DB_MODE = os.environ.get("GENFLOW_DB_MODE", DB_MODE_DEFAULT).lower()
+
+# 生产模式下的SQLite参数
+SQLITE_PRODUCTION_PRAGMAS: Dict[str, Any] = {
+    "journal_mode": "WAL",        # 读写并发，写者不阻塞读者
+    "synchronous": "NORMAL",      # WAL下仅在检查点时fsync，崩溃不损坏数据库
+    "mmap_size": int(os.environ.get("GENFLOW_DB_MMAP_SIZE", 256 * 1024 * 1024)),
+    "cache_size": int(os.environ.get("GENFLOW_DB_CACHE_SIZE", -64000)),  # 负数单位为KB
+    "temp_store": "MEMORY",
+    "busy_timeout": int(os.environ.get("GENFLOW_DB_BUSY_TIMEOUT", 5000)),  # 毫秒
+}
+
+# 生产模式下每线程读连接池上限
+DB_READ_POOL_SIZE = int(os.environ.get("GENFLOW_DB_READ_POOL_SIZE", 16))
+
+
+def _register_pragmas(engine: Engine, pragmas: Dict[str, Any]) -> None:
+    """为引擎的每个新连接设置SQLite参数
+
+    Args:
+        engine: 数据库引擎
+        pragmas: PRAGMA名称到值的映射，foreign_keys始终开启
+    """
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragma(dbapi_connection, connection_record):
+        """设置SQLite连接参数"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+def create_db_engine(db_file: str = DB_FILE, mode: str = DB_MODE, echo: bool = False) -> Engine:
+    """按存储模式创建SQLite引擎
+
+    Args:
+        db_file: 数据库文件路径
+        mode: 存储模式，default 或 production
+        echo: 是否打印SQL
+
+    Returns:
+        Engine: 数据库引擎
+    """
+    if mode == DB_MODE_PRODUCTION:
+        # 每个线程持有独立的读连接，避免共享连接上的游标互相干扰
+        db_engine = create_engine(
+            f"sqlite:///{db_file}",
+            connect_args={"check_same_thread": False},
+            poolclass=SingletonThreadPool,
+            pool_size=DB_READ_POOL_SIZE,
+            echo=echo
+        )
+        _register_pragmas(db_engine, SQLITE_PRODUCTION_PRAGMAS)
+        return db_engine
+
+    if mode != DB_MODE_DEFAULT:
+        logger.warning(f"未知的数据库存储模式: {mode}，使用默认模式")
+
+    db_engine = create_engine(
+        f"sqlite:///{db_file}",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        echo=echo
+    )
+    _register_pragmas(db_engine, {})
+    return db_engine
+
+
+def create_write_engine(db_file: str = DB_FILE, echo: bool = False) -> Engine:
+    """创建写者专用引擎，仅由写队列线程使用的单连接
+
+    Args:
+        db_file: 数据库文件路径
+        echo: 是否打印SQL
+
+    Returns:
+        Engine: 数据库引擎
+    """
+    db_engine = create_engine(
+        f"sqlite:///{db_file}",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        echo=echo
+    )
+    _register_pragmas(db_engine, SQLITE_PRODUCTION_PRAGMAS)
+    return db_engine
+
 
 # 创建数据库引擎
-engine = create_engine(
-    f"sqlite:///{DB_FILE}",
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-    echo=False
-)
-
-# 注册SQLite外部函数 - 支持JSON操作
-@event.listens_for(engine, "connect")
-def set_sqlite_pragma(dbapi_connection, connection_record):
-    """设置SQLite连接参数"""
-    cursor = dbapi_connection.cursor()
-    cursor.execute("PRAGMA foreign_keys=ON")
-    cursor.close()
+engine = create_db_engine()
 
 # 创建会话工厂
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 写队列，仅在生产模式下首次写入时创建
+_write_queue = None
+_write_queue_lock = threading.Lock()
+
+
+def get_write_queue():
+    """获取全局串行写入队列（生产模式）
+
+    Returns:
+        SerializedWriter: 写队列
+    """
+    global _write_queue
+    if _write_queue is None:
+        with _write_queue_lock:
+            if _write_queue is None:
+                from core.models.db.write_queue import SerializedWriter
+                # 写线程提交后对象仍需被调用方读取，提交时不使属性过期
+                write_session_factory = sessionmaker(
+                    autocommit=False, autoflush=False,
+                    expire_on_commit=False, bind=create_write_engine()
+                )
+                _write_queue = SerializedWriter(write_session_factory)
+                _write_queue.start()
+    return _write_queue
+
+
+def use_write_queue() -> bool:
+    """写操作是否经过串行写队列（生产模式）"""
+    return DB_MODE == DB_MODE_PRODUCTION
+
+
+def run_write(fn: Callable[[Session], T], timeout: Optional[float] = None) -> T:
+    """执行一次写事务
+
+    生产模式下投递到串行写队列执行，默认模式下在当前线程的会话中执行并提交。
+
+    Args:
+        fn: 接收会话的写函数，无需自行提交
+        timeout: 生产模式下等待写队列的秒数
+
+    Returns:
+        写函数返回值
+    """
+    if use_write_queue():
+        return get_write_queue().execute(fn, timeout)
+
+    db = SessionLocal(expire_on_commit=False)
+    try:
+        result = fn(db)
+        db.commit()
+        return result
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
 @contextmanager
 def get_db() -> Generator[Session, None, None]:
     """获取数据库会话的上下文管理器
@@ -66,10 +208,41 @@ def get_db() -> Generator[Session, None, None]:
     finally:
         db.close()
 
+@contextmanager
+def session_scope() -> Generator[Session, None, None]:
+    """工作单元会话：成功时提交，异常时回滚，结束时关闭
+
+    会话在当前线程提交，不经过写队列；生产模式下的写事务请使用 ``run_write``。
+
+    使用方法:
+    ```python
+    with session_scope() as db:
+        repo = TopicRepository(db)
+        repo.bulk_upsert(rows)
+    ```
+
+    Returns:
+        Session: 数据库会话对象
+    """
+    db = SessionLocal()
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
 def init_db() -> None:
     """初始化数据库，创建所有表"""
     logger.info("正在初始化数据库...")
     Base.metadata.create_all(bind=engine)
+
+    # 为已有表补建新增的索引
+    from core.models.db.migrations import ensure_indexes
+    ensure_indexes(engine)
+
     logger.info(f"数据库初始化完成，数据存储在: {DB_FILE}")
 
 def get_or_create(db: Session, model, **kwargs) -> tuple[Any, bool]:
@@ -98,6 +271,8 @@ def get_or_create(db: Session, model, **kwargs) -> tuple[Any, bool]:
 def export_to_json(export_path: Optional[str] = None) -> Dict[str, Any]:
     """将数据库导出为JSON格式
 
+    仅适用于少量配置数据；导出全部表请使用 core.models.db.snapshot.export_snapshot。
+
     Args:
         export_path: 可选的导出文件路径
 
@@ -132,6 +307,8 @@ def export_to_json(export_path: Optional[str] = None) -> Dict[str, Any]:
 def import_from_json(import_path: str) -> bool:
     """从JSON文件导入数据
 
+    仅适用于少量配置数据；导入全量快照请使用 core.models.db.snapshot.import_snapshot。
+
     Args:
         import_path: 导入文件路径
 
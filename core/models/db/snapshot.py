@@ -0,0 +1,353 @@
+"""数据库快照的流式导出与导入
+
+快照格式为 NDJSON（每行一个 JSON 对象），可选 zstd 压缩（文件名以 ``.zst`` 结尾）：
+
+    {"type": "header", "version": 1, "tables": [...], "created_at": "..."}
+    {"type": "row", "table": "topics", "data": {...}}
+    ...
+
+导出按表分批从游标读取，导入按表累积批次后以 INSERT … ON CONFLICT 写入，
+每若干批提交一次事务，内存占用只与批大小相关，可用于文章、话题、研究等大表。
+"""
+
+import base64
+import io
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import IO, Any, Dict, Iterator, List, Optional, Sequence
+
+from loguru import logger
+from sqlalchemy import Date, DateTime, LargeBinary, Table, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import NoReferencedColumnError, NoReferencedTableError
+from sqlalchemy.schema import sort_tables
+
+from core.models.db.session import Base, engine as default_engine
+
+SNAPSHOT_VERSION = 1
+
+# 每批读取/写入的行数
+DEFAULT_BATCH_SIZE = 1000
+
+# 导入时每多少批提交一次事务
+DEFAULT_BATCHES_PER_TRANSACTION = 20
+
+# 定义了数据库模型的模块，导入后才能在元数据中找到所有表
+MODEL_MODULES = [
+    "core.models.db",
+    "core.models.db.model_manager",
+    "core.models.research.research_db",
+    "core.models.outline.outline_db",
+]
+
+
+@dataclass
+class SnapshotStats:
+    """快照导出/导入统计"""
+    rows: Dict[str, int] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def total_rows(self) -> int:
+        """总行数"""
+        return sum(self.rows.values())
+
+    @property
+    def rows_per_sec(self) -> float:
+        """每秒处理行数"""
+        return self.total_rows / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典"""
+        return {
+            "rows": dict(self.rows),
+            "total_rows": self.total_rows,
+            "elapsed": round(self.elapsed, 3),
+            "rows_per_sec": round(self.rows_per_sec, 1),
+        }
+
+
+def load_models() -> None:
+    """导入所有模型模块，确保其表注册到 Base.metadata"""
+    import importlib
+
+    for module_name in MODEL_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except Exception as e:
+            logger.warning(f"导入模型模块失败，快照将不包含其表: {module_name}: {str(e)}")
+
+
+def _open_snapshot(path: str, mode: str) -> IO[str]:
+    """打开快照文件，``.zst`` 后缀使用 zstd 流式压缩
+
+    Args:
+        path: 文件路径
+        mode: "r" 或 "w"
+
+    Returns:
+        IO[str]: 文本流
+    """
+    if path.endswith(".zst"):
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError("zstd压缩快照需要安装 zstandard: pip install zstandard") from e
+
+        if mode == "w":
+            raw = zstandard.ZstdCompressor(level=3).stream_writer(open(path, "wb"))
+        else:
+            raw = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"))
+        return io.TextIOWrapper(raw, encoding="utf-8")
+
+    return open(path, mode, encoding="utf-8")
+
+
+def _foreign_keys_resolvable(table: Table) -> bool:
+    """表的外键是否都能找到引用的表和列"""
+    try:
+        for fk in table.foreign_keys:
+            fk.column
+    except (NoReferencedTableError, NoReferencedColumnError) as e:
+        logger.warning(f"表 {table.name} 的外键无法解析，快照将跳过该表: {str(e)}")
+        return False
+    return True
+
+
+def _resolve_tables(tables: Optional[Sequence[str]]) -> List[Table]:
+    """按外键依赖顺序返回需要处理的表
+
+    只对要处理的表排序，其他表外键定义有误时不影响指定的表。
+
+    Args:
+        tables: 表名列表，为None时处理所有外键可解析的表
+
+    Returns:
+        List[Table]: 表列表
+    """
+    load_models()
+    metadata_tables = Base.metadata.tables
+    if tables is None:
+        selected = [t for t in metadata_tables.values() if _foreign_keys_resolvable(t)]
+    else:
+        unknown = set(tables) - set(metadata_tables)
+        if unknown:
+            raise ValueError(f"未知的表: {', '.join(sorted(unknown))}")
+        selected = [metadata_tables[name] for name in dict.fromkeys(tables)]
+    return sort_tables(selected)
+
+
+def _encode_value(value: Any) -> Any:
+    """将列值转换为JSON可序列化的值"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode("ascii")
+    return value
+
+
+def _decode_row(table: Table, data: Dict[str, Any]) -> Dict[str, Any]:
+    """按列类型还原导出时转换过的值，并丢弃表中不存在的列"""
+    row = {}
+    for name, value in data.items():
+        column = table.columns.get(name)
+        if column is None:
+            continue
+        if value is not None:
+            if isinstance(column.type, DateTime):
+                value = datetime.fromisoformat(value)
+            elif isinstance(column.type, Date):
+                value = date.fromisoformat(value)
+            elif isinstance(column.type, LargeBinary):
+                value = base64.b64decode(value)
+        row[name] = value
+    return row
+
+
+def iter_table_rows(conn: Connection, table: Table,
+                    batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+    """按主键顺序流式读取表中的行
+
+    Args:
+        conn: 数据库连接
+        table: 表
+        batch_size: 每批从游标取的行数
+
+    Returns:
+        Iterator[Dict[str, Any]]: 行迭代器
+    """
+    stmt = select(table).order_by(*table.primary_key.columns)
+    result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(stmt)
+    for partition in result.mappings().partitions():
+        for row in partition:
+            yield dict(row)
+
+
+def export_snapshot(path: str, tables: Optional[Sequence[str]] = None,
+                    batch_size: int = DEFAULT_BATCH_SIZE,
+                    bind: Optional[Engine] = None) -> SnapshotStats:
+    """将数据库流式导出为 NDJSON 快照
+
+    Args:
+        path: 快照文件路径，``.zst`` 后缀启用压缩
+        tables: 需要导出的表名，为None时导出所有表
+        batch_size: 每批读取的行数
+        bind: 数据库引擎，默认使用全局引擎
+
+    Returns:
+        SnapshotStats: 导出统计
+    """
+    bind = bind or default_engine
+    target_tables = _resolve_tables(tables)
+    stats = SnapshotStats()
+    start = time.perf_counter()
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    with _open_snapshot(path, "w") as f, bind.connect() as conn:
+        existing = set(bind.dialect.get_table_names(conn))
+        header = {
+            "type": "header",
+            "version": SNAPSHOT_VERSION,
+            "tables": [t.name for t in target_tables if t.name in existing],
+            "created_at": datetime.now().isoformat(),
+        }
+        f.write(json.dumps(header, ensure_ascii=False) + "\n")
+
+        for table in target_tables:
+            if table.name not in existing:
+                continue
+
+            count = 0
+            for row in iter_table_rows(conn, table, batch_size):
+                record = {
+                    "type": "row",
+                    "table": table.name,
+                    "data": {k: _encode_value(v) for k, v in row.items()},
+                }
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                count += 1
+            stats.rows[table.name] = count
+            logger.info(f"已导出表 {table.name}: {count} 行")
+
+    stats.elapsed = time.perf_counter() - start
+    logger.info(f"快照导出完成: {path}，共 {stats.total_rows} 行，{stats.rows_per_sec:.0f} 行/秒")
+    return stats
+
+
+def _upsert_batch(conn: Connection, table: Table, rows: List[Dict[str, Any]]) -> None:
+    """以 INSERT … ON CONFLICT DO UPDATE 写入一批行
+
+    executemany 要求同一批参数列一致，列集合不同的行分开执行。
+    """
+    groups: Dict[frozenset, List[Dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(frozenset(row), []).append(row)
+
+    pk_names = [c.name for c in table.primary_key.columns]
+    for group in groups.values():
+        stmt = sqlite_insert(table)
+        update_columns = [c for c in group[0] if c not in pk_names]
+        if update_columns:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=pk_names,
+                set_={c: stmt.excluded[c] for c in update_columns}
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=pk_names)
+        conn.execute(stmt, group)
+
+
+def import_snapshot(path: str, tables: Optional[Sequence[str]] = None,
+                    batch_size: int = DEFAULT_BATCH_SIZE,
+                    batches_per_transaction: int = DEFAULT_BATCHES_PER_TRANSACTION,
+                    bind: Optional[Engine] = None) -> SnapshotStats:
+    """从 NDJSON 快照流式导入数据
+
+    已存在的行按主键更新，不存在的行插入。每 ``batches_per_transaction`` 批
+    提交一次事务，失败时只回滚当前事务，已提交的批次保留。
+
+    Args:
+        path: 快照文件路径
+        tables: 需要导入的表名，为None时导入快照中的所有表
+        batch_size: 每批写入的行数
+        batches_per_transaction: 每个事务包含的批次数
+        bind: 数据库引擎，默认使用全局引擎
+
+    Returns:
+        SnapshotStats: 导入统计
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"快照文件不存在: {path}")
+
+    bind = bind or default_engine
+    table_map = {t.name: t for t in _resolve_tables(tables)}
+    Base.metadata.create_all(bind=bind, tables=list(table_map.values()))
+
+    stats = SnapshotStats()
+    start = time.perf_counter()
+
+    with _open_snapshot(path, "r") as f:
+        conn = bind.connect()
+        trans = conn.begin()
+        batches_in_transaction = 0
+        current_table: Optional[Table] = None
+        rows: List[Dict[str, Any]] = []
+
+        def flush() -> None:
+            nonlocal batches_in_transaction
+            if current_table is None or not rows:
+                return
+            _upsert_batch(conn, current_table, rows)
+            stats.rows[current_table.name] = stats.rows.get(current_table.name, 0) + len(rows)
+            rows.clear()
+            batches_in_transaction += 1
+
+        try:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+
+                record = json.loads(line)
+                if record.get("type") == "header":
+                    if record.get("version") != SNAPSHOT_VERSION:
+                        raise ValueError(f"不支持的快照版本: {record.get('version')}")
+                    continue
+
+                table = table_map.get(record.get("table"))
+                if table is None:
+                    continue
+
+                # 快照按外键顺序写出，切换表时先写完上一张表，保证父表行先于子表行
+                if table is not current_table:
+                    flush()
+                    current_table = table
+
+                rows.append(_decode_row(table, record["data"]))
+                if len(rows) >= batch_size:
+                    flush()
+
+                if batches_in_transaction >= batches_per_transaction:
+                    trans.commit()
+                    trans = conn.begin()
+                    batches_in_transaction = 0
+                    logger.debug(f"已导入 {stats.total_rows} 行")
+
+            flush()
+            trans.commit()
+        except Exception:
+            trans.rollback()
+            raise
+        finally:
+            conn.close()
+
+    stats.elapsed = time.perf_counter() - start
+    logger.info(f"快照导入完成: {path}，共 {stats.total_rows} 行，{stats.rows_per_sec:.0f} 行/秒")
+    return stats
@@ -0,0 +1,152 @@
+"""串行写入队列
+
+SQLite 同一时刻只允许一个写事务。多线程直接写库时，后到的写者会在
+busy_timeout 内自旋等待，超时后抛出 "database is locked"。本模块把所有写操作
+投递到一个专用写线程，由它持有唯一的写连接按顺序执行，读操作则继续走
+每线程独立的读连接，互不阻塞（WAL 模式下读写可并发）。
+"""
+
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from loguru import logger
+from sqlalchemy.orm import Session, sessionmaker
+
+T = TypeVar("T")
+
+# 队列关闭标记
+_STOP = object()
+
+
+class SerializedWriter:
+    """单写者队列
+
+    调用方通过 ``submit`` 提交 ``fn(session)``，写线程在独立事务中执行并提交，
+    结果或异常通过 ``Future`` 返回。
+
+    使用方法:
+    ```python
+    writer = SerializedWriter(WriteSessionLocal)
+    topic = writer.execute(lambda db: db.merge(Topic(id="t1", title="...")))
+    ```
+    """
+
+    def __init__(self, session_factory: sessionmaker, max_queue_size: int = 10000,
+                 name: str = "genflow-db-writer"):
+        """初始化
+
+        Args:
+            session_factory: 绑定写引擎的会话工厂
+            max_queue_size: 队列最大长度，队列满时 submit 会阻塞（背压）
+            name: 写线程名称
+        """
+        self._session_factory = session_factory
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue_size)
+        self._name = name
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        # 统计单独加锁，写线程更新统计时不会与 start/stop 争用 _lock
+        self._stats_lock = threading.Lock()
+        self._stats = {"submitted": 0, "completed": 0, "failed": 0}
+
+    @property
+    def is_running(self) -> bool:
+        """写线程是否在运行"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """启动写线程（幂等）"""
+        with self._lock:
+            if self.is_running:
+                return
+            self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+            self._thread.start()
+            logger.info(f"数据库写线程已启动: {self._name}")
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """停止写线程，已入队的写操作会先执行完
+
+        Args:
+            timeout: 等待写线程退出的秒数
+        """
+        with self._lock:
+            if not self.is_running:
+                return
+            thread = self._thread
+
+        # 入队和等待都不持有 _lock，队列满时 put 会阻塞到写线程腾出空间
+        self._queue.put(_STOP)
+        thread.join(timeout)
+        with self._lock:
+            if self._thread is thread and not thread.is_alive():
+                self._thread = None
+        logger.info(f"数据库写线程已停止: {self._name}")
+
+    def submit(self, fn: Callable[[Session], T]) -> "Future[T]":
+        """提交写操作
+
+        Args:
+            fn: 接收会话的写函数，返回值作为 Future 结果；无需自行提交事务
+
+        Returns:
+            Future: 写操作结果
+        """
+        if not self.is_running:
+            self.start()
+        future: "Future[T]" = Future()
+        self._queue.put((fn, future))
+        with self._stats_lock:
+            self._stats["submitted"] += 1
+        return future
+
+    def execute(self, fn: Callable[[Session], T], timeout: Optional[float] = None) -> T:
+        """提交写操作并等待完成
+
+        Args:
+            fn: 接收会话的写函数
+            timeout: 等待秒数
+
+        Returns:
+            写函数返回值
+        """
+        return self.submit(fn).result(timeout)
+
+    def get_stats(self) -> Dict[str, int]:
+        """获取写队列统计
+
+        Returns:
+            Dict[str, int]: 已提交、已完成、失败次数以及当前排队数
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["pending"] = self._queue.qsize()
+        return stats
+
+    def _run(self) -> None:
+        """写线程主循环"""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+
+            fn, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            session = self._session_factory()
+            try:
+                result = fn(session)
+                session.commit()
+            except BaseException as e:  # noqa: B902 - 异常原样交给调用方
+                session.rollback()
+                with self._stats_lock:
+                    self._stats["failed"] += 1
+                future.set_exception(e)
+            else:
+                with self._stats_lock:
+                    self._stats["completed"] += 1
+                future.set_result(result)
+            finally:
+                session.close()
@@ -57,33 +57,97 @@ class ArticleAdapter:
             # 导入仓库
             from core.models.db.repository import ArticleRepository
 
-            # 创建仓库实例
-            article_repo = ArticleRepository()
-
-            # 转换为字典
-            article_dict = cls._get_article_dict(article)
-
-            # 保存文章
-            if hasattr(article, 'id') and article.id:
-                # 如果有ID，尝试更新
-                result = article_repo.update(article.id, article_dict)
-                if result is None:
-                    # 如果更新失败（记录不存在），创建新记录
+            with ArticleRepository() as article_repo:
+                # 转换为字典
+                article_dict = cls._get_article_dict(article)
+
+                # 保存文章
+                if hasattr(article, 'id') and article.id:
+                    # 如果有ID，尝试更新
+                    result = article_repo.update(article.id, article_dict)
+                    if result is None:
+                        # 如果更新失败（记录不存在），创建新记录
+                        result = article_repo.create(article_dict)
+                else:
+                    # 创建新记录
                     result = article_repo.create(article_dict)
-            else:
-                # 创建新记录
-                result = article_repo.create(article_dict)
 
-            if result:
-                logger.info(f"已保存文章: {getattr(article, 'id', '(新文章)')}")
-                return True
-            else:
-                logger.error(f"保存文章失败: {getattr(article, 'id', '(新文章)')}")
-                return False
+                if result:
+                    logger.info(f"已保存文章: {getattr(article, 'id', '(新文章)')}")
+                    return True
+                else:
+                    logger.error(f"保存文章失败: {getattr(article, 'id', '(新文章)')}")
+                    return False
         except Exception as e:
             logger.error(f"保存文章失败: {str(e)}")
             return False
 
+    @classmethod
+    def save_articles(cls, articles: List[Any]) -> int:
+        """批量保存文章到数据库
+
+        在一个事务内按批次执行 INSERT … ON CONFLICT，已存在的文章会被更新。
+
+        Args:
+            articles: 文章对象列表
+
+        Returns:
+            int: 成功写入的文章数量，失败返回0
+        """
+        try:
+            # 初始化数据库
+            if not cls.initialize():
+                return 0
+
+            # 导入仓库
+            from core.models.db.repository import ArticleRepository
+            from core.models.db.session import run_write
+
+            rows = []
+            for article in articles:
+                article_dict = cls._get_article_dict(article)
+                if not article_dict.get("id"):
+                    logger.warning("跳过缺少ID的文章")
+                    continue
+                rows.append(article_dict)
+
+            if not rows:
+                return 0
+
+            # 生产模式下经串行写队列提交
+            count = run_write(lambda db: ArticleRepository(db).bulk_upsert(rows))
+
+            logger.info(f"成功批量保存 {count} 篇文章")
+            return count
+        except Exception as e:
+            logger.error(f"批量保存文章失败: {str(e)}")
+            return 0
+
+    @classmethod
+    def get_articles(cls, article_ids: List[str]) -> List[Dict[str, Any]]:
+        """批量获取文章
+
+        Args:
+            article_ids: 文章ID列表
+
+        Returns:
+            List[Dict]: 文章列表，不存在的ID被忽略
+        """
+        try:
+            # 初始化数据库
+            if not cls.initialize():
+                return []
+
+            # 导入仓库
+            from core.models.db.repository import ArticleRepository
+            from core.models.db.session import session_scope
+
+            with session_scope() as db:
+                return [article.to_dict() for article in ArticleRepository(db).get_many(article_ids)]
+        except Exception as e:
+            logger.error(f"批量获取文章失败: {str(e)}")
+            return []
+
     @staticmethod
     def _get_article_dict(article: Any) -> Dict[str, Any]:
         """将文章对象转换为字典
@@ -149,18 +213,16 @@ class ArticleAdapter:
             # 导入仓库
             from core.models.db.repository import ArticleRepository
 
-            # 创建仓库实例
-            article_repo = ArticleRepository()
-
-            # 获取文章
-            article = article_repo.get(article_id)
-            if not article:
-                return None
+            with ArticleRepository() as article_repo:
+                # 获取文章
+                article = article_repo.get(article_id)
+                if not article:
+                    return None
 
-            # 返回字典格式
-            if hasattr(article, 'to_dict'):
-                return article.to_dict()
-            return dict(article)
+                # 返回字典格式
+                if hasattr(article, 'to_dict'):
+                    return article.to_dict()
+                return dict(article)
         except Exception as e:
             logger.error(f"获取文章失败: {str(e)}")
             return None
@@ -183,17 +245,15 @@ class ArticleAdapter:
             # 导入仓库
             from core.models.db.repository import ArticleRepository
 
-            # 创建仓库实例
-            article_repo = ArticleRepository()
-
-            # 使用筛选条件查询
-            articles = article_repo.db.query(article_repo.model).filter(article_repo.model.status == status).all()
+            with ArticleRepository() as article_repo:
+                # 使用筛选条件查询
+                articles = article_repo.db.query(article_repo.model).filter(article_repo.model.status == status).all()
 
-            # 转换为字典列表
-            return [
-                article.to_dict() if hasattr(article, 'to_dict') else dict(article)
-                for article in articles
-            ]
+                # 转换为字典列表
+                return [
+                    article.to_dict() if hasattr(article, 'to_dict') else dict(article)
+                    for article in articles
+                ]
         except Exception as e:
             logger.error(f"获取文章失败: {str(e)}")
             return []
@@ -217,21 +277,14 @@ class ArticleAdapter:
             # 导入仓库
             from core.models.db.repository import ArticleRepository
 
-            # 创建仓库实例
-            article_repo = ArticleRepository()
+            with ArticleRepository() as article_repo:
+                # 更新状态，文章不存在时返回None
+                if article_repo.update(article_id, {"status": status}) is None:
+                    logger.warning(f"更新状态失败: 未找到文章 {article_id}")
+                    return False
 
-            # 获取文章
-            article = article_repo.get(article_id)
-            if not article:
-                logger.warning(f"更新状态失败: 未找到文章 {article_id}")
-                return False
-
-            # 更新状态
-            article.status = status
-            article_repo.db.commit()
-
-            logger.info(f"已更新文章 {article_id} 状态为 {status}")
-            return True
+                logger.info(f"已更新文章 {article_id} 状态为 {status}")
+                return True
         except Exception as e:
             logger.error(f"更新文章状态失败: {str(e)}")
             return False
@@ -254,18 +307,16 @@ class ArticleAdapter:
             # 导入仓库
             from core.models.db.repository import ArticleRepository
 
-            # 创建仓库实例
-            article_repo = ArticleRepository()
-
-            # 删除文章
-            success = article_repo.delete(article_id)
+            with ArticleRepository() as article_repo:
+                # 删除文章
+                success = article_repo.delete(article_id)
 
-            if success:
-                logger.info(f"成功删除文章: {article_id}")
-            else:
-                logger.warning(f"删除文章失败, 未找到文章: {article_id}")
+                if success:
+                    logger.info(f"成功删除文章: {article_id}")
+                else:
+                    logger.warning(f"删除文章失败, 未找到文章: {article_id}")
 
-            return success
+                return success
         except Exception as e:
             logger.error(f"删除文章失败: {str(e)}")
             return False
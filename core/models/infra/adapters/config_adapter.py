@@ -3,9 +3,12 @@
 负责内容类型、文章风格和平台配置的数据库访问。
 """
 
+import os
 from typing import Dict, List, Optional, Any
 from loguru import logger
 
+from core.models.infra.config_snapshot import ConfigSnapshot
+
 
 class ConfigAdapter:
     """配置适配器，负责处理配置相关的数据库操作"""
@@ -57,10 +60,19 @@ class ConfigAdapter:
                 return False
 
             # 导入迁移工具
-            from core.models.db.migrate_configs import migrate_all
+            from core.models.db import migrate_configs
+            from core.models.db.session import DB_FILE
+
+            # 配置源文件自上次同步后未变化时跳过迁移，sync_mode下总是执行完整同步
+            target = cls._sync_target(DB_FILE)
+            if not sync_mode and ConfigSnapshot.is_synced(target, cls._config_digest(migrate_configs)):
+                logger.info("配置文件未变化，跳过同步到数据库")
+                return True
 
             # 执行迁移，在sync_mode下执行完整同步（包括删除不存在的配置）
-            migrate_all(sync_mode=sync_mode)
+            # 全部迁移成功后才记录摘要，失败的配置在下次启动时重新迁移
+            if migrate_configs.migrate_all(sync_mode=sync_mode):
+                ConfigSnapshot.mark_synced(target, cls._config_digest(migrate_configs))
 
             logger.info(f"配置文件已成功同步到数据库 (sync_mode={sync_mode})")
             return True
@@ -68,6 +80,29 @@ class ConfigAdapter:
             logger.error(f"同步配置文件到数据库失败: {str(e)}")
             return False
 
+    @staticmethod
+    def _sync_target(db_file: str) -> str:
+        """同步目标标识：数据库文件路径和inode，数据库文件重建后需要重新同步"""
+        try:
+            return f"{os.path.abspath(db_file)}:{os.stat(db_file).st_ino}"
+        except OSError:
+            return os.path.abspath(db_file)
+
+    @staticmethod
+    def _config_digest(migrate_module: Any) -> Optional[str]:
+        """迁移所用配置源文件的摘要
+
+        文章风格来自配置快照中的 styles 组，内容类型和平台来自模块中的常量，
+        因此这些模块文件和迁移脚本本身也计入摘要。
+        """
+        from core.models.content_type import constants
+        from core.models.platform import platform
+
+        return ConfigSnapshot.digest(
+            ["styles"],
+            extra_files=[constants.__file__, platform.__file__, migrate_module.__file__],
+        )
+
     #
     # 内容类型相关方法
     #
@@ -85,11 +120,12 @@ class ConfigAdapter:
                 return {}
 
             # 导入仓库
-            from core.models.db.repository import content_type_repo
+            from core.models.db.repository import ContentTypeRepository
 
-            # 获取所有内容类型
-            content_types = content_type_repo.get_all()
-            return {ct.id: ct for ct in content_types}
+            with ContentTypeRepository() as content_type_repo:
+                # 获取所有内容类型
+                content_types = content_type_repo.get_all()
+                return {ct.id: ct for ct in content_types}
         except Exception as e:
             logger.error(f"从数据库加载内容类型失败: {str(e)}")
             return {}
@@ -110,10 +146,11 @@ class ConfigAdapter:
                 return None
 
             # 导入仓库
-            from core.models.db.repository import content_type_repo
+            from core.models.db.repository import ContentTypeRepository
 
-            # 获取内容类型
-            return content_type_repo.get(content_type_id)
+            with ContentTypeRepository() as content_type_repo:
+                # 获取内容类型
+                return content_type_repo.get(content_type_id)
         except Exception as e:
             logger.error(f"获取内容类型失败: {str(e)}")
             return None
@@ -134,23 +171,24 @@ class ConfigAdapter:
                 return False
 
             # 导入仓库
-            from core.models.db.repository import content_type_repo
-
-            # 转换为字典
-            content_type_dict = cls._get_content_type_dict(content_type)
-
-            # 检查是否已存在
-            existing = content_type_repo.get(content_type.id)
-            if existing:
-                # 更新
-                content_type_repo.update(content_type.id, content_type_dict)
-                logger.info(f"已更新内容类型: {content_type.id}")
-            else:
-                # 创建
-                content_type_repo.create(content_type_dict)
-                logger.info(f"已创建内容类型: {content_type.id}")
-
-            return True
+            from core.models.db.repository import ContentTypeRepository
+
+            with ContentTypeRepository() as content_type_repo:
+                # 转换为字典
+                content_type_dict = cls._get_content_type_dict(content_type)
+
+                # 检查是否已存在
+                existing = content_type_repo.get(content_type.id)
+                if existing:
+                    # 更新
+                    content_type_repo.update(content_type.id, content_type_dict)
+                    logger.info(f"已更新内容类型: {content_type.id}")
+                else:
+                    # 创建
+                    content_type_repo.create(content_type_dict)
+                    logger.info(f"已创建内容类型: {content_type.id}")
+
+                return True
         except Exception as e:
             logger.error(f"保存内容类型失败: {str(e)}")
             return False
@@ -197,11 +235,12 @@ class ConfigAdapter:
                 return {}
 
             # 导入仓库
-            from core.models.db.repository import article_style_repo
+            from core.models.db.repository import ArticleStyleRepository
 
-            # 获取所有文章风格
-            styles = article_style_repo.get_all()
-            return {style.name: style for style in styles}
+            with ArticleStyleRepository() as article_style_repo:
+                # 获取所有文章风格
+                styles = article_style_repo.get_all()
+                return {style.name: style for style in styles}
         except Exception as e:
             logger.error(f"从数据库加载文章风格失败: {str(e)}")
             return {}
@@ -222,10 +261,11 @@ class ConfigAdapter:
                 return None
 
             # 导入仓库
-            from core.models.db.repository import article_style_repo
+            from core.models.db.repository import ArticleStyleRepository
 
-            # 获取文章风格
-            return article_style_repo.get(style_name)
+            with ArticleStyleRepository() as article_style_repo:
+                # 获取文章风格
+                return article_style_repo.get(style_name)
         except Exception as e:
             logger.error(f"获取文章风格失败: {str(e)}")
             return None
@@ -246,23 +286,24 @@ class ConfigAdapter:
                 return False
 
             # 导入仓库
-            from core.models.db.repository import article_style_repo
-
-            # 转换为字典
-            style_dict = cls._get_style_dict(style)
-
-            # 检查是否已存在
-            existing = article_style_repo.get(style.name)
-            if existing:
-                # 更新
-                article_style_repo.update(style.name, style_dict)
-                logger.info(f"已更新文章风格: {style.name}")
-            else:
-                # 创建
-                article_style_repo.create(style_dict)
-                logger.info(f"已创建文章风格: {style.name}")
-
-            return True
+            from core.models.db.repository import ArticleStyleRepository
+
+            with ArticleStyleRepository() as article_style_repo:
+                # 转换为字典
+                style_dict = cls._get_style_dict(style)
+
+                # 检查是否已存在
+                existing = article_style_repo.get(style.name)
+                if existing:
+                    # 更新
+                    article_style_repo.update(style.name, style_dict)
+                    logger.info(f"已更新文章风格: {style.name}")
+                else:
+                    # 创建
+                    article_style_repo.create(style_dict)
+                    logger.info(f"已创建文章风格: {style.name}")
+
+                return True
         except Exception as e:
             logger.error(f"保存文章风格失败: {str(e)}")
             return False
@@ -309,11 +350,12 @@ class ConfigAdapter:
                 return {}
 
             # 导入仓库
-            from core.models.db.repository import platform_repo
+            from core.models.db.repository import PlatformRepository
 
-            # 获取所有平台
-            platforms = platform_repo.get_all()
-            return {platform.id: platform for platform in platforms}
+            with PlatformRepository() as platform_repo:
+                # 获取所有平台
+                platforms = platform_repo.get_all()
+                return {platform.id: platform for platform in platforms}
         except Exception as e:
             logger.error(f"从数据库加载平台配置失败: {str(e)}")
             return {}
@@ -334,10 +376,11 @@ class ConfigAdapter:
                 return None
 
             # 导入仓库
-            from core.models.db.repository import platform_repo
+            from core.models.db.repository import PlatformRepository
 
-            # 获取平台
-            return platform_repo.get(platform_id)
+            with PlatformRepository() as platform_repo:
+                # 获取平台
+                return platform_repo.get(platform_id)
         except Exception as e:
             logger.error(f"获取平台配置失败: {str(e)}")
             return None
@@ -358,23 +401,24 @@ class ConfigAdapter:
                 return False
 
             # 导入仓库
-            from core.models.db.repository import platform_repo
-
-            # 转换为字典
-            platform_dict = cls._get_platform_dict(platform)
-
-            # 检查是否已存在
-            existing = platform_repo.get(platform.id)
-            if existing:
-                # 更新
-                platform_repo.update(platform.id, platform_dict)
-                logger.info(f"已更新平台配置: {platform.id}")
-            else:
-                # 创建
-                platform_repo.create(platform_dict)
-                logger.info(f"已创建平台配置: {platform.id}")
-
-            return True
+            from core.models.db.repository import PlatformRepository
+
+            with PlatformRepository() as platform_repo:
+                # 转换为字典
+                platform_dict = cls._get_platform_dict(platform)
+
+                # 检查是否已存在
+                existing = platform_repo.get(platform.id)
+                if existing:
+                    # 更新
+                    platform_repo.update(platform.id, platform_dict)
+                    logger.info(f"已更新平台配置: {platform.id}")
+                else:
+                    # 创建
+                    platform_repo.create(platform_dict)
+                    logger.info(f"已创建平台配置: {platform.id}")
+
+                return True
         except Exception as e:
             logger.error(f"保存平台配置失败: {str(e)}")
             return False
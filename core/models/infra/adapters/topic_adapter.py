@@ -56,15 +56,16 @@ class TopicAdapter:
                 return None
 
             # 导入仓库
-            from core.models.db.repository import topic_repo
-
-            # 获取话题
-            topic = topic_repo.get(topic_id)
-            if topic and hasattr(topic, 'to_dict'):
-                return topic.to_dict()
-            elif topic:
-                return dict(topic)
-            return None
+            from core.models.db.repository import TopicRepository
+
+            with TopicRepository() as topic_repo:
+                # 获取话题
+                topic = topic_repo.get(topic_id)
+                if topic and hasattr(topic, 'to_dict'):
+                    return topic.to_dict()
+                elif topic:
+                    return dict(topic)
+                return None
         except Exception as e:
             logger.error(f"获取话题[{topic_id}]失败: {str(e)}")
             return None
@@ -85,40 +86,107 @@ class TopicAdapter:
                 return False
 
             # 导入仓库
-            from core.models.db.repository import topic_repo
-
-            # 转换为字典
-            topic_dict = cls._get_topic_dict(topic)
+            from core.models.db.repository import TopicRepository
 
-            # 确保必须的字段
-            if 'id' not in topic_dict or 'title' not in topic_dict or 'platform' not in topic_dict:
-                logger.error("保存话题失败: 缺少必要字段(id, title, platform)")
-                return False
+            with TopicRepository() as topic_repo:
+                # 转换为字典
+                topic_dict = cls._get_topic_dict(topic)
 
-            # 检查是否已存在
-            existing = topic_repo.get(topic_dict['id'])
-            if existing:
-                # 更新
-                updated = topic_repo.update(topic_dict['id'], topic_dict)
-                if updated:
-                    logger.info(f"成功更新话题: {topic_dict['id']}")
-                    return True
-                else:
-                    logger.error(f"更新话题失败: {topic_dict['id']}")
+                # 确保必须的字段
+                if 'id' not in topic_dict or 'title' not in topic_dict or 'platform' not in topic_dict:
+                    logger.error("保存话题失败: 缺少必要字段(id, title, platform)")
                     return False
-            else:
-                # 创建
-                created = topic_repo.create(topic_dict)
-                if created:
-                    logger.info(f"成功创建话题: {topic_dict['id']}")
-                    return True
+
+                # 检查是否已存在
+                existing = topic_repo.get(topic_dict['id'])
+                if existing:
+                    # 更新
+                    updated = topic_repo.update(topic_dict['id'], topic_dict)
+                    if updated:
+                        logger.info(f"成功更新话题: {topic_dict['id']}")
+                        return True
+                    else:
+                        logger.error(f"更新话题失败: {topic_dict['id']}")
+                        return False
                 else:
-                    logger.error(f"创建话题失败")
-                    return False
+                    # 创建
+                    created = topic_repo.create(topic_dict)
+                    if created:
+                        logger.info(f"成功创建话题: {topic_dict['id']}")
+                        return True
+                    else:
+                        logger.error(f"创建话题失败")
+                        return False
         except Exception as e:
             logger.error(f"保存话题失败: {str(e)}")
             return False
 
+    @classmethod
+    def save_topics(cls, topics: List[Any]) -> int:
+        """批量保存话题到数据库
+
+        在一个事务内按批次执行 INSERT … ON CONFLICT，已存在的话题会被更新。
+
+        Args:
+            topics: 话题对象列表
+
+        Returns:
+            int: 成功写入的话题数量，失败返回0
+        """
+        try:
+            # 初始化数据库
+            if not cls.initialize():
+                return 0
+
+            # 导入仓库
+            from core.models.db.repository import TopicRepository
+            from core.models.db.session import run_write
+
+            rows = []
+            for topic in topics:
+                topic_dict = cls._get_topic_dict(topic)
+                if 'id' not in topic_dict or 'title' not in topic_dict:
+                    logger.warning(f"跳过缺少必要字段(id, title)的话题: {topic_dict.get('id')}")
+                    continue
+                rows.append(topic_dict)
+
+            if not rows:
+                return 0
+
+            # 生产模式下经串行写队列提交
+            count = run_write(lambda db: TopicRepository(db).bulk_upsert(rows))
+
+            logger.info(f"成功批量保存 {count} 个话题")
+            return count
+        except Exception as e:
+            logger.error(f"批量保存话题失败: {str(e)}")
+            return 0
+
+    @classmethod
+    def get_topics(cls, topic_ids: List[str]) -> List[Dict[str, Any]]:
+        """批量获取话题
+
+        Args:
+            topic_ids: 话题ID列表
+
+        Returns:
+            List[Dict[str, Any]]: 话题列表，不存在的ID被忽略
+        """
+        try:
+            # 初始化数据库
+            if not cls.initialize():
+                return []
+
+            # 导入仓库
+            from core.models.db.repository import TopicRepository
+            from core.models.db.session import session_scope
+
+            with session_scope() as db:
+                return [topic.to_dict() for topic in TopicRepository(db).get_many(topic_ids)]
+        except Exception as e:
+            logger.error(f"批量获取话题失败: {str(e)}")
+            return []
+
     @staticmethod
     def _get_topic_dict(topic: Any) -> Dict[str, Any]:
         """将话题对象转换为字典
@@ -149,11 +217,12 @@ class TopicAdapter:
         return topic_dict
 
     @classmethod
-    def get_topics_by_platform(cls, platform: str) -> List[Dict[str, Any]]:
-        """获取指定平台的所有话题
+    def get_topics_by_platform(cls, platform: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """获取指定平台的话题
 
         Args:
             platform: 平台标识
+            limit: 返回数量限制，为None时不限制
 
         Returns:
             List[Dict[str, Any]]: 话题列表
@@ -164,16 +233,17 @@ class TopicAdapter:
                 return []
 
             # 导入仓库
-            from core.models.db.repository import topic_repo
+            from core.models.db.repository import TopicRepository
 
-            # 获取话题
-            topics = topic_repo.get_by_platform(platform)
+            with TopicRepository() as topic_repo:
+                # 获取话题
+                topics = topic_repo.get_by_platform(platform, limit=limit)
 
-            # 转换为字典列表
-            return [
-                topic.to_dict() if hasattr(topic, 'to_dict') else dict(topic)
-                for topic in topics
-            ]
+                # 转换为字典列表
+                return [
+                    topic.to_dict() if hasattr(topic, 'to_dict') else dict(topic)
+                    for topic in topics
+                ]
         except Exception as e:
             logger.error(f"获取平台话题失败: {str(e)}")
             return []
@@ -194,17 +264,18 @@ class TopicAdapter:
                 return False
 
             # 导入仓库
-            from core.models.db.repository import topic_repo
+            from core.models.db.repository import TopicRepository
 
-            # 删除话题
-            success = topic_repo.delete(topic_id)
+            with TopicRepository() as topic_repo:
+                # 删除话题
+                success = topic_repo.delete(topic_id)
 
-            if success:
-                logger.info(f"成功删除话题: {topic_id}")
-            else:
-                logger.warning(f"删除话题失败, 未找到话题: {topic_id}")
+                if success:
+                    logger.info(f"成功删除话题: {topic_id}")
+                else:
+                    logger.warning(f"删除话题失败, 未找到话题: {topic_id}")
 
-            return success
+                return success
         except Exception as e:
             logger.error(f"删除话题失败: {str(e)}")
             return False
@@ -0,0 +1,233 @@
+"""配置注册表
+
+平台、文章风格和内容类型的统一内存索引。
+
+各管理器的数据保存在以名称为键的字典中，按ID/不区分大小写的名称/风格类型查找时
+需要遍历全部对象，风格与内容类型的兼容性每次调用都重新计算。这些查找在智能体团队
+内部被频繁调用，注册表在首次查找时一次性建立索引：
+
+- 平台：按ID、名称及其casefold形式索引
+- 风格：按名称、casefold名称和类型索引
+- 内容类型：按名称及其casefold形式索引
+- 兼容性矩阵：(风格名称, 内容类型) → 是否兼容，预先计算所有已知组合
+
+注册表带版本号，管理器的 ``save_*`` 等修改操作调用 ``invalidate()`` 使版本号加一，
+下次查找时重新建立索引。
+"""
+
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from loguru import logger
+
+
+def _fold(name: Any) -> str:
+    """名称归一化：去除首尾空白并转为casefold形式"""
+    return str(name).strip().casefold()
+
+
+class ConfigRegistry:
+    """配置注册表
+
+    所有方法均为类方法，与各管理器的用法一致。
+    """
+
+    _version: int = 0
+    _built_version: int = -1
+    _lock = threading.RLock()
+
+    _platforms: Dict[str, Any] = {}
+    _styles: Dict[str, Any] = {}
+    _styles_by_type: Dict[str, Any] = {}
+    _content_types: Dict[str, Any] = {}
+    _compatibility: Dict[Tuple[str, str], bool] = {}
+
+    _stats: Dict[str, int] = {"builds": 0, "lookups": 0, "compat_computed": 0}
+
+    @classmethod
+    def version(cls) -> int:
+        """当前版本号
+
+        Returns:
+            int: 版本号，每次失效加一
+        """
+        return cls._version
+
+    @classmethod
+    def invalidate(cls, reason: str = "") -> None:
+        """使索引失效，下次查找时重建
+
+        Args:
+            reason: 失效原因，仅用于日志
+        """
+        with cls._lock:
+            cls._version += 1
+        logger.debug(f"配置注册表已失效 (版本 {cls._version}){': ' + reason if reason else ''}")
+
+    @classmethod
+    def _ensure_built(cls) -> None:
+        """版本号变化时重建索引"""
+        if cls._built_version == cls._version:
+            return
+
+        with cls._lock:
+            if cls._built_version == cls._version:
+                return
+            # 延迟导入，避免与各管理器循环导入
+            from core.models.platform.platform_manager import PlatformManager
+            from core.models.style.style_manager import StyleManager
+            from core.models.content_type.content_type_manager import ContentTypeManager
+
+            # 管理器首次初始化时会使注册表失效，先完成初始化再记录版本号
+            PlatformManager.ensure_initialized()
+            if not StyleManager._initialized:
+                StyleManager.initialize()
+            ContentTypeManager.ensure_initialized()
+
+            version = cls._version
+            cls._build(PlatformManager, StyleManager, ContentTypeManager)
+            cls._built_version = version
+
+    @classmethod
+    def _build(cls, platform_manager: Any, style_manager: Any, content_type_manager: Any) -> None:
+        """从各管理器读取数据并建立索引"""
+        platforms: Dict[str, Any] = {}
+        for platform in platform_manager.get_all_platforms():
+            for key in (getattr(platform, "id", None), platform.name):
+                if key:
+                    platforms.setdefault(str(key), platform)
+                    platforms.setdefault(_fold(key), platform)
+
+        styles: Dict[str, Any] = {}
+        styles_by_type: Dict[str, Any] = {}
+        for name, style in style_manager.get_all_styles().items():
+            styles[name] = style
+            styles.setdefault(_fold(name), style)
+            # 与原线性查找一致，同类型取第一个
+            styles_by_type.setdefault(style.type, style)
+
+        content_types: Dict[str, Any] = {}
+        for name, content_type in content_type_manager.get_all_content_types().items():
+            content_types[name] = content_type
+            content_types.setdefault(_fold(name), content_type)
+
+        compatibility: Dict[Tuple[str, str], bool] = {}
+        for style_name, style in style_manager.get_all_styles().items():
+            for type_name in content_type_manager.get_all_content_types():
+                compatibility[(style_name, type_name)] = style.is_compatible_with_content_type(type_name)
+
+        cls._platforms = platforms
+        cls._styles = styles
+        cls._styles_by_type = styles_by_type
+        cls._content_types = content_types
+        cls._compatibility = compatibility
+        cls._stats["builds"] += 1
+        logger.debug(f"配置注册表已重建: {len(platforms)} 个平台索引, {len(styles)} 个风格索引, "
+                     f"{len(compatibility)} 个兼容性组合")
+
+    @classmethod
+    def get_platform(cls, key: str) -> Optional[Any]:
+        """按ID或名称查找平台，不区分大小写
+
+        Args:
+            key: 平台ID或名称
+
+        Returns:
+            Optional[Any]: 平台对象，不存在则返回None
+        """
+        if not key:
+            return None
+        cls._ensure_built()
+        cls._stats["lookups"] += 1
+        return cls._platforms.get(key) or cls._platforms.get(_fold(key))
+
+    @classmethod
+    def get_style(cls, name: str) -> Optional[Any]:
+        """按名称查找风格，不区分大小写
+
+        Args:
+            name: 风格名称
+
+        Returns:
+            Optional[Any]: 风格对象，不存在则返回None
+        """
+        if not name:
+            return None
+        cls._ensure_built()
+        cls._stats["lookups"] += 1
+        return cls._styles.get(name) or cls._styles.get(_fold(name))
+
+    @classmethod
+    def find_style_by_type(cls, style_type: str) -> Optional[Any]:
+        """按类型查找风格
+
+        Args:
+            style_type: 风格类型
+
+        Returns:
+            Optional[Any]: 该类型的第一个风格，不存在则返回None
+        """
+        cls._ensure_built()
+        cls._stats["lookups"] += 1
+        return cls._styles_by_type.get(style_type)
+
+    @classmethod
+    def get_content_type(cls, name: str) -> Optional[Any]:
+        """按名称查找内容类型，不区分大小写
+
+        Args:
+            name: 内容类型名称
+
+        Returns:
+            Optional[Any]: 内容类型对象，不存在则返回None
+        """
+        if not name:
+            return None
+        cls._ensure_built()
+        cls._stats["lookups"] += 1
+        return cls._content_types.get(name) or cls._content_types.get(_fold(name))
+
+    @classmethod
+    def is_compatible(cls, style_name: str, content_type: str) -> bool:
+        """风格是否与内容类型兼容
+
+        已知组合直接查矩阵；未知的内容类型名称计算一次后记入矩阵，直到下次失效。
+
+        Args:
+            style_name: 风格名称
+            content_type: 内容类型名称
+
+        Returns:
+            bool: 是否兼容，风格不存在时返回False
+        """
+        cls._ensure_built()
+        cls._stats["lookups"] += 1
+        key = (style_name, content_type)
+        result = cls._compatibility.get(key)
+        if result is not None:
+            return result
+
+        style = cls._styles.get(style_name) or cls._styles.get(_fold(style_name))
+        if style is None:
+            return False
+
+        result = style.is_compatible_with_content_type(content_type)
+        cls._compatibility[key] = result
+        cls._stats["compat_computed"] += 1
+        return result
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        """获取统计信息
+
+        Returns:
+            Dict[str, Any]: 版本号、重建次数、查找次数和索引大小
+        """
+        return {
+            "version": cls._version,
+            "platforms": len(cls._platforms),
+            "styles": len(cls._styles),
+            "content_types": len(cls._content_types),
+            "compatibility": len(cls._compatibility),
+            **cls._stats,
+        }
@@ -10,6 +10,14 @@ import os
 import json
 from pathlib import Path
 
+from .config_snapshot import ConfigSnapshot
+
+# 核心配置类型与文件名
+CORE_CONFIG_FILES = {
+    "app": "app_config.json",
+    "database": "db_config.json",
+}
+
 class ConfigService:
     """配置服务类，处理应用配置的加载和管理
 
@@ -53,16 +61,18 @@ class ConfigService:
 
     @classmethod
     def load_core_configs(cls) -> None:
-        """加载核心配置文件"""
-        # 加载应用配置
-        app_config = cls.load_config_file("app_config.json")
-        if app_config:
-            cls._config_cache["app"] = app_config
-
-        # 加载数据库配置
-        db_config = cls.load_config_file("db_config.json")
-        if db_config:
-            cls._config_cache["database"] = db_config
+        """加载核心配置文件，源文件未变化时直接使用配置快照"""
+        configs = ConfigSnapshot.load_group(
+            "core_configs", cls._config_dir, dict, files=list(CORE_CONFIG_FILES.values())
+        )
+
+        # 加载应用配置和数据库配置
+        for config_type, filename in CORE_CONFIG_FILES.items():
+            file_path = os.path.join(cls._config_dir, filename)
+            if not os.path.exists(file_path):
+                logger.warning(f"配置文件不存在: {file_path}")
+            elif configs.get(file_path):
+                cls._config_cache[config_type] = configs[file_path]
 
     @classmethod
     def load_config_file(cls, filename: str) -> Optional[Dict[str, Any]]:
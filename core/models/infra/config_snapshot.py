@@ -0,0 +1,348 @@
+"""配置快照
+
+平台、文章风格和应用配置在首次使用时逐个读取JSON文件并构建模型，每次启动都要重复一遍。
+配置快照把解析、校验后的模型对象保存到一个二进制缓存文件中：
+
+- 每组配置（如 platforms、styles）以源文件的 (路径, mtime_ns, 大小) 和模型代码文件的签名为键
+- 键未变化时直接从快照取出模型对象，不再读取和解析JSON
+- 键变化时并行读取源文件，内容哈希未变的文件复用快照中的对象，只解析改动的文件
+- 每组模型单独序列化，每次载入都反序列化出新对象，调用方修改模型不会影响快照
+- 快照通过 mmap 读取，写入时先写临时文件再原子替换
+- 记录配置同步到数据库时的源文件摘要，配置未变化时可跳过重复迁移
+
+快照只是缓存，删除快照文件或设置 GENFLOW_CONFIG_SNAPSHOT=0 后行为与直接读取JSON相同。
+
+使用方法:
+    models = ConfigSnapshot.load_group("platforms", platforms_dir, lambda data: Platform(**data))
+
+环境变量：
+    GENFLOW_CONFIG_SNAPSHOT: 是否启用快照，默认 1
+    GENFLOW_CONFIG_SNAPSHOT_PATH: 快照文件路径，默认 $GENFLOW_CACHE_DIR/config_snapshot-<项目路径哈希>.bin
+    GENFLOW_CACHE_DIR: 缓存目录，默认 $XDG_CACHE_HOME/genflow 或 ~/.cache/genflow
+    GENFLOW_CONFIG_LOAD_WORKERS: 并行读取配置文件的线程数
+"""
+
+import fnmatch
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+# 快照格式版本，格式变化时旧快照自动失效
+SNAPSHOT_VERSION = 1
+
+CONFIG_SNAPSHOT_ENABLED = os.environ.get("GENFLOW_CONFIG_SNAPSHOT", "1").lower() not in ("0", "false", "no")
+# 快照默认放在用户缓存目录而不是源码目录，文件名带上项目路径的哈希，多个检出互不覆盖
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+CONFIG_CACHE_DIR = os.environ.get("GENFLOW_CACHE_DIR") or os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "genflow"
+)
+CONFIG_SNAPSHOT_PATH = os.environ.get("GENFLOW_CONFIG_SNAPSHOT_PATH") or os.path.join(
+    CONFIG_CACHE_DIR, f"config_snapshot-{hashlib.md5(_PROJECT_ROOT.encode('utf-8')).hexdigest()[:12]}.bin"
+)
+CONFIG_LOAD_WORKERS = int(os.environ.get("GENFLOW_CONFIG_LOAD_WORKERS", min(8, (os.cpu_count() or 1) + 4)))
+
+# 每个线程至少处理的文件数，文件较少时在当前线程解析
+MIN_FILES_PER_WORKER = 16
+
+# 文件签名: (路径, mtime_ns, 大小)
+FileStamp = Tuple[str, int, int]
+
+
+def file_stamp(path: str) -> Optional[FileStamp]:
+    """获取文件签名，文件不存在时返回None"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+
+def _code_stamp(obj: Any) -> Optional[FileStamp]:
+    """模型代码所在文件的签名，模型定义变化时快照中的对象随之失效"""
+    module = sys.modules.get(getattr(obj, "__module__", "") or "")
+    path = getattr(module, "__file__", None)
+    return file_stamp(path) if path else None
+
+
+def _read_and_parse(path: str, factory: Callable[[Any], Any],
+                    cached: Optional[Tuple[str, Any]]) -> Tuple[str, Any]:
+    """读取文件并构建模型，内容哈希与快照一致时复用快照中的对象
+
+    Returns:
+        Tuple[str, Any]: 内容哈希和模型对象
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw).hexdigest()
+    if cached is not None and cached[0] == digest:
+        return digest, cached[1]
+    return digest, factory(json.loads(raw.decode("utf-8")))
+
+
+def _parse_chunk(paths: Sequence[str], factory: Callable[[Any], Any],
+                 previous: Dict[str, Tuple[str, Any]]) -> List[Tuple[str, Optional[str], Any]]:
+    """解析一批文件，单个文件失败时记录异常而不中断
+
+    Returns:
+        List[Tuple[str, Optional[str], Any]]: (路径, 内容哈希, 模型对象或异常)
+    """
+    results = []
+    for path in paths:
+        try:
+            results.append((path, *_read_and_parse(path, factory, previous.get(path))))
+        except Exception as e:
+            results.append((path, None, e))
+    return results
+
+
+class ConfigSnapshot:
+    """配置快照
+
+    所有方法均为类方法，与各管理器的用法一致。
+    """
+
+    _lock = threading.RLock()
+    _path: str = CONFIG_SNAPSHOT_PATH
+    _enabled: bool = CONFIG_SNAPSHOT_ENABLED
+    _data: Optional[Dict[str, Any]] = None
+    _stats: Dict[str, int] = {"hits": 0, "misses": 0, "parsed": 0, "reused": 0, "writes": 0}
+
+    @classmethod
+    def configure(cls, path: Optional[str] = None, enabled: Optional[bool] = None) -> None:
+        """修改快照设置并清空内存中的快照
+
+        Args:
+            path: 快照文件路径
+            enabled: 是否启用快照
+        """
+        with cls._lock:
+            if path is not None:
+                cls._path = path
+            if enabled is not None:
+                cls._enabled = enabled
+            cls._data = None
+
+    @classmethod
+    def reset(cls) -> None:
+        """清空内存中的快照和统计，下次使用时重新读取快照文件"""
+        with cls._lock:
+            cls._data = None
+            cls._stats = {key: 0 for key in cls._stats}
+
+    @classmethod
+    def stats(cls) -> Dict[str, int]:
+        """快照命中、未命中、解析和复用的文件数，以及写入次数"""
+        return dict(cls._stats)
+
+    @classmethod
+    def load_group(
+        cls,
+        name: str,
+        directory: str,
+        factory: Callable[[Any], Any],
+        files: Optional[Sequence[str]] = None,
+        pattern: str = "*.json",
+        schema: Any = None,
+        cache: bool = True,
+    ) -> Dict[str, Any]:
+        """加载一组配置文件
+
+        Args:
+            name: 配置组名称，快照中以此区分不同的配置
+            directory: 配置目录
+            factory: 由JSON数据构建模型对象的函数
+            files: 目录中的文件名列表，为None时按pattern匹配目录中的文件
+            pattern: 文件匹配模式
+            schema: 模型类，其代码文件变化时重新解析，默认取factory所在模块
+            cache: 是否使用快照，为False时只并行解析源文件
+
+        Returns:
+            Dict[str, Any]: 文件路径到模型对象的映射（按路径排序），解析失败的文件会被跳过
+        """
+        spec = {"directory": directory, "files": list(files) if files is not None else None, "pattern": pattern}
+        key = cls._group_key(spec, schema if schema is not None else factory)
+        paths = [stamp[0] for stamp in key[2]]
+        cache = cache and cls._enabled
+
+        with cls._lock:
+            group = cls._snapshot()["groups"].get(name) if cache else None
+        if group and group["key"] == key:
+            cls._stats["hits"] += 1
+            # 每次从序列化数据重建对象，调用方修改模型不会影响快照
+            return pickle.loads(group["blob"])
+
+        cls._stats["misses"] += 1
+        previous = {}
+        if group:
+            cached_models = pickle.loads(group["blob"])
+            previous = {path: (digest, cached_models[path]) for path, digest in group["hashes"].items()
+                        if path in cached_models}
+        models, hashes, failed = cls._parse_files(paths, factory, previous)
+
+        # 有文件解析失败时不写入快照，下次启动时重新解析并报告错误
+        if cache and not failed:
+            with cls._lock:
+                cls._snapshot()["groups"][name] = {
+                    "key": key,
+                    "spec": spec,
+                    "hashes": hashes,
+                    "blob": pickle.dumps(models, protocol=pickle.HIGHEST_PROTOCOL),
+                }
+                cls._save()
+        return models
+
+    @classmethod
+    def digest(cls, groups: Iterable[str], extra_files: Iterable[str] = ()) -> Optional[str]:
+        """计算配置源文件的当前摘要
+
+        用于判断配置自上次同步以来是否变化。
+
+        Args:
+            groups: 配置组名称
+            extra_files: 额外的源文件（如定义配置常量的模块）
+
+        Returns:
+            Optional[str]: 摘要，配置组尚未载入快照时返回None
+        """
+        if not cls._enabled:
+            return None
+        keys = []
+        with cls._lock:
+            snapshot_groups = cls._snapshot()["groups"]
+            for name in groups:
+                group = snapshot_groups.get(name)
+                if group is None:
+                    return None
+                key = cls._group_key(group["spec"], None, group["key"][1])
+                if key != group["key"]:
+                    return None
+                keys.append((name, key))
+        keys.append(("extra", tuple(file_stamp(path) for path in extra_files)))
+        return hashlib.sha256(repr(keys).encode("utf-8")).hexdigest()
+
+    @classmethod
+    def is_synced(cls, target: str, digest: Optional[str]) -> bool:
+        """配置是否已按该摘要同步到目标（如数据库文件）"""
+        if not digest:
+            return False
+        with cls._lock:
+            return cls._snapshot()["synced"].get(target) == digest
+
+    @classmethod
+    def mark_synced(cls, target: str, digest: Optional[str]) -> None:
+        """记录配置已按该摘要同步到目标"""
+        if not digest or not cls._enabled:
+            return
+        with cls._lock:
+            cls._snapshot()["synced"][target] = digest
+            cls._save()
+
+    @classmethod
+    def _group_key(cls, spec: Dict[str, Any], schema: Any, code: Any = None) -> Tuple:
+        """配置组的键：快照版本、模型代码签名和源文件签名"""
+        directory = spec["directory"]
+        if spec["files"] is not None:
+            paths = [os.path.join(directory, name) for name in spec["files"]]
+        elif os.path.isdir(directory):
+            with os.scandir(directory) as entries:
+                paths = [entry.path for entry in entries if fnmatch.fnmatch(entry.name, spec["pattern"])]
+        else:
+            paths = []
+        stamps = tuple(stamp for stamp in map(file_stamp, sorted(paths)) if stamp is not None)
+        if schema is not None:
+            code = _code_stamp(schema)
+        return (SNAPSHOT_VERSION, code, stamps)
+
+    @classmethod
+    def _parse_files(
+        cls, paths: List[str], factory: Callable[[Any], Any], previous: Dict[str, Tuple[str, Any]]
+    ) -> Tuple[Dict[str, Any], Dict[str, str], bool]:
+        """并行读取并解析配置文件
+
+        Returns:
+            Tuple: 路径到模型对象的映射、路径到内容哈希的映射、是否有文件解析失败
+        """
+        models: Dict[str, Any] = {}
+        hashes: Dict[str, str] = {}
+        failed = False
+        if not paths:
+            return models, hashes, failed
+
+        # 每个线程处理一批文件，避免逐个提交任务的开销
+        workers = max(1, min(CONFIG_LOAD_WORKERS, len(paths) // MIN_FILES_PER_WORKER))
+        if workers == 1:
+            results = _parse_chunk(paths, factory, previous)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                chunks = executor.map(
+                    _parse_chunk, [paths[i::workers] for i in range(workers)], repeat(factory), repeat(previous)
+                )
+                results = sorted((item for chunk in chunks for item in chunk), key=lambda item: item[0])
+
+        for path, digest, model in results:
+            if digest is None:
+                logger.error(f"加载配置文件失败 {path}: {str(model)}")
+                failed = True
+                continue
+            if previous.get(path, (None,))[0] == digest:
+                cls._stats["reused"] += 1
+            else:
+                cls._stats["parsed"] += 1
+            models[path] = model
+            hashes[path] = digest
+        return models, hashes, failed
+
+    @classmethod
+    def _snapshot(cls) -> Dict[str, Any]:
+        """内存中的快照，首次使用时从快照文件读取"""
+        if cls._data is None:
+            cls._data = cls._read() or {"version": SNAPSHOT_VERSION, "groups": {}, "synced": {}}
+        return cls._data
+
+    @classmethod
+    def _read(cls) -> Optional[Dict[str, Any]]:
+        """通过 mmap 读取快照文件，文件不存在、损坏或版本不符时返回None"""
+        if not cls._enabled:
+            return None
+        try:
+            with open(cls._path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    data = pickle.loads(buffer)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"配置快照无法读取，将重新生成: {str(e)}")
+            return None
+
+        if not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION:
+            logger.info("配置快照版本不符，将重新生成")
+            return None
+        return data
+
+    @classmethod
+    def _save(cls) -> None:
+        """原子写入快照文件"""
+        directory = os.path.dirname(os.path.abspath(cls._path))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".config_snapshot.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(cls._data, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cls._path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            cls._stats["writes"] += 1
+        except Exception as e:
+            logger.warning(f"写入配置快照失败: {str(e)}")
@@ -278,6 +278,40 @@ class DBAdapter:
             logger.error(f"保存文章失败: {str(e)}")
             return False
 
+    @classmethod
+    def save_articles(cls, articles: List[Any]) -> int:
+        """批量保存文章到数据库
+
+        Args:
+            articles: 文章对象列表
+
+        Returns:
+            int: 成功写入的文章数量
+        """
+        try:
+            from core.models.infra.adapters.article_adapter import ArticleAdapter
+            return ArticleAdapter.save_articles(articles)
+        except Exception as e:
+            logger.error(f"批量保存文章失败: {str(e)}")
+            return 0
+
+    @classmethod
+    def get_articles(cls, article_ids: List[str]) -> List[Dict[str, Any]]:
+        """批量获取文章
+
+        Args:
+            article_ids: 文章ID列表
+
+        Returns:
+            List[Dict]: 文章列表
+        """
+        try:
+            from core.models.infra.adapters.article_adapter import ArticleAdapter
+            return ArticleAdapter.get_articles(article_ids)
+        except Exception as e:
+            logger.error(f"批量获取文章失败: {str(e)}")
+            return []
+
     @classmethod
     def get_article(cls, article_id: str) -> Optional[Dict[str, Any]]:
         """获取指定ID的文章
@@ -385,6 +419,40 @@ class DBAdapter:
             logger.error(f"保存话题失败: {str(e)}")
             return False
 
+    @classmethod
+    def save_topics(cls, topics: List[Any]) -> int:
+        """批量保存话题到数据库
+
+        Args:
+            topics: 话题对象列表
+
+        Returns:
+            int: 成功写入的话题数量
+        """
+        try:
+            from core.models.infra.adapters.topic_adapter import TopicAdapter
+            return TopicAdapter.save_topics(topics)
+        except Exception as e:
+            logger.error(f"批量保存话题失败: {str(e)}")
+            return 0
+
+    @classmethod
+    def get_topics(cls, topic_ids: List[str]) -> List[Dict[str, Any]]:
+        """批量获取话题
+
+        Args:
+            topic_ids: 话题ID列表
+
+        Returns:
+            List[Dict[str, Any]]: 话题列表
+        """
+        try:
+            from core.models.infra.adapters.topic_adapter import TopicAdapter
+            return TopicAdapter.get_topics(topic_ids)
+        except Exception as e:
+            logger.error(f"批量获取话题失败: {str(e)}")
+            return []
+
     @classmethod
     def get_topics_by_platform(cls, platform: str) -> List[Dict[str, Any]]:
         """获取指定平台的所有话题
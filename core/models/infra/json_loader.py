@@ -16,56 +16,68 @@ class JsonModelLoader:
     """JSON模型加载器，用于从文件目录加载模型"""
 
     @staticmethod
-    def load_models_from_directory(directory: str, model_class: Type[T]) -> List[T]:
+    def build_model(data: Any, model_class: Type[T]) -> T:
+        """由JSON数据构建模型
+
+        Args:
+            data: JSON数据
+            model_class: 模型类
+
+        Returns:
+            T: 模型对象
+        """
+        # 如果model_class是BaseModel的子类，使用其构造函数
+        if isinstance(model_class, type) and issubclass(model_class, BaseModel):
+            # 对于Pydantic模型，直接使用**data初始化
+            return cast(T, model_class(**data))
+        # 如果model_class是dict类型，直接返回字典
+        if model_class == dict:
+            return cast(T, data)
+        # 其他情况，尝试直接实例化
+        try:
+            # 尝试使用空构造函数创建实例，然后设置属性
+            model_instance = model_class()
+            for key, value in data.items():
+                if hasattr(model_instance, key):
+                    setattr(model_instance, key, value)
+            return cast(T, model_instance)
+        except Exception:
+            # 失败时使用字典作为回退
+            return cast(T, data)
+
+    @staticmethod
+    def load_models_from_directory(directory: str, model_class: Type[T],
+                                   snapshot_group: Optional[str] = None) -> List[T]:
         """从目录加载模型
 
+        文件并行读取和解析，指定 snapshot_group 时源文件未变化则直接使用配置快照。
+
         Args:
             directory: 目录路径
             model_class: 模型类
+            snapshot_group: 配置快照中的组名，为None时不使用快照
 
         Returns:
             List[T]: 模型对象列表
         """
-        models: List[T] = []
-
         # 检查目录是否存在
         if not os.path.exists(directory):
             logger.warning(f"目录不存在: {directory}")
-            return models
-
-        # 遍历目录中的所有JSON文件
-        for file_path in Path(directory).glob("*.json"):
-            try:
-                # 读取JSON文件
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                # 如果model_class是BaseModel的子类，使用其构造函数
-                if isinstance(model_class, type) and issubclass(model_class, BaseModel):
-                    # 对于Pydantic模型，直接使用**data初始化
-                    model = cast(T, model_class(**data))
-                # 如果model_class是dict类型，直接返回字典
-                elif model_class == dict:
-                    model = cast(T, data)
-                # 其他情况，尝试直接实例化
-                else:
-                    try:
-                        # 尝试使用空构造函数创建实例，然后设置属性
-                        model_instance = model_class()
-                        for key, value in data.items():
-                            if hasattr(model_instance, key):
-                                setattr(model_instance, key, value)
-                        model = cast(T, model_instance)
-                    except Exception:
-                        # 失败时使用字典作为回退
-                        model = cast(T, data)
-
-                models.append(model)
-                logger.debug(f"已加载模型: {file_path.name}")
-            except Exception as e:
-                logger.error(f"加载模型失败 {file_path}: {str(e)}")
-
-        return models
+            return []
+
+        # 延迟导入避免循环引用
+        from core.models.infra.config_snapshot import ConfigSnapshot
+
+        models = ConfigSnapshot.load_group(
+            snapshot_group or directory,
+            directory,
+            lambda data: JsonModelLoader.build_model(data, model_class),
+            schema=model_class,
+            cache=snapshot_group is not None,
+        )
+        for file_path in models:
+            logger.debug(f"已加载模型: {os.path.basename(file_path)}")
+        return list(models.values())
 
     @staticmethod
     def load_model_from_file(file_path: str, model_class: Type[T]) -> Optional[T]:
@@ -88,26 +100,7 @@ class JsonModelLoader:
             with open(file_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
 
-            # 如果model_class是BaseModel的子类，使用其构造函数
-            if isinstance(model_class, type) and issubclass(model_class, BaseModel):
-                # 对于Pydantic模型，直接使用**data初始化
-                model = cast(T, model_class(**data))
-            # 如果model_class是dict类型，直接返回字典
-            elif model_class == dict:
-                model = cast(T, data)
-            # 其他情况，尝试直接实例化
-            else:
-                try:
-                    # 尝试使用空构造函数创建实例，然后设置属性
-                    model_instance = model_class()
-                    for key, value in data.items():
-                        if hasattr(model_instance, key):
-                            setattr(model_instance, key, value)
-                    model = cast(T, model_instance)
-                except Exception:
-                    # 失败时使用字典作为回退
-                    model = cast(T, data)
-
+            model = JsonModelLoader.build_model(data, model_class)
             logger.debug(f"已加载模型: {file_path}")
             return model
         except Exception as e:
@@ -2,52 +2,91 @@
 
 该模块提供临时存储功能，用于存储生命周期短暂的对象，
 例如临时大纲、进度报告等，这些对象不需要持久化到数据库。
+
+过期时间基于单调时钟，过期对象通过最小堆按到期顺序惰性清理，每次操作只弹出
+已到期的堆顶，不再扫描全部对象；超过容量上限时按LRU淘汰最久未访问的对象。
+
+多进程部署时设置环境变量 TEMP_STORAGE_REDIS_URL，``get_instance`` 会返回基于Redis的
+实现，接口保持一致。
+
+可通过环境变量调整:
+- TEMP_STORAGE_MAX_SIZE: 每个存储实例的对象数上限，默认10000
+- TEMP_STORAGE_REDIS_URL: Redis连接URL，设置后使用Redis存储
 """
 
-from typing import Dict, Optional, Any, TypeVar, Generic, List
-from datetime import datetime, timedelta
+from typing import Dict, Optional, Any, TypeVar, Generic, List, Tuple
+from collections import OrderedDict
+from datetime import datetime
+import heapq
+import os
+import pickle
+import time
 import uuid
 import threading
 from loguru import logger
 
 T = TypeVar('T')
 
+# 每个存储实例的对象数上限
+MAX_SIZE = int(os.environ.get("TEMP_STORAGE_MAX_SIZE", 10000))
+
+# Redis连接URL，未设置时使用进程内存储
+REDIS_URL = os.environ.get("TEMP_STORAGE_REDIS_URL")
+
+# Redis键前缀
+REDIS_KEY_PREFIX = "genflow:tmp"
+
+
 class TemporaryStorage(Generic[T]):
     """通用临时存储类
 
-    使用内存存储临时对象，支持过期时间和自动清理。
+    使用内存存储临时对象，支持过期时间、容量上限和线程安全访问。
     """
 
     # 类变量，存储所有实例
     _instances: Dict[str, 'TemporaryStorage'] = {}
     _lock = threading.Lock()
 
-    def __init__(self, name: str, ttl_seconds: int = 3600):
+    def __init__(self, name: str, ttl_seconds: int = 3600, max_size: Optional[int] = MAX_SIZE):
         """初始化临时存储
 
         Args:
             name: 存储名称，用于识别不同的存储实例
             ttl_seconds: 对象默认生存时间（秒），默认1小时
+            max_size: 对象数上限，超出时淘汰最久未访问的对象；None表示不限制
         """
         self.name = name
         self.ttl_seconds = ttl_seconds
-        self.items: Dict[str, Dict[str, Any]] = {}
-        self.last_cleanup = datetime.now()
+        self.max_size = max_size
+        # 键 -> {'value', 'expiry'(单调时钟), 'created_at'}，按访问顺序排列
+        self.items: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # 过期堆，元素为 (过期时间, 序号, 键)；对象被覆盖或删除后旧元素留在堆中，弹出时跳过
+        self._expiry_heap: List[Tuple[float, int, str]] = []
+        self._seq = 0
+        self._item_lock = threading.RLock()
+        self.stats = {"expired": 0, "evicted": 0}
 
     @classmethod
-    def get_instance(cls, name: str, ttl_seconds: int = 3600) -> 'TemporaryStorage':
+    def get_instance(cls, name: str, ttl_seconds: int = 3600,
+                     max_size: Optional[int] = MAX_SIZE) -> 'TemporaryStorage':
         """获取存储实例，如果不存在则创建
 
+        配置了 TEMP_STORAGE_REDIS_URL 时创建基于Redis的实例。
+
         Args:
             name: 存储名称
             ttl_seconds: 对象默认生存时间（秒）
+            max_size: 对象数上限（仅内存存储）
 
         Returns:
             TemporaryStorage: 存储实例
         """
         with cls._lock:
             if name not in cls._instances:
-                cls._instances[name] = TemporaryStorage(name, ttl_seconds)
+                if REDIS_URL:
+                    cls._instances[name] = RedisTemporaryStorage(name, ttl_seconds, redis_url=REDIS_URL)
+                else:
+                    cls._instances[name] = TemporaryStorage(name, ttl_seconds, max_size)
             return cls._instances[name]
 
     def set(self, key: str, value: T, ttl_seconds: Optional[int] = None) -> str:
@@ -67,17 +106,30 @@ class TemporaryStorage(Generic[T]):
 
         # 计算过期时间
         ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
-        expiry = datetime.now() + timedelta(seconds=ttl)
-
-        # 存储对象
-        self.items[key] = {
-            'value': value,
-            'expiry': expiry,
-            'created_at': datetime.now()
-        }
-
-        # 执行清理
-        self._cleanup_if_needed()
+        now = time.monotonic()
+        expiry = now + ttl
+
+        with self._item_lock:
+            self._purge_expired(now)
+
+            # 存储对象
+            self._seq += 1
+            self.items[key] = {
+                'value': value,
+                'expiry': expiry,
+                'created_at': datetime.now(),
+                'seq': self._seq
+            }
+            self.items.move_to_end(key)
+            heapq.heappush(self._expiry_heap, (expiry, self._seq, key))
+
+            # 超出容量时淘汰最久未访问的对象
+            if self.max_size is not None:
+                while len(self.items) > self.max_size:
+                    self.items.popitem(last=False)
+                    self.stats["evicted"] += 1
+
+            self._compact_heap()
 
         return key
 
@@ -90,20 +142,22 @@ class TemporaryStorage(Generic[T]):
         Returns:
             Optional[T]: 存储的对象，如果不存在或已过期则返回None
         """
-        # 执行清理
-        self._cleanup_if_needed()
+        now = time.monotonic()
+        with self._item_lock:
+            self._purge_expired(now)
 
-        # 检查对象是否存在
-        if key not in self.items:
-            return None
+            item = self.items.get(key)
+            if item is None:
+                return None
 
-        # 检查对象是否过期
-        item = self.items[key]
-        if datetime.now() > item['expiry']:
-            del self.items[key]
-            return None
+            # 堆中的到期时间可能相同，这里再检查一次
+            if now >= item['expiry']:
+                del self.items[key]
+                self.stats["expired"] += 1
+                return None
 
-        return item['value']
+            self.items.move_to_end(key)
+            return item['value']
 
     def update(self, key: str, value: T) -> bool:
         """更新对象，保持原有过期时间
@@ -115,21 +169,17 @@ class TemporaryStorage(Generic[T]):
         Returns:
             bool: 是否成功更新
         """
-        if key not in self.items:
-            return False
+        with self._item_lock:
+            self._purge_expired(time.monotonic())
 
-        # 保持原有过期时间
-        expiry = self.items[key]['expiry']
-        created_at = self.items[key]['created_at']
+            item = self.items.get(key)
+            if item is None:
+                return False
 
-        # 更新对象
-        self.items[key] = {
-            'value': value,
-            'expiry': expiry,
-            'created_at': created_at
-        }
-
-        return True
+            # 保持原有过期时间和堆中的序号
+            item['value'] = value
+            self.items.move_to_end(key)
+            return True
 
     def delete(self, key: str) -> bool:
         """删除对象
@@ -140,11 +190,14 @@ class TemporaryStorage(Generic[T]):
         Returns:
             bool: 是否成功删除
         """
-        if key not in self.items:
-            return False
+        with self._item_lock:
+            if key not in self.items:
+                return False
 
-        del self.items[key]
-        return True
+            # 堆中的元素在弹出时跳过
+            del self.items[key]
+            self._compact_heap()
+            return True
 
     def list_keys(self) -> List[str]:
         """列出所有有效的键名
@@ -152,33 +205,150 @@ class TemporaryStorage(Generic[T]):
         Returns:
             List[str]: 键名列表
         """
-        # 执行清理
-        self._cleanup_if_needed()
+        with self._item_lock:
+            self._purge_expired(time.monotonic())
+            return list(self.items.keys())
+
+    def __len__(self) -> int:
+        """有效对象数"""
+        with self._item_lock:
+            self._purge_expired(time.monotonic())
+            return len(self.items)
 
-        return list(self.items.keys())
+    def _purge_expired(self, now: float) -> None:
+        """弹出所有已到期的堆顶并删除对应对象
 
-    def _cleanup_if_needed(self) -> None:
-        """根据需要执行清理，避免过于频繁的清理"""
-        # 每10分钟或项目数超过100时执行一次完整清理
-        current_time = datetime.now()
-        if (current_time - self.last_cleanup > timedelta(minutes=10) or
-                len(self.items) > 100):
-            self._cleanup()
-            self.last_cleanup = current_time
+        每个堆元素只会被弹出一次，清理的均摊开销为 O(log n)。
+
+        Args:
+            now: 当前单调时钟时间
+        """
+        heap = self._expiry_heap
+        expired = 0
+        while heap and heap[0][0] <= now:
+            _, seq, key = heapq.heappop(heap)
+            item = self.items.get(key)
+            # 对象已被删除、淘汰或以新的过期时间覆盖时，该堆元素已失效
+            if item is not None and item['seq'] == seq:
+                del self.items[key]
+                expired += 1
+
+        if expired:
+            self.stats["expired"] += expired
+            logger.debug(f"[{self.name}] 已清理 {expired} 个过期对象")
+
+    def _compact_heap(self) -> None:
+        """失效的堆元素过多时重建堆，保证堆大小与对象数同阶"""
+        if len(self._expiry_heap) > 2 * len(self.items) + 64:
+            self._expiry_heap = [(item['expiry'], item['seq'], key) for key, item in self.items.items()]
+            heapq.heapify(self._expiry_heap)
 
     def _cleanup(self) -> None:
         """清理过期对象"""
-        current_time = datetime.now()
-        expired_keys = [
-            key for key, item in self.items.items()
-            if current_time > item['expiry']
-        ]
+        with self._item_lock:
+            self._purge_expired(time.monotonic())
 
-        for key in expired_keys:
-            del self.items[key]
 
-        if expired_keys:
-            logger.debug(f"[{self.name}] 已清理 {len(expired_keys)} 个过期对象")
+class RedisTemporaryStorage(TemporaryStorage[T]):
+    """基于Redis的临时存储
+
+    对象以pickle序列化后用带过期时间的键保存，多个进程共享同一份数据。
+    过期由Redis负责；容量上限由Redis的maxmemory策略控制，不在此处限制。
+    """
+
+    def __init__(self, name: str, ttl_seconds: int = 3600, redis_url: Optional[str] = None,
+                 client: Any = None):
+        """初始化Redis临时存储
+
+        Args:
+            name: 存储名称
+            ttl_seconds: 对象默认生存时间（秒）
+            redis_url: Redis连接URL
+            client: 已创建的Redis客户端（可选），提供时忽略redis_url
+        """
+        super().__init__(name, ttl_seconds, max_size=None)
+        if client is None:
+            try:
+                import redis
+            except ImportError as e:
+                raise ImportError("Redis临时存储需要安装 redis: pip install redis") from e
+            client = redis.Redis.from_url(redis_url or REDIS_URL)
+        self.client = client
+        self.prefix = f"{REDIS_KEY_PREFIX}:{name}:"
+
+    def _key(self, key: str) -> str:
+        return self.prefix + key
+
+    def set(self, key: str, value: T, ttl_seconds: Optional[int] = None) -> str:
+        """存储对象
+
+        Args:
+            key: 对象键名，如果为None则自动生成
+            value: 要存储的对象
+            ttl_seconds: 对象生存时间（秒），如果为None则使用默认值
+
+        Returns:
+            str: 存储的键名
+        """
+        if key is None:
+            key = str(uuid.uuid4())
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        self.client.set(self._key(key), pickle.dumps(value), ex=max(int(ttl), 1))
+        return key
+
+    def get(self, key: str) -> Optional[T]:
+        """获取对象
+
+        Args:
+            key: 对象键名
+
+        Returns:
+            Optional[T]: 存储的对象，如果不存在或已过期则返回None
+        """
+        data = self.client.get(self._key(key))
+        return pickle.loads(data) if data is not None else None
+
+    def update(self, key: str, value: T) -> bool:
+        """更新对象，保持原有过期时间
+
+        Args:
+            key: 对象键名
+            value: 新的对象值
+
+        Returns:
+            bool: 是否成功更新
+        """
+        return bool(self.client.set(self._key(key), pickle.dumps(value), xx=True, keepttl=True))
+
+    def delete(self, key: str) -> bool:
+        """删除对象
+
+        Args:
+            key: 对象键名
+
+        Returns:
+            bool: 是否成功删除
+        """
+        return bool(self.client.delete(self._key(key)))
+
+    def list_keys(self) -> List[str]:
+        """列出所有有效的键名
+
+        Returns:
+            List[str]: 键名列表
+        """
+        keys = []
+        for raw in self.client.scan_iter(match=self.prefix + "*"):
+            raw = raw.decode() if isinstance(raw, bytes) else raw
+            keys.append(raw[len(self.prefix):])
+        return keys
+
+    def __len__(self) -> int:
+        """有效对象数"""
+        return len(self.list_keys())
+
+    def _cleanup(self) -> None:
+        """Redis自行处理过期，无需清理"""
 
 
 class OutlineStorage:
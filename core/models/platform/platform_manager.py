@@ -14,6 +14,8 @@ from core.models.platform.platform import Platform, get_default_platform
 from core.models.infra.json_loader import JsonModelLoader
 from core.models.platform.platform_validator import validate_article_against_platform
 from ..infra.base_manager import BaseManager
+from ..infra.config_registry import ConfigRegistry
+from ..infra.config_snapshot import ConfigSnapshot
 
 
 class PlatformManager(BaseManager):
@@ -41,26 +43,20 @@ class PlatformManager(BaseManager):
         cls._load_platforms()
 
         cls._initialized = True
+        ConfigRegistry.invalidate("平台加载")
         logger.info("平台管理器初始化完成")
 
     @classmethod
     def _load_platforms(cls) -> None:
         """从文件目录加载平台数据"""
-        # 从platforms目录加载平台数据
+        # 从platforms目录加载平台数据，源文件未变化时直接使用配置快照
         platforms_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'platforms')
         platforms: List[Platform] = []
 
         try:
-            # 加载目录中的所有平台JSON文件
-            if os.path.exists(platforms_dir):
-                for file_path in Path(platforms_dir).glob("*.json"):
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            platform_data = json.load(f)
-                            platform = Platform(**platform_data)
-                            platforms.append(platform)
-                    except Exception as file_e:
-                        logger.error(f"加载平台文件失败 {file_path}: {str(file_e)}")
+            platforms = list(ConfigSnapshot.load_group(
+                "platforms", platforms_dir, lambda data: Platform(**data), schema=Platform
+            ).values())
         except Exception as e:
             logger.error(f"从目录加载平台失败: {str(e)}")
 
@@ -81,7 +77,7 @@ class PlatformManager(BaseManager):
             Optional[Platform]: 平台对象，不存在则返回None
         """
         cls.ensure_initialized()
-        return cls._platforms.get(platform_id)
+        return cls._platforms.get(platform_id) or ConfigRegistry.get_platform(platform_id)
 
     @classmethod
     def get_platform_by_name(cls, name: str) -> Optional[Platform]:
@@ -99,12 +95,8 @@ class PlatformManager(BaseManager):
         if name in cls._platforms:
             return cls._platforms[name]
 
-        # 不区分大小写匹配
-        for platform in cls._platforms.values():
-            if platform.name.lower() == name.lower():
-                return platform
-
-        return None
+        # 不区分大小写匹配（注册表索引）
+        return ConfigRegistry.get_platform(name)
 
     @classmethod
     def get_all_platforms(cls) -> List[Platform]:
@@ -130,6 +122,7 @@ class PlatformManager(BaseManager):
 
         # 保存到缓存
         cls._platforms[platform.name] = platform
+        ConfigRegistry.invalidate(f"保存平台 {platform.name}")
 
         # 尝试保存到文件
         try:
@@ -11,6 +11,9 @@ import json
 from datetime import datetime
 from loguru import logger
 
+from ..infra.config_registry import ConfigRegistry
+from ..infra.config_snapshot import ConfigSnapshot
+
 
 class ArticleStyle:
     """文章风格模型
@@ -198,31 +201,25 @@ class StyleManager:
             cls._styles[cls._default_style.name] = cls._default_style
 
         cls._initialized = True
+        ConfigRegistry.invalidate("风格加载")
         logger.info(f"风格管理器初始化完成，已加载 {len(cls._styles)} 个风格")
 
     @classmethod
     def load_styles(cls) -> None:
-        """从文件加载风格"""
+        """从文件加载风格，源文件未变化时直接使用配置快照"""
         try:
-            style_files = [f for f in os.listdir(cls._style_dir) if f.endswith('.json')]
-
-            for file_name in style_files:
-                file_path = os.path.join(cls._style_dir, file_name)
-
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        style_data = json.load(f)
+            styles = ConfigSnapshot.load_group(
+                "styles", cls._style_dir, lambda data: ArticleStyle(**data), schema=ArticleStyle
+            )
 
-                    style = ArticleStyle(**style_data)
-                    cls._styles[style.name] = style
+            for style in styles.values():
+                cls._styles[style.name] = style
 
-                    # 设置第一个加载的风格为默认风格
-                    if not cls._default_style:
-                        cls._default_style = style
+                # 设置第一个加载的风格为默认风格
+                if not cls._default_style:
+                    cls._default_style = style
 
-                    logger.debug(f"已加载风格: {style.name}")
-                except Exception as e:
-                    logger.error(f"加载风格文件 {file_name} 失败: {str(e)}")
+                logger.debug(f"已加载风格: {style.name}")
 
         except Exception as e:
             logger.error(f"加载风格目录失败: {str(e)}")
@@ -291,11 +288,7 @@ class StyleManager:
         if not cls._initialized:
             cls.initialize()
 
-        for style in cls._styles.values():
-            if style.type == style_type:
-                return style
-
-        return None
+        return ConfigRegistry.find_style_by_type(style_type)
 
     @classmethod
     def create_style_from_description(cls, description: str, options: Optional[Dict[str, Any]] = None) -> ArticleStyle:
@@ -316,6 +309,7 @@ class StyleManager:
         # 保存到内存
         if style.name not in cls._styles:
             cls._styles[style.name] = style
+            ConfigRegistry.invalidate(f"新建风格 {style.name}")
 
         return style
 
@@ -335,6 +329,7 @@ class StyleManager:
         try:
             # 保存到内存
             cls._styles[style.name] = style
+            ConfigRegistry.invalidate(f"保存风格 {style.name}")
 
             # 保存到文件
             file_path = os.path.join(cls._style_dir, f"{style.name}.json")
@@ -0,0 +1,95 @@
+"""配置注册表测试
+
+验证平台/风格/内容类型索引查找、兼容性矩阵以及保存后的失效重建
+"""
+
+import sys
+import os
+import unittest
+
+# 添加项目根目录到系统路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+from core.models.infra.config_registry import ConfigRegistry
+from core.models.platform.platform import Platform
+from core.models.platform.platform_manager import PlatformManager
+from core.models.style.style_manager import ArticleStyle, StyleManager
+from core.models.content_type.content_type import ContentTypeModel
+from core.models.content_type.content_type_manager import ContentTypeManager
+
+
+class ConfigRegistryTest(unittest.TestCase):
+    """配置注册表测试类"""
+
+    def setUp(self):
+        """测试准备"""
+        PlatformManager.ensure_initialized()
+        StyleManager.initialize()
+        ContentTypeManager.ensure_initialized()
+
+        self.platform = Platform(name="TestHub", url="https://testhub.example.com")
+        PlatformManager._platforms[self.platform.name] = self.platform
+
+        self.style = ArticleStyle(name="registry_tech_style", type="registry_test", content_types=["技术"])
+        self.other_style = ArticleStyle(name="registry_other_style", type="registry_test")
+        StyleManager._styles[self.style.name] = self.style
+        StyleManager._styles[self.other_style.name] = self.other_style
+        ConfigRegistry.invalidate("测试准备")
+
+    def tearDown(self):
+        """测试清理"""
+        PlatformManager._platforms.pop(self.platform.name, None)
+        StyleManager._styles.pop(self.style.name, None)
+        StyleManager._styles.pop(self.other_style.name, None)
+        ContentTypeManager._content_types.pop("registry_test_type", None)
+        ConfigRegistry.invalidate("测试清理")
+
+    def test_platform_lookup_case_insensitive(self):
+        """平台名称查找不区分大小写"""
+        self.assertIs(PlatformManager.get_platform_by_name("testhub"), self.platform)
+        self.assertIs(PlatformManager.get_platform_by_name(" TESTHUB "), self.platform)
+        self.assertIsNone(PlatformManager.get_platform_by_name("不存在的平台"))
+
+    def test_find_style_by_type(self):
+        """按类型查找返回该类型的第一个风格"""
+        self.assertIs(StyleManager.find_style_by_type("registry_test"), self.style)
+        self.assertIsNone(StyleManager.find_style_by_type("no_such_type"))
+
+    def test_compatibility_matrix_matches_style(self):
+        """兼容性矩阵与风格自身的判断一致"""
+        for name in ContentTypeManager.get_all_content_types():
+            for style in (self.style, self.other_style):
+                self.assertEqual(ConfigRegistry.is_compatible(style.name, name),
+                                 style.is_compatible_with_content_type(name))
+
+        self.assertTrue(ConfigRegistry.is_compatible(self.style.name, "技术"))
+        self.assertFalse(ConfigRegistry.is_compatible(self.style.name, "故事"))
+        # 未登记的内容类型名称按风格规则计算一次并记入矩阵
+        self.assertTrue(ConfigRegistry.is_compatible(self.style.name, "技术博客"))
+        self.assertFalse(ConfigRegistry.is_compatible("no_such_style", "技术"))
+
+    def test_save_invalidates_index(self):
+        """保存内容类型后版本号增加，新内容类型可被查找"""
+        self.assertIsNone(ConfigRegistry.get_content_type("registry_test_type"))
+        version = ConfigRegistry.version()
+
+        ContentTypeManager.save_content_type(ContentTypeModel(
+            name="registry_test_type", depth="light", description="测试", word_count="500",
+            focus="测试", style="测试", structure="测试"
+        ))
+
+        self.assertGreater(ConfigRegistry.version(), version)
+        self.assertIsNotNone(ConfigRegistry.get_content_type("REGISTRY_TEST_TYPE"))
+
+    def test_lookups_do_not_rebuild(self):
+        """版本号不变时重复查找不会重建索引"""
+        ConfigRegistry.get_platform("testhub")
+        builds = ConfigRegistry.get_stats()["builds"]
+        for _ in range(100):
+            ConfigRegistry.get_platform("testhub")
+            ConfigRegistry.is_compatible(self.style.name, "技术")
+        self.assertEqual(ConfigRegistry.get_stats()["builds"], builds)
+
+
+if __name__ == "__main__":
+    unittest.main()
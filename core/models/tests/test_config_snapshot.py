@@ -0,0 +1,173 @@
+"""配置快照测试
+
+验证首次解析后写入快照、再次启动直接命中快照、源文件变化时只重新解析改动的文件，
+以及解析失败、快照损坏和同步摘要的处理
+"""
+
+import sys
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from typing import List
+from unittest.mock import MagicMock, patch
+
+from pydantic import BaseModel
+
+# 添加项目根目录到系统路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+from core.models.infra.config_snapshot import CONFIG_SNAPSHOT_ENABLED, CONFIG_SNAPSHOT_PATH, ConfigSnapshot
+from core.models.infra.adapters.config_adapter import ConfigAdapter
+
+
+class SampleConfig(BaseModel):
+    """测试用配置模型"""
+    name: str
+    weight: int = 1
+    tags: List[str] = []
+
+
+def build_sample(data):
+    return SampleConfig(**data)
+
+
+class ConfigSnapshotTest(unittest.TestCase):
+    """配置快照测试类"""
+
+    def setUp(self):
+        """测试准备"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_dir = os.path.join(self.temp_dir, "configs")
+        os.makedirs(self.config_dir)
+        for i, name in enumerate(["alpha", "beta", "gamma"]):
+            self.write_config(name, {"name": name, "weight": i, "tags": [name.upper()]})
+        ConfigSnapshot.configure(path=os.path.join(self.temp_dir, "snapshot.bin"), enabled=True)
+        ConfigSnapshot.reset()
+
+    def tearDown(self):
+        """测试清理"""
+        ConfigSnapshot.configure(path=CONFIG_SNAPSHOT_PATH, enabled=CONFIG_SNAPSHOT_ENABLED)
+        ConfigSnapshot.reset()
+        shutil.rmtree(self.temp_dir)
+
+    def write_config(self, name, data):
+        with open(os.path.join(self.config_dir, f"{name}.json"), "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    def load(self):
+        return ConfigSnapshot.load_group("samples", self.config_dir, build_sample, schema=SampleConfig)
+
+    def restart(self):
+        """模拟重新启动：清空内存中的快照，下次加载从快照文件读取"""
+        ConfigSnapshot.reset()
+
+    def test_cold_then_warm(self):
+        """首次加载解析全部文件并写入快照，重启后直接命中快照"""
+        cold = self.load()
+        self.assertEqual([model.name for model in cold.values()], ["alpha", "beta", "gamma"])
+        self.assertEqual(ConfigSnapshot.stats()["parsed"], 3)
+        self.assertEqual(ConfigSnapshot.stats()["writes"], 1)
+
+        self.restart()
+        warm = self.load()
+        self.assertEqual(warm, cold)
+        self.assertEqual(ConfigSnapshot.stats()["hits"], 1)
+        self.assertEqual(ConfigSnapshot.stats()["parsed"], 0)
+
+    def test_only_changed_files_reparsed(self):
+        """内容变化的文件重新解析，只修改时间变化的文件复用快照中的对象"""
+        self.load()
+        self.restart()
+
+        self.write_config("beta", {"name": "beta", "weight": 42})
+        gamma = os.path.join(self.config_dir, "gamma.json")
+        stat = os.stat(gamma)
+        os.utime(gamma, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        models = self.load()
+        self.assertEqual(models[os.path.join(self.config_dir, "beta.json")].weight, 42)
+        self.assertEqual(ConfigSnapshot.stats()["misses"], 1)
+        self.assertEqual(ConfigSnapshot.stats()["parsed"], 1)
+        self.assertEqual(ConfigSnapshot.stats()["reused"], 2)
+
+        # 新增和删除文件
+        os.remove(os.path.join(self.config_dir, "alpha.json"))
+        self.write_config("delta", {"name": "delta"})
+        self.assertEqual([model.name for model in self.load().values()], ["beta", "delta", "gamma"])
+
+    def test_loaded_models_are_independent(self):
+        """修改加载得到的模型不影响快照"""
+        self.load()
+        models = self.load()
+        next(iter(models.values())).tags.append("changed")
+
+        self.restart()
+        self.assertEqual(next(iter(self.load().values())).tags, ["ALPHA"])
+
+    def test_invalid_file_not_cached(self):
+        """解析失败的文件被跳过，且不写入快照"""
+        with open(os.path.join(self.config_dir, "broken.json"), "w", encoding="utf-8") as f:
+            f.write("{not json")
+        models = self.load()
+        self.assertEqual(len(models), 3)
+        self.assertEqual(ConfigSnapshot.stats()["writes"], 0)
+        self.assertFalse(os.path.exists(ConfigSnapshot._path))
+
+    def test_corrupt_snapshot_ignored(self):
+        """快照文件损坏时重新解析并覆盖"""
+        with open(ConfigSnapshot._path, "wb") as f:
+            f.write(b"not a snapshot")
+        self.assertEqual(len(self.load()), 3)
+        self.assertEqual(ConfigSnapshot.stats()["writes"], 1)
+
+        self.restart()
+        self.load()
+        self.assertEqual(ConfigSnapshot.stats()["hits"], 1)
+
+    def test_sync_digest(self):
+        """配置未变化时同步摘要保持一致，源文件变化后需要重新同步"""
+        self.assertIsNone(ConfigSnapshot.digest(["samples"]))
+
+        self.load()
+        digest = ConfigSnapshot.digest(["samples"])
+        ConfigSnapshot.mark_synced("test.db", digest)
+
+        self.restart()
+        self.assertTrue(ConfigSnapshot.is_synced("test.db", ConfigSnapshot.digest(["samples"])))
+        self.assertFalse(ConfigSnapshot.is_synced("other.db", digest))
+
+        self.write_config("alpha", {"name": "alpha", "weight": 100})
+        self.assertFalse(ConfigSnapshot.is_synced("test.db", ConfigSnapshot.digest(["samples"])))
+
+    def test_sync_skipped_when_unchanged(self):
+        """配置未变化时跳过迁移，源文件变化或 sync_mode=True 时重新迁移"""
+        db_file = os.path.join(self.temp_dir, "test.db")
+        open(db_file, "w").close()
+        migrate_configs = MagicMock(migrate_all=MagicMock(return_value=True))
+
+        with patch.object(ConfigAdapter, "initialize", return_value=True), \
+                patch.object(ConfigAdapter, "_config_digest", lambda module: ConfigSnapshot.digest(["samples"])), \
+                patch("core.models.db.migrate_configs", migrate_configs, create=True), \
+                patch("core.models.db.session.DB_FILE", db_file):
+            self.load()
+            self.assertTrue(ConfigAdapter.sync_config_to_db(sync_mode=False))
+            self.assertEqual(migrate_configs.migrate_all.call_count, 1)
+
+            self.restart()
+            self.load()
+            self.assertTrue(ConfigAdapter.sync_config_to_db(sync_mode=False))
+            self.assertEqual(migrate_configs.migrate_all.call_count, 1)
+
+            self.assertTrue(ConfigAdapter.sync_config_to_db(sync_mode=True))
+            self.assertEqual(migrate_configs.migrate_all.call_count, 2)
+
+            self.write_config("alpha", {"name": "alpha", "weight": 100})
+            self.load()
+            self.assertTrue(ConfigAdapter.sync_config_to_db(sync_mode=False))
+            self.assertEqual(migrate_configs.migrate_all.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
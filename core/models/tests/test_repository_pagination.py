@@ -0,0 +1,170 @@
+"""仓库分页与索引迁移测试
+
+验证键集分页在排序值重复时不丢行、不重复，游标解析失败时抛出ValueError，
+以及ensure_indexes在已有数据库上补建索引且可重复执行
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, create_engine, inspect, text
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+# 添加项目根目录到系统路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+from core.models.db.repository import BaseRepository, decode_cursor, encode_cursor
+from core.models.db.migrations import ensure_indexes
+
+PageBase = declarative_base()
+
+
+class PageItem(PageBase):
+    """分页测试模型"""
+    __tablename__ = "page_items"
+    __table_args__ = (
+        Index("ix_page_items_created_at", "created_at", "id"),
+    )
+
+    id = Column(String(32), primary_key=True)
+    created_at = Column(Integer, nullable=False)
+    published_at = Column(DateTime, nullable=True)
+
+
+class RepositoryPaginationTest(unittest.TestCase):
+    """键集分页测试类"""
+
+    def setUp(self):
+        """测试准备：每个创建时间有多条记录"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.engine = create_engine(f"sqlite:///{os.path.join(self.temp_dir, 'page.db')}")
+        PageBase.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+        self.db.add_all([
+            PageItem(id=f"item-{i:02d}", created_at=i // 4,
+                     published_at=datetime(2024, 1, 1 + i // 4))
+            for i in range(20)
+        ])
+        self.db.commit()
+        self.repo = BaseRepository(PageItem, self.db)
+
+    def tearDown(self):
+        """测试清理"""
+        self.db.close()
+        self.engine.dispose()
+        shutil.rmtree(self.temp_dir)
+
+    def _collect(self, order_by, descending, limit=3):
+        """逐页读取全部记录，返回主键列表和页数"""
+        ids, pages, cursor = [], 0, None
+        while True:
+            page = self.repo.paginate(order_by, cursor=cursor, limit=limit, descending=descending)
+            ids.extend(item.id for item in page.items)
+            pages += 1
+            if not page.has_more:
+                return ids, pages
+            cursor = page.next_cursor
+
+    def test_paginate_descending_with_duplicate_values(self):
+        """降序分页跨越重复的创建时间，不丢行也不重复"""
+        ids, pages = self._collect("created_at", descending=True)
+
+        expected = [item.id for item in sorted(
+            self.db.query(PageItem).all(), key=lambda item: (item.created_at, item.id), reverse=True
+        )]
+        self.assertEqual(ids, expected)
+        self.assertEqual(pages, 7)
+
+    def test_paginate_ascending_with_duplicate_values(self):
+        """升序分页跨越重复的创建时间，不丢行也不重复"""
+        ids, _ = self._collect("created_at", descending=False)
+
+        self.assertEqual(ids, [f"item-{i:02d}" for i in range(20)])
+
+    def test_paginate_datetime_column(self):
+        """日期时间排序列的游标可以还原并继续分页"""
+        ids, _ = self._collect("published_at", descending=False, limit=5)
+
+        self.assertEqual(ids, [f"item-{i:02d}" for i in range(20)])
+
+    def test_paginate_with_filters(self):
+        """过滤条件与游标同时生效"""
+        filters = [PageItem.created_at >= 3]
+        first = self.repo.paginate("created_at", limit=5, filters=filters)
+        second = self.repo.paginate("created_at", cursor=first.next_cursor, limit=5, filters=filters)
+
+        self.assertEqual(len(first.items) + len(second.items), 8)
+        self.assertIsNone(second.next_cursor)
+        self.assertTrue(all(item.created_at >= 3 for item in first.items + second.items))
+
+    def test_iter_all(self):
+        """流式遍历按主键返回全部记录"""
+        ids = [item.id for item in self.repo.iter_all(batch_size=3)]
+
+        self.assertEqual(ids, [f"item-{i:02d}" for i in range(20)])
+
+    def test_invalid_cursor_raises_value_error(self):
+        """格式错误或被篡改的游标抛出ValueError"""
+        cursor = encode_cursor(5, "item-20")
+        tampered = cursor[:-4] + ("AAAA" if not cursor.endswith("AAAA") else "BBBB")
+
+        for bad in ["not-a-cursor", "!!!", tampered, encode_cursor(1, "x")[:5]]:
+            with self.subTest(cursor=bad):
+                with self.assertRaises(ValueError):
+                    decode_cursor(bad)
+                with self.assertRaises(ValueError):
+                    self.repo.paginate("created_at", cursor=bad)
+
+    def test_cursor_round_trip(self):
+        """游标编码后可以还原排序值和主键"""
+        value = datetime(2024, 5, 1, 12, 30, 15, 123456)
+
+        self.assertEqual(decode_cursor(encode_cursor(value, "a")), (value, "a"))
+        self.assertEqual(decode_cursor(encode_cursor(3, "b")), (3, "b"))
+
+
+class EnsureIndexesTest(unittest.TestCase):
+    """索引迁移测试类"""
+
+    def setUp(self):
+        """测试准备：建表时还没有声明的索引"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.engine = create_engine(f"sqlite:///{os.path.join(self.temp_dir, 'legacy.db')}")
+        with self.engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE page_items (id VARCHAR(32) PRIMARY KEY, "
+                "created_at INTEGER NOT NULL, published_at DATETIME)"
+            ))
+
+    def tearDown(self):
+        """测试清理"""
+        self.engine.dispose()
+        shutil.rmtree(self.temp_dir)
+
+    def _index_names(self):
+        return {ix["name"] for ix in inspect(self.engine).get_indexes("page_items")}
+
+    def test_ensure_indexes_is_idempotent(self):
+        """补建缺失的索引，重复执行不再创建"""
+        tables = [PageItem.__table__]
+
+        self.assertEqual(ensure_indexes(self.engine, tables), ["ix_page_items_created_at"])
+        self.assertIn("ix_page_items_created_at", self._index_names())
+        self.assertEqual(ensure_indexes(self.engine, tables), [])
+
+    def test_ensure_indexes_skips_missing_tables(self):
+        """数据库中不存在的表被跳过"""
+        self.engine.dispose()
+        shutil.rmtree(self.temp_dir)
+        self.temp_dir = tempfile.mkdtemp()
+        self.engine = create_engine(f"sqlite:///{os.path.join(self.temp_dir, 'empty.db')}")
+
+        self.assertEqual(ensure_indexes(self.engine, [PageItem.__table__]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""数据库快照测试
+
+验证NDJSON快照的导出、导入往返以及按主键的upsert行为
+"""
+
+import sys
+import os
+import json
+import tempfile
+import unittest
+
+# 添加项目根目录到系统路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+from sqlalchemy import select
+
+from core.models.db.session import create_db_engine
+from core.models.db.snapshot import export_snapshot, import_snapshot
+from core.models.topic.topic_db import Topic
+
+
+class SnapshotTest(unittest.TestCase):
+    """数据库快照测试类"""
+
+    def setUp(self):
+        """测试准备"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.source = create_db_engine(os.path.join(self.temp_dir, "source.db"))
+        self.target = create_db_engine(os.path.join(self.temp_dir, "target.db"))
+        Topic.__table__.create(self.source)
+
+        with self.source.begin() as conn:
+            conn.execute(Topic.__table__.insert(), [
+                {"id": f"t{i}", "title": f"话题{i}", "platform": "weibo",
+                 "created_at": 1700000000 + i, "updated_at": 1700000000 + i}
+                for i in range(25)
+            ])
+
+    def tearDown(self):
+        """测试清理"""
+        self.source.dispose()
+        self.target.dispose()
+
+    def _read_titles(self, engine):
+        with engine.connect() as conn:
+            rows = conn.execute(select(Topic.__table__).order_by(Topic.__table__.c.id)).mappings()
+            return {row["id"]: row["title"] for row in rows}
+
+    def test_round_trip(self):
+        """导出后导入到空库，数据一致"""
+        path = os.path.join(self.temp_dir, "snapshot.ndjson")
+
+        exported = export_snapshot(path, tables=["topics"], batch_size=10, bind=self.source)
+        imported = import_snapshot(path, tables=["topics"], batch_size=10,
+                                   batches_per_transaction=2, bind=self.target)
+
+        self.assertEqual(exported.rows["topics"], 25)
+        self.assertEqual(imported.rows["topics"], 25)
+        self.assertEqual(self._read_titles(self.source), self._read_titles(self.target))
+
+        with open(path, encoding="utf-8") as f:
+            header = json.loads(f.readline())
+        self.assertEqual(header["type"], "header")
+        self.assertEqual(header["tables"], ["topics"])
+
+    def test_import_updates_existing_rows(self):
+        """重复导入时按主键更新已存在的行"""
+        path = os.path.join(self.temp_dir, "snapshot.ndjson")
+        export_snapshot(path, tables=["topics"], bind=self.source)
+        import_snapshot(path, tables=["topics"], bind=self.target)
+
+        with self.target.begin() as conn:
+            conn.execute(Topic.__table__.update().values(title="已修改"))
+
+        import_snapshot(path, tables=["topics"], bind=self.target)
+
+        self.assertEqual(self._read_titles(self.source), self._read_titles(self.target))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+"""临时存储测试
+
+验证过期堆的惰性清理、LRU容量上限、并发访问以及Redis实现的接口一致性
+"""
+
+import sys
+import os
+import fnmatch
+import threading
+import unittest
+from unittest import mock
+
+# 添加项目根目录到系统路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+from core.models.infra import temporary_storage
+from core.models.infra.temporary_storage import TemporaryStorage, RedisTemporaryStorage
+
+
+class FakeClock:
+    """可手动推进的单调时钟"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeRedis:
+    """只实现测试所需命令的内存Redis"""
+
+    def __init__(self):
+        self.data = {}
+
+    def set(self, key, value, ex=None, xx=False, keepttl=False):
+        if xx and key not in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def delete(self, key):
+        return 1 if self.data.pop(key, None) is not None else 0
+
+    def scan_iter(self, match):
+        return [k.encode() for k in self.data if fnmatch.fnmatch(k, match)]
+
+
+class TemporaryStorageTest(unittest.TestCase):
+    """临时存储测试类"""
+
+    def setUp(self):
+        """测试准备"""
+        self.clock = FakeClock()
+        patcher = mock.patch.object(temporary_storage.time, "monotonic", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_expiry(self):
+        """到期对象在下一次访问时被清理"""
+        storage = TemporaryStorage("test_expiry", ttl_seconds=100)
+        storage.set("short", 1, ttl_seconds=10)
+        storage.set("long", 2)
+
+        self.clock.now += 50
+        self.assertIsNone(storage.get("short"))
+        self.assertEqual(storage.get("long"), 2)
+        self.assertEqual(storage.list_keys(), ["long"])
+        self.assertEqual(storage.stats["expired"], 1)
+
+    def test_overwrite_extends_expiry(self):
+        """覆盖对象后旧的到期记录不再生效"""
+        storage = TemporaryStorage("test_overwrite")
+        storage.set("k", "old", ttl_seconds=10)
+        storage.set("k", "new", ttl_seconds=100)
+
+        self.clock.now += 50
+        self.assertEqual(storage.get("k"), "new")
+
+    def test_update_keeps_expiry(self):
+        """更新对象保持原有过期时间"""
+        storage = TemporaryStorage("test_update")
+        storage.set("k", "old", ttl_seconds=10)
+        self.assertTrue(storage.update("k", "new"))
+        self.assertEqual(storage.get("k"), "new")
+
+        self.clock.now += 20
+        self.assertFalse(storage.update("k", "newer"))
+        self.assertIsNone(storage.get("k"))
+
+    def test_lru_eviction(self):
+        """超出容量时淘汰最久未访问的对象"""
+        storage = TemporaryStorage("test_lru", max_size=3)
+        for key in ("a", "b", "c"):
+            storage.set(key, key)
+        storage.get("a")
+        storage.set("d", "d")
+
+        self.assertEqual(sorted(storage.list_keys()), ["a", "c", "d"])
+        self.assertEqual(storage.stats["evicted"], 1)
+
+    def test_heap_stays_bounded(self):
+        """反复覆盖同一个键时过期堆不会无限增长"""
+        storage = TemporaryStorage("test_heap")
+        for i in range(10000):
+            storage.set("k", i)
+        self.assertLessEqual(len(storage._expiry_heap), 2 * len(storage.items) + 65)
+
+    def test_many_items(self):
+        """大量对象时每次访问只处理到期的对象"""
+        storage = TemporaryStorage("test_many", ttl_seconds=3600, max_size=None)
+        for i in range(50000):
+            storage.set(str(i), i, ttl_seconds=10 if i % 2 else 3600)
+
+        self.clock.now += 60
+        self.assertIsNone(storage.get("1"))
+        self.assertEqual(len(storage), 25000)
+        self.assertEqual(storage.get("0"), 0)
+
+    def test_concurrent_access(self):
+        """多线程并发读写"""
+        storage = TemporaryStorage("test_threads", max_size=500)
+        errors = []
+
+        def worker(n):
+            try:
+                for i in range(2000):
+                    key = f"{n}-{i % 100}"
+                    storage.set(key, i)
+                    storage.get(key)
+                    if i % 7 == 0:
+                        storage.delete(key)
+                    if i % 500 == 0:
+                        storage.list_keys()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(storage), 500)
+
+    def test_redis_storage(self):
+        """Redis实现与内存实现接口一致"""
+        storage = RedisTemporaryStorage("outlines", ttl_seconds=60, client=FakeRedis())
+        key = storage.set(None, {"title": "大纲"})
+
+        self.assertEqual(storage.get(key), {"title": "大纲"})
+        self.assertTrue(storage.update(key, {"title": "新大纲"}))
+        self.assertEqual(storage.get(key)["title"], "新大纲")
+        self.assertEqual(storage.list_keys(), [key])
+        self.assertFalse(storage.update("missing", 1))
+        self.assertTrue(storage.delete(key))
+        self.assertIsNone(storage.get(key))
+
+
+if __name__ == "__main__":
+    unittest.main()
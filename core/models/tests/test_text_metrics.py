@@ -0,0 +1,87 @@
+"""文本指标测试
+
+验证单遍统计的各项指标、标签和链接的处理以及按章节的增量更新
+"""
+
+import sys
+import os
+import unittest
+
+# 添加项目根目录到系统路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+from core.models.article.text_metrics import DocumentMetrics, TextMetrics, count_words, measure_text
+from core.models.article.article import Article, Section
+
+
+SAMPLE = (
+    "# 引言\n\n"
+    "异步编程是现代Python开发中不可或缺的一部分。It's an e-mail test! 3.14 is pi.\n\n"
+    "![架构图](https://example.com/a.png) 详见[文档](https://docs.example.com/guide?x=1)。<b>粗体</b>\n\n"
+    "结尾没有标点"
+)
+
+
+class TextMetricsTest(unittest.TestCase):
+    """文本指标测试类"""
+
+    def test_measure_text(self):
+        """一次扫描得到字数、句子、段落和图片数"""
+        metrics = measure_text(SAMPLE)
+        self.assertEqual(metrics.cjk_chars, 32)
+        self.assertEqual(metrics.latin_words, 9)
+        self.assertEqual(metrics.sentences, 7)
+        self.assertEqual(metrics.paragraphs, 4)
+        self.assertEqual(metrics.images, 1)
+        self.assertEqual(metrics.word_count, 41)
+
+    def test_markup_not_counted(self):
+        """HTML标签、图片和链接地址不计入字数"""
+        self.assertEqual(count_words('<div class="content">你好 world</div>'), 3)
+        self.assertEqual(count_words("[链接](https://example.com/very/long/path)"), 2)
+        self.assertEqual(count_words(""), 0)
+        self.assertEqual(count_words(None), 0)
+
+    def test_extended_cjk(self):
+        """扩展区汉字、假名和韩文按字计"""
+        self.assertEqual(measure_text("𠀀𪜀ひらがなカタカナ한국어").cjk_chars, 13)
+
+    def test_read_time(self):
+        """阅读时间按中文400字/分钟、英文200词/分钟估算，至少1分钟"""
+        self.assertEqual(TextMetrics(cjk_chars=4000).read_time(), 10)
+        self.assertEqual(TextMetrics(latin_words=1000).read_time(), 5)
+        self.assertEqual(TextMetrics().read_time(), 1)
+
+    def test_incremental_update(self):
+        """只重新统计变化的段落，总计与整体统计一致"""
+        parts = {str(i): f"第{i}段内容。Paragraph {i}." for i in range(50)}
+        document = DocumentMetrics()
+        document.sync(parts.items())
+
+        parts["7"] = "修改后的第七段，内容更长一些。Edited paragraph seven here."
+        del parts["8"]
+        total = document.sync(parts.items())
+
+        expected = sum((measure_text(text) for text in parts.values()), TextMetrics())
+        self.assertEqual(total, expected)
+
+    def test_article_metrics(self):
+        """文章指标使用统一的字数口径，修改章节后结果随之更新"""
+        article = Article(
+            id="a1", topic_id="t1", title="异步编程", summary="简介",
+            sections=[
+                Section(id="s1", title="引言", content="Python异步编程。", order=1),
+                Section(id="s2", title="实践", content="使用 asyncio 编写代码。", order=2),
+            ],
+        )
+        metrics = article.calculate_metrics()
+        self.assertEqual(metrics["word_count"], 4 + 2 + 2 + 5 + 2 + 1 + 6)
+        self.assertEqual(article.word_count, metrics["word_count"])
+        self.assertEqual(metrics["section_count"], 2)
+
+        article.sections[1].content = "使用 asyncio 和 aiohttp 编写高并发代码。"
+        self.assertEqual(article.calculate_metrics()["word_count"], 4 + 2 + 2 + 5 + 2 + 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
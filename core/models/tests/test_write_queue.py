@@ -0,0 +1,220 @@
+"""串行写入队列测试
+
+验证SerializedWriter按顺序执行写操作、提交/回滚事务并返回结果
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import Column, Integer, String
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+# 添加项目根目录到系统路径
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+from core.models.db.write_queue import SerializedWriter
+from core.models.db import session as db_session
+from core.models.db.repository import BaseRepository
+
+
+class SerializedWriterTest(unittest.TestCase):
+    """串行写入队列测试类"""
+
+    def setUp(self):
+        """测试准备"""
+        self.sessions = []
+
+        def session_factory():
+            session = MagicMock()
+            self.sessions.append(session)
+            return session
+
+        self.writer = SerializedWriter(session_factory)
+        self.writer.start()
+
+    def tearDown(self):
+        """测试清理"""
+        self.writer.stop(timeout=5)
+
+    def test_execute_commits_and_returns_result(self):
+        """写操作成功后提交并返回结果"""
+        result = self.writer.execute(lambda db: "ok", timeout=5)
+
+        self.assertEqual(result, "ok")
+        self.sessions[0].commit.assert_called_once()
+        self.sessions[0].close.assert_called_once()
+
+    def test_execute_rolls_back_on_error(self):
+        """写操作失败时回滚并把异常抛给调用方"""
+        def failing(db):
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            self.writer.execute(failing, timeout=5)
+
+        self.sessions[0].rollback.assert_called_once()
+        self.sessions[0].commit.assert_not_called()
+        self.assertEqual(self.writer.get_stats()["failed"], 1)
+
+    def test_writes_run_on_single_thread_in_order(self):
+        """多线程提交的写操作在同一写线程上串行执行"""
+        executed = []
+        thread_ids = set()
+
+        def make_write(i):
+            def write(db):
+                thread_ids.add(threading.get_ident())
+                executed.append(i)
+            return write
+
+        futures = [self.writer.submit(make_write(i)) for i in range(50)]
+        for future in futures:
+            future.result(timeout=5)
+
+        self.assertEqual(executed, list(range(50)))
+        self.assertEqual(len(thread_ids), 1)
+        self.assertNotIn(threading.get_ident(), thread_ids)
+        self.assertEqual(self.writer.get_stats()["completed"], 50)
+
+    def test_stop_drains_non_empty_queue(self):
+        """队列中仍有写操作时停止：先执行完已入队的写操作再退出，不会死锁"""
+        release = threading.Event()
+        executed = []
+
+        def slow_write(db):
+            release.wait(5)
+            executed.append("slow")
+
+        futures = [self.writer.submit(slow_write)]
+        futures += [self.writer.submit(lambda db, i=i: executed.append(i)) for i in range(50)]
+
+        stopper = threading.Thread(target=self.writer.stop, kwargs={"timeout": 5})
+        stopper.start()
+        release.set()
+        stopper.join(10)
+
+        self.assertFalse(stopper.is_alive())
+        self.assertFalse(self.writer.is_running)
+        self.assertTrue(all(future.done() for future in futures))
+        self.assertEqual(executed, ["slow"] + list(range(50)))
+        self.assertEqual(self.writer.get_stats()["completed"], 51)
+
+
+class WriteQueueItem(declarative_base()):
+    """测试用模型，使用独立的声明基类，不依赖其他模型的映射配置"""
+    __tablename__ = "write_queue_item"
+
+    id = Column(String(64), primary_key=True)
+    title = Column(String(255), nullable=False)
+    created_at = Column(Integer, default=lambda: int(time.time()))
+    updated_at = Column(Integer, default=lambda: int(time.time()), onupdate=lambda: int(time.time()))
+
+
+class RepositoryWriteQueueTest(unittest.TestCase):
+    """生产模式下仓库自有会话的写操作经过串行写队列"""
+
+    def setUp(self):
+        """测试准备：临时数据库和绑定它的写队列"""
+        self.temp_dir = tempfile.mkdtemp()
+        db_file = os.path.join(self.temp_dir, "test.db")
+        read_engine = db_session.create_db_engine(db_file, mode=db_session.DB_MODE_PRODUCTION)
+        WriteQueueItem.__table__.create(read_engine)
+
+        self.writer = SerializedWriter(sessionmaker(
+            autocommit=False, autoflush=False, expire_on_commit=False,
+            bind=db_session.create_write_engine(db_file)
+        ))
+        self.writer.start()
+        self.read_session_factory = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+        self.patches = [
+            patch.object(db_session, "DB_MODE", db_session.DB_MODE_PRODUCTION),
+            patch.object(db_session, "_write_queue", self.writer),
+            patch("core.models.db.repository.SessionLocal", self.read_session_factory),
+        ]
+        for p in self.patches:
+            p.start()
+        self.repo = BaseRepository(WriteQueueItem)
+
+    def tearDown(self):
+        """测试清理"""
+        self.repo.close()
+        for p in reversed(self.patches):
+            p.stop()
+        self.writer.stop(timeout=5)
+        shutil.rmtree(self.temp_dir)
+
+    def titles(self):
+        with self.read_session_factory() as db:
+            return [(item.id, item.title) for item in db.query(WriteQueueItem).order_by(WriteQueueItem.id)]
+
+    def test_repository_writes_go_through_writer(self):
+        """create/update/bulk_upsert/delete 都由写线程提交，读会话能看到结果"""
+        created = self.repo.create({"id": "t1", "title": "话题一"})
+        self.assertEqual(created.title, "话题一")
+        self.assertIsNotNone(created.created_at)
+
+        self.assertEqual(self.repo.update("t1", {"title": "话题一(改)"}).title, "话题一(改)")
+        self.assertEqual(self.repo.bulk_upsert([
+            {"id": "t1", "title": "话题一(批量)"},
+            {"id": "t2", "title": "话题二"},
+        ]), 2)
+        self.assertTrue(self.repo.delete("t2"))
+
+        self.assertEqual(self.writer.get_stats()["completed"], 4)
+        self.assertEqual(self.titles(), [("t1", "话题一(批量)")])
+
+    def test_unit_of_work_session_not_queued(self):
+        """调用方传入的工作单元会话仍在调用方线程中执行，不经过写队列"""
+        with self.read_session_factory() as db:
+            BaseRepository(WriteQueueItem, db).create({"id": "t3", "title": "话题三"})
+            db.commit()
+        self.assertEqual(self.writer.get_stats()["submitted"], 0)
+        self.assertEqual(self.titles(), [("t3", "话题三")])
+
+    def test_run_write_uses_writer(self):
+        """适配器通过 run_write 提交的批量写入也由写线程执行"""
+        count = db_session.run_write(lambda db: BaseRepository(WriteQueueItem, db).bulk_upsert([
+            {"id": "t4", "title": "话题四"}, {"id": "t5", "title": "话题五"},
+        ]))
+        self.assertEqual(count, 2)
+        self.assertEqual(self.writer.get_stats()["completed"], 1)
+        self.assertEqual(self.titles(), [("t4", "话题四"), ("t5", "话题五")])
+
+    def test_bulk_upsert_refreshes_updated_at(self):
+        """冲突更新时按列定义的onupdate刷新updated_at，created_at保持不变"""
+        self.repo.bulk_upsert([{"id": "t6", "title": "话题六", "created_at": 100, "updated_at": 100}])
+        before = int(time.time())
+        self.repo.bulk_upsert([{"id": "t6", "title": "话题六(改)"}])
+        self.repo.bulk_upsert([{"id": "t6", "title": "话题六(再改)"}], update_columns=["title"])
+
+        with self.read_session_factory() as db:
+            item = db.get(WriteQueueItem, "t6")
+            self.assertEqual(item.title, "话题六(再改)")
+            self.assertEqual(item.created_at, 100)
+            self.assertGreaterEqual(item.updated_at, before)
+
+    def test_context_manager_closes_owned_session(self):
+        """with语句结束时关闭仓库的自有会话，调用方传入的会话保持打开"""
+        self.repo.create({"id": "t7", "title": "话题七"})
+
+        with BaseRepository(WriteQueueItem) as repo:
+            self.assertEqual(repo.get("t7").title, "话题七")
+            owned = repo.db
+        self.assertIsNone(repo._db)
+
+        with patch.object(owned, "close") as close:
+            with BaseRepository(WriteQueueItem, owned) as repo:
+                repo.get("t7")
+            close.assert_not_called()
+        owned.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, DateTime, Integer
+from sqlalchemy import Column, String, Text, DateTime, Integer, Index
 from sqlalchemy.orm import relationship
 from typing import Dict, Any
 import time
@@ -11,6 +11,13 @@ class Topic(Base):
     提供对话题的数据持久化支持，不包含业务逻辑
     """
     __tablename__ = "topics"
+    __table_args__ = (
+        # 按平台取最新话题及按平台分页
+        Index("ix_topics_platform_created_at", "platform", "created_at", "id"),
+        # 按时间范围查询及全局键集分页
+        Index("ix_topics_created_at", "created_at", "id"),
+        Index("ix_topics_updated_at", "updated_at", "id"),
+    )
 
     id = Column(String(64), primary_key=True, index=True, comment="话题ID")
     title = Column(String(255), nullable=False, comment="话题标题")
@@ -21,8 +28,8 @@ class Topic(Base):
     keywords = Column(Text, nullable=True, comment="关键词，以逗号分隔")
     language = Column(String(10), default="zh-CN", comment="语言")
 
-    created_at = Column(Integer, default=int(time.time()), comment="创建时间")
-    updated_at = Column(Integer, default=int(time.time()), onupdate=int(time.time()), comment="更新时间")
+    created_at = Column(Integer, default=lambda: int(time.time()), comment="创建时间")
+    updated_at = Column(Integer, default=lambda: int(time.time()), onupdate=lambda: int(time.time()), comment="更新时间")
 
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典
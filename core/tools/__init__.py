@@ -4,19 +4,7 @@ GenFlow Tools Package
 This package contains various utility tools and helpers for the GenFlow system.
 """
 
-from core.tools.base import BaseTool, ToolResult
-from core.tools.content_collectors import ContentCollector
-from core.tools.search_tools import SearchAggregator
-from core.tools.nlp_tools import NLPAggregator
-from core.tools.style_tools import StyleAdapter
-from core.tools.trending_tools import TrendingTopics
-from core.tools.review_tools import (
-    PlagiarismChecker,
-    StatisticalAIDetector,
-    OpenAIDetector,
-    SensitiveWordChecker,
-    ReviewResult
-)
+from core.lazy_imports import lazy_exports
 
 __all__ = [
     'BaseTool',
@@ -32,3 +20,18 @@ __all__ = [
     'SensitiveWordChecker',
     'ReviewResult'
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "BaseTool": ".base",
+    "ToolResult": ".base",
+    "ContentCollector": ".content_collectors",
+    "SearchAggregator": ".search_tools",
+    "NLPAggregator": ".nlp_tools",
+    "StyleAdapter": ".style_tools",
+    "TrendingTopics": ".trending_tools",
+    "PlagiarismChecker": ".review_tools",
+    "StatisticalAIDetector": ".review_tools",
+    "OpenAIDetector": ".review_tools",
+    "SensitiveWordChecker": ".review_tools",
+    "ReviewResult": ".review_tools",
+})
@@ -1,14 +1,21 @@
 """内容采集工具包"""
-from .base_collector import BaseCollector
-from .collector import ContentCollector
-from .newspaper_collector import NewspaperCollector
-from .trafilatura_collector import TrafilaturaCollector
-from .readability_collector import ReadabilityCollector
+
+from core.lazy_imports import lazy_exports
 
 __all__ = [
     'BaseCollector',
     'ContentCollector',
+    'ContentFetcher',
     'NewspaperCollector',
     'TrafilaturaCollector',
     'ReadabilityCollector'
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "BaseCollector": ".base_collector",
+    "ContentCollector": ".collector",
+    "ContentFetcher": ".fetcher",
+    "NewspaperCollector": ".newspaper_collector",
+    "TrafilaturaCollector": ".trafilatura_collector",
+    "ReadabilityCollector": ".readability_collector",
+})
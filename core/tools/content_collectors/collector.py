@@ -1,13 +1,9 @@
 """内容采集模块"""
 from typing import List, Dict, Optional, Union
 import logging
-import time
-from dataclasses import dataclass
+from dataclasses import asdict
 from abc import ABC, abstractmethod
 import asyncio
-import requests
-from newspaper import Article, Config as NewsConfig
-from newspaper.article import ArticleException
 from pytrends.request import TrendReq
 from firecrawl.firecrawl import FirecrawlApp
 from pydantic import BaseModel
@@ -16,22 +12,7 @@ from .base_collector import (
     register_parser, register_source, BaseCollector
 )
 from core.tools.base import BaseTool, ToolResult
-from .newspaper_collector import NewspaperCollector
-from .trafilatura_collector import TrafilaturaCollector
-from .readability_collector import ReadabilityCollector
-
-@dataclass
-class ContentItem:
-    """统一的内容数据结构"""
-    title: str
-    url: str
-    content: str
-    summary: Optional[str] = None
-    keywords: Optional[List[str]] = None
-    authors: Optional[List[str]] = None
-    publish_date: Optional[str] = None
-    source_type: str = "web"  # web, news, social 等
-    source_tool: str = "unknown"  # newspaper, firecrawl, custom 等
+from .fetcher import ContentFetcher
 
 class ContentParser(ABC):
     """内容解析器抽象基类"""
@@ -43,47 +24,23 @@ class ContentParser(ABC):
 
 @register_parser("newspaper")
 class NewspaperParser(ContentParser):
-    """基于 newspaper3k 的解析器"""
+    """基于 newspaper3k 的解析器
 
-    def __init__(self, language: str = 'zh'):
-        self.config = NewsConfig()
-        self.config.language = language
-        self.config.browser_user_agent = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        self.config.request_timeout = 10
-        self.config.fetch_images = False
+    页面由共享的 ContentFetcher 下载和缓存，提取在进程池中执行。
+    """
 
-    async def parse(self, url: str, retries: int = 3) -> Optional[ContentItem]:
-        for i in range(retries):
-            try:
-                article = Article(url, config=self.config)
-                article.download()
-                article.parse()
-
-                try:
-                    article.nlp()
-                except:
-                    pass
-
-                return ContentItem(
-                    title=article.title,
-                    url=url,
-                    content=article.text,
-                    summary=article.summary,
-                    keywords=article.keywords,
-                    authors=article.authors,
-                    publish_date=str(article.publish_date) if article.publish_date else None,
-                    source_tool="newspaper"
-                )
-
-            except ArticleException as e:
-                if i == retries - 1:
-                    logging.warning(f"Newspaper解析失败 {url}: {str(e)}")
-                    return None
-                time.sleep(1)
-            except Exception as e:
-                logging.error(f"Newspaper解析错误 {url}: {str(e)}")
-                return None
-        return None
+    extractor = "newspaper"
+
+    def __init__(self, language: str = 'zh', fetcher: Optional[ContentFetcher] = None):
+        self.language = language
+        self.fetcher = fetcher or ContentFetcher.get_instance()
+
+    async def parse(self, url: str) -> Optional[ContentItem]:
+        try:
+            return await self.fetcher.get_content(url, [self.extractor], {"language": self.language})
+        except Exception as e:
+            logging.error(f"Newspaper解析错误 {url}: {str(e)}")
+            return None
 
 class FirecrawlParser(ContentParser):
     """基于 Firecrawl 的解析器"""
@@ -121,45 +78,19 @@ class FirecrawlParser(ContentParser):
 
 @register_parser("trafilatura")
 class TrafilaturaParser(ContentParser):
-    """基于 Trafilatura 的解析器"""
+    """基于 Trafilatura 的解析器
 
-    def __init__(self):
-        import trafilatura
-        self.trafilatura = trafilatura
+    页面由共享的 ContentFetcher 下载和缓存，提取在进程池中执行。
+    """
 
-    async def parse(self, url: str) -> Optional[ContentItem]:
-        try:
-            # 下载网页
-            downloaded = self.trafilatura.fetch_url(url)
-            if not downloaded:
-                return None
-
-            # 提取内容
-            result = self.trafilatura.extract(
-                downloaded,
-                output_format='json',
-                with_metadata=True,
-                include_comments=False,
-                include_tables=True
-            )
+    extractor = "trafilatura"
 
-            if not result:
-                return None
-
-            # 解析 JSON
-            import json
-            data = json.loads(result)
-
-            return ContentItem(
-                title=data.get('title', ''),
-                url=url,
-                content=data.get('text', ''),
-                summary=data.get('description', ''),
-                authors=data.get('author', '').split(',') if data.get('author') else None,
-                publish_date=data.get('date', None),
-                source_tool="trafilatura"
-            )
+    def __init__(self, fetcher: Optional[ContentFetcher] = None):
+        self.fetcher = fetcher or ContentFetcher.get_instance()
 
+    async def parse(self, url: str) -> Optional[ContentItem]:
+        try:
+            return await self.fetcher.get_content(url, [self.extractor])
         except Exception as e:
             logging.error(f"Trafilatura解析错误 {url}: {str(e)}")
             return None
@@ -167,29 +98,70 @@ class TrafilaturaParser(ContentParser):
 class ContentSource(ABC):
     """内容源抽象基类"""
 
-    def __init__(self, parsers: List[ContentParser]):
+    def __init__(self, parsers: List[ContentParser], fetcher: Optional[ContentFetcher] = None):
         self.parsers = parsers
+        self.fetcher = fetcher or ContentFetcher.get_instance()
 
     @abstractmethod
     async def search(self, keyword: str) -> List[Dict]:
         """搜索内容"""
         pass
 
+    def _split_parsers(self):
+        """区分基于HTML提取的解析器（共享一次下载）和调用外部服务的解析器"""
+        extractors = [p.extractor for p in self.parsers if getattr(p, "extractor", None)]
+        remote = [p for p in self.parsers if not getattr(p, "extractor", None)]
+        return extractors, remote
+
     async def get_content(self, url: str) -> Optional[ContentItem]:
         """获取内容，尝试所有可用的解析器
 
+        页面只下载一次，基于HTML的解析器在同一次提取中按顺序尝试；都失败时再尝试
+        Firecrawl等调用外部服务的解析器。
+
         Args:
             url: 文章URL
 
         Returns:
             Optional[ContentItem]: 解析结果
         """
-        for parser in self.parsers:
+        extractors, remote = self._split_parsers()
+        if extractors:
+            try:
+                content = await self.fetcher.get_content(url, extractors)
+                if content and content.content:
+                    return content
+            except Exception as e:
+                logging.warning(f"提取内容失败 {url}: {str(e)}")
+        return await self._parse_remote(url, remote)
+
+    async def get_contents(self, urls: List[str]) -> List[Optional[ContentItem]]:
+        """批量获取内容
+
+        Args:
+            urls: 文章URL列表
+
+        Returns:
+            List[Optional[ContentItem]]: 与urls顺序一致的解析结果
+        """
+        extractors, remote = self._split_parsers()
+        results: List[Optional[ContentItem]] = [None] * len(urls)
+        if extractors:
+            results = await self.fetcher.get_contents(urls, extractors)
+        if remote:
+            missing = [i for i, item in enumerate(results) if not (item and item.content)]
+            fallbacks = await asyncio.gather(*(self._parse_remote(urls[i], remote) for i in missing))
+            for i, item in zip(missing, fallbacks):
+                results[i] = item
+        return results
+
+    async def _parse_remote(self, url: str, parsers: List[ContentParser]) -> Optional[ContentItem]:
+        for parser in parsers:
             try:
                 content = await parser.parse(url)
                 if content and content.content:
                     return content
-            except:
+            except Exception:
                 continue
         return None
 
@@ -281,31 +253,36 @@ class ContentCollector(BaseTool):
     name = "content_collector"
     description = "多源内容采集工具"
 
-    def __init__(self, config: Dict = None):
+    def __init__(self, config: Dict = None, fetcher: Optional[ContentFetcher] = None):
         super().__init__(config)
-        self.tools = [
-            NewspaperCollector(config),
-            TrafilaturaCollector(config),
-            ReadabilityCollector(config)
-        ]
+        self.fetcher = fetcher or ContentFetcher.get_instance()
+        self.extractors = self.config.get("extractors", ("newspaper", "trafilatura", "readability", "basic"))
 
     async def execute(self, url: str) -> ToolResult:
-        """执行内容采集的主要方法"""
-        results = []
-        for tool in self.tools:
-            result = await tool.execute(url)
-            if result.success:
-                results.append((tool.name, result))
-
-        if not results:
+        """执行内容采集的主要方法
+
+        页面只下载一次，各提取器在进程池中对同一份HTML提取，选择正文最长的结果。
+        """
+        try:
+            item = await self.fetcher.get_content(url, self.extractors, pick="longest")
+        except Exception as e:
+            return self._create_error_result(str(e))
+
+        if item is None:
             return self._create_error_result("All tools failed to extract content")
 
-        # 选择最佳结果（这里可以实现更复杂的选择逻辑）
-        best_result = max(results, key=lambda x: len(str(x[1].data)))
-        return self._create_success_result(
-            best_result[1].data,
-            {"tool_used": best_result[0]}
-        )
+        return self._create_success_result(asdict(item), {"tool_used": item.source_tool})
+
+    async def get_contents(self, urls: List[str]) -> List[Optional[ContentItem]]:
+        """批量采集多个网页
+
+        Args:
+            urls: 网页URL列表
+
+        Returns:
+            List[Optional[ContentItem]]: 与urls顺序一致的结果，失败的位置为None
+        """
+        return await self.fetcher.get_contents(urls, self.extractors, pick="longest")
 
     async def _run(self, url: str) -> ToolResult:
         """CrewAI 所需的内部执行方法"""
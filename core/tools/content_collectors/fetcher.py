@@ -0,0 +1,642 @@
+"""网页抓取层
+
+所有内容解析器共享的下载与缓存层：
+
+- 每个URL只下载一次：使用共享的aiohttp连接池，相同URL的并发请求合并为一次下载
+- 抓取礼仪：遵守各站点的robots.txt（含Crawl-delay），同一站点的请求之间至少间隔 FETCH_HOST_INTERVAL 秒
+- 磁盘缓存：原始HTML按URL缓存在 CONTENT_CACHE_DIR，同时记录ETag/Last-Modified；
+  未过期时直接使用缓存，过期后发送条件请求，服务器返回304时继续使用缓存内容
+- 正文提取：在进程池中对缓存的HTML依次尝试各提取器（trafilatura、newspaper、readability，
+  最后是只依赖标准库的basic），不再为每个解析器重新下载页面
+
+用法::
+
+    fetcher = ContentFetcher.get_instance()
+    item = await fetcher.get_content(url)
+    items = await fetcher.get_contents(urls)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Any, ClassVar, Dict, List, Optional, Sequence
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
+
+from .base_collector import ContentItem
+
+logger = logging.getLogger("content_fetcher")
+
+# 原始HTML缓存目录
+CONTENT_CACHE_DIR = os.environ.get(
+    "CONTENT_CACHE_DIR", os.path.join(tempfile.gettempdir(), "genflow_content_cache")
+)
+
+# 缓存有效期（秒），过期后发送条件请求重新验证
+CONTENT_CACHE_TTL = float(os.environ.get("CONTENT_CACHE_TTL", 3600))
+
+# 单次请求超时（秒）
+FETCH_TIMEOUT = float(os.environ.get("FETCH_TIMEOUT", 15))
+
+# 连接池大小与单站点并发连接数
+FETCH_MAX_CONNECTIONS = int(os.environ.get("FETCH_MAX_CONNECTIONS", 32))
+FETCH_MAX_PER_HOST = int(os.environ.get("FETCH_MAX_PER_HOST", 4))
+
+# 同一站点相邻两次请求的最小间隔（秒）
+FETCH_HOST_INTERVAL = float(os.environ.get("FETCH_HOST_INTERVAL", 0.5))
+
+# 网络错误和5xx响应的重试次数
+FETCH_RETRIES = int(os.environ.get("FETCH_RETRIES", 2))
+
+# 是否遵守robots.txt
+FETCH_RESPECT_ROBOTS = os.environ.get("FETCH_RESPECT_ROBOTS", "true").lower() == "true"
+
+# 正文提取进程数，0表示使用CPU核数
+FETCH_WORKERS = int(os.environ.get("FETCH_WORKERS", 0))
+
+# 批量抓取的并发上限
+FETCH_CONCURRENCY = int(os.environ.get("FETCH_CONCURRENCY", 16))
+
+FETCH_USER_AGENT = os.environ.get(
+    "FETCH_USER_AGENT",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (compatible; GenFlowBot/1.0)"
+)
+
+# 默认的提取器顺序
+DEFAULT_EXTRACTORS = ("trafilatura", "newspaper", "readability", "basic")
+
+
+# ---------------------------------------------------------------------------
+# 正文提取器（模块级函数，可在进程池中执行）
+# ---------------------------------------------------------------------------
+
+class _TextExtractor(HTMLParser):
+    """标准库实现的简单正文提取：标题加段落、标题和列表文本"""
+
+    BLOCK_TAGS = {"p", "h1", "h2", "h3", "h4", "h5", "h6", "li", "blockquote", "pre"}
+    SKIP_TAGS = {"script", "style", "noscript", "nav", "footer", "header", "aside", "form"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = ""
+        self.blocks: List[str] = []
+        self._in_title = False
+        self._skip_depth = 0
+        self._block_depth = 0
+        self._buffer: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag == "title":
+            self._in_title = True
+        elif tag in self.BLOCK_TAGS:
+            self._block_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag == "title":
+            self._in_title = False
+        elif tag in self.BLOCK_TAGS and self._block_depth:
+            self._block_depth -= 1
+            if not self._block_depth:
+                text = " ".join("".join(self._buffer).split())
+                if text:
+                    self.blocks.append(text)
+                self._buffer = []
+
+    def handle_data(self, data):
+        if self._in_title:
+            self.title += data
+        elif self._block_depth and not self._skip_depth:
+            self._buffer.append(data)
+
+
+def _html_to_text(html: str) -> Dict[str, str]:
+    parser = _TextExtractor()
+    parser.feed(html)
+    parser.close()
+    return {"title": parser.title.strip(), "text": "\n\n".join(parser.blocks)}
+
+
+def _extract_trafilatura(html: str, url: str, options: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    import trafilatura
+
+    result = trafilatura.extract(
+        html,
+        url=url,
+        output_format="json",
+        with_metadata=True,
+        include_comments=False,
+        include_tables=True
+    )
+    if not result:
+        return None
+    data = json.loads(result)
+    return {
+        "title": data.get("title") or "",
+        "content": data.get("text") or "",
+        "summary": data.get("description") or "",
+        "authors": data.get("author").split(",") if data.get("author") else None,
+        "publish_date": data.get("date"),
+    }
+
+
+def _extract_newspaper(html: str, url: str, options: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    from newspaper import Article, Config as NewsConfig
+
+    config = NewsConfig()
+    config.language = options.get("language", "zh")
+    config.fetch_images = False
+    article = Article(url, config=config)
+    article.download(input_html=html)
+    article.parse()
+    try:
+        article.nlp()
+    except Exception:
+        pass
+    return {
+        "title": article.title,
+        "content": article.text,
+        "summary": article.summary,
+        "keywords": article.keywords,
+        "authors": article.authors,
+        "publish_date": str(article.publish_date) if article.publish_date else None,
+    }
+
+
+def _extract_readability(html: str, url: str, options: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    from readability.readability import Document
+
+    doc = Document(html)
+    text = _html_to_text(doc.summary())["text"]
+    return {"title": doc.short_title() or doc.title(), "content": text}
+
+
+def _extract_basic(html: str, url: str, options: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    data = _html_to_text(html)
+    return {"title": data["title"], "content": data["text"]}
+
+
+EXTRACTORS = {
+    "trafilatura": _extract_trafilatura,
+    "newspaper": _extract_newspaper,
+    "readability": _extract_readability,
+    "basic": _extract_basic,
+}
+
+
+def extract_content(html: str, url: str, extractors: Sequence[str] = DEFAULT_EXTRACTORS,
+                    options: Optional[Dict[str, Any]] = None,
+                    pick: str = "first") -> Optional[Dict[str, Any]]:
+    """对HTML依次尝试各提取器
+
+    未安装依赖或提取失败的提取器被跳过。此函数在进程池中执行，参数和返回值都需可序列化。
+
+    Args:
+        html: 网页HTML
+        url: 网页URL
+        extractors: 提取器名称，按优先级排列
+        options: 提取器选项，如 {"language": "zh"}
+        pick: "first" 返回第一个提取到正文的结果，"longest" 返回正文最长的结果
+
+    Returns:
+        Optional[Dict[str, Any]]: ContentItem字段，source_tool为使用的提取器
+    """
+    options = options or {}
+    best = None
+    for name in extractors:
+        extractor = EXTRACTORS.get(name)
+        if extractor is None:
+            continue
+        try:
+            data = extractor(html, url, options)
+        except ImportError:
+            continue
+        except Exception as e:
+            logger.debug(f"{name} 提取失败 {url}: {str(e)}")
+            continue
+        if not data or not data.get("content"):
+            continue
+        data["source_tool"] = name
+        if pick == "first":
+            return data
+        if best is None or len(data["content"]) > len(best["content"]):
+            best = data
+    return best
+
+
+# ---------------------------------------------------------------------------
+# 磁盘缓存
+# ---------------------------------------------------------------------------
+
+@dataclass
+class CachedPage:
+    """缓存的原始网页"""
+    url: str
+    body: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    encoding: Optional[str] = None
+    fetched_at: float = field(default_factory=time.time)
+
+    def is_fresh(self, ttl: float) -> bool:
+        """是否在有效期内"""
+        return time.time() - self.fetched_at < ttl
+
+    @property
+    def text(self) -> str:
+        """按响应编码解码的HTML"""
+        return self.body.decode(self.encoding or "utf-8", errors="replace")
+
+
+class HtmlCache:
+    """原始HTML磁盘缓存
+
+    每个URL对应 ``<sha256>.html`` 和记录ETag、Last-Modified、抓取时间的 ``<sha256>.json``。
+    """
+
+    def __init__(self, cache_dir: str = CONTENT_CACHE_DIR):
+        """初始化缓存
+
+        Args:
+            cache_dir: 缓存目录
+        """
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.html"), os.path.join(self.cache_dir, f"{key}.json")
+
+    def load(self, url: str) -> Optional[CachedPage]:
+        """读取缓存
+
+        Args:
+            url: 网页URL
+
+        Returns:
+            Optional[CachedPage]: 缓存的网页，不存在时返回None
+        """
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        return CachedPage(url=url, body=body, etag=meta.get("etag"), last_modified=meta.get("last_modified"),
+                          encoding=meta.get("encoding"), fetched_at=meta.get("fetched_at", 0))
+
+    def store(self, page: CachedPage, body_changed: bool = True) -> None:
+        """写入缓存，先写临时文件再替换，避免读到写了一半的文件
+
+        Args:
+            page: 网页
+            body_changed: 为False时只更新元数据（304响应）
+        """
+        body_path, meta_path = self._paths(page.url)
+        if body_changed:
+            self._write(body_path, page.body)
+        meta = {"url": page.url, "etag": page.etag, "last_modified": page.last_modified,
+                "encoding": page.encoding, "fetched_at": page.fetched_at}
+        self._write(meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+
+    @staticmethod
+    def _write(path: str, data: bytes) -> None:
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+
+# ---------------------------------------------------------------------------
+# 抓取器
+# ---------------------------------------------------------------------------
+
+class _HostState:
+    """单个站点的robots规则和请求节奏"""
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.next_request = 0.0
+        self.robots: Optional[RobotFileParser] = None
+        self.robots_loaded = False
+
+
+class ContentFetcher:
+    """异步网页抓取器"""
+
+    # 类级别缓存
+    _instance: ClassVar[Optional['ContentFetcher']] = None
+
+    @classmethod
+    def get_instance(cls) -> 'ContentFetcher':
+        """获取抓取器实例（单例模式）
+
+        Returns:
+            ContentFetcher: 抓取器实例
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def clear_cache(cls):
+        """清除缓存的实例"""
+        cls._instance = None
+
+    def __init__(self, cache_dir: str = CONTENT_CACHE_DIR, cache_ttl: float = CONTENT_CACHE_TTL,
+                 host_interval: float = FETCH_HOST_INTERVAL, respect_robots: bool = FETCH_RESPECT_ROBOTS,
+                 timeout: float = FETCH_TIMEOUT, retries: int = FETCH_RETRIES,
+                 executor: Optional[Executor] = None, user_agent: str = FETCH_USER_AGENT):
+        """初始化抓取器
+
+        Args:
+            cache_dir: HTML缓存目录
+            cache_ttl: 缓存有效期（秒）
+            host_interval: 同一站点相邻请求的最小间隔（秒）
+            respect_robots: 是否遵守robots.txt
+            timeout: 单次请求超时（秒）
+            retries: 网络错误和5xx响应的重试次数
+            executor: 正文提取使用的执行器，默认按需创建进程池
+            user_agent: 请求使用的User-Agent
+        """
+        self.cache = HtmlCache(cache_dir)
+        self.cache_ttl = cache_ttl
+        self.host_interval = host_interval
+        self.respect_robots = respect_robots
+        self.timeout = timeout
+        self.retries = retries
+        self.user_agent = user_agent
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._session = None
+        self._session_loop = None
+        self._hosts: Dict[str, _HostState] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.stats = {
+            "requests": 0, "cache_hits": 0, "not_modified": 0, "robots_blocked": 0,
+            "errors": 0, "bytes": 0, "extractions": 0,
+        }
+
+    async def _get_session(self):
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            # 事件循环变化时先关闭旧会话，避免其连接池泄漏
+            await self._close_session()
+            try:
+                import aiohttp
+            except ImportError as e:
+                raise ImportError("网页抓取需要安装 aiohttp: pip install aiohttp") from e
+            connector = aiohttp.TCPConnector(
+                limit=FETCH_MAX_CONNECTIONS,
+                limit_per_host=FETCH_MAX_PER_HOST,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"User-Agent": self.user_agent},
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def _close_session(self) -> None:
+        """关闭当前HTTP会话
+
+        会话只能在创建它的事件循环中关闭：该循环仍在其他线程运行时投递到该循环关闭，
+        已经结束时在当前循环中尽量释放连接。
+        """
+        session, loop = self._session, self._session_loop
+        self._session = None
+        self._session_loop = None
+        if session is None or session.closed:
+            return
+        if loop is not None and loop is not asyncio.get_running_loop() and loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+        try:
+            await session.close()
+        except Exception as e:
+            logger.debug(f"关闭旧HTTP会话失败: {str(e)}")
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=FETCH_WORKERS or None)
+        return self._executor
+
+    def _host_state(self, url: str) -> _HostState:
+        parts = urlsplit(url)
+        host = f"{parts.scheme}://{parts.netloc}".lower()
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState()
+        return state
+
+    async def _allowed(self, url: str, state: _HostState) -> bool:
+        """检查robots.txt是否允许抓取，每个站点只下载一次robots.txt"""
+        if not self.respect_robots:
+            return True
+        if not state.robots_loaded:
+            async with state.lock:
+                if not state.robots_loaded:
+                    state.robots = await self._load_robots(url)
+                    state.robots_loaded = True
+        return state.robots is None or state.robots.can_fetch(self.user_agent, url)
+
+    async def _load_robots(self, url: str) -> Optional[RobotFileParser]:
+        parts = urlsplit(url)
+        robots_url = f"{parts.scheme}://{parts.netloc}/robots.txt"
+        try:
+            session = await self._get_session()
+            async with session.get(robots_url) as response:
+                if response.status != 200:
+                    return None
+                text = await response.text(errors="replace")
+        except Exception as e:
+            logger.debug(f"获取robots.txt失败 {robots_url}: {str(e)}")
+            return None
+        parser = RobotFileParser(robots_url)
+        parser.parse(text.splitlines())
+        return parser
+
+    async def _wait_turn(self, state: _HostState) -> None:
+        """同一站点的请求按间隔依次发出，Crawl-delay大于配置间隔时以Crawl-delay为准"""
+        interval = self.host_interval
+        if state.robots is not None:
+            interval = max(interval, float(state.robots.crawl_delay(self.user_agent) or 0))
+        if interval <= 0:
+            return
+        async with state.lock:
+            now = time.monotonic()
+            delay = state.next_request - now
+            state.next_request = max(now, state.next_request) + interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def fetch(self, url: str) -> Optional[CachedPage]:
+        """获取网页原始内容，优先使用缓存，相同URL的并发请求只下载一次
+
+        Args:
+            url: 网页URL
+
+        Returns:
+            Optional[CachedPage]: 网页，下载失败或robots.txt禁止时返回None
+        """
+        inflight = self._inflight.get(url)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[url] = future
+        try:
+            page = await self._fetch(url)
+            future.set_result(page)
+            return page
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(url, None)
+
+    async def _fetch(self, url: str) -> Optional[CachedPage]:
+        cached = await asyncio.to_thread(self.cache.load, url)
+        if cached is not None and cached.is_fresh(self.cache_ttl):
+            self.stats["cache_hits"] += 1
+            return cached
+
+        state = self._host_state(url)
+        if not await self._allowed(url, state):
+            self.stats["robots_blocked"] += 1
+            logger.info(f"robots.txt禁止抓取: {url}")
+            return None
+
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        session = await self._get_session()
+        for attempt in range(self.retries + 1):
+            await self._wait_turn(state)
+            self.stats["requests"] += 1
+            try:
+                async with session.get(url, headers=headers) as response:
+                    if response.status == 304 and cached is not None:
+                        self.stats["not_modified"] += 1
+                        cached.fetched_at = time.time()
+                        await asyncio.to_thread(self.cache.store, cached, False)
+                        return cached
+                    if response.status >= 500 and attempt < self.retries:
+                        raise RuntimeError(f"HTTP {response.status}")
+                    if response.status >= 400:
+                        self.stats["errors"] += 1
+                        logger.warning(f"抓取失败 {url}: HTTP {response.status}")
+                        return None
+                    body = await response.read()
+                    page = CachedPage(
+                        url=url,
+                        body=body,
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                        encoding=response.charset,
+                    )
+            except Exception as e:
+                if attempt < self.retries:
+                    await asyncio.sleep(0.5 * 2 ** attempt)
+                    continue
+                self.stats["errors"] += 1
+                logger.warning(f"抓取失败 {url}: {str(e)}")
+                return None
+
+            self.stats["bytes"] += len(page.body)
+            await asyncio.to_thread(self.cache.store, page)
+            return page
+        return None
+
+    async def extract(self, page: CachedPage, extractors: Sequence[str] = DEFAULT_EXTRACTORS,
+                      options: Optional[Dict[str, Any]] = None, pick: str = "first") -> Optional[ContentItem]:
+        """在执行器中从网页提取正文
+
+        Args:
+            page: 网页
+            extractors: 提取器名称，按优先级排列
+            options: 提取器选项
+            pick: "first" 或 "longest"，见 extract_content
+
+        Returns:
+            Optional[ContentItem]: 提取结果
+        """
+        loop = asyncio.get_running_loop()
+        self.stats["extractions"] += 1
+        data = await loop.run_in_executor(
+            self._get_executor(), extract_content, page.text, page.url, tuple(extractors), options or {}, pick
+        )
+        if data is None:
+            return None
+        return ContentItem(url=page.url, **data)
+
+    async def get_content(self, url: str, extractors: Sequence[str] = DEFAULT_EXTRACTORS,
+                          options: Optional[Dict[str, Any]] = None, pick: str = "first") -> Optional[ContentItem]:
+        """下载（或读取缓存）并提取网页正文
+
+        Args:
+            url: 网页URL
+            extractors: 提取器名称，按优先级排列
+            options: 提取器选项，如 {"language": "zh"}
+            pick: "first" 或 "longest"，见 extract_content
+
+        Returns:
+            Optional[ContentItem]: 提取结果，失败时返回None
+        """
+        page = await self.fetch(url)
+        if page is None:
+            return None
+        return await self.extract(page, extractors, options, pick)
+
+    async def get_contents(self, urls: Sequence[str], extractors: Sequence[str] = DEFAULT_EXTRACTORS,
+                           options: Optional[Dict[str, Any]] = None, pick: str = "first",
+                           concurrency: int = FETCH_CONCURRENCY) -> List[Optional[ContentItem]]:
+        """批量获取网页正文，下载和提取并发进行
+
+        Args:
+            urls: 网页URL列表
+            extractors: 提取器名称，按优先级排列
+            options: 提取器选项
+            pick: "first" 或 "longest"，见 extract_content
+            concurrency: 同时处理的URL数上限
+
+        Returns:
+            List[Optional[ContentItem]]: 与urls顺序一致的结果，失败的位置为None
+        """
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def run(url: str) -> Optional[ContentItem]:
+            async with semaphore:
+                try:
+                    return await self.get_content(url, extractors, options, pick)
+                except Exception as e:
+                    logger.error(f"获取内容失败 {url}: {str(e)}")
+                    return None
+
+        return list(await asyncio.gather(*(run(url) for url in urls)))
+
+    async def close(self) -> None:
+        """关闭HTTP会话和自建的进程池"""
+        await self._close_session()
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -4,6 +4,7 @@
 主要用于分析热点话题数据之间的关系。
 """
 
-from .topic_kg import TopicKnowledgeGraph
+from .kg_store import KnowledgeGraphStore, normalize_entity_name
+from .topic_kg import TopicKnowledgeGraph, update_knowledge_graph
 
-__all__ = ["TopicKnowledgeGraph"]
+__all__ = ["TopicKnowledgeGraph", "KnowledgeGraphStore", "normalize_entity_name", "update_knowledge_graph"]
@@ -0,0 +1,364 @@
+"""话题知识图谱存储
+
+基于SQLite的邻接表存储，替代进程内的实体字典和关系列表：
+
+- entities: 实体，按规范化名称去重（同一实体在不同话题中出现只存一份）
+- topics: 已处理的话题，用于增量更新时跳过已抽取过的话题
+- topic_entities: 话题与实体的关联，按实体建索引，"相关话题"查询即两次索引查找
+- relations: 实体间关系，(source_id, target_id, type) 唯一，重复出现时保留最高可信度
+
+默认数据库为 data/topic_kg.db，可通过环境变量 TOPIC_KG_DB_PATH 修改，测试中可用 ":memory:"。
+"""
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 知识图谱数据库路径
+TOPIC_KG_DB_PATH = os.environ.get(
+    "TOPIC_KG_DB_PATH",
+    str(Path(__file__).parent.parent.parent.parent / "data" / "topic_kg.db")
+)
+
+# 名称两端去除的标点和引号
+_STRIP_CHARS = " \t\r\n\"'“”‘’《》「」『』【】()（）[]<>#·.,，。:：;；!！?？"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entities (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    source TEXT,
+    first_seen INTEGER NOT NULL,
+    last_seen INTEGER NOT NULL,
+    mentions INTEGER NOT NULL DEFAULT 1
+);
+CREATE TABLE IF NOT EXISTS topics (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    platform TEXT,
+    first_seen INTEGER NOT NULL,
+    last_seen INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS topic_entities (
+    topic_id TEXT NOT NULL,
+    entity_id TEXT NOT NULL,
+    PRIMARY KEY (topic_id, entity_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_topic_entities_entity ON topic_entities(entity_id, topic_id);
+CREATE TABLE IF NOT EXISTS relations (
+    source_id TEXT NOT NULL,
+    target_id TEXT NOT NULL,
+    type TEXT NOT NULL,
+    confidence REAL NOT NULL,
+    timestamp INTEGER NOT NULL,
+    PRIMARY KEY (source_id, target_id, type)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_relations_target ON relations(target_id);
+"""
+
+
+def normalize_entity_name(name: str) -> str:
+    """规范化实体名称，作为去重键
+
+    全角转半角（NFKC）、去掉两端的引号书名号等标点、合并空白并转为casefold形式。
+
+    Args:
+        name: 实体名称
+
+    Returns:
+        str: 规范化后的名称
+    """
+    text = unicodedata.normalize("NFKC", name or "")
+    text = re.sub(r"\s+", " ", text).strip(_STRIP_CHARS)
+    return text.casefold()
+
+
+def topic_key(topic: Dict[str, Any]) -> str:
+    """计算话题ID：优先使用话题自带的id，否则使用标题的MD5（与热点缓存的标题哈希一致）
+
+    Args:
+        topic: 话题数据
+
+    Returns:
+        str: 话题ID
+    """
+    if topic.get("id"):
+        return str(topic["id"])
+    return hashlib.md5(topic.get("title", "").encode("utf-8")).hexdigest()
+
+
+class KnowledgeGraphStore:
+    """基于SQLite的知识图谱存储
+
+    单个连接加锁使用，写操作批量在一个事务中完成。
+    """
+
+    def __init__(self, db_path: str = TOPIC_KG_DB_PATH):
+        """初始化存储
+
+        Args:
+            db_path: 数据库路径，":memory:" 表示内存数据库
+        """
+        self.db_path = db_path
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        if db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # 写入
+    # ------------------------------------------------------------------
+
+    def known_topics(self, topic_ids: Iterable[str]) -> set:
+        """返回已处理过的话题ID
+
+        Args:
+            topic_ids: 话题ID
+
+        Returns:
+            set: 其中已存在的话题ID
+        """
+        ids = list(topic_ids)
+        known = set()
+        with self._lock:
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT id FROM topics WHERE id IN ({','.join('?' * len(chunk))})", chunk
+                ).fetchall()
+                known.update(row["id"] for row in rows)
+        return known
+
+    def touch_topics(self, topic_ids: Iterable[str], timestamp: Optional[int] = None) -> None:
+        """更新已知话题的最近出现时间
+
+        Args:
+            topic_ids: 话题ID
+            timestamp: 时间戳，默认当前时间
+        """
+        now = timestamp or int(time.time())
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE topics SET last_seen = MAX(last_seen, ?) WHERE id = ?",
+                [(now, topic_id) for topic_id in topic_ids]
+            )
+
+    def add_topic(self, topic_id: str, title: str, platform: Optional[str],
+                  entities: List[Dict[str, Any]], relations: List[Dict[str, Any]],
+                  timestamp: Optional[int] = None) -> List[str]:
+        """写入一个话题及其实体和关系
+
+        实体按规范化名称合并：已存在的实体只增加出现次数并更新最近出现时间。
+
+        Args:
+            topic_id: 话题ID
+            title: 话题标题
+            platform: 话题来源平台
+            entities: 实体，包含 name、type，可选 source
+            relations: 关系，包含 source、target（实体名称）、type、confidence
+            timestamp: 话题时间戳，默认当前时间
+
+        Returns:
+            List[str]: 话题关联的实体ID
+        """
+        now = timestamp or int(time.time())
+        entity_rows: Dict[str, Tuple] = {}
+        for entity in entities:
+            entity_id = normalize_entity_name(entity.get("name", ""))
+            if not entity_id or entity_id in entity_rows:
+                continue
+            entity_rows[entity_id] = (
+                entity_id, entity["name"].strip(), entity.get("type") or "未知",
+                entity.get("source"), now, now
+            )
+
+        relation_rows = []
+        for relation in relations:
+            source_id = normalize_entity_name(relation.get("source", ""))
+            target_id = normalize_entity_name(relation.get("target", ""))
+            if source_id in entity_rows and target_id in entity_rows and source_id != target_id:
+                relation_rows.append((source_id, target_id, relation.get("type") or "相关",
+                                      float(relation.get("confidence", 0.5)), now))
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO topics (id, title, platform, first_seen, last_seen) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET last_seen = MAX(last_seen, excluded.last_seen)",
+                (topic_id, title, platform, now, now)
+            )
+            self._conn.executemany(
+                "INSERT INTO entities (id, name, type, source, first_seen, last_seen) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET mentions = mentions + 1, "
+                "last_seen = MAX(last_seen, excluded.last_seen)",
+                list(entity_rows.values())
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO topic_entities (topic_id, entity_id) VALUES (?, ?)",
+                [(topic_id, entity_id) for entity_id in entity_rows]
+            )
+            self._conn.executemany(
+                "INSERT INTO relations (source_id, target_id, type, confidence, timestamp) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(source_id, target_id, type) DO UPDATE SET "
+                "confidence = MAX(confidence, excluded.confidence), timestamp = excluded.timestamp",
+                relation_rows
+            )
+        return list(entity_rows)
+
+    # ------------------------------------------------------------------
+    # 查询
+    # ------------------------------------------------------------------
+
+    def get_entity(self, name: str) -> Optional[Dict[str, Any]]:
+        """按名称查找实体（规范化后匹配）
+
+        Args:
+            name: 实体名称
+
+        Returns:
+            Optional[Dict[str, Any]]: 实体
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM entities WHERE id = ?", (normalize_entity_name(name),)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def topic_entities(self, topic_id: str) -> List[Dict[str, Any]]:
+        """获取话题关联的实体
+
+        Args:
+            topic_id: 话题ID
+
+        Returns:
+            List[Dict[str, Any]]: 实体列表
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT e.* FROM topic_entities te JOIN entities e ON e.id = te.entity_id "
+                "WHERE te.topic_id = ? ORDER BY e.mentions DESC", (topic_id,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def related_topics(self, topic_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """查找与话题共享实体的其他话题
+
+        按共享实体的权重之和排序，出现在越少话题中的实体权重越高（1/出现次数），
+        避免"中国"这类高频实体主导结果。
+
+        Args:
+            topic_id: 话题ID
+            limit: 返回数量上限
+
+        Returns:
+            List[Dict[str, Any]]: 相关话题，包含 score 和 shared_entities
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT t.id, t.title, t.platform, t.last_seen,
+                       SUM(1.0 / e.mentions) AS score,
+                       GROUP_CONCAT(e.name, '、') AS shared_entities
+                FROM topic_entities mine
+                JOIN topic_entities other
+                  ON other.entity_id = mine.entity_id AND other.topic_id != mine.topic_id
+                JOIN entities e ON e.id = mine.entity_id
+                JOIN topics t ON t.id = other.topic_id
+                WHERE mine.topic_id = ?
+                GROUP BY t.id
+                ORDER BY score DESC, t.last_seen DESC
+                LIMIT ?
+                """,
+                (topic_id, limit)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def related_entities(self, name: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """查找与实体直接相关的实体（双向关系）
+
+        Args:
+            name: 实体名称
+            limit: 返回数量上限
+
+        Returns:
+            List[Dict[str, Any]]: 相关实体，包含 relation 和 confidence
+        """
+        entity_id = normalize_entity_name(name)
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT e.*, r.type AS relation, r.confidence FROM relations r
+                JOIN entities e ON e.id = r.target_id WHERE r.source_id = ?
+                UNION ALL
+                SELECT e.*, r.type AS relation, r.confidence FROM relations r
+                JOIN entities e ON e.id = r.source_id WHERE r.target_id = ?
+                ORDER BY confidence DESC
+                LIMIT ?
+                """,
+                (entity_id, entity_id, limit)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def find_topic(self, title: str) -> Optional[str]:
+        """按标题查找话题ID，先精确匹配再做子串匹配
+
+        Args:
+            title: 话题标题或其中一部分
+
+        Returns:
+            Optional[str]: 话题ID
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT id FROM topics WHERE title = ?", (title,)).fetchone()
+            if row is None:
+                row = self._conn.execute(
+                    "SELECT id FROM topics WHERE instr(title, ?) > 0 ORDER BY last_seen DESC LIMIT 1", (title,)
+                ).fetchone()
+        return row["id"] if row else None
+
+    def export(self) -> Dict[str, List[Dict[str, Any]]]:
+        """导出全部实体和关系
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: {"entities": [...], "relations": [...]}
+        """
+        with self._lock:
+            entities = [dict(row) for row in self._conn.execute("SELECT * FROM entities")]
+            relations = [dict(row) for row in self._conn.execute("SELECT * FROM relations")]
+        return {"entities": entities, "relations": relations}
+
+    def get_stats(self) -> Dict[str, int]:
+        """获取统计信息
+
+        Returns:
+            Dict[str, int]: 话题、实体、关联和关系数量
+        """
+        with self._lock:
+            return {
+                table: self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("topics", "entities", "topic_entities", "relations")
+            }
+
+    def clear(self) -> None:
+        """清空全部数据"""
+        with self._lock, self._conn:
+            for table in ("topic_entities", "relations", "entities", "topics"):
+                self._conn.execute(f"DELETE FROM {table}")
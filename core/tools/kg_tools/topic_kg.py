@@ -1,16 +1,37 @@
 """话题知识图谱工具
 
 实验性功能：构建热点话题的知识图谱。
-使用外部 API (如 Dify) 进行实体识别和关系抽取。
+使用外部 API (如 Dify) 进行实体识别和关系抽取，结果持久化到 SQLite（见 kg_store.py）。
+
+抽取按批进行：一次请求处理 KG_BATCH_SIZE 个话题，同时返回实体和关系，多个批次并发发送，
+共用一个HTTP连接池。已处理过的话题不会重复抽取，每次热点更新后只处理新出现的话题。
 """
+import asyncio
 import logging
-from typing import Dict, List, Optional, Tuple
+import os
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 import httpx
 from pydantic import BaseModel, Field
 
+from .kg_store import KnowledgeGraphStore, TOPIC_KG_DB_PATH, normalize_entity_name, topic_key
+
 logger = logging.getLogger(__name__)
 
+# 每次请求抽取的话题数
+KG_BATCH_SIZE = int(os.environ.get("KG_BATCH_SIZE", 20))
+
+# 同时进行的抽取请求数
+KG_CONCURRENCY = int(os.environ.get("KG_CONCURRENCY", 4))
+
+# 抽取请求超时（秒）
+KG_TIMEOUT = float(os.environ.get("KG_TIMEOUT", 60))
+
+# 外部抽取API，热点更新时据此决定是否增量更新知识图谱
+TOPIC_KG_API_ENDPOINT = os.environ.get("TOPIC_KG_API_ENDPOINT")
+TOPIC_KG_API_KEY = os.environ.get("TOPIC_KG_API_KEY", "")
+
+
 class Entity(BaseModel):
     """实体模型"""
     id: str
@@ -19,6 +40,7 @@ class Entity(BaseModel):
     source: str = Field(description="实体来源（话题标题/描述）")
     timestamp: int = Field(description="首次发现时间")
 
+
 class Relation(BaseModel):
     """关系模型"""
     source_id: str
@@ -27,6 +49,7 @@ class Relation(BaseModel):
     confidence: float = Field(ge=0.0, le=1.0)
     timestamp: int
 
+
 class TopicKnowledgeGraph:
     """话题知识图谱
 
@@ -40,81 +63,183 @@ class TopicKnowledgeGraph:
     生产环境建议使用专门的图数据库和知识图谱服务。
     """
 
-    def __init__(self, api_endpoint: str, api_key: str):
+    def __init__(self, api_endpoint: str, api_key: str, store: Optional[KnowledgeGraphStore] = None,
+                 db_path: str = TOPIC_KG_DB_PATH, batch_size: int = KG_BATCH_SIZE,
+                 concurrency: int = KG_CONCURRENCY):
         """初始化知识图谱工具
 
         Args:
             api_endpoint: 外部API地址（如Dify API）
             api_key: API密钥
+            store: 知识图谱存储，默认打开 db_path
+            db_path: SQLite数据库路径
+            batch_size: 每次请求抽取的话题数
+            concurrency: 同时进行的抽取请求数
         """
         self.api_endpoint = api_endpoint
         self.api_key = api_key
-        self.entities: Dict[str, Entity] = {}
-        self.relations: List[Relation] = []
-
-    async def extract_entities(self, topic: Dict) -> List[Entity]:
-        """从话题中提取实体
+        self.store = store or KnowledgeGraphStore(db_path)
+        self.batch_size = max(batch_size, 1)
+        self.concurrency = max(concurrency, 1)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self) -> "TopicKnowledgeGraph":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.api_endpoint,
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=KG_TIMEOUT,
+                limits=httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """关闭HTTP连接池"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+    async def _complete(self, prompt: str, temperature: float) -> Optional[str]:
+        """调用外部API，失败时返回None"""
+        response = await self._get_client().post(
+            "/completion",
+            json={
+                "prompt": prompt,
+                "temperature": temperature
+            }
+        )
+        if response.status_code != 200:
+            logger.error(f"API调用失败: {response.status_code}")
+            return None
+        return response.json()["text"]
+
+    async def extract_batch(self, topics: List[Dict]) -> Dict[int, Tuple[List[Dict], List[Dict]]]:
+        """一次请求从多个话题中抽取实体和关系
 
         Args:
-            topic: 话题数据
+            topics: 话题数据列表
 
         Returns:
-            List[Entity]: 识别出的实体列表
+            Dict[int, Tuple[List[Dict], List[Dict]]]: 话题下标 -> (实体列表, 关系列表)，
+            实体包含 name、type、source，关系包含 source、target、type、confidence
         """
-        # 构建提示词
-        title = topic.get("title", "")
-        desc = topic.get("description", "")
-        prompt = f"""请从以下文本中识别重要实体（人物、组织、地点、事件等），格式要求：
-        - 每行一个实体
-        - 实体类型用[]标注
-        - 示例：张三[人物]
-
-        文本内容：
-        标题：{title}
-        描述：{desc}
+        lines = []
+        for i, topic in enumerate(topics, 1):
+            lines.append(f"{i}. 标题：{topic.get('title', '')}")
+            if topic.get("description"):
+                lines.append(f"   描述：{topic['description']}")
+        prompt = f"""请从以下每个话题中识别重要实体（人物、组织、地点、事件等），并分析同一话题内实体之间的关系。格式要求：
+        - 每行一条结果，不要输出其他内容
+        - 实体行：E|话题编号|实体名称|实体类型，示例：E|1|张三|人物
+        - 关系行：R|话题编号|实体1|关系类型|实体2|可信度，可信度范围0.0-1.0，示例：R|1|张三|隶属于|某公司|0.9
+
+        话题列表：
+        {chr(10).join(lines)}
         """
 
+        results: Dict[int, Tuple[List[Dict], List[Dict]]] = {i: ([], []) for i in range(len(topics))}
         try:
-            # 调用外部API进行实体识别
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.api_endpoint}/completion",
-                    headers={"Authorization": f"Bearer {self.api_key}"},
-                    json={
-                        "prompt": prompt,
-                        "temperature": 0.1
-                    }
-                )
-
-                if response.status_code != 200:
-                    logger.error(f"API调用失败: {response.status_code}")
-                    return []
-
-                # 解析返回的实体
-                entities = []
-                for line in response.json()["text"].split("\n"):
-                    if not line.strip():
-                        continue
-                    try:
-                        name, type_str = line.split("[")
-                        entity_type = type_str.rstrip("]")
-                        entity = Entity(
-                            id=f"{name}_{len(self.entities)}",
-                            name=name.strip(),
-                            type=entity_type,
-                            source="title" if name in title else "description",
-                            timestamp=topic.get("timestamp", int(datetime.now().timestamp()))
-                        )
-                        entities.append(entity)
-                    except Exception as e:
-                        logger.warning(f"实体解析失败: {e}, 原文: {line}")
-                        continue
-
-                return entities
-
+            text = await self._complete(prompt, 0.1)
         except Exception as e:
             logger.error(f"实体提取失败: {e}")
-            return []
+            return results
+        if not text:
+            return results
+
+        for line in text.split("\n"):
+            parts = [part.strip() for part in line.strip().split("|")]
+            if len(parts) < 4:
+                continue
+            try:
+                index = int(parts[1]) - 1
+                if index not in results:
+                    continue
+                entities, relations = results[index]
+                if parts[0] == "E" and parts[2]:
+                    title = topics[index].get("title", "")
+                    entities.append({
+                        "name": parts[2],
+                        "type": parts[3] or "未知",
+                        "source": "title" if parts[2] in title else "description",
+                    })
+                elif parts[0] == "R" and len(parts) >= 6:
+                    relations.append({
+                        "source": parts[2],
+                        "type": parts[3],
+                        "target": parts[4],
+                        "confidence": min(max(float(parts[5]), 0.0), 1.0),
+                    })
+            except (ValueError, IndexError) as e:
+                logger.warning(f"抽取结果解析失败: {e}, 原文: {line}")
+        return results
+
+    async def process_topics(self, topics: List[Dict]) -> Dict[str, int]:
+        """增量处理话题：跳过已处理过的话题，新话题按批并发抽取并写入存储
+
+        Args:
+            topics: 话题数据列表
+
+        Returns:
+            Dict[str, int]: 新处理、跳过的话题数以及写入的实体、关系数
+        """
+        unique: Dict[str, Dict] = {}
+        for topic in topics:
+            if topic.get("title"):
+                unique.setdefault(topic_key(topic), topic)
+
+        known = self.store.known_topics(unique)
+        if known:
+            self.store.touch_topics(known)
+        pending = [(topic_id, topic) for topic_id, topic in unique.items() if topic_id not in known]
+        stats = {"processed": 0, "skipped": len(known), "entities": 0, "relations": 0}
+        if not pending:
+            return stats
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        batches = [pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size)]
+
+        async def run(batch):
+            async with semaphore:
+                return batch, await self.extract_batch([topic for _, topic in batch])
+
+        for batch, results in await asyncio.gather(*(run(batch) for batch in batches)):
+            for index, (topic_id, topic) in enumerate(batch):
+                entities, relations = results.get(index, ([], []))
+                if not entities:
+                    # 抽取失败的话题不记为已处理，下次更新时重试
+                    continue
+                timestamp = topic.get("timestamp") or topic.get("source_time")
+                self.store.add_topic(topic_id, topic["title"], topic.get("platform"), entities, relations,
+                                     int(timestamp) if timestamp else None)
+                stats["processed"] += 1
+                stats["entities"] += len(entities)
+                stats["relations"] += len(relations)
+
+        logger.info(f"知识图谱增量更新: {stats}")
+        return stats
+
+    async def extract_entities(self, topic: Dict) -> List[Entity]:
+        """从话题中提取实体
+
+        Args:
+            topic: 话题数据
+
+        Returns:
+            List[Entity]: 识别出的实体列表
+        """
+        entities, _ = (await self.extract_batch([topic]))[0]
+        timestamp = topic.get("timestamp", int(datetime.now().timestamp()))
+        return [
+            Entity(id=normalize_entity_name(e["name"]), name=e["name"], type=e["type"],
+                   source=e["source"], timestamp=timestamp)
+            for e in entities
+        ]
 
     async def analyze_relations(self, entities: List[Entity]) -> List[Relation]:
         """分析实体间的关系
@@ -141,51 +266,40 @@ class TopicKnowledgeGraph:
         """
 
         try:
-            # 调用外部API分析关系
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.api_endpoint}/completion",
-                    headers={"Authorization": f"Bearer {self.api_key}"},
-                    json={
-                        "prompt": prompt,
-                        "temperature": 0.2
-                    }
-                )
-
-                if response.status_code != 200:
-                    logger.error(f"API调用失败: {response.status_code}")
-                    return []
-
-                # 解析返回的关系
-                relations = []
-                entity_map = {e.name: e.id for e in entities}
-
-                for line in response.json()["text"].split("\n"):
-                    if not line.strip():
-                        continue
-                    try:
-                        source, rel_type, target, conf = line.split("|")
-                        if source.strip() in entity_map and target.strip() in entity_map:
-                            relation = Relation(
-                                source_id=entity_map[source.strip()],
-                                target_id=entity_map[target.strip()],
-                                type=rel_type.strip(),
-                                confidence=float(conf),
-                                timestamp=int(datetime.now().timestamp())
-                            )
-                            relations.append(relation)
-                    except Exception as e:
-                        logger.warning(f"关系解析失败: {e}, 原文: {line}")
-                        continue
-
-                return relations
+            text = await self._complete(prompt, 0.2)
+            if not text:
+                return []
+
+            # 解析返回的关系
+            relations = []
+            entity_map = {e.name: e.id for e in entities}
+
+            for line in text.split("\n"):
+                if not line.strip():
+                    continue
+                try:
+                    source, rel_type, target, conf = line.split("|")
+                    if source.strip() in entity_map and target.strip() in entity_map:
+                        relation = Relation(
+                            source_id=entity_map[source.strip()],
+                            target_id=entity_map[target.strip()],
+                            type=rel_type.strip(),
+                            confidence=float(conf),
+                            timestamp=int(datetime.now().timestamp())
+                        )
+                        relations.append(relation)
+                except Exception as e:
+                    logger.warning(f"关系解析失败: {e}, 原文: {line}")
+                    continue
+
+            return relations
 
         except Exception as e:
             logger.error(f"关系分析失败: {e}")
             return []
 
     async def process_topic(self, topic: Dict) -> Tuple[List[Entity], List[Relation]]:
-        """处理单个话题，提取实体和关系
+        """处理单个话题，提取实体和关系并写入存储
 
         Args:
             topic: 话题数据
@@ -193,20 +307,46 @@ class TopicKnowledgeGraph:
         Returns:
             Tuple[List[Entity], List[Relation]]: 识别出的实体和关系
         """
-        # 提取实体
-        entities = await self.extract_entities(topic)
+        results = await self.extract_batch([topic])
+        entities, relations = results[0]
         if not entities:
             return [], []
 
-        # 分析关系
-        relations = await self.analyze_relations(entities)
+        timestamp = topic.get("timestamp", int(datetime.now().timestamp()))
+        self.store.add_topic(topic_key(topic), topic.get("title", ""), topic.get("platform"),
+                             entities, relations, timestamp)
+
+        entity_models = [
+            Entity(id=normalize_entity_name(e["name"]), name=e["name"], type=e["type"],
+                   source=e["source"], timestamp=timestamp)
+            for e in entities
+        ]
+        known_ids = {e.id for e in entity_models}
+        relation_models = [
+            Relation(source_id=normalize_entity_name(r["source"]), target_id=normalize_entity_name(r["target"]),
+                     type=r["type"], confidence=r["confidence"], timestamp=timestamp)
+            for r in relations
+            if normalize_entity_name(r["source"]) in known_ids and normalize_entity_name(r["target"]) in known_ids
+        ]
+        return entity_models, relation_models
+
+    def related_topics(self, topic: Any, limit: int = 10) -> List[Dict]:
+        """查找与话题共享实体的其他话题
 
-        # 更新知识图谱
-        for entity in entities:
-            self.entities[entity.id] = entity
-        self.relations.extend(relations)
+        Args:
+            topic: 话题数据或话题标题
+            limit: 返回数量上限
 
-        return entities, relations
+        Returns:
+            List[Dict]: 相关话题，按相关度排序
+        """
+        if isinstance(topic, dict):
+            topic_id = topic_key(topic)
+        else:
+            topic_id = self.store.find_topic(str(topic))
+        if not topic_id:
+            return []
+        return self.store.related_topics(topic_id, limit)
 
     def get_graph_data(self) -> Dict:
         """获取知识图谱数据
@@ -214,12 +354,28 @@ class TopicKnowledgeGraph:
         Returns:
             Dict: 知识图谱数据，包含实体和关系
         """
-        return {
-            "entities": [e.dict() for e in self.entities.values()],
-            "relations": [r.dict() for r in self.relations]
-        }
+        return self.store.export()
 
     def clear(self):
         """清空知识图谱数据"""
-        self.entities.clear()
-        self.relations.clear()
+        self.store.clear()
+
+
+async def update_knowledge_graph(topics: List[Dict]) -> Optional[Dict[str, int]]:
+    """用一次热点更新的话题增量更新知识图谱
+
+    未配置 TOPIC_KG_API_ENDPOINT 时不做任何处理。
+
+    Args:
+        topics: 处理后的话题列表
+
+    Returns:
+        Optional[Dict[str, int]]: 更新统计，未启用时返回None
+    """
+    if not TOPIC_KG_API_ENDPOINT:
+        return None
+    async with TopicKnowledgeGraph(TOPIC_KG_API_ENDPOINT, TOPIC_KG_API_KEY) as kg:
+        try:
+            return await kg.process_topics(topics)
+        finally:
+            kg.store.close()
@@ -1,18 +1,35 @@
 """NLP工具模块
 
 包含文本处理、语言识别、摘要等NLP相关功能。"""
-from .processor import (
-    NLPAggregator,
-    ChineseNLPTool,
-    SummaTool,
-    YakeTool
-)
-from .text_utils import count_words
+
+from core.lazy_imports import lazy_exports
 
 __all__ = [
     'NLPAggregator',
     'ChineseNLPTool',
     'SummaTool',
     'YakeTool',
-    'count_words'
+    'count_words',
+    'Tokenizer',
+    'get_tokenizer',
+    'register_tokenizer',
+    'count_tokens',
+    'pack_to_budget',
+    'record_prompt',
+    'get_prompt_stats'
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "NLPAggregator": ".processor",
+    "ChineseNLPTool": ".processor",
+    "SummaTool": ".processor",
+    "YakeTool": ".processor",
+    "count_words": ".text_utils",
+    "Tokenizer": ".token_budget",
+    "get_tokenizer": ".token_budget",
+    "register_tokenizer": ".token_budget",
+    "count_tokens": ".token_budget",
+    "pack_to_budget": ".token_budget",
+    "record_prompt": ".token_budget",
+    "get_prompt_stats": ".token_budget",
+})
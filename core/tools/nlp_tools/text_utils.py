@@ -5,6 +5,10 @@
 import re
 from typing import Optional, Dict, List, Union
 
+from core.models.article.text_metrics import measure_text
+
+_HTML_TAG = re.compile(r'<[^>]+>')
+
 def count_words(text: Union[str, Dict, List], chinese_as_word: bool = True) -> int:
     """统计文本中的字数
 
@@ -22,19 +26,11 @@ def count_words(text: Union[str, Dict, List], chinese_as_word: bool = True) -> i
     if not text:
         return 0
 
-    # 处理字典
+    # 处理字典和列表
     if isinstance(text, dict):
-        count = 0
-        for value in text.values():
-            count += count_words(value, chinese_as_word)
-        return count
-
-    # 处理列表
+        return sum(count_words(value, chinese_as_word) for value in text.values())
     if isinstance(text, list):
-        count = 0
-        for item in text:
-            count += count_words(item, chinese_as_word)
-        return count
+        return sum(count_words(item, chinese_as_word) for item in text)
 
     # 确保是字符串
     if not isinstance(text, str):
@@ -43,24 +39,9 @@ def count_words(text: Union[str, Dict, List], chinese_as_word: bool = True) -> i
         except:
             return 0
 
-    # 移除HTML标签
-    text = re.sub(r'<[^>]+>', '', text)
-
-    # 移除多余空白
-    text = re.sub(r'\s+', ' ', text).strip()
-
-    if not text:
-        return 0
-
     if chinese_as_word:
-        # 中文每个字符算一个词
-        # 匹配CJK字符（中日韩文字）
-        chinese_chars = re.findall(r'[\u4e00-\u9fff\u3400-\u4dbf\u20000-\u2a6df\u2a700-\u2b73f\u2b740-\u2b81f\u2b820-\u2ceaf\uf900-\ufaff\u3300-\u33ff\ufe30-\ufe4f\uf900-\ufaff\ufe30-\ufe4f\u2f800-\u2fa1f]', text)
-
-        # 匹配非CJK单词
-        non_chinese_words = re.findall(r'[a-zA-Z0-9_\-\']+', text)
-
-        return len(chinese_chars) + len(non_chinese_words)
+        # 中日韩字符每个字算一个词，其他语言按词计，HTML标签和链接地址不计入
+        return measure_text(text).word_count
     else:
-        # 按空格分词统计
-        return len(text.split())
+        # 移除HTML标签后按空格分词统计
+        return len(_HTML_TAG.sub(' ', text).split())
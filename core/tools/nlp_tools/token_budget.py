@@ -0,0 +1,350 @@
+"""Token计数与预算
+
+为热点摘要、研究材料和各团队任务的提示词提供统一的token计数：
+
+- Tokenizer：token计数后端接口，默认使用 tiktoken 的BPE编码，未安装时退回近似计数
+- 计数结果按文本缓存（LRU），重复的话题、模板和研究片段不会重复编码
+- pack_to_budget：按优先级选择能放入token预算的条目
+- record_prompt：记录每个团队任务的提示词token数，便于统计成本和延迟
+
+环境变量：
+    TOKEN_COUNTER: 计数后端，auto（默认）、tiktoken、heuristic 或通过 register_tokenizer 注册的名称
+    TOKEN_MODEL: 默认模型名称，用于选择编码
+    TOKEN_ENCODING: 模型未知时使用的编码，默认 cl100k_base
+    TOKEN_CACHE_SIZE: 每个计数器缓存的文本数量
+    PROMPT_TOKEN_WARN: 提示词token数超过此值时输出警告
+"""
+import logging
+import math
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+TOKEN_COUNTER = os.environ.get("TOKEN_COUNTER", "auto")
+TOKEN_MODEL = os.environ.get("TOKEN_MODEL", "")
+TOKEN_ENCODING = os.environ.get("TOKEN_ENCODING", "cl100k_base")
+TOKEN_CACHE_SIZE = int(os.environ.get("TOKEN_CACHE_SIZE", "4096"))
+PROMPT_TOKEN_WARN = int(os.environ.get("PROMPT_TOKEN_WARN", "8000"))
+
+# 近似计数：中日韩字符每字1个token，字母串约4个字母1个token，数字每3位1个token，其他符号各1个token
+_HEURISTIC_TOKEN = re.compile(
+    "(?P<cjk>[\u3400-\u9fff\uf900-\ufaff\u3040-\u30ff\uac00-\ud7af])"
+    r"|(?P<word>[A-Za-z]+)"
+    r"|(?P<num>\d{1,3})"
+    r"|(?P<other>\S)"
+)
+
+
+class Tokenizer:
+    """token计数后端基类
+
+    子类实现 _count 和 truncate，count 会对结果做LRU缓存。
+    """
+
+    name = "base"
+
+    def __init__(self, cache_size: int = TOKEN_CACHE_SIZE):
+        """初始化
+
+        Args:
+            cache_size: 缓存的文本数量，0表示不缓存
+        """
+        self._cached_count = lru_cache(maxsize=cache_size)(self._count) if cache_size else self._count
+
+    def count(self, text: Optional[str]) -> int:
+        """计算文本的token数
+
+        Args:
+            text: 文本
+
+        Returns:
+            int: token数
+        """
+        if not text:
+            return 0
+        return self._cached_count(text)
+
+    def count_many(self, texts: Iterable[Optional[str]]) -> int:
+        """计算多段文本的token总数"""
+        return sum(self.count(text) for text in texts)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """截断文本使其不超过指定token数
+
+        Args:
+            text: 文本
+            max_tokens: 最大token数
+
+        Returns:
+            str: 截断后的文本
+        """
+        raise NotImplementedError
+
+    def _count(self, text: str) -> int:
+        raise NotImplementedError
+
+    def cache_info(self):
+        """计数缓存的命中情况"""
+        return self._cached_count.cache_info() if hasattr(self._cached_count, "cache_info") else None
+
+
+class TiktokenTokenizer(Tokenizer):
+    """基于 tiktoken BPE 编码的计数器"""
+
+    name = "tiktoken"
+
+    def __init__(self, model: Optional[str] = None, encoding: Optional[str] = None,
+                 cache_size: int = TOKEN_CACHE_SIZE):
+        """初始化
+
+        Args:
+            model: 模型名称（可带 openai/ 等前缀），用于选择编码
+            encoding: 编码名称，指定时忽略model
+            cache_size: 缓存的文本数量
+        """
+        try:
+            import tiktoken
+        except ImportError:
+            raise ImportError("使用BPE token计数需要安装 tiktoken: pip install tiktoken")
+
+        if encoding:
+            self.encoding = tiktoken.get_encoding(encoding)
+        elif model:
+            try:
+                self.encoding = tiktoken.encoding_for_model(model.split("/")[-1])
+            except KeyError:
+                self.encoding = tiktoken.get_encoding(TOKEN_ENCODING)
+        else:
+            self.encoding = tiktoken.get_encoding(TOKEN_ENCODING)
+        super().__init__(cache_size)
+
+    def encode(self, text: str) -> List[int]:
+        """编码文本，特殊token按普通文本处理"""
+        return self.encoding.encode(text, disallowed_special=())
+
+    def _count(self, text: str) -> int:
+        return len(self.encode(text))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        if max_tokens <= 0 or not text:
+            return ""
+        tokens = self.encode(text)
+        if len(tokens) <= max_tokens:
+            return text
+        # 截断位置可能落在多字节字符中间，去掉解码出的替换字符
+        return self.encoding.decode(tokens[:max_tokens]).rstrip("\ufffd")
+
+
+class HeuristicTokenizer(Tokenizer):
+    """不依赖分词器的近似计数器，结果与cl100k编码大致相当"""
+
+    name = "heuristic"
+
+    def __init__(self, model: Optional[str] = None, cache_size: int = TOKEN_CACHE_SIZE):
+        """初始化
+
+        Args:
+            model: 忽略，与其他后端保持相同的构造参数
+            cache_size: 缓存的文本数量
+        """
+        super().__init__(cache_size)
+
+    @staticmethod
+    def _token_cost(match: re.Match) -> int:
+        if match.lastgroup == "word":
+            return math.ceil((match.end() - match.start()) / 4)
+        return 1
+
+    def _count(self, text: str) -> int:
+        return sum(self._token_cost(match) for match in _HEURISTIC_TOKEN.finditer(text))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        if max_tokens <= 0 or not text:
+            return ""
+        used = 0
+        for match in _HEURISTIC_TOKEN.finditer(text):
+            used += self._token_cost(match)
+            if used > max_tokens:
+                return text[:match.start()].rstrip()
+        return text
+
+
+_BACKENDS: Dict[str, Callable[..., Tokenizer]] = {
+    TiktokenTokenizer.name: TiktokenTokenizer,
+    HeuristicTokenizer.name: HeuristicTokenizer,
+}
+_instances: Dict[Tuple[str, str], Tokenizer] = {}
+_instances_lock = threading.Lock()
+
+
+def register_tokenizer(name: str, factory: Callable[..., Tokenizer]) -> None:
+    """注册token计数后端
+
+    Args:
+        name: 后端名称，可通过 TOKEN_COUNTER 或 get_tokenizer(backend=name) 使用
+        factory: 接受 model 关键字参数并返回 Tokenizer 的可调用对象
+    """
+    with _instances_lock:
+        _BACKENDS[name] = factory
+        for key in [key for key in _instances if key[0] == name]:
+            del _instances[key]
+
+
+def get_tokenizer(backend: Optional[str] = None, model: Optional[str] = None) -> Tokenizer:
+    """获取（共享的）token计数器
+
+    auto 模式优先使用 tiktoken，不可用时退回近似计数。
+
+    Args:
+        backend: 后端名称，默认取 TOKEN_COUNTER
+        model: 模型名称，默认取 TOKEN_MODEL
+
+    Returns:
+        Tokenizer: token计数器
+    """
+    backend = backend or TOKEN_COUNTER
+    model = model or TOKEN_MODEL
+    key = (backend, model)
+    with _instances_lock:
+        tokenizer = _instances.get(key)
+        if tokenizer is not None:
+            return tokenizer
+
+        if backend == "auto":
+            try:
+                tokenizer = TiktokenTokenizer(model=model or None)
+            except Exception as e:
+                logger.warning(f"BPE分词器不可用，使用近似token计数: {e}")
+                tokenizer = HeuristicTokenizer()
+        else:
+            factory = _BACKENDS.get(backend)
+            if factory is None:
+                raise ValueError(f"未知的token计数后端: {backend}，可选: auto, {', '.join(_BACKENDS)}")
+            tokenizer = factory(model=model or None)
+
+        _instances[key] = tokenizer
+        return tokenizer
+
+
+def count_tokens(text: Optional[str], model: Optional[str] = None) -> int:
+    """使用默认计数器计算文本的token数
+
+    Args:
+        text: 文本
+        model: 模型名称
+
+    Returns:
+        int: token数
+    """
+    return get_tokenizer(model=model).count(text)
+
+
+@dataclass
+class BudgetPack:
+    """预算选择结果"""
+    items: List[Any]
+    tokens: int
+    budget: int
+    dropped: List[Any] = field(default_factory=list)
+
+    @property
+    def remaining(self) -> int:
+        """剩余的token预算"""
+        return self.budget - self.tokens
+
+
+def pack_to_budget(
+    items: Sequence[Any],
+    budget: int,
+    text: Callable[[Any], str] = str,
+    priority: Optional[Callable[[Any], float]] = None,
+    tokenizer: Optional[Tokenizer] = None,
+    item_overhead: int = 0,
+) -> BudgetPack:
+    """按优先级选择能放入token预算的条目
+
+    从优先级最高的条目开始放入，放不下的条目跳过，后面较短的条目仍可能放入。
+    返回的条目保持原有顺序。
+
+    Args:
+        items: 条目列表
+        budget: token预算
+        text: 取条目文本的函数
+        priority: 取条目优先级的函数（越大越优先），默认按原顺序
+        tokenizer: token计数器，默认使用共享计数器
+        item_overhead: 每个条目额外占用的token数（分隔符、格式等）
+
+    Returns:
+        BudgetPack: 选中的条目、使用的token数和未放入的条目
+    """
+    tokenizer = tokenizer or get_tokenizer()
+    costs = [tokenizer.count(text(item)) + item_overhead for item in items]
+    order = range(len(items))
+    if priority is not None:
+        # sorted 是稳定排序，优先级相同时保持原顺序
+        order = sorted(order, key=lambda i: priority(items[i]), reverse=True)
+
+    remaining = budget
+    chosen = set()
+    for index in order:
+        if costs[index] <= remaining:
+            chosen.add(index)
+            remaining -= costs[index]
+
+    return BudgetPack(
+        items=[item for index, item in enumerate(items) if index in chosen],
+        tokens=budget - remaining,
+        budget=budget,
+        dropped=[item for index, item in enumerate(items) if index not in chosen],
+    )
+
+
+_prompt_stats: Dict[str, Dict[str, int]] = {}
+_prompt_stats_lock = threading.Lock()
+
+
+def record_prompt(crew: str, task: str, *parts: Optional[str]) -> int:
+    """记录团队任务的提示词token数
+
+    Args:
+        crew: 团队名称
+        task: 任务名称
+        *parts: 提示词的各部分（任务描述、期望输出等）
+
+    Returns:
+        int: 提示词token数
+    """
+    tokens = get_tokenizer().count_many(part for part in parts if isinstance(part, str))
+    name = f"{crew}.{task}"
+    if tokens > PROMPT_TOKEN_WARN:
+        logger.warning(f"任务 {name} 提示词 {tokens} tokens，超过 {PROMPT_TOKEN_WARN}")
+    else:
+        logger.info(f"任务 {name} 提示词 {tokens} tokens")
+
+    with _prompt_stats_lock:
+        stats = _prompt_stats.setdefault(name, {"calls": 0, "tokens": 0, "max_tokens": 0})
+        stats["calls"] += 1
+        stats["tokens"] += tokens
+        stats["max_tokens"] = max(stats["max_tokens"], tokens)
+    return tokens
+
+
+def get_prompt_stats() -> Dict[str, Dict[str, int]]:
+    """获取各任务的提示词统计
+
+    Returns:
+        Dict[str, Dict[str, int]]: 任务名（团队.任务）到调用次数、token总数和最大token数的映射
+    """
+    with _prompt_stats_lock:
+        return {name: dict(stats) for name, stats in _prompt_stats.items()}
+
+
+def reset_prompt_stats() -> None:
+    """清空提示词统计"""
+    with _prompt_stats_lock:
+        _prompt_stats.clear()
@@ -1,11 +1,6 @@
 """审查工具包"""
-from .reviewer import (
-    PlagiarismChecker,
-    StatisticalAIDetector,
-    OpenAIDetector,
-    SensitiveWordChecker,
-    ReviewResult
-)
+
+from core.lazy_imports import lazy_exports
 
 __all__ = [
     'PlagiarismChecker',
@@ -14,3 +9,11 @@ __all__ = [
     'SensitiveWordChecker',
     'ReviewResult'
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "PlagiarismChecker": ".reviewer",
+    "StatisticalAIDetector": ".reviewer",
+    "OpenAIDetector": ".reviewer",
+    "SensitiveWordChecker": ".reviewer",
+    "ReviewResult": ".reviewer",
+})
@@ -1,12 +1,27 @@
 """搜索工具包"""
-from .searcher import (
-    SearchAggregator,
-    DuckDuckGoTool,
-    GoogleTrendsTool
-)
+
+from core.lazy_imports import lazy_exports
 
 __all__ = [
     'SearchAggregator',
+    'SearchEngine',
+    'SearchCache',
     'DuckDuckGoTool',
-    'GoogleTrendsTool'
+    'GoogleTrendsTool',
+    'canonical_url',
+    'SearchProvider',
+    'DuckDuckGoProvider',
+    'HttpSearchProvider'
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "SearchAggregator": ".searcher",
+    "SearchEngine": ".searcher",
+    "SearchCache": ".searcher",
+    "DuckDuckGoTool": ".searcher",
+    "GoogleTrendsTool": ".searcher",
+    "canonical_url": ".searcher",
+    "SearchProvider": ".providers",
+    "DuckDuckGoProvider": ".providers",
+    "HttpSearchProvider": ".providers",
+})
@@ -0,0 +1,186 @@
+"""搜索后端
+
+每个后端实现 ``search(query, limit)``，返回统一格式的结果列表，供 SearchAggregator 并发调用：
+
+- DuckDuckGoProvider: duckduckgo_search 库（同步接口，在线程中执行）
+- HttpSearchProvider: SearXNG 兼容的 JSON 搜索接口（GET {base_url}/search?q=...&format=json），
+  可指向自建的 SearXNG 实例，也可在测试中指向本地HTTP服务
+
+结果格式::
+
+    {"title": str, "url": str, "snippet": str, "source": 后端名称, "rank": 在该后端结果中的名次}
+"""
+
+import asyncio
+import os
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+# 单个后端的默认超时（秒）
+PROVIDER_TIMEOUT = float(os.environ.get("SEARCH_PROVIDER_TIMEOUT", 8))
+
+# SearXNG兼容搜索接口地址，设置后启用HttpSearchProvider
+SEARCH_API_URL = os.environ.get("SEARCH_API_URL")
+
+
+class SearchProvider:
+    """搜索后端基类"""
+
+    name = "base"
+
+    def __init__(self, timeout: float = PROVIDER_TIMEOUT):
+        """初始化搜索后端
+
+        Args:
+            timeout: 单次搜索的截止时间（秒），超时的后端结果被丢弃
+        """
+        self.timeout = timeout
+
+    async def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """执行搜索
+
+        Args:
+            query: 搜索关键词
+            limit: 返回结果数量上限
+
+        Returns:
+            List[Dict[str, Any]]: 搜索结果
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """释放连接等资源"""
+
+    def _hit(self, rank: int, title: Any, url: Any, snippet: Any) -> Dict[str, Any]:
+        return {
+            "title": str(title or ""),
+            "url": str(url or ""),
+            "snippet": str(snippet or ""),
+            "source": self.name,
+            "rank": rank,
+        }
+
+
+class DuckDuckGoProvider(SearchProvider):
+    """DuckDuckGo搜索后端"""
+
+    name = "duckduckgo"
+
+    async def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """执行搜索（duckduckgo_search为同步库，在线程中执行以免阻塞事件循环）
+
+        Args:
+            query: 搜索关键词
+            limit: 返回结果数量上限
+
+        Returns:
+            List[Dict[str, Any]]: 搜索结果
+        """
+        try:
+            from duckduckgo_search import DDGS
+        except ImportError as e:
+            raise ImportError("DuckDuckGo搜索需要安装 duckduckgo_search: pip install duckduckgo-search") from e
+
+        def run() -> List[Dict[str, Any]]:
+            with DDGS() as ddgs:
+                return list(ddgs.text(query, max_results=limit))
+
+        rows = await asyncio.to_thread(run)
+        return [
+            self._hit(rank, row.get("title"), row.get("href") or row.get("url"), row.get("body"))
+            for rank, row in enumerate(rows)
+        ]
+
+
+class HttpSearchProvider(SearchProvider):
+    """SearXNG兼容的HTTP搜索后端"""
+
+    name = "searx"
+
+    def __init__(self, base_url: Optional[str] = None, timeout: float = PROVIDER_TIMEOUT,
+                 name: Optional[str] = None, params: Optional[Dict[str, str]] = None):
+        """初始化HTTP搜索后端
+
+        Args:
+            base_url: 搜索服务地址，默认读取环境变量SEARCH_API_URL
+            timeout: 单次搜索的截止时间（秒）
+            name: 后端名称，默认 "searx"
+            params: 附加的查询参数，如 {"language": "zh-CN"}
+        """
+        super().__init__(timeout)
+        self.base_url = (base_url or SEARCH_API_URL or "").rstrip("/")
+        if name:
+            self.name = name
+        self.params = params or {}
+        self._session = None
+        self._session_loop = None
+
+    async def _get_session(self):
+        # 会话绑定在创建它的事件循环上，run_sync每次调用都会新建事件循环，循环变化时重新创建
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            try:
+                import aiohttp
+            except ImportError as e:
+                raise ImportError("HTTP搜索后端需要安装 aiohttp: pip install aiohttp") from e
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
+            self._session_loop = loop
+        return self._session
+
+    async def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """执行搜索
+
+        Args:
+            query: 搜索关键词
+            limit: 返回结果数量上限
+
+        Returns:
+            List[Dict[str, Any]]: 搜索结果
+        """
+        if not self.base_url:
+            raise ValueError("未配置搜索服务地址 SEARCH_API_URL")
+
+        session = await self._get_session()
+        params = {"q": query, "format": "json", **self.params}
+        async with session.get(f"{self.base_url}/search", params=params) as response:
+            response.raise_for_status()
+            payload = await response.json(content_type=None)
+
+        rows = payload.get("results", []) if isinstance(payload, dict) else []
+        return [
+            self._hit(rank, row.get("title"), row.get("url"), row.get("content") or row.get("snippet"))
+            for rank, row in enumerate(rows[:limit])
+        ]
+
+    async def close(self) -> None:
+        """关闭HTTP会话"""
+        if (self._session is not None and not self._session.closed
+                and self._session_loop is asyncio.get_running_loop()):
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+
+def default_providers(config: Optional[Dict[str, Any]] = None) -> List[SearchProvider]:
+    """根据配置创建搜索后端
+
+    Args:
+        config: 工具配置，可包含 search_api_url、provider_timeout、providers（后端名称列表）
+
+    Returns:
+        List[SearchProvider]: 搜索后端列表
+    """
+    config = config or {}
+    timeout = float(config.get("provider_timeout", PROVIDER_TIMEOUT))
+    enabled = config.get("providers")
+    api_url = config.get("search_api_url", SEARCH_API_URL)
+
+    providers: List[SearchProvider] = []
+    if api_url and (enabled is None or "searx" in enabled):
+        providers.append(HttpSearchProvider(api_url, timeout=timeout))
+    if enabled is None or "duckduckgo" in enabled:
+        providers.append(DuckDuckGoProvider(timeout=timeout))
+
+    logger.debug(f"搜索后端: {[p.name for p in providers]}")
+    return providers
@@ -1,7 +1,253 @@
-from typing import Dict, List, Optional, ClassVar
-from duckduckgo_search import DDGS
-from pytrends.request import TrendReq
+"""搜索工具
+
+SearchAggregator 并发查询所有搜索后端，每个后端有独立的截止时间，超时或失败的后端
+不影响其他后端的结果；结果按规范化URL合并去重，并按规范化查询缓存一段时间。
+"""
+
+import asyncio
+import inspect
+import os
+import re
+import threading
+import time
+from typing import Any, Awaitable, Dict, List, Optional, ClassVar, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from loguru import logger
+
 from core.tools.base import BaseTool, ToolResult
+from .providers import SearchProvider, default_providers
+
+# 搜索结果缓存时间（秒）
+SEARCH_CACHE_TTL = float(os.environ.get("SEARCH_CACHE_TTL", 600))
+
+# 缓存的查询数上限
+SEARCH_CACHE_SIZE = int(os.environ.get("SEARCH_CACHE_SIZE", 1024))
+
+# 批量搜索的并发上限
+SEARCH_CONCURRENCY = int(os.environ.get("SEARCH_CONCURRENCY", 8))
+
+# 规范化URL时去除的跟踪参数
+TRACKING_PARAMS = {"gclid", "fbclid", "spm", "from", "ref", "share_source", "share_medium"}
+
+
+def normalize_query(query: str) -> str:
+    """规范化查询：合并空白并转为casefold形式
+
+    Args:
+        query: 查询
+
+    Returns:
+        str: 规范化后的查询，用作缓存键
+    """
+    return re.sub(r"\s+", " ", query).strip().casefold()
+
+
+def canonical_url(url: str) -> str:
+    """计算URL的规范形式，用于合并不同后端返回的同一页面
+
+    协议和域名转小写，去掉 www. 前缀、默认端口、片段、跟踪参数和末尾斜杠，查询参数排序。
+
+    Args:
+        url: 原始URL
+
+    Returns:
+        str: 规范化后的URL
+    """
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url.strip()
+
+    scheme = parts.scheme.lower() or "http"
+    if scheme == "https":
+        scheme = "http"
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or ""
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+
+def merge_results(result_lists: List[List[Dict[str, Any]]], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """合并多个后端的结果并按规范化URL去重
+
+    按名次交错合并（各后端第1名、各后端第2名……），同一页面只保留第一次出现的条目，
+    并在 sources 中记录返回过它的所有后端。
+
+    Args:
+        result_lists: 各后端的结果列表，顺序即后端优先级
+        limit: 返回结果数量上限
+
+    Returns:
+        List[Dict[str, Any]]: 合并后的结果
+    """
+    merged: Dict[str, Dict[str, Any]] = {}
+    longest = max((len(r) for r in result_lists), default=0)
+    for rank in range(longest):
+        for results in result_lists:
+            if rank >= len(results):
+                continue
+            hit = results[rank]
+            if not hit.get("url"):
+                continue
+            key = canonical_url(hit["url"])
+            existing = merged.get(key)
+            if existing is None:
+                merged[key] = {**hit, "sources": [hit.get("source")]}
+            else:
+                if hit.get("source") not in existing["sources"]:
+                    existing["sources"].append(hit.get("source"))
+                if not existing.get("snippet") and hit.get("snippet"):
+                    existing["snippet"] = hit["snippet"]
+
+    hits = list(merged.values())
+    return hits[:limit] if limit else hits
+
+
+def run_sync(awaitable: Awaitable) -> Any:
+    """在同步代码（如CrewAI工具）中执行协程
+
+    没有运行中的事件循环时直接运行；已在事件循环中时在新线程里运行，避免嵌套事件循环。
+
+    Args:
+        awaitable: 协程
+
+    Returns:
+        Any: 协程的返回值；传入的不是协程时原样返回
+    """
+    if not inspect.isawaitable(awaitable):
+        return awaitable
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(awaitable)
+
+    result: Dict[str, Any] = {}
+
+    def runner() -> None:
+        try:
+            result["value"] = asyncio.run(awaitable)
+        except BaseException as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=runner)
+    thread.start()
+    thread.join()
+    if "error" in result:
+        raise result["error"]
+    return result["value"]
+
+
+class SearchCache:
+    """搜索结果缓存
+
+    按 (规范化查询, 数量) 缓存合并后的结果，同一事件循环中相同查询并发到达时只执行一次搜索。
+    缓存可在多个线程（如run_sync创建的事件循环）之间共享。
+    """
+
+    def __init__(self, ttl: float = SEARCH_CACHE_TTL, max_size: int = SEARCH_CACHE_SIZE):
+        """初始化缓存
+
+        Args:
+            ttl: 缓存时间（秒）
+            max_size: 缓存的查询数上限
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: Dict[Tuple[str, int], Tuple[float, ToolResult]] = {}
+        # 进行中的搜索按事件循环区分：future只能在创建它的循环中等待，run_sync会在不同线程的循环中调用
+        self._inflight: Dict[Tuple[asyncio.AbstractEventLoop, Tuple[str, int]], asyncio.Future] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "shared": 0}
+
+    def get(self, key: Tuple[str, int]) -> Optional[ToolResult]:
+        """查找未过期的缓存
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            Optional[ToolResult]: 缓存的结果
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() >= entry[0]:
+                del self._entries[key]
+                return None
+            return entry[1]
+
+    def put(self, key: Tuple[str, int], result: ToolResult) -> None:
+        """写入缓存，超出上限时淘汰最早写入的条目
+
+        Args:
+            key: 缓存键
+            result: 搜索结果
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + self.ttl, result)
+            while len(self._entries) > self.max_size:
+                self._entries.pop(next(iter(self._entries)))
+
+    async def get_or_create(self, key: Tuple[str, int], factory) -> ToolResult:
+        """获取缓存，未命中时调用factory搜索并缓存成功的结果
+
+        Args:
+            key: 缓存键
+            factory: 无参协程函数，返回ToolResult
+
+        Returns:
+            ToolResult: 搜索结果
+        """
+        cached = self.get(key)
+        if cached is not None:
+            with self._lock:
+                self.stats["hits"] += 1
+            return cached
+
+        loop = asyncio.get_running_loop()
+        inflight_key = (loop, key)
+        with self._lock:
+            inflight = self._inflight.get(inflight_key)
+            if inflight is None:
+                future = loop.create_future()
+                self._inflight[inflight_key] = future
+                self.stats["misses"] += 1
+            else:
+                self.stats["shared"] += 1
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        try:
+            result = await factory()
+            if result.success:
+                self.put(key, result)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            # 没有其他等待者时避免 "exception was never retrieved" 警告
+            future.exception()
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(inflight_key, None)
+
+    def clear(self) -> None:
+        """清空缓存"""
+        with self._lock:
+            self._entries.clear()
+
 
 class DuckDuckGoTool(BaseTool):
     """DuckDuckGo搜索工具"""
@@ -10,9 +256,14 @@ class DuckDuckGoTool(BaseTool):
 
     async def execute(self, query: str, max_results: int = 10) -> ToolResult:
         try:
-            with DDGS() as ddgs:
-                results = [r for r in ddgs.text(query, max_results=max_results)]
-                return self._create_success_result(results)
+            from duckduckgo_search import DDGS
+
+            def run():
+                with DDGS() as ddgs:
+                    return [r for r in ddgs.text(query, max_results=max_results)]
+
+            results = await asyncio.to_thread(run)
+            return self._create_success_result(results)
         except Exception as e:
             return self._create_error_result(str(e))
 
@@ -23,9 +274,17 @@ class GoogleTrendsTool(BaseTool):
 
     def __init__(self, config: Dict = None):
         super().__init__(config)
+        try:
+            from pytrends.request import TrendReq
+        except ImportError as e:
+            raise ImportError("Google Trends需要安装 pytrends: pip install pytrends") from e
         self.pytrends = TrendReq(hl='zh-CN', tz=360)
 
     async def execute(self, keyword: str, timeframe: str = 'today 12-m') -> ToolResult:
+        # pytrends为同步库，在线程中执行以免阻塞事件循环
+        return await asyncio.to_thread(self._fetch, keyword, timeframe)
+
+    def _fetch(self, keyword: str, timeframe: str) -> ToolResult:
         try:
             self.pytrends.build_payload([keyword], timeframe=timeframe)
 
@@ -47,29 +306,180 @@ class GoogleTrendsTool(BaseTool):
             return self._create_error_result(str(e))
 
 class SearchAggregator(BaseTool):
-    """搜索聚合工具"""
+    """搜索聚合工具
+
+    并发查询所有搜索后端，合并去重后返回。``config`` 可包含:
+
+    - providers: 启用的后端名称列表，默认全部
+    - search_api_url: SearXNG兼容搜索接口地址
+    - provider_timeout: 单个后端的截止时间（秒）
+    - include_trends: 是否同时查询Google Trends，默认False
+    """
     name = "search_aggregator"
     description = "多源搜索聚合工具"
 
-    def __init__(self, config: Dict = None):
+    def __init__(self, config: Dict = None, providers: Optional[List[SearchProvider]] = None,
+                 cache: Optional[SearchCache] = None):
+        """初始化搜索聚合工具
+
+        Args:
+            config: 工具配置
+            providers: 搜索后端列表，默认根据配置创建
+            cache: 结果缓存，默认每个实例独立缓存
+        """
         super().__init__(config)
-        self.tools = [
-            DuckDuckGoTool(config),
-            GoogleTrendsTool(config)
-        ]
-
-    async def execute(self, query: str) -> ToolResult:
-        """执行多源搜索"""
-        results = {}
-        for tool in self.tools:
-            result = await tool.execute(query)
-            if result.success:
-                results[tool.name] = result.data
+        self.providers = providers if providers is not None else default_providers(self.config)
+        self.cache = cache or SearchCache()
+        self.trends_tool = GoogleTrendsTool(config) if self.config.get("include_trends") else None
+        self.provider_stats: Dict[str, Dict[str, Any]] = {
+            p.name: {"calls": 0, "errors": 0, "timeouts": 0, "total_time": 0.0} for p in self.providers
+        }
+
+    async def execute(self, query: str, limit: int = 10, **kwargs) -> ToolResult:
+        """执行多源搜索
+
+        Args:
+            query: 搜索关键词
+            limit: 返回结果数量上限
+            **kwargs: 兼容旧调用的其他参数（如filter），目前忽略
+
+        Returns:
+            ToolResult: data为 {"query", "results", "providers"[, "trends"]}
+        """
+        key = (normalize_query(query), limit)
+        return await self.cache.get_or_create(key, lambda: self._search(query, limit))
+
+    async def _search(self, query: str, limit: int) -> ToolResult:
+        """并发查询所有后端并合并结果"""
+        tasks = [self._query_provider(p, query, limit) for p in self.providers]
+        if self.trends_tool is not None:
+            tasks.append(self.trends_tool.execute(query))
+        outcomes = await asyncio.gather(*tasks)
+
+        trends = outcomes.pop() if self.trends_tool is not None else None
+        provider_status = {}
+        result_lists = []
+        for provider, (hits, status) in zip(self.providers, outcomes):
+            provider_status[provider.name] = status
+            result_lists.append(hits)
+
+        data: Dict[str, Any] = {
+            "query": query,
+            "results": merge_results(result_lists, limit),
+            "providers": provider_status,
+        }
+        if trends is not None and trends.success:
+            data["trends"] = trends.data
+
+        if not any(status["ok"] for status in provider_status.values()) and "trends" not in data:
+            return self._create_error_result("All search tools failed", metadata={"providers": provider_status})
+
+        return self._create_success_result(data)
+
+    async def _query_provider(self, provider: SearchProvider, query: str,
+                              limit: int) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """在截止时间内查询单个后端，失败时返回空结果"""
+        stats = self.provider_stats.setdefault(
+            provider.name, {"calls": 0, "errors": 0, "timeouts": 0, "total_time": 0.0}
+        )
+        stats["calls"] += 1
+        start = time.perf_counter()
+        try:
+            hits = await asyncio.wait_for(provider.search(query, limit), timeout=provider.timeout)
+            status = {"ok": True, "count": len(hits)}
+        except asyncio.TimeoutError:
+            stats["timeouts"] += 1
+            hits, status = [], {"ok": False, "error": f"超过截止时间 {provider.timeout}s"}
+        except Exception as e:
+            stats["errors"] += 1
+            logger.warning(f"搜索后端 {provider.name} 失败: {str(e)}")
+            hits, status = [], {"ok": False, "error": str(e)}
+
+        elapsed = time.perf_counter() - start
+        stats["total_time"] += elapsed
+        status["elapsed"] = round(elapsed, 3)
+        return hits, status
+
+    async def search_many(self, queries: List[str], limit: int = 10,
+                          concurrency: int = SEARCH_CONCURRENCY) -> List[ToolResult]:
+        """并发执行多个查询
+
+        Args:
+            queries: 查询列表
+            limit: 每个查询的结果数量上限
+            concurrency: 同时进行的查询数上限
+
+        Returns:
+            List[ToolResult]: 与queries顺序一致的结果
+        """
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
 
-        if not results:
-            return self._create_error_result("All search tools failed")
+        async def run(query: str) -> ToolResult:
+            async with semaphore:
+                return await self.execute(query, limit)
+
+        return list(await asyncio.gather(*(run(q) for q in queries)))
+
+    def execute_sync(self, query: str, limit: int = 10, **kwargs) -> ToolResult:
+        """同步执行搜索，供CrewAI工具等同步代码调用
+
+        Args:
+            query: 搜索关键词
+            limit: 返回结果数量上限
+            **kwargs: 其他参数
+
+        Returns:
+            ToolResult: 搜索结果
+        """
+        return run_sync(self.execute(query, limit, **kwargs))
+
+    def search_many_sync(self, queries: List[str], limit: int = 10,
+                         concurrency: int = SEARCH_CONCURRENCY) -> List[ToolResult]:
+        """同步并发执行多个查询
+
+        Args:
+            queries: 查询列表
+            limit: 每个查询的结果数量上限
+            concurrency: 同时进行的查询数上限
+
+        Returns:
+            List[ToolResult]: 与queries顺序一致的结果
+        """
+        return run_sync(self.search_many(queries, limit, concurrency))
+
+    @staticmethod
+    def format_result(result: ToolResult) -> str:
+        """将搜索结果格式化为文本，供智能体阅读
+
+        Args:
+            result: 搜索结果
+
+        Returns:
+            str: 每行一条结果的文本
+        """
+        if not result.success:
+            return f"搜索失败: {result.error}"
+        if not isinstance(result.data, dict):
+            return str(result.data)
+        hits = result.data.get("results", [])
+        if not hits:
+            return "未找到相关结果"
+        return "\n".join(
+            f"{i}. {hit['title']} ({hit['url']})\n   {hit['snippet']}" for i, hit in enumerate(hits, 1)
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取统计信息
+
+        Returns:
+            Dict[str, Any]: 缓存命中和各后端调用、错误、超时次数
+        """
+        return {"cache": dict(self.cache.stats), "providers": self.provider_stats}
+
+    async def close(self) -> None:
+        """关闭所有后端的连接"""
+        await asyncio.gather(*(p.close() for p in self.providers), return_exceptions=True)
 
-        return self._create_success_result(results)
 
 class SearchEngine:
     """搜索引擎聚合器"""
@@ -93,20 +503,22 @@ class SearchEngine:
         """清除缓存的实例"""
         cls._instance = None
 
-    def __init__(self):
-        """初始化搜索引擎"""
-        # TODO: 初始化搜索引擎配置
-        pass
+    def __init__(self, config: Dict = None):
+        """初始化搜索引擎
+
+        Args:
+            config: 搜索聚合工具配置
+        """
+        self.aggregator = SearchAggregator(config)
 
     async def health_check(self) -> bool:
         """检查引擎健康状态
 
         Returns:
-            bool: 是否健康
+            bool: 是否至少有一个可用的搜索后端
         """
         try:
-            # TODO: 实现健康检查
-            return True
+            return bool(self.aggregator.providers)
         except Exception:
             return False
 
@@ -115,18 +527,13 @@ class SearchEngine:
 
         Args:
             query: 搜索关键词
-            **kwargs: 其他搜索参数
+            **kwargs: 其他搜索参数，如limit
 
         Returns:
             ToolResult: 搜索结果
         """
         try:
-            # TODO: 实现搜索逻辑
-            results = []
-            return ToolResult(
-                success=True,
-                data=results
-            )
+            return await self.aggregator.execute(query, **kwargs)
         except Exception as e:
             return ToolResult(
                 success=False,
@@ -1,6 +1,11 @@
 """样式工具模块"""
-from .adapter import StyleAdapter
+
+from core.lazy_imports import lazy_exports
 
 __all__ = [
     'StyleAdapter'
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "StyleAdapter": ".adapter",
+})
@@ -5,7 +5,11 @@ This package contains tools for collecting and managing trending topics
 from various platforms and sources.
 """
 
-from .tasks import update_trending_data
-from .topic_trends import TrendingTopics
+from core.lazy_imports import lazy_exports
 
 __all__ = ["update_trending_data", "TrendingTopics"]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "update_trending_data": ".tasks",
+    "TrendingTopics": ".topic_trends",
+})
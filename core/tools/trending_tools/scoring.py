@@ -0,0 +1,188 @@
+"""话题批量评分
+
+把一批话题转换为列数组（热度、时间戳、平台索引），用NumPy一次性计算标准化热度、时效衰减和优先级分数，
+再用 argpartition 选出分数最高的前k个话题。
+
+计算公式与 TopicProcessor.calculate_priority_score、calculate_time_weight 和
+calculate_normalized_hot_score 完全一致，区别只在于整批话题共用同一个当前时间。
+
+使用方法:
+    from .scoring import rank_topics
+
+    top_topics = rank_topics(topics, limit=20)  # 按优先级分数从高到低，分数相同时保持原顺序
+"""
+from datetime import datetime
+from itertools import repeat
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .platform_weights import PLATFORM_WEIGHTS, DEFAULT_HOT_SCORES
+
+# 时效性衰减周期（秒）
+DECAY_SECONDS = 7 * 24 * 3600
+
+# 未配置平台的权重和默认热度
+UNKNOWN_PLATFORM_WEIGHT = 0.5
+UNKNOWN_PLATFORM_HOT_SCORE = 1000
+
+# 平台索引：已配置的平台依次编号，最后一位代表未知平台
+_PLATFORMS = list(dict.fromkeys([*PLATFORM_WEIGHTS, *DEFAULT_HOT_SCORES]))
+_PLATFORM_INDEX = {platform: i for i, platform in enumerate(_PLATFORMS)}
+_UNKNOWN_INDEX = len(_PLATFORMS)
+_WEIGHTS = np.array(
+    [PLATFORM_WEIGHTS.get(p, UNKNOWN_PLATFORM_WEIGHT) for p in _PLATFORMS] + [UNKNOWN_PLATFORM_WEIGHT]
+)
+_DEFAULT_HOT_SCORES = np.array(
+    [DEFAULT_HOT_SCORES.get(p, UNKNOWN_PLATFORM_HOT_SCORE) for p in _PLATFORMS] + [UNKNOWN_PLATFORM_HOT_SCORE],
+    dtype=np.float64
+)
+
+
+def platform_indices(platforms: Sequence[Optional[str]]) -> np.ndarray:
+    """把平台名称转换为权重表中的下标，未知平台映射到最后一位
+
+    Args:
+        platforms: 平台名称列表
+
+    Returns:
+        np.ndarray: 平台下标数组
+    """
+    return np.fromiter(
+        map(_PLATFORM_INDEX.get, platforms, repeat(_UNKNOWN_INDEX)),
+        dtype=np.intp,
+        count=len(platforms)
+    )
+
+
+def _to_float_array(values: Sequence) -> Tuple[np.ndarray, np.ndarray]:
+    """数值转换为float64数组，None和非数值（如字符串）记为NaN
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: 数值数组和标记None的布尔数组
+    """
+    types = set(map(type, values))
+    if types <= {int, float, type(None)}:
+        # 常见情况：全部是数字或None，由NumPy直接转换（None转为NaN）
+        array = np.array(values, dtype=np.float64)
+        if type(None) not in types:
+            return array, np.zeros(len(values), dtype=bool)
+        if float not in types:
+            return array, np.isnan(array)
+    else:
+        array = np.fromiter(
+            (v if isinstance(v, (int, float)) else np.nan for v in values),
+            dtype=np.float64,
+            count=len(values)
+        )
+    return array, np.fromiter((v is None for v in values), dtype=bool, count=len(values))
+
+
+def normalized_hot_scores(platforms: Sequence[str], raw_scores: Sequence[Optional[int]]) -> np.ndarray:
+    """批量计算标准化热度值，与 calculate_normalized_hot_score 一致
+
+    Args:
+        platforms: 平台名称列表
+        raw_scores: 原始热度值列表，None或非正数使用平台默认热度
+
+    Returns:
+        np.ndarray: 标准化热度值（int64）
+    """
+    indices = platform_indices(platforms)
+    raw, _ = _to_float_array(raw_scores)
+    hot = np.where(np.isnan(raw) | (raw <= 0), _DEFAULT_HOT_SCORES[indices], raw)
+    return np.maximum(1, np.trunc(hot * _WEIGHTS[indices])).astype(np.int64)
+
+
+def time_weights(timestamps: np.ndarray, now: float) -> np.ndarray:
+    """批量计算时效权重，与 calculate_time_weight 一致
+
+    Args:
+        timestamps: 话题时间戳数组
+        now: 当前时间戳
+
+    Returns:
+        np.ndarray: 时效权重，7天内线性衰减到0
+    """
+    return np.maximum(0, 1 - (now - timestamps) / DECAY_SECONDS)
+
+
+def priority_scores(topics: Sequence[Dict], now: Optional[float] = None) -> np.ndarray:
+    """批量计算优先级分数，与 TopicProcessor.calculate_priority_score 一致
+
+    热度占70%，时效性占20%，平台权重占10%。缺少 hot_score 的话题使用平台默认热度，
+    热度或时间戳不是数值的话题记0分。
+
+    Args:
+        topics: 话题列表
+        now: 当前时间戳，默认取当前时间
+
+    Returns:
+        np.ndarray: 优先级分数（int64）
+    """
+    if now is None:
+        now = datetime.now().timestamp()
+
+    hot_values = [topic.get("hot_score") for topic in topics]
+    indices = platform_indices([topic.get("platform", "") for topic in topics])
+    timestamps, _ = _to_float_array([topic.get("source_time") or topic.get("crawl_time", 0) for topic in topics])
+
+    hot, missing = _to_float_array(hot_values)
+    hot = np.where(missing, _DEFAULT_HOT_SCORES[indices], hot)
+
+    with np.errstate(invalid="ignore", over="ignore"):
+        scores = np.trunc(hot * (0.7 + 0.2 * time_weights(timestamps, now) + 0.1 * _WEIGHTS[indices]))
+    scores[~np.isfinite(scores)] = 0
+    return scores.astype(np.int64)
+
+
+def top_k_indices(scores: np.ndarray, k: Optional[int] = None) -> np.ndarray:
+    """按分数从高到低返回前k个下标
+
+    分数相同时下标小的在前，与对整个列表做稳定排序后截取前k个的结果一致。
+
+    Args:
+        scores: 分数数组
+        k: 返回数量，None表示全部
+
+    Returns:
+        np.ndarray: 下标数组
+    """
+    n = len(scores)
+    if k is None or k >= n:
+        return np.argsort(-scores, kind="stable")
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    # argpartition 找出第k大的分数，等于该分数的话题按下标补足k个
+    threshold = scores[np.argpartition(-scores, k - 1)[:k]].min()
+    above = np.flatnonzero(scores > threshold)
+    ties = np.flatnonzero(scores == threshold)[:k - len(above)]
+    chosen = np.concatenate([above, ties])
+    return chosen[np.argsort(-scores[chosen], kind="stable")]
+
+
+def rank_topics(topics: List[Dict], limit: Optional[int] = None, now: Optional[float] = None) -> List[Dict]:
+    """计算优先级分数并返回分数最高的话题
+
+    返回的话题会写入 priority_score 字段。
+
+    Args:
+        topics: 话题列表
+        limit: 返回数量，None表示全部
+        now: 当前时间戳，默认取当前时间
+
+    Returns:
+        List[Dict]: 按优先级分数从高到低排列的话题
+    """
+    if not topics:
+        return []
+
+    scores = priority_scores(topics, now)
+    ranked = top_k_indices(scores, limit).tolist()
+    result = []
+    for index in ranked:
+        topic = topics[index]
+        topic["priority_score"] = int(scores[index])
+        result.append(topic)
+    return result
@@ -77,6 +77,15 @@ async def update_trending_data() -> bool:
 
         logger.info("数据存储成功")
 
+        # 增量更新话题知识图谱（未配置抽取API时跳过），失败不影响热点更新
+        try:
+            from core.tools.kg_tools.topic_kg import update_knowledge_graph
+            kg_stats = await update_knowledge_graph(processed_data)
+            if kg_stats is not None:
+                logger.info(f"知识图谱更新完成: {kg_stats}")
+        except Exception as e:
+            logger.warning(f"知识图谱更新失败: {e}")
+
         # 清理过期数据
         logger.info("开始清理过期数据...")
         await storage.clear_expired("topic")
@@ -43,6 +43,7 @@ class TrendingTopics(BaseTool):
         limit: 返回结果数量，默认20条
         force_summarize: 是否强制返回摘要数据，不论数据量大小
         word_limit: 当返回的数据超过此字数限制时会自动生成摘要，默认500
+        token_budget: 话题数据的token预算，指定后保留优先级最高且能放入预算的话题
     """
 
     name = "trending_topics"
@@ -109,6 +110,12 @@ class TrendingTopics(BaseTool):
                 "minimum": 0.1,
                 "maximum": 0.5,
                 "optional": True
+            },
+            "token_budget": {
+                "type": "integer",
+                "description": "话题数据的token预算，指定后按优先级保留能放入预算的话题，不再按字数生成摘要",
+                "minimum": 50,
+                "optional": True
             }
         }
     }
@@ -322,20 +329,9 @@ class TrendingTopics(BaseTool):
                 processed_topics = filtered_topics
                 logger.info(f"关键词过滤: {original_count} -> {len(processed_topics)}")
 
-            # 计算优先级分数并排序
-            for topic in processed_topics:
-                try:
-                    topic["priority_score"] = self.processor.calculate_priority_score(topic)
-                except Exception as e:
-                    logger.error(f"计算优先级分数失败: {e}, topic: {topic['title']}")
-                    topic["priority_score"] = 0
-
-            processed_topics.sort(key=lambda x: x["priority_score"], reverse=True)
-
-            # 限制返回数量
+            # 批量计算优先级分数，选出分数最高的话题
             limit = min(limit or 20, 50)  # 确保不超过50
-            if limit:
-                processed_topics = processed_topics[:limit]
+            processed_topics = self.processor.rank_topics(processed_topics, limit)
 
             result = {
                 "topics": processed_topics,
@@ -630,15 +626,54 @@ class TrendingTopics(BaseTool):
         if not topics:
             return 0
 
-        # 将所有话题数据转为字符串
-        text = ""
-        for topic in topics:
-            title = topic.get("title", "")
-            desc = topic.get("desc", "")
-            text += f"{title} {desc} "
+        # 逐个话题统计（中文按字、英文按词），不拼接大字符串
+        return sum(
+            count_words(topic.get("title", "")) + count_words(topic.get("desc", ""))
+            for topic in topics
+        )
+
+    async def _limit_result(
+        self,
+        result: Dict,
+        summarize_type: str,
+        force_summarize: bool,
+        word_limit: Optional[int],
+        token_budget: Optional[int],
+        compression_ratio: float
+    ) -> Dict:
+        """按摘要设置和token预算控制返回的数据量
+
+        Args:
+            result: 完整结果
+            summarize_type: 摘要类型
+            force_summarize: 是否强制返回摘要
+            word_limit: 字数限制，超过则返回摘要
+            token_budget: token预算，指定后按优先级选择话题
+            compression_ratio: 摘要压缩率
+
+        Returns:
+            Dict: 完整、截取或摘要后的结果
+        """
+        if force_summarize:
+            logger.info("强制返回摘要数据")
+            return await self._summarize_topics(result["topics"], summarize_type, compression_ratio)
+
+        if token_budget:
+            pack = self.token_counter.fit_topics(result["topics"], token_budget)
+            if pack.dropped:
+                logger.info(f"话题数据超过token预算({token_budget})，保留优先级最高的{len(pack.items)}条")
+                result["topics"] = pack.items
+                result["total"] = len(pack.items)
+                result["platforms"] = list(set(topic.get("platform", "") for topic in pack.items))
+                result["dropped_count"] = len(pack.dropped)
+            result["token_count"] = pack.tokens
+            return result
+
+        if word_limit and self._count_words_in_topics(result["topics"]) > word_limit:
+            logger.info(f"数据字数超过限制({word_limit})，返回摘要")
+            return await self._summarize_topics(result["topics"], summarize_type, compression_ratio)
 
-        # 使用空格分词统计（简易统计，实际应考虑中文）
-        return len(text)
+        return result
 
     async def execute(
         self,
@@ -647,7 +682,8 @@ class TrendingTopics(BaseTool):
         limit: Optional[int] = 20,
         force_summarize: Optional[bool] = False,
         word_limit: Optional[int] = 500,
-        compression_ratio: Optional[float] = 0.25
+        compression_ratio: Optional[float] = 0.25,
+        token_budget: Optional[int] = None
     ) -> Dict:
         """工具入口方法，根据参数从缓存读取数据
 
@@ -662,8 +698,9 @@ class TrendingTopics(BaseTool):
 
         摘要策略：
         1. force_summarize=True → 直接返回摘要版本
-        2. 数据字数超过word_limit → 返回摘要版本
-        3. 其他情况 → 返回完整数据
+        2. 指定token_budget → 按优先级保留能放入预算的话题
+        3. 数据字数超过word_limit → 返回摘要版本
+        4. 其他情况 → 返回完整数据
 
         Args:
             category: 话题分类，默认为None，将使用"热点"分类
@@ -672,6 +709,7 @@ class TrendingTopics(BaseTool):
             force_summarize: 是否强制返回摘要，默认False
             word_limit: 字数限制，超过则返回摘要，默认500
             compression_ratio: 摘要压缩率，表示摘要提取的话题比例，取值0.1-0.5，默认0.25
+            token_budget: 话题数据的token预算，指定后按优先级选择话题而不再按字数生成摘要
 
         Returns:
             Dict: 处理后的话题数据
@@ -750,16 +788,8 @@ class TrendingTopics(BaseTool):
 
                     result_topics = list(title_to_topic.values())
 
-                    # 计算优先级并排序
-                    for topic in result_topics:
-                        try:
-                            topic["priority_score"] = self.processor.calculate_priority_score(topic)
-                        except Exception as e:
-                            logger.error(f"计算优先级分数失败: {e}, topic: {topic['title']}")
-                            topic["priority_score"] = 0
-
-                    result_topics.sort(key=lambda x: x["priority_score"], reverse=True)
-                    result_topics = result_topics[:limit]
+                    # 批量计算优先级，选出分数最高的话题
+                    result_topics = self.processor.rank_topics(result_topics, limit)
 
                     result = {
                         "topics": result_topics,
@@ -771,17 +801,9 @@ class TrendingTopics(BaseTool):
                         "original_count": 0
                     }
 
-                    # 检查是否需要摘要
-                    if force_summarize:
-                        logger.info("强制返回摘要数据")
-                        return await self._summarize_topics(result["topics"], "keyword", compression_ratio)
-
-                    # 检查数据量是否超过限制
-                    if self._count_words_in_topics(result["topics"]) > word_limit:
-                        logger.info(f"数据字数超过限制({word_limit})，返回摘要")
-                        return await self._summarize_topics(result["topics"], "keyword", compression_ratio)
-
-                    return result
+                    return await self._limit_result(
+                        result, "keyword", force_summarize, word_limit, token_budget, compression_ratio
+                    )
                 else:
                     return {
                         "error": "无匹配数据",
@@ -791,18 +813,10 @@ class TrendingTopics(BaseTool):
                         "original_count": original_count
                     }
 
-            # 计算优先级分数并排序
-            for topic in filtered_topics:
-                try:
-                    topic["priority_score"] = self.processor.calculate_priority_score(topic)
-                except Exception as e:
-                    logger.error(f"计算优先级分数失败: {e}, topic: {topic['title']}")
-                    topic["priority_score"] = 0
-
-            filtered_topics.sort(key=lambda x: x["priority_score"], reverse=True)
+            # 批量计算优先级分数，选出分数最高的话题
+            result_topics = self.processor.rank_topics(filtered_topics, limit)
 
             # 如果过滤后的话题数量不足limit，从热点标签平台补充
-            result_topics = filtered_topics[:limit]
             supplemented_count = 0
 
             if len(result_topics) < limit:
@@ -859,17 +873,9 @@ class TrendingTopics(BaseTool):
             if failed_platforms:
                 result["failed_platforms"] = failed_platforms
 
-            # 检查是否需要摘要
-            if force_summarize:
-                logger.info("强制返回摘要数据")
-                return await self._summarize_topics(result["topics"], "keyword", compression_ratio)
-
-            # 检查数据量是否超过限制
-            if self._count_words_in_topics(result["topics"]) > word_limit:
-                logger.info(f"数据字数超过限制({word_limit})，返回摘要")
-                return await self._summarize_topics(result["topics"], "keyword", compression_ratio)
-
-            return result
+            return await self._limit_result(
+                result, "keyword", force_summarize, word_limit, token_budget, compression_ratio
+            )
 
         # 场景2-4: 其他情况 - 使用分类或默认分类
         use_category = category or "热点"
@@ -954,19 +960,9 @@ class TrendingTopics(BaseTool):
             processed_topics = filtered_topics
             logger.info(f"关键词过滤: 总数据 {original_count} -> 过滤后 {len(processed_topics)}")
 
-        # 计算优先级分数并排序
-        for topic in processed_topics:
-            try:
-                topic["priority_score"] = self.processor.calculate_priority_score(topic)
-            except Exception as e:
-                logger.error(f"计算优先级分数失败: {e}, topic: {topic['title']}")
-                topic["priority_score"] = 0
-
-        processed_topics.sort(key=lambda x: x["priority_score"], reverse=True)
-
-        # 限制返回数量
+        # 批量计算优先级分数，选出分数最高的话题
         limit = min(limit or 20, 50)  # 确保不超过50
-        processed_topics = processed_topics[:limit]
+        processed_topics = self.processor.rank_topics(processed_topics, limit)
 
         # 构建结果
         result = {
@@ -986,17 +982,9 @@ class TrendingTopics(BaseTool):
             result["keywords"] = keywords
             result["original_count"] = original_count
 
-        # 检查是否需要摘要
-        if force_summarize:
-            logger.info("强制返回摘要数据")
-            return await self._summarize_topics(result["topics"], "category", compression_ratio)
-
-        # 检查数据量是否超过限制
-        if self._count_words_in_topics(result["topics"]) > word_limit:
-            logger.info(f"数据字数超过限制({word_limit})，返回摘要")
-            return await self._summarize_topics(result["topics"], "category", compression_ratio)
-
-        return result
+        return await self._limit_result(
+            result, "category", force_summarize, word_limit, token_budget, compression_ratio
+        )
 
     async def get_topics_by_category(
         self,
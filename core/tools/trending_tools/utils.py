@@ -8,7 +8,6 @@ from datetime import datetime, timedelta
 import time
 
 from .platform_weights import (
-    calculate_normalized_hot_score,
     get_platform_weight,
     get_default_hot_score,
     PLATFORM_WEIGHTS,
@@ -20,6 +19,8 @@ from .platform_categories import (
     get_platform_categories,
     CATEGORY_TAGS
 )
+from .scoring import normalized_hot_scores, rank_topics
+from core.tools.nlp_tools.token_budget import BudgetPack, Tokenizer, get_tokenizer, pack_to_budget
 
 logger = logging.getLogger(__name__)
 
@@ -49,38 +50,66 @@ def parse_hot_value(hot_value: any) -> Optional[int]:
     return None
 
 class TokenCounter:
-    """字符计数器（简化版token计数）"""
+    """话题token计数器
+
+    使用共享的BPE分词器计数（见 core.tools.nlp_tools.token_budget），相同文本的计数结果会被缓存。
+    """
+
+    def __init__(self, tokenizer: Optional[Tokenizer] = None):
+        """初始化
+
+        Args:
+            tokenizer: token计数器，默认使用共享计数器
+        """
+        self.tokenizer = tokenizer or get_tokenizer()
 
     @staticmethod
-    def count_topic_tokens(topic: Dict) -> int:
-        """计算单个话题的字符数
+    def topic_text(topic: Dict) -> str:
+        """话题中参与计数的文本：标题、描述和平台名称"""
+        return "\n".join(
+            str(topic.get(field) or "")
+            for field in ("title", "description", "platform")
+        )
+
+    def count_topic_tokens(self, topic: Dict) -> int:
+        """计算单个话题的token数
 
         Args:
             topic: 话题数据字典
 
         Returns:
-            int: 字符总数
+            int: token数
         """
-        total = 0
-        # 计算标题字符数
-        total += len(topic.get("title", ""))
-        # 计算描述字符数
-        total += len(topic.get("description", ""))
-        # 计算平台名称字符数
-        total += len(topic.get("platform", ""))
-        return total
+        return self.tokenizer.count(self.topic_text(topic))
 
-    @staticmethod
-    def estimate_total_tokens(topics: List[Dict]) -> int:
-        """估算话题列表的总字符数
+    def estimate_total_tokens(self, topics: List[Dict]) -> int:
+        """计算话题列表的总token数
+
+        Args:
+            topics: 话题列表
+
+        Returns:
+            int: 总token数
+        """
+        return sum(self.count_topic_tokens(topic) for topic in topics)
+
+    def fit_topics(self, topics: List[Dict], token_budget: int) -> BudgetPack:
+        """按优先级分数选择能放入token预算的话题
 
         Args:
             topics: 话题列表
+            token_budget: token预算
 
         Returns:
-            int: 估算的总字符数
+            BudgetPack: 选中的话题（保持原顺序）和未放入的话题
         """
-        return sum(TokenCounter.count_topic_tokens(topic) for topic in topics)
+        return pack_to_budget(
+            topics,
+            token_budget,
+            text=self.topic_text,
+            priority=lambda topic: topic.get("priority_score") or 0,
+            tokenizer=self.tokenizer,
+        )
 
 class TopicProcessor:
     """话题数据处理器"""
@@ -96,6 +125,7 @@ class TopicProcessor:
             List[Dict]: 处理后的话题列表
         """
         processed = []
+        hot_values = []
         current_time = datetime.now()
         crawl_time = int(current_time.timestamp())
         expire_time = int((current_time + timedelta(days=7)).timestamp())
@@ -112,9 +142,8 @@ class TopicProcessor:
                 continue
 
             try:
-                # 处理热度值
+                # 处理热度值，标准化热度在循环结束后批量计算
                 hot_value = parse_hot_value(topic.get("hot"))
-                hot_score = calculate_normalized_hot_score(platform, hot_value)
 
                 # 尝试从原始数据中获取时间戳
                 timestamp = topic.get("timestamp")
@@ -131,7 +160,7 @@ class TopicProcessor:
                     "title": str(title).strip(),
                     "platform": platform,
                     "source_time": timestamp,
-                    "hot_score": hot_score,
+                    "hot_score": None,
                     "crawl_time": crawl_time,
                     "expire_time": expire_time
                 }
@@ -148,11 +177,17 @@ class TopicProcessor:
                             processed_topic[field] = str(topic[field]).strip()
 
                 processed.append(processed_topic)
+                hot_values.append(hot_value)
 
             except Exception as e:
                 logger.warning(f"话题处理失败: {e}, 原始数据: {topic}")
                 continue
 
+        if processed:
+            scores = normalized_hot_scores([platform] * len(processed), hot_values)
+            for processed_topic, hot_score in zip(processed, scores.tolist()):
+                processed_topic["hot_score"] = hot_score
+
         return processed
 
     def calculate_priority_score(self, topic: Dict) -> int:
@@ -183,6 +218,21 @@ class TopicProcessor:
         # 热度占70%，时效性占20%，平台权重占10%
         return int(hot_score * (0.7 + 0.2 * time_factor + 0.1 * platform_weight))
 
+    def rank_topics(self, topics: List[Dict], limit: Optional[int] = None) -> List[Dict]:
+        """批量计算优先级分数并返回分数最高的话题
+
+        与逐个调用 calculate_priority_score 后稳定排序的结果一致，整批话题使用NumPy一次计算，
+        前k个话题用 argpartition 选出。
+
+        Args:
+            topics: 话题列表
+            limit: 返回数量，None表示全部
+
+        Returns:
+            List[Dict]: 按优先级分数从高到低排列并写入priority_score的话题
+        """
+        return rank_topics(topics, limit)
+
 class TopicFilter:
     """话题过滤器"""
 
@@ -1,10 +1,6 @@
 """写作工具模块"""
-from .article_writer import (
-    ArticleWriter,
-    ArticleSection,
-    ArticleOutline,
-    ArticleStyle
-)
+
+from core.lazy_imports import lazy_exports
 
 __all__ = [
     'ArticleWriter',
@@ -12,3 +8,10 @@ __all__ = [
     'ArticleOutline',
     'ArticleStyle'
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "ArticleWriter": ".article_writer",
+    "ArticleSection": ".article_writer",
+    "ArticleOutline": ".article_writer",
+    "ArticleStyle": ".article_writer",
+})
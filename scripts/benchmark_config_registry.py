@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+配置查找基准测试
+
+向平台管理器和风格管理器注册 N 个平台/风格（默认各500个），比较两种查找方式的耗时：
+- 原方式：不区分大小写的平台名称和风格类型线性扫描，兼容性每次重新计算
+- 新方式：ConfigRegistry 预建的casefold索引和兼容性矩阵
+
+用法:
+  python scripts/benchmark_config_registry.py [--items 500] [--lookups 100000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models.infra.config_registry import ConfigRegistry  # noqa: E402
+from core.models.platform.platform import Platform  # noqa: E402
+from core.models.platform.platform_manager import PlatformManager  # noqa: E402
+from core.models.style.style_manager import ArticleStyle, StyleManager  # noqa: E402
+from core.models.content_type.content_type_manager import ContentTypeManager  # noqa: E402
+
+
+def linear_platform(name: str):
+    """原方式：不区分大小写线性扫描平台"""
+    for platform in PlatformManager._platforms.values():
+        if platform.name.lower() == name.lower():
+            return platform
+    return None
+
+
+def linear_style_type(style_type: str):
+    """原方式：线性扫描风格类型"""
+    for style in StyleManager._styles.values():
+        if style.type == style_type:
+            return style
+    return None
+
+
+def linear_compatible(style_name: str, content_type: str) -> bool:
+    """原方式：每次重新计算兼容性"""
+    style = StyleManager._styles.get(style_name)
+    return bool(style and style.is_compatible_with_content_type(content_type))
+
+
+def timed(func, queries) -> float:
+    """执行查询并返回每次查询的平均耗时（微秒）"""
+    start = time.perf_counter()
+    for args in queries:
+        func(*args)
+    return (time.perf_counter() - start) / len(queries) * 1e6
+
+
+def main() -> None:
+    """主函数"""
+    parser = argparse.ArgumentParser(description="配置查找基准测试")
+    parser.add_argument("--items", type=int, default=500, help="注册的平台/风格数")
+    parser.add_argument("--lookups", type=int, default=100000, help="每种查找的次数")
+    args = parser.parse_args()
+
+    PlatformManager.ensure_initialized()
+    StyleManager.initialize()
+    content_types = list(ContentTypeManager.get_all_content_types())
+
+    for i in range(args.items):
+        platform = Platform(name=f"Platform{i}", url=f"https://p{i}.example.com")
+        PlatformManager._platforms[platform.name] = platform
+        style = ArticleStyle(name=f"style_{i}", type=f"type_{i}",
+                             content_types=random.sample(content_types, k=min(3, len(content_types))))
+        StyleManager._styles[style.name] = style
+    ConfigRegistry.invalidate("基准测试数据")
+
+    rng = random.Random(42)
+    platform_queries = [(f"platform{rng.randrange(args.items)}",) for _ in range(args.lookups)]
+    type_queries = [(f"type_{rng.randrange(args.items)}",) for _ in range(args.lookups)]
+    compat_queries = [(f"style_{rng.randrange(args.items)}", rng.choice(content_types))
+                      for _ in range(args.lookups)]
+
+    build_start = time.perf_counter()
+    ConfigRegistry.get_platform("platform0")
+    build_ms = (time.perf_counter() - build_start) * 1000
+
+    rows = [
+        ("平台名称(不区分大小写)", timed(linear_platform, platform_queries),
+         timed(PlatformManager.get_platform_by_name, platform_queries)),
+        ("按类型查找风格", timed(linear_style_type, type_queries),
+         timed(StyleManager.find_style_by_type, type_queries)),
+        ("风格/内容类型兼容性", timed(linear_compatible, compat_queries),
+         timed(ConfigRegistry.is_compatible, compat_queries)),
+    ]
+
+    header = f"{'查找':<24}{'原方式(us)':>14}{'注册表(us)':>14}{'加速比':>10}"
+    print(header)
+    print("-" * len(header))
+    for label, before, after in rows:
+        print(f"{label:<24}{before:>14.2f}{after:>14.2f}{before / max(after, 1e-9):>10.1f}x")
+    print(f"\n索引构建耗时: {build_ms:.1f} ms，{ConfigRegistry.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+配置快照基准测试
+
+把仓库中的平台和风格配置（platform/collection、style/collection）复制到临时目录，
+每个文件复制 --copies 份以模拟更多配置，比较启动时加载配置的耗时：
+- 逐个读取：原 _load_platforms/load_styles 的方式，依次读取文件、解析JSON并构建模型
+- 快照冷启动：没有快照文件，并行解析全部文件并写入快照
+- 快照热启动：快照文件已存在，通过 mmap 读取后直接反序列化出模型
+
+每种方式执行 --repeat 次取平均，并校验三种方式得到的模型一致。
+
+用法:
+  python scripts/benchmark_config_snapshot.py [--copies 20] [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models.infra.config_snapshot import ConfigSnapshot  # noqa: E402
+from core.models.platform.platform import Platform  # noqa: E402
+from core.models.style.style_manager import ArticleStyle  # noqa: E402
+
+MODELS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "core", "models"))
+GROUPS = {
+    "platforms": (os.path.join(MODELS_DIR, "platform", "collection"), Platform),
+    "styles": (os.path.join(MODELS_DIR, "style", "collection"), ArticleStyle),
+}
+
+
+def prepare(root: str, copies: int) -> dict:
+    """复制配置文件，返回 组名 -> (目录, 模型类)"""
+    groups = {}
+    for name, (source, model_class) in GROUPS.items():
+        target = os.path.join(root, name)
+        os.makedirs(target)
+        for path in Path(source).glob("*.json"):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            for i in range(copies):
+                copy = dict(data, name=f"{data['name']}_{i}")
+                with open(os.path.join(target, f"{path.stem}_{i}.json"), "w", encoding="utf-8") as f:
+                    json.dump(copy, f, ensure_ascii=False)
+        groups[name] = (target, model_class)
+    return groups
+
+
+def load_sequential(groups: dict) -> dict:
+    """原实现：逐个读取、解析和构建模型"""
+    result = {}
+    for name, (directory, model_class) in groups.items():
+        models = []
+        for path in sorted(Path(directory).glob("*.json")):
+            with open(path, "r", encoding="utf-8") as f:
+                models.append(model_class(**json.load(f)))
+        result[name] = models
+    return result
+
+
+def load_snapshot(groups: dict) -> dict:
+    """通过配置快照加载"""
+    return {
+        name: list(ConfigSnapshot.load_group(
+            name, directory, lambda data, cls=model_class: cls(**data), schema=model_class
+        ).values())
+        for name, (directory, model_class) in groups.items()
+    }
+
+
+def fingerprint(result: dict) -> list:
+    """用于比较结果的模型摘要"""
+    return [(name, [model.name for model in models]) for name, models in sorted(result.items())]
+
+
+def timed(func, repeat: int, before=None):
+    """执行 repeat 次，返回最后一次的结果和平均耗时（毫秒）"""
+    total = 0.0
+    for _ in range(repeat):
+        if before:
+            before()
+        start = time.perf_counter()
+        result = func()
+        total += time.perf_counter() - start
+    return result, total / repeat * 1000
+
+
+def main() -> None:
+    """主函数"""
+    parser = argparse.ArgumentParser(description="配置快照基准测试")
+    parser.add_argument("--copies", type=int, default=20, help="每个配置文件复制的份数")
+    parser.add_argument("--repeat", type=int, default=5, help="重复次数")
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix="config_snapshot_bench_")
+    snapshot_path = os.path.join(root, "config_snapshot.bin")
+    try:
+        groups = prepare(root, args.copies)
+        file_count = sum(len(list(Path(directory).glob("*.json"))) for directory, _ in groups.values())
+        ConfigSnapshot.configure(path=snapshot_path, enabled=True)
+
+        def cold_start():
+            ConfigSnapshot.reset()
+            if os.path.exists(snapshot_path):
+                os.remove(snapshot_path)
+
+        expected, sequential_ms = timed(lambda: load_sequential(groups), args.repeat)
+        cold, cold_ms = timed(lambda: load_snapshot(groups), args.repeat, before=cold_start)
+        warm, warm_ms = timed(lambda: load_snapshot(groups), args.repeat, before=ConfigSnapshot.reset)
+        same = fingerprint(expected) == fingerprint(cold) == fingerprint(warm)
+
+        print(f"配置文件: {file_count} 个，快照大小: {os.path.getsize(snapshot_path) / 1024:.1f} KB")
+        print(f"{'方式':<12}{'耗时(ms)':>12}{'加速比':>10}")
+        print("-" * 34)
+        for label, ms in [("逐个读取", sequential_ms), ("快照冷启动", cold_ms), ("快照热启动", warm_ms)]:
+            print(f"{label:<12}{ms:>12.1f}{sequential_ms / ms:>9.1f}x")
+        print(f"结果一致: {'是' if same else '否'}")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
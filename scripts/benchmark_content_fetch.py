@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+网页抓取吞吐量基准测试
+
+启动一个本地模拟站点（每个请求固定延迟，返回带ETag的文章页面），比较三种方式处理 N 个页面的吞吐量：
+- 原方式：逐个URL串行处理，每个解析器各自阻塞下载一次页面（默认3个解析器）
+- ContentFetcher 冷缓存：共享连接池并发下载一次，提取在进程池中执行
+- ContentFetcher 热缓存：页面已在磁盘缓存中，只做提取
+
+用法:
+  python scripts/benchmark_content_fetch.py [--pages 200] [--latency 0.05] [--parsers 3]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.tools.content_collectors.fetcher import ContentFetcher, extract_content  # noqa: E402
+
+PARAGRAPH = "GenFlow 是一个多智能体内容生产系统，负责选题、研究、写作、风格适配和审核。" * 8
+
+
+def make_handler(latency: float):
+    """创建固定延迟的页面处理器"""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            time.sleep(latency)
+            if self.path == "/robots.txt":
+                body = b"User-agent: *\nAllow: /\n"
+                etag = None
+            else:
+                paragraphs = "".join(f"<p>{PARAGRAPH}{i}</p>" for i in range(20))
+                body = (f"<html><head><title>文章 {self.path}</title></head>"
+                        f"<body><nav>导航</nav><h1>文章 {self.path}</h1>{paragraphs}</body></html>").encode()
+                etag = '"' + hashlib.md5(body).hexdigest() + '"'
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            if etag:
+                self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def baseline(urls, parsers: int) -> float:
+    """原方式：串行处理，每个解析器各自下载并提取"""
+    start = time.perf_counter()
+    for url in urls:
+        for _ in range(parsers):
+            with urllib.request.urlopen(url, timeout=30) as response:
+                html = response.read().decode("utf-8")
+            extract_content(html, url, ("basic",))
+    return time.perf_counter() - start
+
+
+async def with_fetcher(urls, cache_dir: str, concurrency: int):
+    """共享抓取层：冷缓存一次，热缓存一次"""
+    fetcher = ContentFetcher(cache_dir=cache_dir, host_interval=0)
+    try:
+        start = time.perf_counter()
+        cold = await fetcher.get_contents(urls, ("basic",), concurrency=concurrency)
+        cold_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        warm = await fetcher.get_contents(urls, ("basic",), concurrency=concurrency)
+        warm_time = time.perf_counter() - start
+    finally:
+        await fetcher.close()
+
+    assert all(cold) and all(warm), "部分页面提取失败"
+    return cold_time, warm_time, fetcher.stats
+
+
+def main() -> None:
+    """主函数"""
+    parser = argparse.ArgumentParser(description="网页抓取吞吐量基准测试")
+    parser.add_argument("--pages", type=int, default=200, help="页面数")
+    parser.add_argument("--latency", type=float, default=0.05, help="模拟站点每个请求的延迟（秒）")
+    parser.add_argument("--parsers", type=int, default=3, help="原方式中每个页面尝试的解析器数")
+    parser.add_argument("--concurrency", type=int, default=16, help="ContentFetcher并发数")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(args.latency))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    urls = [f"http://127.0.0.1:{server.server_port}/article/{i}" for i in range(args.pages)]
+
+    try:
+        base_time = baseline(urls, args.parsers)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cold_time, warm_time, stats = asyncio.run(with_fetcher(urls, cache_dir, args.concurrency))
+    finally:
+        server.shutdown()
+
+    header = f"{'方式':<28}{'耗时(s)':>10}{'页面/秒':>12}"
+    print(header)
+    print("-" * len(header))
+    for label, elapsed in (
+        (f"原方式(串行, {args.parsers}次下载/页)", base_time),
+        ("ContentFetcher 冷缓存", cold_time),
+        ("ContentFetcher 热缓存", warm_time),
+    ):
+        print(f"{label:<28}{elapsed:>10.2f}{args.pages / elapsed:>12.1f}")
+    print(f"\n抓取统计: {stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+控制AI并发会话压测
+
+启动一个本地模拟 OpenAI 服务（固定延迟返回意图、规划和回复），
+将 OPENAI_BASE_URL 指向它，然后在单个进程内并发执行
+ControlAI.process_request，统计每秒完成的会话数与延迟分布。
+每个会话依次调用意图识别、任务规划、响应生成三次 LLM。
+
+用法:
+  python scripts/benchmark_control_ai.py [--sessions 500] [--concurrency 100] [--latency 0.2]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import uvicorn  # noqa: E402
+from fastapi import FastAPI, Request  # noqa: E402
+
+INTENT = {
+    "intent_type": "information_query",
+    "confidence": 0.9,
+    "entities": {"topic": "GenFlow"},
+    "explanation": "模拟意图"
+}
+
+PLAN = {
+    "task_type": "information_query",
+    "steps": [{"action": "provide_information", "parameters": {"message": "GenFlow是内容生产系统"}}],
+    "requires_confirmation": False
+}
+
+
+def create_mock_app(latency: float) -> FastAPI:
+    """创建模拟 OpenAI 聊天补全接口
+
+    Args:
+        latency: 每次请求的模拟延迟（秒）
+
+    Returns:
+        FastAPI: 模拟服务
+    """
+    app = FastAPI()
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request) -> Dict[str, Any]:
+        body = await request.json()
+        await asyncio.sleep(latency)
+
+        prompt = body["messages"][-1]["content"]
+        if "意图类型:" in prompt:
+            content = json.dumps(PLAN, ensure_ascii=False)
+        elif body.get("response_format"):
+            content = json.dumps(INTENT, ensure_ascii=False)
+        else:
+            content = "GenFlow是一个内容生产系统。"
+
+        return {
+            "id": "chatcmpl-mock",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "mock"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        }
+
+    return app
+
+
+def start_mock_server(latency: float) -> str:
+    """在后台线程启动模拟服务
+
+    Args:
+        latency: 模拟延迟（秒）
+
+    Returns:
+        str: 服务地址
+    """
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+
+    config = uvicorn.Config(create_mock_app(latency), host="127.0.0.1", port=port,
+                            log_level="warning", backlog=4096)
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}/v1"
+
+
+async def run_sessions(sessions: int, concurrency: int) -> Dict[str, Any]:
+    """并发执行会话
+
+    Args:
+        sessions: 会话总数
+        concurrency: 同时进行的会话数
+
+    Returns:
+        Dict[str, Any]: 统计结果
+    """
+    from core.control_ai.control_ai import ControlAI
+    from core.control_ai.llm_client import close_llm_client, get_llm_client
+
+    control_ai = ControlAI()
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async def one_session(i: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            result = await control_ai.process_request(f"GenFlow是什么？#{i}")
+            latencies.append(time.perf_counter() - start)
+            if "error" in result:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one_session(i) for i in range(sessions)))
+    elapsed = time.perf_counter() - start
+
+    llm_stats = get_llm_client().get_stats()
+    await close_llm_client()
+
+    latencies.sort()
+    return {
+        "sessions": sessions,
+        "errors": errors,
+        "elapsed": elapsed,
+        "sessions_per_sec": sessions / elapsed if elapsed else 0.0,
+        "p50": statistics.median(latencies),
+        "p95": latencies[max(0, int(len(latencies) * 0.95) - 1)],
+        "llm": llm_stats,
+    }
+
+
+def main() -> None:
+    """主函数"""
+    parser = argparse.ArgumentParser(description="控制AI并发会话压测")
+    parser.add_argument("--sessions", type=int, default=500, help="会话总数")
+    parser.add_argument("--concurrency", type=int, default=100, help="同时进行的会话数")
+    parser.add_argument("--latency", type=float, default=0.2, help="模拟LLM延迟（秒）")
+    args = parser.parse_args()
+
+    os.environ["OPENAI_BASE_URL"] = start_mock_server(args.latency)
+    os.environ.setdefault("OPENAI_API_KEY", "mock-key")
+
+    result = asyncio.run(run_sessions(args.sessions, args.concurrency))
+    serial = args.sessions * 3 * args.latency
+
+    print(f"会话数: {result['sessions']}  并发: {args.concurrency}  错误: {result['errors']}")
+    print(f"耗时: {result['elapsed']:.2f} s（串行调用LLM约需 {serial:.1f} s）")
+    print(f"吞吐量: {result['sessions_per_sec']:.1f} 会话/秒")
+    print(f"延迟 p50: {result['p50'] * 1000:.0f} ms  p95: {result['p95'] * 1000:.0f} ms")
+    llm = result["llm"]
+    print(f"LLM请求: {llm['requests']}  错误: {llm['errors']}  平均耗时: {llm['avg_time'] * 1000:.0f} ms"
+          f"  并发上限: {llm['max_concurrency']}")
+
+
+if __name__ == "__main__":
+    main()
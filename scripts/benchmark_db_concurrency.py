@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+SQLite 并发写入基准测试
+
+对比不同存储模式下 N 个写线程 + M 个读线程的吞吐量和锁错误数：
+  default     - 原有模式：StaticPool 单连接，所有线程共享
+  wal-direct  - WAL + 每线程连接，写线程直接写库
+  production  - WAL + 每线程读连接 + 串行写队列
+
+用法:
+  python scripts/benchmark_db_concurrency.py [--writers 8] [--readers 8] [--ops 500]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import text  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from core.models.db.session import (  # noqa: E402
+    DB_MODE_DEFAULT, DB_MODE_PRODUCTION, create_db_engine, create_write_engine
+)
+from core.models.db.write_queue import SerializedWriter  # noqa: E402
+
+SCENARIOS = ["default", "wal-direct", "production"]
+
+
+class _Counters:
+    """线程安全的计数器"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.values = {"writes": 0, "reads": 0, "lock_errors": 0, "other_errors": 0}
+
+    def incr(self, key: str) -> None:
+        with self.lock:
+            self.values[key] += 1
+
+
+def _record_error(counters: _Counters, error: Exception) -> None:
+    if isinstance(error, OperationalError) and "locked" in str(error):
+        counters.incr("lock_errors")
+    else:
+        counters.incr("other_errors")
+
+
+def _insert(db, writer_id: int, seq: int) -> None:
+    db.execute(
+        text("INSERT INTO bench (writer, seq, payload) VALUES (:w, :s, :p)"),
+        {"w": writer_id, "s": seq, "p": "x" * 256}
+    )
+
+
+def run_scenario(scenario: str, writers: int, readers: int, ops: int) -> Dict[str, Any]:
+    """运行单个场景
+
+    Args:
+        scenario: 场景名称
+        writers: 写线程数
+        readers: 读线程数
+        ops: 每个写线程的写入次数
+
+    Returns:
+        Dict[str, Any]: 测试结果
+    """
+    db_file = os.path.join(tempfile.mkdtemp(prefix="genflow-bench-"), "bench.db")
+    mode = DB_MODE_DEFAULT if scenario == "default" else DB_MODE_PRODUCTION
+    engine = create_db_engine(db_file, mode=mode)
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE bench (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "writer INTEGER, seq INTEGER, payload TEXT)"
+        ))
+
+    ReadSession = sessionmaker(bind=engine)
+    writer_queue = None
+    if scenario == "production":
+        writer_queue = SerializedWriter(
+            sessionmaker(bind=create_write_engine(db_file), expire_on_commit=False)
+        )
+        writer_queue.start()
+
+    counters = _Counters()
+    writers_done = threading.Event()
+
+    def write_direct(writer_id: int) -> None:
+        for seq in range(ops):
+            db = ReadSession()
+            try:
+                _insert(db, writer_id, seq)
+                db.commit()
+                counters.incr("writes")
+            except Exception as e:
+                db.rollback()
+                _record_error(counters, e)
+            finally:
+                db.close()
+
+    def write_queued(writer_id: int) -> None:
+        for seq in range(ops):
+            try:
+                writer_queue.execute(lambda db, s=seq: _insert(db, writer_id, s))
+                counters.incr("writes")
+            except Exception as e:
+                _record_error(counters, e)
+
+    def read_loop() -> None:
+        while not writers_done.is_set():
+            db = ReadSession()
+            try:
+                db.execute(text("SELECT COUNT(*) FROM bench")).scalar()
+                db.execute(
+                    text("SELECT payload FROM bench WHERE id = :id"),
+                    {"id": random.randint(1, max(1, writers * ops))}
+                ).first()
+                counters.incr("reads")
+            except Exception as e:
+                _record_error(counters, e)
+            finally:
+                db.close()
+
+    write_fn: Callable[[int], None] = write_queued if writer_queue else write_direct
+    writer_threads = [threading.Thread(target=write_fn, args=(i,)) for i in range(writers)]
+    reader_threads = [threading.Thread(target=read_loop) for _ in range(readers)]
+
+    start = time.perf_counter()
+    for t in reader_threads + writer_threads:
+        t.start()
+    for t in writer_threads:
+        t.join()
+    writers_done.set()
+    for t in reader_threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    if writer_queue:
+        writer_queue.stop()
+    engine.dispose()
+
+    result = dict(counters.values)
+    result.update({
+        "scenario": scenario,
+        "elapsed": elapsed,
+        "write_ops_per_sec": result["writes"] / elapsed if elapsed else 0.0,
+        "read_ops_per_sec": result["reads"] / elapsed if elapsed else 0.0,
+    })
+    return result
+
+
+def print_report(results: List[Dict[str, Any]]) -> None:
+    """打印结果表格"""
+    header = f"{'场景':<12}{'耗时(s)':>10}{'写入/s':>12}{'读取/s':>12}{'锁错误':>10}{'其他错误':>10}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r['scenario']:<12}{r['elapsed']:>10.2f}{r['write_ops_per_sec']:>12.1f}"
+            f"{r['read_ops_per_sec']:>12.1f}{r['lock_errors']:>10}{r['other_errors']:>10}"
+        )
+
+
+def main() -> None:
+    """主函数"""
+    parser = argparse.ArgumentParser(description="SQLite 并发写入基准测试")
+    parser.add_argument("--writers", type=int, default=8, help="写线程数")
+    parser.add_argument("--readers", type=int, default=8, help="读线程数")
+    parser.add_argument("--ops", type=int, default=500, help="每个写线程的写入次数")
+    parser.add_argument("--scenario", choices=SCENARIOS, action="append",
+                        help="只运行指定场景，可重复")
+    args = parser.parse_args()
+
+    results = [
+        run_scenario(scenario, args.writers, args.readers, args.ops)
+        for scenario in (args.scenario or SCENARIOS)
+    ]
+    print(f"\n写线程: {args.writers}  读线程: {args.readers}  每线程写入: {args.ops}\n")
+    print_report(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+启动导入时间基准测试
+
+在独立的子进程中用 ``python -X importtime`` 导入各启动入口，统计：
+- 导入耗时：入口本身导入的全部模块的累计时间（不含解释器启动时已加载的模块）
+- 进程耗时：子进程从启动到退出的时间，取多次中的最小值
+- 按顶层包汇总的导入耗时，找出最慢的依赖
+- 是否加载了 crewai、langchain、jieba、nltk 等重型依赖
+
+每个入口都有导入时间预算，并且不允许加载重型依赖；使用 --check 时超出预算或导入失败返回非零退出码，
+可以放进CI防止启动时间回退。
+
+用法:
+  python scripts/benchmark_import_time.py [--targets web cli-help core.tools] [--repeat 3] [--top 10] [--check]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# 启动阶段不应加载的重型依赖（只在真正调用对应工具或团队时才导入）
+HEAVY_MODULES = [
+    "crewai", "langchain", "langchain_core", "jieba", "nltk", "newspaper",
+    "trafilatura", "yake", "summa", "litellm", "openai",
+]
+
+
+@dataclass
+class Target:
+    """启动入口"""
+    args: List[str]
+    budget_ms: float
+    cwd: str = ROOT
+    description: str = ""
+
+
+TARGETS: Dict[str, Target] = {
+    "web": Target(["-c", "import main"], 1500, os.path.join(ROOT, "backend", "src"), "API进程（backend/src/main.py）"),
+    "cli-help": Target(["-m", "core.main", "--help"], 800, description="命令行 --help"),
+    "core.tools": Target(["-c", "import core.tools"], 500, description="工具包"),
+    "core.agents": Target(
+        ["-c", "import core.agents.topic_crew, core.agents.research_crew, core.agents.writing_crew, "
+               "core.agents.style_crew, core.agents.review_crew"],
+        500, description="各团队包"
+    ),
+    "controller": Target(["-c", "import core.controllers.content_controller"], 800, description="内容控制器模块"),
+}
+
+_IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int, int]]:
+    """解析 -X importtime 输出
+
+    Returns:
+        List[Tuple[str, int, int, int]]: (模块名, 嵌套深度, 自身耗时us, 累计耗时us)
+    """
+    entries = []
+    for line in stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append((name, len(indent) // 2, int(self_us), int(cumulative_us)))
+    return entries
+
+
+def run_importtime(args: List[str], cwd: str) -> Tuple[subprocess.CompletedProcess, float]:
+    """以 -X importtime 运行子进程，返回进程结果和耗时（毫秒）"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")])))
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=cwd, env=env, capture_output=True, text=True
+    )
+    return result, (time.perf_counter() - start) * 1000
+
+
+def startup_modules() -> set:
+    """解释器启动时已导入的模块"""
+    result, _ = run_importtime(["-c", "pass"], ROOT)
+    return {name for name, _, _, _ in parse_importtime(result.stderr)}
+
+
+def measure(target: Target, baseline: set, repeat: int) -> dict:
+    """测量一个入口的导入时间"""
+    best: Optional[dict] = None
+    for _ in range(repeat):
+        result, wall_ms = run_importtime(target.args, target.cwd)
+        entries = [entry for entry in parse_importtime(result.stderr) if entry[0] not in baseline]
+        import_ms = sum(cumulative for _, depth, _, cumulative in entries if depth == 0) / 1000
+        if best is None or wall_ms < best["wall_ms"]:
+            by_package = defaultdict(int)
+            for name, _, self_us, _ in entries:
+                by_package[name.split(".")[0]] += self_us
+            errors = [line for line in result.stderr.splitlines() if not line.startswith("import time:")]
+            best = {
+                "wall_ms": wall_ms,
+                "import_ms": import_ms,
+                "modules": len(entries),
+                "packages": by_package,
+                "heavy": sorted({name.split(".")[0] for name, _, _, _ in entries} & set(HEAVY_MODULES)),
+                "returncode": result.returncode,
+                "error": errors[-1] if result.returncode != 0 and errors else "",
+            }
+    return best
+
+
+def main() -> None:
+    """主函数"""
+    parser = argparse.ArgumentParser(description="启动导入时间基准测试")
+    parser.add_argument("--targets", nargs="+", choices=list(TARGETS), default=list(TARGETS), help="测量的入口")
+    parser.add_argument("--repeat", type=int, default=3, help="每个入口运行次数，取最快的一次")
+    parser.add_argument("--top", type=int, default=8, help="列出导入最慢的包的数量")
+    parser.add_argument("--check", action="store_true", help="超出预算、加载重型依赖或导入失败时返回非零退出码")
+    args = parser.parse_args()
+
+    baseline = startup_modules()
+    failed = []
+    header = f"{'入口':<14}{'导入(ms)':>10}{'进程(ms)':>10}{'预算(ms)':>10}{'模块数':>8}  重型依赖"
+    print(header)
+    print("-" * (len(header) + 10))
+
+    results = {}
+    for name in args.targets:
+        target = TARGETS[name]
+        stats = measure(target, baseline, args.repeat)
+        results[name] = stats
+        over = stats["import_ms"] > target.budget_ms or stats["heavy"]
+        if over or stats["returncode"] != 0:
+            failed.append(name)
+        print(f"{name:<14}{stats['import_ms']:>10.1f}{stats['wall_ms']:>10.1f}{target.budget_ms:>10.0f}"
+              f"{stats['modules']:>8}  {', '.join(stats['heavy']) or '-'}{'  超出预算' if over else ''}")
+        if stats["error"]:
+            print(f"{'':<14}退出码 {stats['returncode']}: {stats['error']}")
+
+    for name, stats in results.items():
+        slowest = sorted(stats["packages"].items(), key=lambda item: item[1], reverse=True)[:args.top]
+        print(f"\n{name}（{TARGETS[name].description}）导入最慢的包:")
+        for package, self_us in slowest:
+            print(f"  {package:<24}{self_us / 1000:>8.1f} ms")
+
+    if args.check and failed:
+        print(f"\n超出预算或导入失败: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
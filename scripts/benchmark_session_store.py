@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+控制AI会话内存基准测试
+
+创建 N 个会话（默认10万），每个会话进行若干轮对话，用 tracemalloc 统计
+两种方式的内存占用：
+- 原方式：普通字典保存全部会话，历史记录无限增长
+- 新方式：MemorySessionStore（LRU + 空闲过期）保存会话，历史超出窗口后压缩为摘要
+
+用法:
+  python scripts/benchmark_session_store.py [--sessions 100000] [--turns 30] [--max-sessions 10000]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import core.control_ai.control_ai as control_ai_module  # noqa: E402
+from core.control_ai.control_ai import SessionState  # noqa: E402
+from core.control_ai.session_store import MemorySessionStore  # noqa: E402
+
+USER_INPUT = "帮我写一篇关于人工智能在医疗领域应用的文章，风格专业一些，字数两千字左右"
+RESPONSE = "好的，我将为您创作一篇关于人工智能在医疗领域应用的专业文章。" * 4
+
+
+def run(store, sessions: int, turns: int) -> dict:
+    """写入会话并统计内存
+
+    Args:
+        store: 会话存储（dict或SessionStore）
+        sessions: 会话数
+        turns: 每个会话的对话轮数
+
+    Returns:
+        dict: 统计结果
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    for i in range(sessions):
+        session = SessionState(f"session-{i}")
+        for _ in range(turns):
+            session.add_interaction(USER_INPUT, RESPONSE)
+        if isinstance(store, dict):
+            store[session.session_id] = session
+        else:
+            store.save(session)
+
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"sessions": len(store), "current_mb": current / 1024 / 1024,
+            "peak_mb": peak / 1024 / 1024, "elapsed": elapsed}
+
+
+def main() -> None:
+    """主函数"""
+    parser = argparse.ArgumentParser(description="控制AI会话内存基准测试")
+    parser.add_argument("--sessions", type=int, default=100000, help="会话数")
+    parser.add_argument("--turns", type=int, default=30, help="每个会话的对话轮数")
+    parser.add_argument("--max-sessions", type=int, default=10000, help="LRU容量")
+    args = parser.parse_args()
+
+    # 原方式：关闭历史压缩
+    window = control_ai_module.HISTORY_WINDOW
+    control_ai_module.HISTORY_WINDOW = args.turns + 1
+    baseline = run({}, args.sessions, args.turns)
+    control_ai_module.HISTORY_WINDOW = window
+
+    bounded = run(MemorySessionStore(max_sessions=args.max_sessions), args.sessions, args.turns)
+
+    header = f"{'方式':<28}{'保留会话':>10}{'当前(MB)':>12}{'峰值(MB)':>12}{'耗时(s)':>10}"
+    print(header)
+    print("-" * len(header))
+    for label, r in (("dict + 完整历史", baseline), ("LRU存储 + 历史压缩", bounded)):
+        print(f"{label:<28}{r['sessions']:>10}{r['current_mb']:>12.1f}{r['peak_mb']:>12.1f}{r['elapsed']:>10.2f}")
+    print(f"\n每会话内存: 原方式 {baseline['current_mb'] * 1024 / max(baseline['sessions'], 1):.1f} KB，"
+          f"新方式 {bounded['current_mb'] * 1024 / max(bounded['sessions'], 1):.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+文本指标基准测试
+
+生成约 1 MB 的中英混合 Markdown 文档（默认200个章节），比较字数统计的耗时：
+- 原 count_words：去标签、合并空白、CJK 和英文词各一次 findall，共四遍扫描
+- measure_text：单个预编译正则一次扫描，同时得到字数、句子、段落和图片数
+- DocumentMetrics 增量更新：修改其中一个章节后只重新统计该章节
+
+用法:
+  python scripts/benchmark_text_metrics.py [--size-mb 1] [--sections 200] [--repeat 5]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.models.article.text_metrics import DocumentMetrics, measure_text  # noqa: E402
+
+CJK_SAMPLE = "异步编程是现代开发中不可或缺的一部分它能显著提升输入输出密集型程序的吞吐量"
+LATIN_SAMPLE = ["async", "await", "event", "loop", "coroutine", "throughput", "latency", "Python"]
+
+
+def original_count_words(text: str) -> int:
+    """原 text_utils.count_words 的字符串分支"""
+    text = re.sub(r'<[^>]+>', '', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    chinese_chars = re.findall(r'[\u4e00-\u9fff\u3400-\u4dbf\uf900-\ufaff\u3300-\u33ff\ufe30-\ufe4f]', text)
+    non_chinese_words = re.findall(r'[a-zA-Z0-9_\-\']+', text)
+    return len(chinese_chars) + len(non_chinese_words)
+
+
+def make_section(rng: random.Random, size: int) -> str:
+    """生成一个约 size 字节的章节"""
+    parts = []
+    length = 0
+    while length < size:
+        sentence = CJK_SAMPLE[:rng.randrange(10, len(CJK_SAMPLE))] + " " + " ".join(rng.sample(LATIN_SAMPLE, 3))
+        sentence += rng.choice(["。", "！", ". "])
+        if rng.random() < 0.1:
+            sentence += "\n\n"
+        if rng.random() < 0.01:
+            sentence += "![示意图](https://example.com/a.png)\n\n"
+        parts.append(sentence)
+        length += len(sentence.encode("utf-8"))
+    return "".join(parts)
+
+
+def timed(func, repeat: int) -> float:
+    """执行 repeat 次并返回平均耗时（毫秒）"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    """主函数"""
+    parser = argparse.ArgumentParser(description="文本指标基准测试")
+    parser.add_argument("--size-mb", type=float, default=1.0, help="文档大小（MB）")
+    parser.add_argument("--sections", type=int, default=200, help="章节数")
+    parser.add_argument("--repeat", type=int, default=5, help="重复次数")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    section_size = int(args.size_mb * 1024 * 1024 / args.sections)
+    sections = [make_section(rng, section_size) for _ in range(args.sections)]
+    document = "\n\n".join(sections)
+
+    metrics = DocumentMetrics()
+    metrics.sync((str(i), text) for i, text in enumerate(sections))
+    edits = [make_section(rng, section_size) for _ in range(args.repeat)]
+    edit_iter = iter(edits)
+
+    def incremental():
+        metrics.update("0", next(edit_iter))
+
+    rows = [
+        ("原 count_words（四遍扫描）", timed(lambda: original_count_words(document), args.repeat)),
+        ("measure_text（单遍）", timed(lambda: measure_text(document), args.repeat)),
+        ("增量更新一个章节", timed(incremental, args.repeat)),
+    ]
+
+    print(f"文档大小: {len(document.encode('utf-8')) / 1024 / 1024:.2f} MB，{args.sections} 个章节")
+    print(f"统计结果: {measure_text(document).to_dict()}\n")
+    header = f"{'方式':<30}{'耗时(ms)':>12}"
+    print(header)
+    print("-" * len(header))
+    for label, elapsed in rows:
+        print(f"{label:<30}{elapsed:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
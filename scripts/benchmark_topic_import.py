@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+话题批量导入基准测试
+
+对比导入大量话题时逐行 create（每行提交并 refresh）与
+TopicRepository.bulk_create / bulk_upsert 的吞吐量。
+
+用法:
+  python scripts/benchmark_topic_import.py [--count 100000] [--naive-count 5000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from core.models.db.session import DB_MODE_PRODUCTION, create_db_engine  # noqa: E402
+from core.models.db.repository import TopicRepository  # noqa: E402
+from core.models.topic.topic_db import Topic  # noqa: E402
+
+
+def make_topics(count: int) -> List[Dict[str, Any]]:
+    """生成测试话题"""
+    platforms = ["weibo", "zhihu", "bilibili", "toutiao", "douyin"]
+    now = int(time.time())
+    return [
+        {
+            "id": f"topic-{i:08d}",
+            "title": f"测试话题 {i}",
+            "description": "基准测试生成的话题描述",
+            "platform": platforms[i % len(platforms)],
+            "url": f"https://example.com/topics/{i}",
+            "keywords": ["基准", "测试", f"k{i % 100}"],
+            "created_at": now - i,
+            "updated_at": now - i,
+        }
+        for i in range(count)
+    ]
+
+
+def timed(label: str, rows: int, fn: Callable[[], Any]) -> Dict[str, Any]:
+    """计时执行"""
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    return {"label": label, "rows": rows, "elapsed": elapsed,
+            "rows_per_sec": rows / elapsed if elapsed else 0.0}
+
+
+def run(count: int, naive_count: int) -> List[Dict[str, Any]]:
+    """运行全部场景
+
+    Args:
+        count: 批量导入的话题数
+        naive_count: 逐行导入的话题数（逐行提交很慢，单独限制）
+
+    Returns:
+        List[Dict[str, Any]]: 各场景结果
+    """
+    db_file = os.path.join(tempfile.mkdtemp(prefix="genflow-bench-"), "topics.db")
+    engine = create_db_engine(db_file, mode=DB_MODE_PRODUCTION)
+    Topic.__table__.create(engine)
+    Session = sessionmaker(bind=engine)
+    topics = make_topics(count)
+    results = []
+
+    # 原有方式：每行构造ORM对象、提交并refresh
+    def naive_import():
+        db = Session()
+        repo = TopicRepository(db)
+        for row in topics[:naive_count]:
+            obj = Topic(**repo.to_row(row))
+            db.add(obj)
+            db.commit()
+            db.refresh(obj)
+        db.close()
+
+    results.append(timed("逐行 create", naive_count, naive_import))
+
+    with engine.begin() as conn:
+        conn.execute(Topic.__table__.delete())
+
+    def bulk_create():
+        db = Session()
+        TopicRepository(db).bulk_create(topics)
+        db.commit()
+        db.close()
+
+    results.append(timed("bulk_create", count, bulk_create))
+
+    # 同一批数据再次upsert，全部走冲突更新分支
+    for row in topics:
+        row["title"] = row["title"] + " (更新)"
+
+    def bulk_upsert():
+        db = Session()
+        TopicRepository(db).bulk_upsert(topics)
+        db.commit()
+        db.close()
+
+    results.append(timed("bulk_upsert(更新)", count, bulk_upsert))
+
+    with engine.begin() as conn:
+        conn.execute(Topic.__table__.delete())
+
+    results.append(timed("bulk_upsert(插入)", count, bulk_upsert))
+
+    engine.dispose()
+    return results
+
+
+def main() -> None:
+    """主函数"""
+    parser = argparse.ArgumentParser(description="话题批量导入基准测试")
+    parser.add_argument("--count", type=int, default=100000, help="批量导入的话题数")
+    parser.add_argument("--naive-count", type=int, default=5000, help="逐行导入的话题数")
+    args = parser.parse_args()
+
+    results = run(args.count, args.naive_count)
+
+    header = f"{'场景':<20}{'行数':>10}{'耗时(s)':>12}{'行/s':>14}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(f"{r['label']:<20}{r['rows']:>10}{r['elapsed']:>12.2f}{r['rows_per_sec']:>14.1f}")
+
+    naive_rate = results[0]["rows_per_sec"]
+    if naive_rate:
+        print(f"\n按逐行速度估算导入 {args.count} 个话题需 {args.count / naive_rate:.1f} 秒")
+
+
+if __name__ == "__main__":
+    main()
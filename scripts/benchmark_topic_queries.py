@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+话题查询基准测试
+
+在 N 条话题（默认100万）上分别于“无索引”和“有索引”两种状态下执行
+TopicRepository 的常用查询，打印 EXPLAIN QUERY PLAN 与耗时，并对比
+深分页下 OFFSET 与键集分页的差异。
+
+用法:
+  python scripts/benchmark_topic_queries.py [--rows 1000000] [--db /tmp/topics.db]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy.dialects import sqlite  # noqa: E402
+from sqlalchemy.orm import Query, sessionmaker  # noqa: E402
+
+from core.models.db.session import DB_MODE_PRODUCTION, create_db_engine  # noqa: E402
+from core.models.db.migrations import drop_declared_indexes, ensure_indexes  # noqa: E402
+from core.models.db.repository import TopicRepository  # noqa: E402
+from core.models.topic.topic_db import Topic  # noqa: E402
+
+PLATFORMS = ["weibo", "zhihu", "bilibili", "toutiao", "douyin", "baidu", "juejin", "csdn"]
+BASE_TIME = 1_700_000_000
+REPEAT = 5
+
+
+def populate(engine, rows: int) -> None:
+    """写入测试数据"""
+    Session = sessionmaker(bind=engine)
+    batch = 50000
+    for start in range(0, rows, batch):
+        db = Session()
+        TopicRepository(db).bulk_create(
+            {
+                "id": f"topic-{i:08d}",
+                "title": f"话题 {i}",
+                "platform": PLATFORMS[i % len(PLATFORMS)],
+                "created_at": BASE_TIME + i,
+                "updated_at": BASE_TIME + i,
+            }
+            for i in range(start, min(start + batch, rows))
+        )
+        db.commit()
+        db.close()
+        print(f"  已写入 {min(start + batch, rows)}/{rows}", end="\r")
+    print()
+
+
+def explain(db, query: Query) -> List[str]:
+    """获取查询计划"""
+    compiled = query.statement.compile(dialect=sqlite.dialect(),
+                                       compile_kwargs={"literal_binds": True})
+    rows = db.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}").fetchall()
+    return [row[-1] for row in rows]
+
+
+def measure(fn: Callable[[], Any]) -> float:
+    """多次执行取最短耗时（毫秒）"""
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run_queries(engine, rows: int) -> Dict[str, Dict[str, Any]]:
+    """执行查询集"""
+    db = sessionmaker(bind=engine)()
+    repo = TopicRepository(db)
+    mid = BASE_TIME + rows // 2
+    deep_offset = max(0, rows // len(PLATFORMS) - 100)
+
+    # 先翻到深处，获取键集分页在相同位置的游标
+    page = repo.paginate_by_platform("zhihu", limit=deep_offset)
+    deep_cursor = page.next_cursor
+
+    by_platform = db.query(Topic).filter(Topic.platform == "zhihu").order_by(
+        Topic.created_at.desc(), Topic.id.desc())
+    cases = {
+        "get_by_platform(limit=50)": (
+            by_platform.limit(50),
+            lambda: repo.get_by_platform("zhihu", limit=50)),
+        "query_by_time_range(1h)": (
+            db.query(Topic).filter(Topic.created_at >= mid, Topic.created_at <= mid + 3600),
+            lambda: repo.query_by_time_range(mid, mid + 3600)),
+        "get_latest(10)": (
+            db.query(Topic).order_by(Topic.created_at.desc(), Topic.id.desc()).limit(10),
+            lambda: repo.get_latest(10)),
+        "平台深分页 OFFSET": (
+            by_platform.offset(deep_offset).limit(50),
+            lambda: by_platform.offset(deep_offset).limit(50).all()),
+        "平台深分页 键集": (
+            by_platform.limit(50),
+            lambda: repo.paginate_by_platform("zhihu", cursor=deep_cursor, limit=50)),
+    }
+
+    results = {}
+    for name, (query, fn) in cases.items():
+        results[name] = {"plan": explain(db, query), "ms": measure(fn)}
+    db.close()
+    return results
+
+
+def print_results(title: str, results: Dict[str, Dict[str, Any]]) -> None:
+    """打印结果"""
+    print(f"\n=== {title} ===")
+    for name, result in results.items():
+        print(f"{name:<28}{result['ms']:>10.2f} ms")
+        for line in result["plan"]:
+            print(f"    {line}")
+
+
+def main() -> None:
+    """主函数"""
+    parser = argparse.ArgumentParser(description="话题查询基准测试")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="话题数量")
+    parser.add_argument("--db", help="数据库文件路径，已存在则复用其中数据")
+    args = parser.parse_args()
+
+    db_file = args.db or os.path.join(tempfile.mkdtemp(prefix="genflow-bench-"), "topics.db")
+    reuse = os.path.exists(db_file)
+    engine = create_db_engine(db_file, mode=DB_MODE_PRODUCTION)
+
+    if not reuse:
+        print(f"创建测试数据库: {db_file}")
+        Topic.__table__.create(engine)
+        populate(engine, args.rows)
+
+    drop_declared_indexes(engine)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("ANALYZE")
+    print_results("无索引", run_queries(engine, args.rows))
+
+    start = time.perf_counter()
+    created = ensure_indexes(engine)
+    print(f"\n创建索引 {', '.join(created)} 耗时 {time.perf_counter() - start:.1f} 秒")
+    print_results("有索引", run_queries(engine, args.rows))
+
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+话题评分基准测试
+
+生成随机话题（默认 1万 和 100万 条），比较计算优先级分数并取前k个话题的耗时：
+- 逐个计算：对每个话题调用 TopicProcessor.calculate_priority_score，再整体排序后截取
+- 批量计算：rank_topics 转为NumPy列数组一次计算分数，argpartition 选出前k个
+
+两种方式使用同一个当前时间，并校验结果完全一致。
+
+用法:
+  python scripts/benchmark_topic_scoring.py [--sizes 10000 1000000] [--limit 50] [--repeat 3]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.tools.trending_tools.platform_weights import PLATFORM_WEIGHTS  # noqa: E402
+from core.tools.trending_tools.scoring import rank_topics  # noqa: E402
+from core.tools.trending_tools.utils import TopicProcessor  # noqa: E402
+
+NOW = datetime.now().timestamp()
+
+
+class FrozenDatetime(datetime):
+    """固定当前时间，使两种方式的结果可以比较"""
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.fromtimestamp(NOW, tz)
+
+
+def make_topics(count: int, rng: random.Random) -> list:
+    """生成 count 条随机话题"""
+    platforms = list(PLATFORM_WEIGHTS) + ["unknown-site"]
+    return [
+        {
+            "title": f"话题{i}",
+            "platform": rng.choice(platforms),
+            "hot_score": rng.randint(1, 5_000_000) if rng.random() < 0.9 else None,
+            "source_time": int(NOW) - rng.randint(0, 10 * 24 * 3600),
+        }
+        for i in range(count)
+    ]
+
+
+def loop_rank(topics: list, limit: int) -> list:
+    """原实现：逐个评分、排序、截取"""
+    processor = TopicProcessor()
+    for topic in topics:
+        topic["priority_score"] = processor.calculate_priority_score(topic)
+    return sorted(topics, key=lambda x: x["priority_score"], reverse=True)[:limit]
+
+
+def timed(func, repeat: int):
+    """执行 repeat 次，返回最后一次的结果和平均耗时（毫秒）"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return result, (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    """主函数"""
+    parser = argparse.ArgumentParser(description="话题评分基准测试")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000], help="话题数量")
+    parser.add_argument("--limit", type=int, default=50, help="返回的话题数量")
+    parser.add_argument("--repeat", type=int, default=3, help="重复次数")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    header = f"{'话题数':>10}{'逐个计算(ms)':>16}{'批量计算(ms)':>16}{'加速比':>10}{'结果一致':>10}"
+    print(header)
+    print("-" * len(header))
+
+    for size in args.sizes:
+        topics = make_topics(size, rng)
+        with patch("core.tools.trending_tools.utils.datetime", FrozenDatetime):
+            expected, loop_ms = timed(lambda: loop_rank(topics, args.limit), args.repeat)
+        expected = [(t["title"], t["priority_score"]) for t in expected]
+
+        ranked, numpy_ms = timed(lambda: rank_topics(topics, args.limit, now=NOW), args.repeat)
+        same = [(t["title"], t["priority_score"]) for t in ranked] == expected
+
+        print(f"{size:>10}{loop_ms:>16.1f}{numpy_ms:>16.1f}{loop_ms / numpy_ms:>9.1f}x{'是' if same else '否':>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,8 @@ GenFlow 数据库管理工具
   content    - 列出所有内容类型
   styles     - 列出所有文章风格
   platforms  - 列出所有平台配置
+  export     - 流式导出数据库快照: export <文件.ndjson[.zst]> [表名 ...]
+  import     - 流式导入数据库快照: import <文件.ndjson[.zst]> [表名 ...]
   help       - 显示帮助信息
 """
 
@@ -221,6 +223,34 @@ def list_platforms():
     except Exception as e:
         print(f"✗ 错误: {str(e)}")
 
+def export_snapshot(path, tables=None):
+    """流式导出数据库快照"""
+    print(f"正在导出数据库快照到 {path} ...")
+
+    try:
+        from core.models.db.snapshot import export_snapshot as do_export
+        stats = do_export(path, tables=tables or None)
+
+        for table_name, count in stats.rows.items():
+            print(f"  - {table_name}: {count} 行")
+        print(f"✓ 共导出 {stats.total_rows} 行，耗时 {stats.elapsed:.2f} 秒，{stats.rows_per_sec:.0f} 行/秒")
+    except Exception as e:
+        print(f"✗ 错误: {str(e)}")
+
+def import_snapshot(path, tables=None):
+    """流式导入数据库快照"""
+    print(f"正在从 {path} 导入数据库快照...")
+
+    try:
+        from core.models.db.snapshot import import_snapshot as do_import
+        stats = do_import(path, tables=tables or None)
+
+        for table_name, count in stats.rows.items():
+            print(f"  - {table_name}: {count} 行")
+        print(f"✓ 共导入 {stats.total_rows} 行，耗时 {stats.elapsed:.2f} 秒，{stats.rows_per_sec:.0f} 行/秒")
+    except Exception as e:
+        print(f"✗ 错误: {str(e)}")
+
 def show_help():
     """显示帮助信息"""
     print(__doc__)
@@ -247,6 +277,12 @@ def main():
         list_article_styles()
     elif command == "platforms":
         list_platforms()
+    elif command in ("export", "import"):
+        if len(sys.argv) < 3:
+            print(f"用法: python db_tools.py {command} <文件路径> [表名 ...]")
+            return
+        handler = export_snapshot if command == "export" else import_snapshot
+        handler(sys.argv[2], sys.argv[3:])
     elif command == "help":
         show_help()
     else:
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+本地意图分类器评估
+
+将样本（内置示例 + 意图日志）按比例划分为训练集与留出集，用训练集拟合
+TF-IDF 层，在留出集上统计各层的命中率、准确率与单次分类耗时。
+未命中的样本在线上会交给 LLM 处理。
+
+用法:
+  python scripts/evaluate_intent_classifier.py [--log intent_log.jsonl] [--test-ratio 0.3]
+  python scripts/evaluate_intent_classifier.py --test held_out.jsonl
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.control_ai.intent_classifier import (  # noqa: E402
+    DEFAULT_CONFIDENCE_THRESHOLD,
+    DEFAULT_EXAMPLES_PATH,
+    LocalIntentClassifier,
+    TfidfIntentClassifier,
+    load_examples,
+)
+
+
+def main() -> None:
+    """主函数"""
+    parser = argparse.ArgumentParser(description="本地意图分类器评估")
+    parser.add_argument("--examples", default=DEFAULT_EXAMPLES_PATH, help="样本文件")
+    parser.add_argument("--log", help="LLM意图日志，作为额外样本")
+    parser.add_argument("--test", help="留出集文件，不指定时从样本中随机划分")
+    parser.add_argument("--test-ratio", type=float, default=0.3, help="随机划分的留出比例")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_CONFIDENCE_THRESHOLD, help="置信度阈值")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    examples = load_examples(args.examples)
+    if args.log:
+        examples.extend(load_examples(args.log))
+
+    if args.test:
+        train, test = examples, load_examples(args.test)
+    else:
+        random.Random(args.seed).shuffle(examples)
+        split = int(len(examples) * (1 - args.test_ratio))
+        train, test = examples[:split], examples[split:]
+
+    classifier = LocalIntentClassifier(
+        tfidf_classifier=TfidfIntentClassifier().fit(train),
+        confidence_threshold=args.threshold,
+    )
+
+    correct = Counter()
+    hits = Counter()
+    errors = []
+    latencies = []
+    for text, expected in test:
+        start = time.perf_counter()
+        result = classifier.classify(text)
+        latencies.append(time.perf_counter() - start)
+
+        if result is None:
+            continue
+        hits[result["source"]] += 1
+        if result["intent_type"] == expected:
+            correct[result["source"]] += 1
+        else:
+            errors.append((text, expected, result["intent_type"], result["source"]))
+
+    total = len(test)
+    answered = sum(hits.values())
+    print(f"训练样本: {len(train)}  留出样本: {total}  阈值: {args.threshold}")
+    for source in ("rules", "tfidf"):
+        if hits[source]:
+            print(f"{source:<8}命中 {hits[source]:>5} ({hits[source] / total:.1%})  "
+                  f"准确率 {correct[source] / hits[source]:.1%}")
+    if total:
+        print(f"本地处理 {answered}/{total} ({answered / total:.1%})，"
+              f"准确率 {sum(correct.values()) / answered if answered else 0:.1%}，"
+              f"交给LLM {total - answered} ({(total - answered) / total:.1%})")
+        print(f"单次分类耗时 p50 {statistics.median(latencies) * 1e6:.0f} µs，"
+              f"最大 {max(latencies) * 1e6:.0f} µs")
+
+    for text, expected, actual, source in errors:
+        print(f"  误判[{source}] {text!r}: 期望 {expected}，实际 {actual}")
+
+
+if __name__ == "__main__":
+    main()
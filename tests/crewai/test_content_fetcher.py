@@ -0,0 +1,192 @@
+"""
+网页抓取层测试
+
+使用本地HTTP服务测试ContentFetcher：每个URL只下载一次、磁盘缓存与ETag条件请求、
+robots.txt、同站点请求间隔以及提取器的回退顺序。
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from core.tools.content_collectors.fetcher import ContentFetcher, extract_content
+
+PAGE = ("<html><head><title>测试文章</title><script>var x = 1;</script></head>"
+        "<body><nav>导航</nav><h1>标题</h1><p>第一段正文。</p><p>第二段<b>正文</b>。</p></body></html>")
+
+
+class FixtureServer:
+    """记录请求次数、支持ETag和robots.txt的本地站点"""
+
+    def __init__(self):
+        self.requests = []
+        self.not_modified = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests.append((self.path, time.monotonic()))
+                if self.path == "/robots.txt":
+                    return self._send(b"User-agent: *\nDisallow: /private\n")
+                if self.path == "/missing":
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                body = PAGE.encode()
+                etag = '"' + hashlib.md5(body).hexdigest() + '"'
+                if self.headers.get("If-None-Match") == etag:
+                    server.not_modified += 1
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                self._send(body, etag)
+
+            def _send(self, body, etag=None):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                if etag:
+                    self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self.httpd.server_port}{path}"
+
+    def page_requests(self):
+        return [path for path, _ in self.requests if path != "/robots.txt"]
+
+
+@pytest.fixture
+def site():
+    server = FixtureServer()
+    yield server
+    server.httpd.shutdown()
+
+
+def make_fetcher(cache_dir, **kwargs):
+    kwargs.setdefault("host_interval", 0)
+    return ContentFetcher(cache_dir=str(cache_dir), executor=ThreadPoolExecutor(2), **kwargs)
+
+
+def test_extract_content_fallback():
+    """未知或失败的提取器被跳过，basic提取器去除脚本和导航"""
+    data = extract_content(PAGE, "http://example.com", ("no_such_extractor", "basic"))
+
+    assert data["source_tool"] == "basic"
+    assert data["title"] == "测试文章"
+    assert data["content"] == "标题\n\n第一段正文。\n\n第二段正文。"
+
+
+
+def test_session_recreated_and_old_closed_on_loop_change(tmp_path):
+    """每次asyncio.run都是新的事件循环，换循环时重新创建会话并关闭旧会话"""
+    fetcher = ContentFetcher(cache_dir=str(tmp_path), host_interval=0)
+
+    first = asyncio.run(fetcher._get_session())
+
+    async def reuse():
+        session = await fetcher._get_session()
+        assert await fetcher._get_session() is session
+        await fetcher.close()
+        return session
+
+    second = asyncio.run(reuse())
+
+    assert second is not first
+    assert first.closed
+    assert second.closed
+
+async def test_bulk_fetch_downloads_each_url_once(site, tmp_path):
+    """批量获取时重复的URL只下载一次，结果顺序与输入一致"""
+    fetcher = make_fetcher(tmp_path)
+    urls = [site.url("/a"), site.url("/b"), site.url("/a")]
+    try:
+        items = await fetcher.get_contents(urls, ("basic",))
+    finally:
+        await fetcher.close()
+
+    assert [item.url for item in items] == urls
+    assert sorted(site.page_requests()) == ["/a", "/b"]
+
+
+async def test_disk_cache_and_conditional_request(site, tmp_path):
+    """缓存有效期内不访问网络，过期后发送条件请求并使用304响应"""
+    url = site.url("/article")
+    fetcher = make_fetcher(tmp_path)
+    try:
+        await fetcher.get_content(url, ("basic",))
+    finally:
+        await fetcher.close()
+
+    fresh = make_fetcher(tmp_path)
+    try:
+        item = await fresh.get_content(url, ("basic",))
+    finally:
+        await fresh.close()
+    assert item.title == "测试文章"
+    assert fresh.stats["cache_hits"] == 1
+    assert site.page_requests() == ["/article"]
+
+    stale = make_fetcher(tmp_path, cache_ttl=0)
+    try:
+        item = await stale.get_content(url, ("basic",))
+    finally:
+        await stale.close()
+    assert item.content
+    assert site.not_modified == 1
+    assert stale.stats["not_modified"] == 1
+
+
+async def test_robots_and_http_errors(site, tmp_path):
+    """robots.txt禁止的路径不抓取，4xx响应返回None"""
+    fetcher = make_fetcher(tmp_path)
+    try:
+        blocked = await fetcher.get_content(site.url("/private/page"))
+        missing = await fetcher.get_content(site.url("/missing"))
+    finally:
+        await fetcher.close()
+
+    assert blocked is None and missing is None
+    assert fetcher.stats["robots_blocked"] == 1
+    assert "/private/page" not in site.page_requests()
+    assert [path for path, _ in site.requests].count("/robots.txt") == 1
+
+
+async def test_host_politeness_interval(site, tmp_path):
+    """同一站点的请求按最小间隔依次发出"""
+    fetcher = make_fetcher(tmp_path, host_interval=0.1)
+    try:
+        await fetcher.get_contents([site.url(f"/p{i}") for i in range(4)], ("basic",))
+    finally:
+        await fetcher.close()
+
+    times = sorted(t for path, t in site.requests if path != "/robots.txt")
+    gaps = [b - a for a, b in zip(times, times[1:])]
+    assert len(times) == 4
+    assert min(gaps) >= 0.08
+
+
+async def test_process_pool_extraction(site, tmp_path):
+    """默认在进程池中提取正文"""
+    fetcher = ContentFetcher(cache_dir=str(tmp_path), host_interval=0)
+    try:
+        item = await fetcher.get_content(site.url("/article"), ("basic",))
+    finally:
+        await fetcher.close()
+
+    assert item.source_tool == "basic"
+    assert "第一段正文" in item.content
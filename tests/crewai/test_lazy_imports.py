@@ -0,0 +1,74 @@
+"""
+延迟导入测试
+
+在独立的子进程中导入工具包和团队包，验证导入时不加载crewai、jieba、nltk等重型依赖，
+访问导出名称时得到与直接导入子模块相同的对象。
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+HEAVY_MODULES = ["crewai", "langchain", "jieba", "nltk", "newspaper", "trafilatura", "yake", "summa"]
+
+
+def run_python(code):
+    """在新进程中执行代码，返回其打印的JSON结果"""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT, capture_output=True, text=True,
+        env=dict(os.environ, PYTHONPATH=ROOT)
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("module", [
+    "core.tools",
+    "core.tools.nlp_tools",
+    "core.tools.content_collectors",
+    "core.tools.review_tools",
+    "core.agents.topic_crew",
+    "core.agents.research_crew",
+    "core.agents.writing_crew",
+    "core.agents.style_crew",
+    "core.agents.review_crew",
+])
+def test_package_import_does_not_load_heavy_modules(module):
+    """导入包本身不加载重型依赖"""
+    loaded = run_python(
+        f"import json, sys, {module}\n"
+        f"print(json.dumps(sorted({{m.split('.')[0] for m in sys.modules}} & set({HEAVY_MODULES!r}))))"
+    )
+    assert loaded == []
+
+
+def test_exports_resolve_on_first_access():
+    """导出名称首次访问时导入子模块，结果与直接导入一致，并缓存到包属性中"""
+    result = run_python(
+        "import json, sys\n"
+        "import core.tools.nlp_tools as nlp_tools\n"
+        "before = 'core.tools.nlp_tools.token_budget' in sys.modules\n"
+        "from core.tools.nlp_tools import get_tokenizer\n"
+        "from core.tools.nlp_tools.token_budget import get_tokenizer as direct\n"
+        "print(json.dumps({\n"
+        "    'before': before,\n"
+        "    'same': get_tokenizer is direct,\n"
+        "    'cached': 'get_tokenizer' in vars(nlp_tools),\n"
+        "    'in_dir': 'NLPAggregator' in dir(nlp_tools),\n"
+        "    'processor_loaded': 'core.tools.nlp_tools.processor' in sys.modules,\n"
+        "}))"
+    )
+    assert result == {"before": False, "same": True, "cached": True, "in_dir": True, "processor_loaded": False}
+
+
+def test_unknown_attribute_raises():
+    """未导出的名称仍然抛出 AttributeError"""
+    import core.tools
+
+    with pytest.raises(AttributeError):
+        core.tools.NoSuchTool
@@ -331,6 +331,39 @@ async def test_all_research_tools_with_crewai():
     for tool in agent.tools:
         assert isinstance(tool, BaseTool)
 
+def test_collect_content_searches_then_fetches():
+    """内容收集先搜索，再批量抓取搜索结果的正文，整个过程在同步调用中完成"""
+    from core.tools.base import ToolResult
+    from core.tools.content_collectors.base_collector import ContentItem
+    from core.tools.search_tools.searcher import run_sync
+
+    hits = [
+        {"title": "搜索标题A", "url": "https://a.com", "snippet": "摘要A"},
+        {"title": "搜索标题B", "url": "https://b.com", "snippet": "摘要B"},
+    ]
+
+    class FakeSearch:
+        async def execute(self, query, limit=10, **kwargs):
+            return ToolResult(success=True, data={"query": query, "results": hits[:limit]})
+
+    class FakeCollector:
+        def __init__(self):
+            self.urls = None
+
+        async def get_contents(self, urls):
+            self.urls = urls
+            return [ContentItem(title="正文标题A", url=urls[0], content="正文A"), None]
+
+    tools = ResearchTools.__new__(ResearchTools)
+    tools.search_tools = FakeSearch()
+    tools.content_collector = FakeCollector()
+
+    text = run_sync(tools._collect_content("人工智能", 5))
+
+    assert tools.content_collector.urls == ["https://a.com", "https://b.com"]
+    assert "正文标题A (https://a.com)\n正文A" in text
+    assert "搜索标题B (https://b.com)\n摘要B" in text
+
 if __name__ == "__main__":
     # 执行所有测试
     pytest.main(["-xvs", __file__])
@@ -0,0 +1,71 @@
+"""
+审核引擎测试
+
+测试本地确定性检查的并发执行、拒绝时跳过LLM以及终审结果合并。
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from core.agents.review_crew.review_engine import (
+    ReviewEngine,
+    check_plagiarism,
+    check_sensitive_words,
+    count_words,
+)
+
+RULES = {
+    "min_words": 50,
+    "max_words": 5000,
+    "allowed_tags": ["技术", "AI"],
+    "sensitive_words": ["敏感词1"],
+}
+
+CLEAN_TEXT = (
+    "异步编程让单个线程可以同时处理大量网络请求。在Python中，asyncio提供了事件循环、"
+    "协程和任务等基础设施，适合处理高并发的I/O密集型场景。\n"
+    "实际项目里，我们常常把数据库访问、HTTP调用放进协程，用gather并发等待结果，"
+    "同时注意不要在协程中调用阻塞函数，否则整个事件循环都会停下来。"
+)
+
+
+def test_local_checks():
+    """本地检查识别敏感词、查重和字数"""
+    assert check_sensitive_words("这里有敏感词1和敏感词1", ["敏感词1"])["sensitive_count"] == 2
+    assert check_plagiarism(CLEAN_TEXT, [CLEAN_TEXT])["plagiarism_rate"] == 1.0
+    assert check_plagiarism(CLEAN_TEXT, ["完全无关的另一段文字内容"])["plagiarism_rate"] == 0.0
+    assert count_words("Python异步编程 best practice") == 4 + 3
+
+
+async def test_reject_skips_llm():
+    """本地检查判定拒绝时不调用LLM"""
+    final_reviewer = AsyncMock(return_value={"approval_status": "approved"})
+    engine = ReviewEngine(RULES, final_reviewer=final_reviewer, sensitive_words=[])
+
+    review = await engine.review(CLEAN_TEXT + "敏感词1", title="测试", tags=["技术"])
+
+    final_reviewer.assert_not_called()
+    assert review["final_review"]["approval_status"] == "rejected"
+    assert review["final_review"]["decided_by"] == "local_checks"
+    assert review["metrics"]["llm_calls"] == 0
+    assert review["metrics"]["llm_calls_saved"] == 5
+    assert set(review["metrics"]["check_times"]) == {"plagiarism", "sensitive", "compliance", "ai_detection"}
+
+
+async def test_single_llm_call_for_final_review():
+    """通过本地检查的文章只调用一次LLM，并合并终审结果"""
+    final_reviewer = AsyncMock(return_value={"approval_status": "approved", "quality_score": 0.85})
+    engine = ReviewEngine(RULES, final_reviewer=final_reviewer, sensitive_words=[])
+
+    review = await engine.review(CLEAN_TEXT, title="Python异步编程", tags=["技术", "Python"])
+
+    final_reviewer.assert_awaited_once()
+    prompt = final_reviewer.await_args.args[0]
+    assert "Python异步编程" in prompt
+    assert '"invalid_tags"' in prompt
+    assert review["preliminary"]["approval_status"] == "needs_revision"
+    assert review["final_review"]["approval_status"] == "approved"
+    assert review["final_review"]["quality_score"] == 0.85
+    assert review["final_review"]["decided_by"] == "llm"
+    assert review["metrics"]["llm_calls"] == 1
+    assert review["metrics"]["llm_calls_saved"] == 4
@@ -0,0 +1,214 @@
+"""
+搜索聚合测试
+
+测试SearchAggregator并发查询各后端、单个后端超时或失败不影响结果、按规范化URL去重以及查询缓存；
+HttpSearchProvider通过本地HTTP服务验证对SearXNG格式响应的解析。
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from core.tools.search_tools import SearchAggregator, SearchProvider, HttpSearchProvider, canonical_url
+
+
+class FakeProvider(SearchProvider):
+    """按固定延迟返回固定结果的模拟后端"""
+
+    def __init__(self, name, urls, delay=0.0, timeout=1.0, error=None):
+        super().__init__(timeout)
+        self.name = name
+        self.urls = urls
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    async def search(self, query, limit=10):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return [self._hit(rank, f"{self.name}-{rank}", url, f"{query} 摘要")
+                for rank, url in enumerate(self.urls[:limit])]
+
+
+def test_canonical_url():
+    """规范化URL忽略协议、www、跟踪参数、片段和末尾斜杠"""
+    assert canonical_url("https://www.Example.com/a/?utm_source=x&b=2&a=1#top") == \
+        canonical_url("http://example.com/a?a=1&b=2")
+    assert canonical_url("https://example.com/a") != canonical_url("https://example.com/b")
+
+
+async def test_providers_run_concurrently():
+    """各后端并发查询，总耗时接近最慢的后端"""
+    providers = [FakeProvider(f"p{i}", [f"https://site{i}.com/"], delay=0.2) for i in range(4)]
+    aggregator = SearchAggregator(providers=providers)
+
+    start = time.perf_counter()
+    result = await aggregator.execute("并发")
+    elapsed = time.perf_counter() - start
+
+    assert result.success
+    assert len(result.data["results"]) == 4
+    assert elapsed < 0.5
+
+
+async def test_slow_and_failing_providers_do_not_block():
+    """超过截止时间或出错的后端被跳过，其余结果正常返回"""
+    providers = [
+        FakeProvider("fast", ["https://a.com"]),
+        FakeProvider("slow", ["https://b.com"], delay=5, timeout=0.1),
+        FakeProvider("broken", [], error=RuntimeError("503")),
+    ]
+    aggregator = SearchAggregator(providers=providers)
+
+    start = time.perf_counter()
+    result = await aggregator.execute("截止时间")
+
+    assert time.perf_counter() - start < 1
+    assert result.success
+    assert [hit["url"] for hit in result.data["results"]] == ["https://a.com"]
+    assert result.data["providers"]["fast"]["ok"]
+    assert not result.data["providers"]["slow"]["ok"]
+    assert result.data["providers"]["broken"]["error"] == "503"
+    assert aggregator.get_stats()["providers"]["slow"]["timeouts"] == 1
+
+
+async def test_all_providers_failing():
+    """所有后端都失败时返回错误且不缓存"""
+    provider = FakeProvider("broken", [], error=RuntimeError("down"))
+    aggregator = SearchAggregator(providers=[provider])
+
+    assert not (await aggregator.execute("失败")).success
+    assert not (await aggregator.execute("失败")).success
+    assert provider.calls == 2
+
+
+async def test_results_deduplicated_by_canonical_url():
+    """不同后端返回的同一页面合并为一条，并记录来源"""
+    providers = [
+        FakeProvider("a", ["https://www.example.com/post?utm_source=a", "https://a.com/1"]),
+        FakeProvider("b", ["http://example.com/post/", "https://b.com/1"]),
+    ]
+    aggregator = SearchAggregator(providers=providers)
+
+    result = await aggregator.execute("去重")
+    hits = result.data["results"]
+
+    assert len(hits) == 3
+    assert hits[0]["sources"] == ["a", "b"]
+    assert [hit["url"] for hit in hits[1:]] == ["https://a.com/1", "https://b.com/1"]
+
+
+async def test_query_cache_and_inflight_dedupe():
+    """相同查询命中缓存，并发的相同查询只搜索一次"""
+    provider = FakeProvider("p", ["https://a.com"], delay=0.05)
+    aggregator = SearchAggregator(providers=[provider])
+
+    await asyncio.gather(*(aggregator.execute("缓存  测试") for _ in range(5)))
+    await aggregator.execute("缓存 测试")
+
+    assert provider.calls == 1
+    stats = aggregator.get_stats()["cache"]
+    assert stats["shared"] == 4
+    assert stats["hits"] == 1
+
+
+async def test_search_many():
+    """批量查询并发执行且结果顺序与查询一致"""
+    provider = FakeProvider("p", ["https://a.com"], delay=0.1)
+    aggregator = SearchAggregator(providers=[provider])
+
+    queries = [f"事实{i}" for i in range(8)]
+    start = time.perf_counter()
+    results = await aggregator.search_many(queries, limit=3)
+
+    assert time.perf_counter() - start < 0.5
+    assert [r.data["query"] for r in results] == queries
+
+
+def test_execute_sync():
+    """同步调用在没有事件循环时可用"""
+    aggregator = SearchAggregator(providers=[FakeProvider("p", ["https://a.com"])])
+    result = aggregator.execute_sync("同步")
+
+    assert result.success
+    assert "https://a.com" in SearchAggregator.format_result(result)
+
+
+class SearxHandler(BaseHTTPRequestHandler):
+    """返回SearXNG格式JSON的本地搜索服务"""
+
+    def do_GET(self):
+        query = parse_qs(urlsplit(self.path).query)
+        body = json.dumps({"results": [
+            {"title": f"{query['q'][0]} {i}", "url": f"https://example.com/{i}", "content": "内容"}
+            for i in range(5)
+        ]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+async def test_http_provider_against_local_server():
+    """HttpSearchProvider解析SearXNG格式的响应"""
+    server = HTTPServer(("127.0.0.1", 0), SearxHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    provider = HttpSearchProvider(f"http://127.0.0.1:{server.server_port}", timeout=5)
+    try:
+        hits = await provider.search("本地", limit=3)
+    finally:
+        await provider.close()
+        server.shutdown()
+
+    assert [hit["url"] for hit in hits] == [f"https://example.com/{i}" for i in range(3)]
+    assert hits[0]["title"] == "本地 0"
+    assert hits[0]["source"] == "searx"
+
+
+def test_http_provider_back_to_back_execute_sync():
+    """连续两次同步调用各自运行在新的事件循环中，HTTP会话随循环重新创建"""
+    server = HTTPServer(("127.0.0.1", 0), SearxHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    provider = HttpSearchProvider(f"http://127.0.0.1:{server.server_port}", timeout=5)
+    aggregator = SearchAggregator(providers=[provider])
+    try:
+        first = aggregator.execute_sync("第一次", limit=2)
+        second = aggregator.execute_sync("第二次", limit=2)
+    finally:
+        server.shutdown()
+
+    assert first.success and second.success
+    assert first.data["providers"]["searx"]["ok"]
+    assert second.data["providers"]["searx"]["ok"]
+    assert second.data["results"][0]["title"] == "第二次 0"
+
+
+def test_cache_shared_across_sync_calls_from_threads():
+    """多个线程各自通过run_sync查询时共享缓存，不会等待其他事件循环中的future"""
+    provider = FakeProvider("p", ["https://a.com"], delay=0.05)
+    aggregator = SearchAggregator(providers=[provider])
+    results = []
+
+    def worker():
+        results.append(aggregator.execute_sync("并发"))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+
+    assert len(results) == 4
+    assert all(r.success for r in results)
+    assert aggregator.execute_sync("并发").success
+    assert aggregator.get_stats()["cache"]["hits"] >= 1
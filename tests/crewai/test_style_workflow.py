@@ -0,0 +1,120 @@
+"""
+风格化工作流测试
+
+测试平台分析缓存、平台分析与风格建议并行、长文分块并行改写以及阶段耗时。
+"""
+
+import asyncio
+import pytest
+
+from core.agents.style_crew import style_crew as style_crew_module
+from core.agents.style_crew.style_crew import PlatformAnalysisCache, StyleCrew, split_into_chunks
+from core.models.article.basic_article import BasicArticle
+
+PLATFORM_INFO = {"platform_id": "zhihu", "platform_name": "知乎", "style_rules": {"tone": "professional"}}
+
+
+@pytest.fixture
+def crew(monkeypatch):
+    """替换各阶段智能体调用的StyleCrew"""
+    monkeypatch.setattr(style_crew_module, "platform_analysis_cache", PlatformAnalysisCache(ttl=60))
+    crew = StyleCrew(verbose=False)
+    crew._init_complete = True
+    calls = {"analysis": 0, "adapt": [], "active": 0, "peak": 0}
+
+    async def analyze(platform_info):
+        calls["analysis"] += 1
+        await asyncio.sleep(0.1)
+        return {"language_style": "专业"}
+
+    async def recommend(platform_analysis, article, style_config):
+        await asyncio.sleep(0.1)
+        return {"based_on": platform_analysis}
+
+    async def adapt(article, style_recommendations, style_config, part_note=""):
+        calls["active"] += 1
+        calls["peak"] = max(calls["peak"], calls["active"])
+        calls["adapt"].append(style_config.get("max_length"))
+        await asyncio.sleep(0.05)
+        calls["active"] -= 1
+        return article.content.upper()
+
+    async def check(adapted_content, platform_info, style_config):
+        return {"overall_score": 8.0}
+
+    crew._run_platform_analysis = analyze
+    crew._generate_style_recommendations = recommend
+    crew._adapt_section = adapt
+    crew._check_quality = check
+    crew.calls = calls
+    return crew
+
+
+def test_split_into_chunks():
+    """按章节分块，过长章节按段落切分"""
+    content = "\n".join(f"## 第{i}节\n\n" + "内容" * 300 for i in range(4))
+    chunks = split_into_chunks(content, max_chars=1000)
+    assert len(chunks) == 4
+    assert all(len(chunk) <= 1000 for chunk in chunks)
+    assert split_into_chunks("短文", max_chars=1000) == ["短文"]
+
+
+def test_cache_key_changes_with_rules():
+    """平台规则变化后缓存键变化"""
+    changed = {**PLATFORM_INFO, "style_rules": {"tone": "casual"}}
+    assert PlatformAnalysisCache.make_key(PLATFORM_INFO) != PlatformAnalysisCache.make_key(changed)
+    assert PlatformAnalysisCache.make_key({**PLATFORM_INFO, "rules_version": "v2"}) == ("zhihu", "v2")
+
+
+async def test_platform_analysis_cached_and_overlapped(crew):
+    """首次平台分析与风格建议并行，之后命中缓存"""
+    article = BasicArticle(title="测试", content="正文")
+
+    first = await crew._run_style_workflow(article, {}, PLATFORM_INFO)
+    second = await crew._run_style_workflow(article, {}, PLATFORM_INFO)
+
+    assert crew.calls["analysis"] == 1
+    assert first.execution_time < 0.18
+    assert second.platform_analysis == {"language_style": "专业"}
+    assert second.style_recommendations == {"based_on": {"language_style": "专业"}}
+    assert second.stage_timings["platform_analysis"] == 0.0
+    assert set(first.stage_timings) == {"platform_analysis", "style_recommendations", "content_adaptation", "quality_check"}
+
+
+async def test_long_article_adapted_in_parallel(crew, monkeypatch):
+    """长文按章节分块并行改写，长度要求按比例分配"""
+    monkeypatch.setattr(style_crew_module, "ADAPT_CHUNK_CHARS", 1000)
+    content = "\n".join(f"## part{i}\n\n" + "text " * 150 for i in range(4))
+    article = BasicArticle(title="长文", content=content)
+
+    adapted = await crew._adapt_content(article, {}, {"max_length": 8000})
+
+    assert len(crew.calls["adapt"]) == 4
+    assert crew.calls["peak"] > 1
+    assert all(limit < 8000 for limit in crew.calls["adapt"])
+    assert adapted.count("## PART") == 4
+
+
+async def test_cache_clear_discards_pending_analysis():
+    """clear() 之后的请求重新分析，清空前开始的分析结果不会写入缓存"""
+    cache = PlatformAnalysisCache(ttl=60)
+    started = asyncio.Event()
+    release = asyncio.Event()
+    versions = iter(["旧分析", "新分析"])
+
+    async def analyze():
+        version = next(versions)
+        started.set()
+        await release.wait()
+        return {"version": version}
+
+    stale = asyncio.create_task(cache.get_or_create(PLATFORM_INFO, analyze))
+    await started.wait()
+    cache.clear()
+    fresh = asyncio.create_task(cache.get_or_create(PLATFORM_INFO, analyze))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert (await stale)["version"] == "旧分析"
+    assert (await fresh)["version"] == "新分析"
+    assert cache.get(PLATFORM_INFO) == {"version": "新分析"}
@@ -0,0 +1,133 @@
+"""
+Token计数与预算测试
+
+测试近似计数和BPE计数后端、计数缓存、后端注册、按优先级的预算选择、
+热点话题的token预算以及研究材料压缩。
+"""
+
+import pytest
+
+from core.tools.nlp_tools.token_budget import (
+    HeuristicTokenizer,
+    Tokenizer,
+    get_prompt_stats,
+    get_tokenizer,
+    pack_to_budget,
+    record_prompt,
+    register_tokenizer,
+    reset_prompt_stats,
+)
+from core.tools.trending_tools.utils import TokenCounter
+
+
+def test_heuristic_count_and_truncate():
+    """中文每字一个token，英文约4个字母一个token，截断结果不超过预算"""
+    tokenizer = HeuristicTokenizer()
+    assert tokenizer.count("异步编程") == 4
+    assert tokenizer.count("hello world") == 4
+    assert tokenizer.count("2024年") == 3
+    assert tokenizer.count("") == 0
+
+    text = "异步编程是现代Python开发中不可或缺的一部分。" * 20
+    truncated = tokenizer.truncate(text, 50)
+    assert tokenizer.count(truncated) <= 50
+    assert text.startswith(truncated)
+    assert tokenizer.truncate("短文本", 50) == "短文本"
+
+
+def test_count_cache():
+    """相同文本只编码一次"""
+    tokenizer = HeuristicTokenizer(cache_size=16)
+    for _ in range(5):
+        tokenizer.count("重复的提示词模板")
+    info = tokenizer.cache_info()
+    assert info.misses == 1 and info.hits == 4
+
+
+def test_tiktoken_backend():
+    """BPE计数与tiktoken编码结果一致"""
+    tiktoken = pytest.importorskip("tiktoken")
+    try:
+        encoding = tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        pytest.skip(f"无法加载编码文件: {e}")
+
+    tokenizer = get_tokenizer("tiktoken", model="openai/gpt-4")
+    text = "Token budgeting for 热点话题摘要 <|endoftext|>"
+    assert tokenizer.count(text) == len(encoding.encode(text, disallowed_special=()))
+    assert tokenizer.count(tokenizer.truncate(text, 5)) <= 5
+
+
+def test_register_tokenizer():
+    """注册的后端可以按名称获取，未知后端报错"""
+
+    class CharTokenizer(Tokenizer):
+        name = "chars"
+
+        def __init__(self, model=None):
+            super().__init__(cache_size=0)
+
+        def _count(self, text):
+            return len(text)
+
+        def truncate(self, text, max_tokens):
+            return text[:max_tokens]
+
+    register_tokenizer("chars", CharTokenizer)
+    assert get_tokenizer("chars").count("abc") == 3
+    with pytest.raises(ValueError):
+        get_tokenizer("no_such_backend")
+
+
+def test_pack_to_budget_by_priority():
+    """优先级高的条目先放入，放不下的跳过，结果保持原顺序"""
+    tokenizer = HeuristicTokenizer()
+    items = [("甲" * 5, 1), ("乙" * 8, 5), ("丙" * 4, 3), ("丁" * 2, 0)]
+    pack = pack_to_budget(items, 14, text=lambda item: item[0], priority=lambda item: item[1], tokenizer=tokenizer)
+
+    assert [item[1] for item in pack.items] == [5, 3, 0]
+    assert pack.tokens == 14
+    assert pack.remaining == 0
+    assert [item[1] for item in pack.dropped] == [1]
+
+
+def test_fit_topics_keeps_highest_priority():
+    """超出预算时保留优先级分数最高的话题"""
+    counter = TokenCounter(HeuristicTokenizer())
+    topics = [
+        {"title": f"话题{i}" + "内容" * 10, "platform": "weibo", "priority_score": score}
+        for i, score in enumerate([10, 90, 50, 70])
+    ]
+    per_topic = counter.count_topic_tokens(topics[0])
+    pack = counter.fit_topics(topics, per_topic * 2)
+
+    assert [topic["priority_score"] for topic in pack.items] == [90, 70]
+    assert pack.tokens == counter.estimate_total_tokens(pack.items)
+
+
+def test_fit_research_materials():
+    """研究材料超出预算时按片段压缩，各材料靠前的片段优先保留"""
+    from core.agents.research_crew.research_util import fit_research_materials
+
+    background = "\n\n".join(f"背景第{i}段。" + "细节" * 30 for i in range(10))
+    expert = "\n\n".join(f"专家观点{i}。" + "分析" * 30 for i in range(10))
+    fitted = fit_research_materials({"background": background, "expert": expert}, token_budget=300)
+
+    tokenizer = get_tokenizer()
+    assert tokenizer.count_many(fitted.values()) <= 300
+    assert fitted["background"].startswith("背景第0段")
+    assert fitted["expert"].startswith("专家观点0")
+
+    small = {"background": "短", "expert": None}
+    assert fit_research_materials(small, token_budget=300) == {"background": "短", "expert": ""}
+
+
+def test_record_prompt_stats():
+    """按团队任务累计提示词token数"""
+    reset_prompt_stats()
+    record_prompt("writing", "outline", "为文章创建大纲", "JSON大纲")
+    record_prompt("writing", "outline", "为另一篇文章创建大纲")
+
+    stats = get_prompt_stats()["writing.outline"]
+    assert stats["calls"] == 2
+    assert stats["tokens"] > stats["max_tokens"] > 0
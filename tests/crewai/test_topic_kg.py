@@ -0,0 +1,123 @@
+"""
+话题知识图谱测试
+
+使用模拟的抽取API测试TopicKnowledgeGraph：按批抽取、实体按规范化名称去重、
+增量更新跳过已处理话题、相关话题查询以及SQLite持久化。
+"""
+
+import json
+
+import httpx
+
+from core.tools.kg_tools.kg_store import KnowledgeGraphStore, normalize_entity_name
+from core.tools.kg_tools.topic_kg import TopicKnowledgeGraph
+
+# 模拟抽取结果：话题标题 -> (实体, 关系)
+EXTRACTIONS = {
+    "OpenAI发布新模型": (["OpenAI|组织", "GPT-5|产品"], ["OpenAI|发布|GPT-5|0.9"]),
+    "微软与openai续约": (["微软|组织", " OpenAI |组织"], ["微软|合作|OpenAI|0.8"]),
+    "《GPT-5》评测出炉": (["GPT-5|产品"], []),
+    "北京今日降雪": (["北京|地点"], []),
+}
+
+
+class FakeExtractionAPI:
+    """按话题编号返回实体和关系行的模拟API"""
+
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        prompt = json.loads(request.content)["prompt"]
+        self.requests.append(prompt)
+        lines = []
+        for title, (entities, relations) in EXTRACTIONS.items():
+            for line in prompt.splitlines():
+                line = line.strip()
+                if line.endswith(f"标题：{title}"):
+                    index = line.split(".")[0]
+                    lines += [f"E|{index}|{entity}" for entity in entities]
+                    lines += [f"R|{index}|{relation}" for relation in relations]
+        return httpx.Response(200, json={"text": "\n".join(lines)})
+
+
+def make_graph(store, api, batch_size=2):
+    kg = TopicKnowledgeGraph("http://kg.test", "key", store=store, batch_size=batch_size)
+    kg._client = httpx.AsyncClient(base_url="http://kg.test", transport=httpx.MockTransport(api))
+    return kg
+
+
+def topics(*titles):
+    return [{"title": title, "platform": "weibo", "timestamp": 1700000000 + i} for i, title in enumerate(titles)]
+
+
+def test_normalize_entity_name():
+    """全角、大小写、书名号和多余空白不影响去重"""
+    assert normalize_entity_name("《GPT-5》") == normalize_entity_name(" gpt-5 ")
+    assert normalize_entity_name("ＯｐｅｎＡＩ") == "openai"
+
+
+async def test_batched_extraction_and_dedupe():
+    """多个话题按批抽取，同名实体只存一份"""
+    api = FakeExtractionAPI()
+    store = KnowledgeGraphStore(":memory:")
+    async with make_graph(store, api) as kg:
+        stats = await kg.process_topics(topics(*EXTRACTIONS))
+
+    assert len(api.requests) == 2
+    assert stats["processed"] == 4
+    assert store.get_entity("openai")["mentions"] == 2
+    assert store.get_entity("gpt-5")["mentions"] == 2
+    assert store.get_stats()["entities"] == 4
+    assert store.get_stats()["relations"] == 2
+
+
+async def test_incremental_update_skips_known_topics():
+    """已处理过的话题不会再次抽取"""
+    api = FakeExtractionAPI()
+    store = KnowledgeGraphStore(":memory:")
+    async with make_graph(store, api) as kg:
+        await kg.process_topics(topics("OpenAI发布新模型", "北京今日降雪"))
+        stats = await kg.process_topics(topics("OpenAI发布新模型", "北京今日降雪", "微软与openai续约"))
+
+    assert stats == {"processed": 1, "skipped": 2, "entities": 2, "relations": 1}
+    assert len(api.requests) == 2
+    assert "北京今日降雪" not in api.requests[1]
+
+
+async def test_related_topics():
+    """共享实体的话题相互关联，无共享实体的话题不出现"""
+    api = FakeExtractionAPI()
+    store = KnowledgeGraphStore(":memory:")
+    async with make_graph(store, api, batch_size=10) as kg:
+        await kg.process_topics(topics(*EXTRACTIONS))
+        related = kg.related_topics("OpenAI发布新模型")
+
+    titles = [item["title"] for item in related]
+    assert sorted(titles) == ["《GPT-5》评测出炉", "微软与openai续约"]
+    assert "北京今日降雪" not in titles
+    assert {e["name"] for e in store.related_entities("OpenAI")} == {"GPT-5", "微软"}
+
+
+async def test_failed_extraction_is_retried(tmp_path):
+    """抽取失败的话题不记为已处理，数据在重新打开数据库后仍然存在"""
+    db_path = str(tmp_path / "kg.db")
+
+    def failing(request):
+        return httpx.Response(500)
+
+    store = KnowledgeGraphStore(db_path)
+    async with make_graph(store, failing) as kg:
+        stats = await kg.process_topics(topics("OpenAI发布新模型"))
+    assert stats["processed"] == 0
+
+    api = FakeExtractionAPI()
+    async with make_graph(store, api) as kg:
+        stats = await kg.process_topics(topics("OpenAI发布新模型"))
+    assert stats["processed"] == 1
+    store.close()
+
+    reopened = KnowledgeGraphStore(db_path)
+    assert reopened.get_stats()["topics"] == 1
+    assert reopened.get_entity("OpenAI")["type"] == "组织"
+    reopened.close()
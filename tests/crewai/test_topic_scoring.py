@@ -0,0 +1,119 @@
+"""
+话题批量评分测试
+
+验证NumPy批量评分与逐个话题计算的结果完全一致：优先级分数、标准化热度、
+时效权重以及分数相同时的排序。
+"""
+
+import random
+from datetime import datetime
+from unittest.mock import patch
+
+import numpy as np
+
+from core.tools.trending_tools.platform_weights import PLATFORM_WEIGHTS, calculate_normalized_hot_score
+from core.tools.trending_tools.scoring import (
+    normalized_hot_scores,
+    priority_scores,
+    rank_topics,
+    time_weights,
+    top_k_indices,
+)
+from core.tools.trending_tools.utils import TopicProcessor, calculate_time_weight
+
+NOW = 1700000000.0
+
+
+class FrozenDatetime(datetime):
+    """固定当前时间，使逐个计算与批量计算使用同一时间"""
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.fromtimestamp(NOW, tz)
+
+
+def make_topics(count, seed=7):
+    rng = random.Random(seed)
+    platforms = list(PLATFORM_WEIGHTS) + ["unknown-site", None]
+    topics = []
+    for i in range(count):
+        topic = {
+            "title": f"话题{i}",
+            "platform": rng.choice(platforms),
+            "hot_score": rng.choice([None, 0, rng.randint(1, 5_000_000), rng.randint(1, 100)]),
+        }
+        if rng.random() < 0.8:
+            topic["source_time"] = int(NOW) - rng.randint(-3600, 10 * 24 * 3600)
+        if rng.random() < 0.5:
+            topic["crawl_time"] = int(NOW) - rng.randint(0, 3 * 24 * 3600)
+        topics.append(topic)
+    return topics
+
+
+def scalar_scores(topics):
+    processor = TopicProcessor()
+    with patch("core.tools.trending_tools.utils.datetime", FrozenDatetime):
+        return [processor.calculate_priority_score(topic) for topic in topics]
+
+
+def test_priority_scores_match_scalar_formula():
+    """批量分数与 calculate_priority_score 逐个计算的结果完全一致"""
+    topics = make_topics(5000)
+    assert priority_scores(topics, NOW).tolist() == scalar_scores(topics)
+
+
+def test_invalid_values_score_zero():
+    """非数值的热度或时间戳记0分（逐个计算时这些话题会因异常记0分）"""
+    topics = [
+        {"platform": "weibo", "hot_score": "很热", "source_time": int(NOW)},
+        {"platform": "weibo", "hot_score": 100, "source_time": "昨天"},
+        {"platform": "weibo", "hot_score": float("nan"), "source_time": int(NOW)},
+    ]
+    assert priority_scores(topics, NOW).tolist() == [0, 0, 0]
+
+
+def test_normalized_hot_scores_and_time_weights():
+    """标准化热度和时效权重与单个计算函数一致"""
+    platforms = ["weibo", "github", "unknown-site", "zhihu", "csdn"]
+    raw = [12345, None, -5, 0, 1]
+    expected = [calculate_normalized_hot_score(p, r) for p, r in zip(platforms, raw)]
+    assert normalized_hot_scores(platforms, raw).tolist() == expected
+
+    timestamps = [NOW, NOW - 3 * 24 * 3600, NOW - 30 * 24 * 3600, NOW + 3600]
+    with patch("core.tools.trending_tools.utils.datetime", FrozenDatetime):
+        expected = [calculate_time_weight({"source_time": ts}) for ts in timestamps]
+    assert time_weights(np.array(timestamps), NOW).tolist() == expected
+
+
+def test_top_k_matches_stable_sort():
+    """argpartition 选出的前k个与稳定排序后截取的结果一致，包括分数相同的情况"""
+    rng = np.random.default_rng(3)
+    scores = rng.integers(0, 20, size=1000)
+    expected = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)
+    for k in (0, 1, 7, 50, 999, 1000, None):
+        assert top_k_indices(scores, k).tolist() == expected[:k]
+
+
+def test_rank_topics_matches_loop():
+    """rank_topics 的结果与原先逐个评分、排序、截取的结果一致"""
+    topics = make_topics(2000, seed=11)
+    expected_scores = scalar_scores(topics)
+    expected = sorted(range(len(topics)), key=lambda i: expected_scores[i], reverse=True)[:20]
+
+    ranked = rank_topics(topics, limit=20, now=NOW)
+    assert [topic["title"] for topic in ranked] == [topics[i]["title"] for i in expected]
+    assert [topic["priority_score"] for topic in ranked] == [expected_scores[i] for i in expected]
+    assert rank_topics([], limit=20) == []
+
+
+def test_process_topics_hot_score():
+    """处理平台数据时批量计算的标准化热度与逐个计算一致"""
+    raw = [{"title": "甲", "hot": "1,234"}, {"title": "乙"}, {"title": "丙", "hot": 0}, {"hot": 5}]
+    processed = TopicProcessor().process_topics(raw, "weibo")
+
+    assert [topic["title"] for topic in processed] == ["甲", "乙", "丙"]
+    assert [topic["hot_score"] for topic in processed] == [
+        calculate_normalized_hot_score("weibo", 1234),
+        calculate_normalized_hot_score("weibo", None),
+        calculate_normalized_hot_score("weibo", 0),
+    ]
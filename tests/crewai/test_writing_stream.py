@@ -0,0 +1,144 @@
+"""
+流式写作测试
+
+测试WritingCrew.stream_article的事件顺序：大纲完成即推送，章节正文按片段推送，
+事实核查和最终稿随后推送；出错时以error事件结束。
+"""
+
+import asyncio
+import time
+
+from core.agents.writing_crew.writing_crew import WritingCrew
+from core.agents.writing_crew.writing_stream import normalize_outline_sections, assemble_markdown
+from core.models.article.article import Article
+
+OUTLINE = {
+    "outline": [
+        {"title": "引言", "points": ["背景"]},
+        {"title": "正文", "points": ["要点一", "要点二"]},
+        {"title": "结论", "points": []},
+    ],
+    "summary": "三段式结构",
+    "tags": ["测试"],
+}
+
+
+class FakeLLM:
+    """逐字流式返回的模拟LLM"""
+
+    def __init__(self, fail_at=None):
+        self.fail_at = fail_at
+        self.calls = 0
+
+    async def stream_chat(self, messages, model=None):
+        self.calls += 1
+        if self.calls == self.fail_at:
+            raise RuntimeError("LLM不可用")
+        for char in f"第{self.calls}部分内容":
+            await asyncio.sleep(0.01)
+            yield char
+
+
+def make_crew():
+    """替换智能体任务执行的WritingCrew"""
+    crew = WritingCrew(verbose=False)
+    crew.agents = object()
+    crew.executed = []
+
+    async def run_single_task(agent, task):
+        crew.executed.append(task.agent)
+        await asyncio.sleep(0.05)
+        if task.agent is crew.outline_creator:
+            return OUTLINE
+        if task.agent is crew.fact_checker:
+            return {"accuracy_score": 9.0, "issues": [], "suggestions": "无"}
+        return {"title": "测试文章", "summary": "摘要", "content": "## 引言\n...", "tags": ["a", "b", "c"]}
+
+    crew._run_single_task = run_single_task
+    crew._create_outline_task = lambda article, platform: type("T", (), {"agent": crew.outline_creator})()
+    crew._create_fact_check_task = lambda article, platform, content=None: type("T", (), {"agent": crew.fact_checker})()
+    crew._create_edit_task = lambda article, platform, content=None, fact_check=None: type("T", (), {"agent": crew.editor})()
+    crew.outline_creator, crew.fact_checker, crew.editor = object(), object(), object()
+    return crew
+
+
+async def collect(crew, llm, **kwargs):
+    article = Article(id="a1", topic_id="t1", title="测试文章", summary="摘要", metadata={})
+    events = []
+    start = time.perf_counter()
+    async for event in crew.stream_article(article, llm=llm, **kwargs):
+        events.append((time.perf_counter() - start, event))
+    return events
+
+
+async def test_stream_event_order():
+    """事件按 started → outline_ready → 章节token → fact_check → final_draft → done 顺序产出"""
+    events = await collect(make_crew(), FakeLLM())
+    types = [e.type for _, e in events]
+
+    assert types[0] == "started"
+    assert types[1] == "outline_ready"
+    assert types[-3:] == ["fact_check", "final_draft", "done"]
+    assert types.count("section_started") == 3
+    assert types.count("section_completed") == 3
+
+    # 每个章节的token拼接后等于章节内容
+    completed = [e for _, e in events if e.type == "section_completed"]
+    for event in completed:
+        tokens = [e.data["text"] for _, e in events if e.type == "token" and e.section_index == event.section_index]
+        assert "".join(tokens) == event.data["content"]
+
+    done = events[-1][1].data
+    assert [s["title"] for s in done["content"]["sections"]] == ["引言", "正文", "结论"]
+    assert done["final_draft"]["metadata"]["fact_check"]["accuracy_score"] == 9.0
+
+
+async def test_first_token_before_article_finished():
+    """第一个正文片段远早于整篇文章完成"""
+    events = await collect(make_crew(), FakeLLM())
+    first_token = next(t for t, e in events if e.type == "token")
+    done = events[-1][0]
+    assert first_token < done / 2
+
+
+async def test_existing_outline_skips_outline_task():
+    """提供大纲时不再调用大纲智能体"""
+    crew = make_crew()
+    events = await collect(crew, FakeLLM(), outline=OUTLINE)
+    assert crew.outline_creator not in crew.executed
+    assert events[1][1].type == "outline_ready"
+
+
+async def test_error_event_ends_stream():
+    """章节生成失败时以error事件结束"""
+    events = await collect(make_crew(), FakeLLM(fail_at=2))
+    types = [e.type for _, e in events]
+    assert types[-1] == "error"
+    assert "done" not in types
+    assert types.count("section_completed") == 1
+
+
+async def test_platform_error_yields_error_event():
+    """平台解析失败时同样以error事件结束，而不是从生成器抛出"""
+    crew = make_crew()
+
+    def fail(platform):
+        raise ValueError("未知平台")
+
+    crew._resolve_platform = fail
+    events = await collect(crew, FakeLLM(), platform="missing")
+    assert [e.type for _, e in events] == ["started", "error"]
+    assert events[-1][1].data["message"] == "未知平台"
+
+
+def test_default_platform_resolution():
+    """未提供平台或平台未知时返回可用的平台对象"""
+    crew = WritingCrew(verbose=False)
+    assert crew._resolve_platform(None).name == "通用平台"
+
+
+def test_outline_helpers():
+    """大纲章节归一化与Markdown拼接"""
+    sections = normalize_outline_sections({"sections": ["引言", {"title": "正文", "key_points": ["a"]}]})
+    assert sections == [{"title": "引言", "points": []}, {"title": "正文", "points": ["a"]}]
+    assert assemble_markdown([{"title": "引言", "content": "内容\n"}]) == "## 引言\n内容"